@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Migration Script: Fügt team.character_render_data hinzu und befüllt die Spalte
+
+Die Spalte enthält die aus character_customization abgeleiteten Teile, Animationen
+und Stimm-Einstellungen als kompaktes JSON. Neue Anpassungen schreiben sie automatisch
+mit; dieses Script legt die Spalte an und berechnet sie für bestehende Teams.
+
+python add_character_render_data_migration.py
+"""
+
+import os
+import sys
+
+# Füge das Projekt-Root-Verzeichnis zum sys.path hinzu
+PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import text
+
+from app import create_app, db
+from app.models import build_character_render_data
+
+
+def migrate_character_render_data():
+    """Legt die Spalte character_render_data an und berechnet sie für alle Teams"""
+
+    app = create_app()
+
+    with app.app_context():
+        print("🔄 Überprüfe Datenbank-Schema...")
+
+        inspector = db.inspect(db.engine)
+        columns = {col['name'] for col in inspector.get_columns('team')}
+
+        try:
+            with db.engine.begin() as conn:
+                if 'character_render_data' in columns:
+                    print("✅ Spalte character_render_data existiert bereits.")
+                else:
+                    conn.execute(text("ALTER TABLE team ADD COLUMN character_render_data TEXT"))
+                    print("➕ Spalte character_render_data angelegt.")
+
+                teams = conn.execute(text(
+                    "SELECT id, character_customization FROM team "
+                    "WHERE character_customization IS NOT NULL"
+                )).fetchall()
+
+                rows = [{'team_id': team_id, 'render_data': build_character_render_data(raw)}
+                        for team_id, raw in teams]
+                if rows:
+                    conn.execute(text(
+                        "UPDATE team SET character_render_data = :render_data WHERE id = :team_id"
+                    ), rows)
+
+            print(f"✅ Render-Daten für {len(rows)} Team(s) berechnet.")
+            return True
+
+        except Exception as e:
+            print(f"❌ Fehler bei der Migration: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = migrate_character_render_data()
+    sys.exit(0 if success else 1)
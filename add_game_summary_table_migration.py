@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Migration Script: Legt die Tabelle game_summary an
+
+Die Endstatistik eines Spiels (Positionsverlauf, Minispiel-Statistiken, Spieldauer)
+wird beim Spielgewinn einmal berechnet und in game_summary gespeichert. Für bereits
+beendete Spiele berechnet die Goodbye-Seite sie beim ersten Aufruf nachträglich.
+
+python add_game_summary_table_migration.py
+"""
+
+import os
+import sys
+
+# Füge das Projekt-Root-Verzeichnis zum sys.path hinzu
+PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from app import create_app, db
+from app.models import GameSummary
+
+
+def migrate_game_summary():
+    """Legt die Tabelle game_summary an"""
+
+    app = create_app()
+
+    with app.app_context():
+        print("🔄 Überprüfe Datenbank-Schema...")
+
+        try:
+            inspector = db.inspect(db.engine)
+            if 'game_summary' in inspector.get_table_names():
+                print("✅ Tabelle game_summary existiert bereits.")
+            else:
+                GameSummary.__table__.create(db.engine)
+                print("➕ Tabelle game_summary angelegt.")
+            return True
+
+        except Exception as e:
+            print(f"❌ Fehler bei der Migration: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = migrate_game_summary()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Migration Script: Überführt gespielte Inhalte in die Tabelle played_content
+
+Bisher lagen die gespielten Content-IDs als komma-separierte Liste in
+game_session.played_content_ids. Dieses Script legt die indizierte Tabelle
+played_content (game_session_id, content_id, played_at) an und übernimmt die
+vorhandenen IDs. Die alte Spalte bleibt für ältere Backups erhalten.
+
+python add_played_content_table_migration.py
+"""
+
+import os
+import sys
+
+# Füge das Projekt-Root-Verzeichnis zum sys.path hinzu
+PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import text
+
+from app import create_app, db
+from app.models import PlayedContent
+
+
+def migrate_played_content():
+    """Legt die Tabelle played_content an und übernimmt die alten ID-Listen"""
+
+    app = create_app()
+
+    with app.app_context():
+        print("🔄 Überprüfe Datenbank-Schema...")
+
+        inspector = db.inspect(db.engine)
+        if 'played_content' in inspector.get_table_names():
+            print("✅ Tabelle played_content existiert bereits.")
+        else:
+            PlayedContent.__table__.create(db.engine)
+            print("➕ Tabelle played_content angelegt.")
+
+        try:
+            with db.engine.begin() as conn:
+                sessions = conn.execute(text(
+                    "SELECT id, played_content_ids, start_time FROM game_session "
+                    "WHERE played_content_ids IS NOT NULL AND played_content_ids != ''"
+                )).fetchall()
+                existing = {(row[0], row[1]) for row in conn.execute(text(
+                    "SELECT game_session_id, content_id FROM played_content"
+                ))}
+
+                rows = []
+                for session_id, played_ids, start_time in sessions:
+                    for content_id in dict.fromkeys(cid.strip() for cid in played_ids.split(',') if cid.strip()):
+                        if (session_id, content_id) not in existing:
+                            rows.append({'session_id': session_id, 'content_id': content_id,
+                                         'played_at': start_time})
+
+                if rows:
+                    conn.execute(text(
+                        "INSERT INTO played_content (game_session_id, content_id, played_at) "
+                        "VALUES (:session_id, :content_id, COALESCE(:played_at, CURRENT_TIMESTAMP))"
+                    ), rows)
+
+            print(f"✅ {len(rows)} gespielte Inhalte aus {len(sessions)} Spielsitzung(en) übernommen.")
+            return True
+
+        except Exception as e:
+            print(f"❌ Fehler bei der Migration: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = migrate_played_content()
+    sys.exit(0 if success else 1)
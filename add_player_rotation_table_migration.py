@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Migration Script: Überführt die Spieler-Rotation in die Tabelle player_rotation
+
+Bisher lagen die Einsatz-Zähler als JSON ({team_id: {spieler: anzahl}}) in
+game_session.player_rotation_data. Dieses Script legt die Tabelle player_rotation
+(game_session_id, team_id, player_name, play_count) an und übernimmt die
+vorhandenen Zähler. Die alte Spalte bleibt für ältere Backups erhalten.
+
+python add_player_rotation_table_migration.py
+"""
+
+import json
+import os
+import sys
+
+# Füge das Projekt-Root-Verzeichnis zum sys.path hinzu
+PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import text
+
+from app import create_app, db
+from app.models import PlayerRotation
+
+
+def migrate_player_rotation():
+    """Legt die Tabelle player_rotation an und übernimmt die JSON-Zähler"""
+
+    app = create_app()
+
+    with app.app_context():
+        print("🔄 Überprüfe Datenbank-Schema...")
+
+        inspector = db.inspect(db.engine)
+        if 'player_rotation' in inspector.get_table_names():
+            print("✅ Tabelle player_rotation existiert bereits.")
+        else:
+            PlayerRotation.__table__.create(db.engine)
+            print("➕ Tabelle player_rotation angelegt.")
+
+        try:
+            with db.engine.begin() as conn:
+                sessions = conn.execute(text(
+                    "SELECT id, player_rotation_data FROM game_session "
+                    "WHERE player_rotation_data IS NOT NULL AND player_rotation_data != ''"
+                )).fetchall()
+                existing = {(row[0], row[1], row[2]) for row in conn.execute(text(
+                    "SELECT game_session_id, team_id, player_name FROM player_rotation"
+                ))}
+
+                rows = []
+                for session_id, raw in sessions:
+                    try:
+                        rotation_data = json.loads(raw)
+                    except (json.JSONDecodeError, TypeError):
+                        print(f"⚠️  Spielsitzung {session_id}: ungültiges JSON, übersprungen.")
+                        continue
+                    for team_id, players in (rotation_data or {}).items():
+                        if not str(team_id).isdigit() or not isinstance(players, dict):
+                            continue
+                        for player_name, play_count in players.items():
+                            key = (session_id, int(team_id), player_name)
+                            if isinstance(play_count, int) and play_count > 0 and key not in existing:
+                                rows.append({'session_id': session_id, 'team_id': int(team_id),
+                                             'player_name': player_name, 'play_count': play_count})
+
+                if rows:
+                    conn.execute(text(
+                        "INSERT INTO player_rotation (game_session_id, team_id, player_name, play_count) "
+                        "VALUES (:session_id, :team_id, :player_name, :play_count)"
+                    ), rows)
+
+            print(f"✅ {len(rows)} Spieler-Zähler aus {len(sessions)} Spielsitzung(en) übernommen.")
+            return True
+
+        except Exception as e:
+            print(f"❌ Fehler bei der Migration: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = migrate_player_rotation()
+    sys.exit(0 if success else 1)
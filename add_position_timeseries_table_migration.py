@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Migration Script: Legt die Tabelle position_timeseries und die Spalte
+game_session.position_turn_no an
+
+Der Positionsverlauf jedes Teams wird pro Spielsitzung als gepackte Zeitreihe
+(Zugnummer, Position, Wurf) gespeichert und über /api/position-deltas inkrementell
+ausgeliefert. Bereits laufende Spiele zeichnen ab dem nächsten Wurf auf; für ältere
+Spiele berechnet die Goodbye-Statistik den Verlauf weiterhin aus den GameEvents.
+
+python add_position_timeseries_table_migration.py
+"""
+
+import os
+import sys
+
+# Füge das Projekt-Root-Verzeichnis zum sys.path hinzu
+PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import text
+
+from app import create_app, db
+from app.models import PositionTimeseries
+
+
+def migrate_position_timeseries():
+    """Legt die Tabelle position_timeseries und den Zugnummern-Zähler an"""
+
+    app = create_app()
+
+    with app.app_context():
+        print("🔄 Überprüfe Datenbank-Schema...")
+
+        try:
+            inspector = db.inspect(db.engine)
+            if 'position_timeseries' in inspector.get_table_names():
+                print("✅ Tabelle position_timeseries existiert bereits.")
+            else:
+                PositionTimeseries.__table__.create(db.engine)
+                print("➕ Tabelle position_timeseries angelegt.")
+
+            columns = {col['name'] for col in inspector.get_columns('game_session')}
+            if 'position_turn_no' in columns:
+                print("✅ Spalte game_session.position_turn_no existiert bereits.")
+            else:
+                with db.engine.begin() as conn:
+                    conn.execute(text("ALTER TABLE game_session ADD COLUMN position_turn_no INTEGER DEFAULT 0"))
+                    # Zähler bestehender Sitzungen auf die höchste bereits vergebene Zugnummer setzen
+                    conn.execute(text(
+                        "UPDATE game_session SET position_turn_no = COALESCE((SELECT MAX(last_turn_no) "
+                        "FROM position_timeseries WHERE game_session_id = game_session.id), 0)"
+                    ))
+                print("➕ Spalte game_session.position_turn_no angelegt.")
+            return True
+
+        except Exception as e:
+            print(f"❌ Fehler bei der Migration: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = migrate_position_timeseries()
+    sys.exit(0 if success else 1)
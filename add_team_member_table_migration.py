@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Migration Script: Überführt Team-Mitglieder in die Tabelle team_member
+
+Bisher lagen die Spieler als komma-separierte Liste in team.members, ihre
+Einstellungen (can_be_selected, Emoji) in team.player_config und ihre Profilbilder
+in team.profile_images. Dieses Script legt die Tabelle team_member an, erzeugt pro
+Spieler eine Zeile mit diesen Werten und lässt in den JSON-Spalten nur Einträge
+von Nicht-Mitgliedern zurück. Die alte Spalte team.members bleibt für ältere
+Backups erhalten.
+
+python add_team_member_table_migration.py
+"""
+
+import json
+import os
+import sys
+
+# Füge das Projekt-Root-Verzeichnis zum sys.path hinzu
+PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import text
+
+from app import create_app, db
+from app.models import TeamMember
+
+
+def _load_json(raw):
+    try:
+        value = json.loads(raw) if raw else {}
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+def migrate_team_members():
+    """Legt die Tabelle team_member an und übernimmt Mitglieder samt Einstellungen"""
+
+    app = create_app()
+
+    with app.app_context():
+        print("🔄 Überprüfe Datenbank-Schema...")
+
+        inspector = db.inspect(db.engine)
+        if 'team_member' in inspector.get_table_names():
+            print("✅ Tabelle team_member existiert bereits.")
+        else:
+            TeamMember.__table__.create(db.engine)
+            print("➕ Tabelle team_member angelegt.")
+
+        try:
+            with db.engine.begin() as conn:
+                teams = conn.execute(text(
+                    "SELECT id, members, player_config, profile_images FROM team "
+                    "WHERE members IS NOT NULL AND members != ''"
+                )).fetchall()
+                migrated_teams = {row[0] for row in conn.execute(text(
+                    "SELECT DISTINCT team_id FROM team_member"
+                ))}
+
+                member_rows = []
+                team_updates = []
+                for team_id, members, player_config, profile_images in teams:
+                    if team_id in migrated_teams:
+                        continue
+                    rows, extra_config, extra_images = TeamMember.rows_from_legacy(
+                        team_id, members, _load_json(player_config), _load_json(profile_images))
+                    if not rows:
+                        continue
+                    member_rows.extend(rows)
+                    team_updates.append({
+                        'team_id': team_id,
+                        'player_config': json.dumps(extra_config) if extra_config else None,
+                        'profile_images': json.dumps(extra_images) if extra_images else None
+                    })
+
+                if member_rows:
+                    conn.execute(text(
+                        "INSERT INTO team_member (team_id, name, position, can_be_selected, emoji, "
+                        "profile_image, times_selected) VALUES (:team_id, :name, :position, "
+                        ":can_be_selected, :emoji, :profile_image, :times_selected)"
+                    ), member_rows)
+                    conn.execute(text(
+                        "UPDATE team SET player_config = :player_config, profile_images = :profile_images "
+                        "WHERE id = :team_id"
+                    ), team_updates)
+
+            print(f"✅ {len(member_rows)} Spieler aus {len(team_updates)} Team(s) übernommen.")
+            return True
+
+        except Exception as e:
+            print(f"❌ Fehler bei der Migration: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = migrate_team_members()
+    sys.exit(0 if success else 1)
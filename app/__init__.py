@@ -1,30 +1,43 @@
+from datetime import datetime
+import click
 from flask import Flask, g
+from flask.cli import ScriptInfo
 from flask_sqlalchemy import SQLAlchemy
-from flask_login import LoginManager
-from flask_migrate import Migrate
+from flask_login import LoginManager, current_user
 from flask_wtf.csrf import CSRFProtect
 from config import Config
 import os
 
 db = SQLAlchemy()
 login_manager = LoginManager()
-migrate = Migrate()
 csrf = CSRFProtect()
 
+
+class LazyMigrateGroup(click.Group):
+    """
+    `flask db ...` ohne Flask-Migrate beim App-Start: Alembic (samt Mako) kostet beim
+    Import über 100 ms und wird nur für Migrationen gebraucht. Erst wenn ein
+    db-Unterbefehl aufgelöst wird, wird Flask-Migrate geladen und an die App gebunden.
+    """
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        from flask_migrate import Migrate
+        from flask_migrate.cli import db as db_cli_group
+
+        app = parent.ensure_object(ScriptInfo).load_app()
+        if 'migrate' not in app.extensions:
+            Migrate(app, db)
+        # Ab hier übernimmt die Original-Gruppe (Optionen -d/-x, Unterbefehle, Hilfe)
+        return db_cli_group.make_context(info_name, args, parent=parent, **extra)
+
 # login_manager.login_view = 'admin.login' # Setzen wir spezifischer pro Blueprint
 # login_manager.login_message_category = 'info'
 
 @login_manager.user_loader
-def load_user(user_id_with_prefix): # user_id kommt jetzt als String mit Präfix
-    from app.models import Admin, Team
-    
-    if user_id_with_prefix.startswith('admin_'):
-        admin_id = int(user_id_with_prefix.split('_')[1])
-        return Admin.query.get(admin_id)
-    elif user_id_with_prefix.startswith('team_'):
-        team_id = int(user_id_with_prefix.split('_')[1])
-        return Team.query.get(team_id)
-    return None
+def load_user(user_id_with_prefix): # user_id kommt jetzt als String mit Präfix ('admin_1', 'team_3')
+    # Gecacht: bei einem Treffer ohne Datenbankabfrage (siehe app/user_cache.py)
+    from app.user_cache import load_principal
+    return load_principal(user_id_with_prefix)
 
 def create_app(config_class=Config):
     app = Flask(__name__)
@@ -33,10 +46,14 @@ def create_app(config_class=Config):
     # Erhöhe die maximale Request-Größe für Base64-Bilder
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB
 
+    # Strukturiertes Logging für die wii.*-Subsysteme (nicht blockierend über eine Queue)
+    from app.log import configure_logging
+    configure_logging(app)
+
     db.init_app(app)
     login_manager.init_app(app)
-    migrate.init_app(app, db)
     csrf.init_app(app)
+    app.cli.add_command(LazyMigrateGroup('db', help='Datenbank-Migrationen (Flask-Migrate/Alembic)'))
 
     # Setze die Login-Views für die Blueprints
     # Dies ist der Ort, an den Benutzer weitergeleitet werden, wenn @login_required fehlschlägt
@@ -58,12 +75,15 @@ def create_app(config_class=Config):
     from app.teams.routes import teams_bp
     app.register_blueprint(teams_bp)
 
+    # Opt-in Instrumentierung (Metriken unter /admin/metrics)
+    from app.instrumentation import init_instrumentation
+    init_instrumentation(app, db)
+
+    # Modelle einmal beim Start auflösen statt in jedem Template-Aufruf
+    from app.models import Admin as AdminModel, Team as TeamModel
+
     @app.context_processor
     def inject_now_year_and_user_type():
-        from datetime import datetime
-        from flask_login import current_user
-        from app.models import Admin as AdminModel, Team as TeamModel
-
         user_type_in_context = None
         if current_user.is_authenticated:
             if isinstance(current_user, AdminModel):
@@ -74,12 +94,10 @@ def create_app(config_class=Config):
 
     @app.template_filter('is_admin')
     def is_admin_filter(user):
-        from app.models import Admin as AdminModel
         return isinstance(user, AdminModel)
 
     @app.template_filter('is_team')
     def is_team_filter(user):
-        from app.models import Team as TeamModel
         return isinstance(user, TeamModel)
         
     with app.app_context():
@@ -5,18 +5,20 @@ Erweitert das Admin-Interface um Feld-Verwaltungsfunktionen
 import json
 from typing import Dict, List, Optional, Any
 from flask import current_app
-from app.models import FieldConfiguration, db
+from app.models import FieldConfiguration, RoundFieldConfiguration, ROUND_CONFIG_COLUMNS, db
 from app.game_logic.special_fields import get_all_special_field_positions, get_field_statistics
+from app.game_logic.field_config_cache import (
+    get_cached_field_configs, get_active_round_id, invalidate_field_config_cache
+)
 
 
 def get_field_type_color_mapping():
     """
     Gibt eine Zuordnung von Feld-Typen zu Farben zurück
     """
-    field_configs = FieldConfiguration.query.all()
     color_mapping = {}
     
-    for config in field_configs:
+    for config in get_cached_field_configs().values():
         color_mapping[config.field_type] = {
             'color': config.color_hex,
             'emission': config.emission_hex,
@@ -36,10 +38,11 @@ def get_field_preview_data(max_fields=73):
     
     field_preview = []
     field_counts = {}
+    configs = get_cached_field_configs()
     
     for position in range(max_fields):
         field_type = get_field_type_at_position(position)
-        config = FieldConfiguration.get_config_for_field(field_type)
+        config = configs.get(field_type)
         
         field_info = {
             'position': position,
@@ -65,6 +68,42 @@ def get_field_preview_data(max_fields=73):
     }
 
 
+def get_editable_field_configs(field_types=None):
+    """
+    Lädt FieldConfiguration-Zeilen zum Bearbeiten
+
+    Die Werte der aktiven Runde werden auf die Zeilen übertragen, damit Änderungen
+    vom aktuell gültigen Stand ausgehen. Die globalen Zeilen dienen so weiterhin
+    als Vorlage für neue Runden.
+    """
+    query = FieldConfiguration.query
+    if field_types is not None:
+        query = query.filter(FieldConfiguration.field_type.in_(field_types))
+    configs = query.order_by(FieldConfiguration.field_type).all()
+
+    resolved = get_cached_field_configs()
+    for config in configs:
+        snapshot = resolved.get(config.field_type)
+        if snapshot is None:
+            continue
+        for column in ROUND_CONFIG_COLUMNS:
+            value = getattr(snapshot, column)
+            if getattr(config, column) != value:
+                setattr(config, column, value)
+    return configs
+
+
+def sync_active_round_configs(configs):
+    """
+    Übernimmt bearbeitete Konfigurationen per Upsert in die aktive Runde
+    und meldet die Änderung an den Cache
+    """
+    round_id = get_active_round_id()
+    if round_id is not None and configs:
+        RoundFieldConfiguration.upsert_many(round_id, configs)
+    invalidate_field_config_cache()
+
+
 def create_default_field_config(field_type, display_name, **kwargs):
     """
     Erstellt eine Standard-Feld-Konfiguration
@@ -137,6 +176,7 @@ def update_field_config(config_id, form_data):
             extended_config['positions'] = []
     
     config.config_dict = extended_config
+    sync_active_round_configs([config])
     
     # Debug logging
     current_app.logger.info(f"[FIELD CONFIG] Updated config_dict for {config.field_type}: {extended_config}")
@@ -231,7 +271,7 @@ def export_field_configurations():
     """
     Exportiert alle Feld-Konfigurationen als JSON
     """
-    configs = FieldConfiguration.query.all()
+    configs = get_cached_field_configs().values()
     export_data = []
     
     for config in configs:
@@ -257,6 +297,8 @@ def import_field_configurations(import_data):
     """
     imported_count = 0
     errors = []
+    imported_configs = []
+    existing_configs = {config.field_type: config for config in get_editable_field_configs()}
     
     for config_data in import_data:
         try:
@@ -266,17 +308,20 @@ def import_field_configurations(import_data):
                 continue
             
             # Prüfe ob Konfiguration bereits existiert
-            existing_config = FieldConfiguration.query.filter_by(field_type=field_type).first()
+            existing_config = existing_configs.get(field_type)
             
             if existing_config:
                 # Aktualisiere existierende Konfiguration
                 for key, value in config_data.items():
                     if hasattr(existing_config, key):
                         setattr(existing_config, key, value)
+                imported_configs.append(existing_config)
             else:
                 # Erstelle neue Konfiguration
                 new_config = FieldConfiguration(**config_data)
                 db.session.add(new_config)
+                existing_configs[field_type] = new_config
+                imported_configs.append(new_config)
             
             imported_count += 1
             
@@ -285,6 +330,7 @@ def import_field_configurations(import_data):
     
     if imported_count > 0:
         try:
+            sync_active_round_configs(imported_configs)
             db.session.commit()
         except Exception as e:
             db.session.rollback()
@@ -304,10 +350,13 @@ def reset_to_default_configurations():
     try:
         # Lösche alle existierenden Konfigurationen
         FieldConfiguration.query.delete()
+        invalidate_field_config_cache()
         
         # Erstelle Standard-Konfigurationen
         FieldConfiguration.initialize_default_configs()
         
+        # Aktive Runde ebenfalls zurücksetzen
+        sync_active_round_configs(FieldConfiguration.query.all())
         db.session.commit()
         return True
     except Exception as e:
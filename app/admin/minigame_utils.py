@@ -6,9 +6,13 @@ Erweitert um Tracking von bereits gespielten Inhalten
 import os
 import json
 import shutil
+import hashlib
+import copy
+from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
 from flask import current_app
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Mapping, Iterable, AbstractSet
 import uuid
 
 def get_minigame_folders_path() -> str:
@@ -75,6 +79,7 @@ def delete_minigame_folder(folder_name: str) -> bool:
     
     try:
         shutil.rmtree(folder_path)
+        discard_prefetched_content(folder_name)
         return True
     except Exception as e:
         current_app.logger.error(f"Fehler beim Löschen des Ordners {folder_name}: {e}")
@@ -191,7 +196,10 @@ def update_minigame_in_folder(folder_name: str, minigame_id: str, updated_data:
         # Speichere zurück
         with open(json_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
-            
+        
+        # Angehefteter und vorab geladener Inhalt könnte veraltet sein
+        unpin_active_content()
+        discard_prefetched_content(folder_name)
         return True
         
     except Exception as e:
@@ -221,7 +229,10 @@ def delete_minigame_from_folder(folder_name: str, minigame_id: str) -> bool:
         # Speichere zurück
         with open(json_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
-            
+        
+        # Angehefteter und vorab geladener Inhalt könnte veraltet sein
+        unpin_active_content()
+        discard_prefetched_content(folder_name)
         return True
         
     except Exception as e:
@@ -238,13 +249,13 @@ def get_minigame_from_folder(folder_name: str, minigame_id: str) -> Optional[Dic
     
     return None
 
-def get_random_minigame_from_folder(folder_name: str, exclude_played_ids: List[str] = None) -> Optional[Dict[str, Any]]:
+def get_random_minigame_from_folder(folder_name: str, exclude_played_ids: Iterable[str] = None) -> Optional[Dict[str, Any]]:
     """
     Gibt ein zufälliges Minispiel oder eine Frage aus einem Ordner zurück.
     
     Args:
         folder_name: Name des Ordners
-        exclude_played_ids: Liste von IDs, die ausgeschlossen werden sollen
+        exclude_played_ids: IDs, die ausgeschlossen werden sollen (z.B. GameSession.get_played_content_ids())
         
     Returns:
         Zufälliges Minispiel/Frage oder None wenn keines verfügbar
@@ -255,6 +266,7 @@ def get_random_minigame_from_folder(folder_name: str, exclude_played_ids: List[s
         return None
     
     # Filtere bereits gespielte Inhalte heraus
+    exclude_played_ids = _as_id_set(exclude_played_ids)
     if exclude_played_ids:
         available_minigames = [mg for mg in all_minigames if mg.get('id') not in exclude_played_ids]
     else:
@@ -373,12 +385,139 @@ def get_round_save_path(round_name: str) -> str:
     safe_name = "".join(c for c in round_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
     return os.path.join(get_saved_rounds_path(), safe_name)
 
-def save_round_to_filesystem(round_obj) -> bool:
+BACKUP_MANIFEST_FILE = 'manifest.json'
+BACKUP_MANIFEST_VERSION = 1
+
+
+def _iter_json(obj):
+    """Serialisiert ein Objekt stückweise im Format von json.dump(..., indent=2)"""
+    return json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(obj)
+
+
+def _iter_json_list(items):
+    """Serialisiert eine (lazy) Folge als JSON-Liste, ohne die Liste im Speicher aufzubauen"""
+    yield '['
+    first = True
+    for item in items:
+        yield '\n  ' if first else ',\n  '
+        first = False
+        yield json.dumps(item, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+    yield ']' if first else '\n]'
+
+
+def _is_unchanged(target_path: str, previous: Optional[dict], entry: dict) -> bool:
+    return (previous is not None
+            and previous.get('sha256') == entry['sha256']
+            and os.path.exists(target_path)
+            and os.path.getsize(target_path) == entry['size'])
+
+
+def _write_backup_file(round_path: str, relpath: str, chunks, previous: Optional[dict]):
+    """
+    Serialisiert JSON-Stücke gestreamt und vergleicht sie dabei mit der bestehenden Datei.
+    
+    Solange alles übereinstimmt, wird nur gelesen und gehasht; erst ab der ersten
+    Abweichung wird eine temporäre Datei geschrieben (mit dem bereits verglichenen
+    Anfang der alten Datei) und am Ende die Zieldatei ersetzt.
+    
+    Returns:
+        tuple: (Manifest-Eintrag, True wenn die Datei neu geschrieben wurde)
+    """
+    target_path = os.path.join(round_path, relpath)
+    tmp_path = f"{target_path}.tmp"
+    digest = hashlib.sha256()
+    size = 0
+    # Ohne passenden Manifest-Eintrag lohnt der Vergleich nicht: direkt schreiben
+    existing = None
+    if previous is not None and os.path.exists(target_path) and os.path.getsize(target_path) == previous.get('size'):
+        existing = open(target_path, 'rb')
+    out = None
+    try:
+        if existing is None:
+            out = open(tmp_path, 'wb')
+        for chunk in chunks:
+            data = chunk.encode('utf-8')
+            digest.update(data)
+            if out is None and existing.read(len(data)) != data:
+                out = _start_rewrite(existing, tmp_path, size)
+            size += len(data)
+            if out is not None:
+                out.write(data)
+        if out is None and existing.read(1):
+            # Neuer Inhalt ist ein echter Anfang der alten Datei
+            out = _start_rewrite(existing, tmp_path, size)
+    finally:
+        if existing is not None:
+            existing.close()
+        if out is not None:
+            out.close()
+    
+    entry = {'sha256': digest.hexdigest(), 'size': size}
+    if out is None:
+        return entry, False
+    os.replace(tmp_path, target_path)
+    return entry, True
+
+
+def _start_rewrite(existing, tmp_path: str, prefix_size: int):
+    """Öffnet die temporäre Datei und übernimmt die ersten prefix_size Bytes der alten Datei"""
+    out = open(tmp_path, 'wb')
+    existing.seek(0)
+    remaining = prefix_size
+    while remaining:
+        block = existing.read(min(remaining, 1024 * 1024))
+        out.write(block)
+        remaining -= len(block)
+    return out
+
+
+def _file_digest(path: str, digest_cache: Optional[dict] = None) -> dict:
+    """Berechnet SHA-256 und Größe einer Datei blockweise (Ergebnis optional pro Lauf zwischengespeichert)"""
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if digest_cache is not None and key in digest_cache:
+        return digest_cache[key]
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    entry = {'sha256': digest.hexdigest(), 'size': stat.st_size}
+    if digest_cache is not None:
+        digest_cache[key] = entry
+    return entry
+
+
+def _copy_backup_file(source_path: str, round_path: str, relpath: str, previous: Optional[dict],
+                      digest_cache: Optional[dict] = None):
+    """Kopiert eine Datei nur, wenn sich ihr Inhalts-Hash seit dem letzten Backup geändert hat"""
+    target_path = os.path.join(round_path, relpath)
+    entry = _file_digest(source_path, digest_cache)
+    if _is_unchanged(target_path, previous, entry):
+        return entry, False
+    shutil.copy2(source_path, target_path)
+    return entry, True
+
+
+def read_backup_manifest(round_path: str) -> Optional[dict]:
+    """Liest das Manifest eines Runden-Backups (None wenn nicht vorhanden oder unlesbar)"""
+    manifest_path = os.path.join(round_path, BACKUP_MANIFEST_FILE)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get('manifest_version') != BACKUP_MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def save_round_to_filesystem(round_obj, digest_cache: Optional[dict] = None) -> bool:
     """
     Speichert eine GameRound mit kompletten Spielzustand in saubere Ordnerstruktur.
     
     Erstellt:
     spielstaende/runden/[RundenName]/
+    ├── manifest.json        # Hashes und Größen aller Dateien
     ├── rundeninfo.json      # Runden-Metadaten
     ├── teams.json           # Alle Teams mit Positionen
     ├── spielsitzung.json    # GameSession Daten
@@ -387,21 +526,35 @@ def save_round_to_filesystem(round_obj) -> bool:
         └── [Ordnername]/
             └── minigames.json
     
+    Die Sicherung ist inkrementell: Dateien werden gestreamt serialisiert und nur
+    ersetzt, wenn sich ihr SHA-256 gegenüber dem letzten Manifest geändert hat.
+    
     Args:
         round_obj: GameRound Objekt
+        digest_cache: Optionaler Cache für Hashes der Minigame-Quelldateien
+                      (wird beim Sichern mehrerer Runden gemeinsam genutzt)
         
     Returns:
         bool: True wenn erfolgreich gespeichert
     """
-    import json
-    import shutil
-    from datetime import datetime
+    from app.models import Team, GameSession, RoundFieldConfiguration, MinigameFolder
     
     try:
         # Erstelle Ordner für diese Runde
         round_path = get_round_save_path(round_obj.name)
         os.makedirs(round_path, exist_ok=True)
         
+        previous_manifest = read_backup_manifest(round_path) or {}
+        previous_files = previous_manifest.get('files', {})
+        files = {}
+        written_files = []
+        
+        def store(relpath, chunks):
+            entry, written = _write_backup_file(round_path, relpath, chunks, previous_files.get(relpath))
+            files[relpath] = entry
+            if written:
+                written_files.append(relpath)
+        
         # 1. RUNDENINFO.JSON - Basis-Informationen
         rundeninfo = {
             'name': round_obj.name,
@@ -409,46 +562,44 @@ def save_round_to_filesystem(round_obj) -> bool:
             'minigame_folder_name': round_obj.minigame_folder.name if round_obj.minigame_folder else None,
             'is_active': round_obj.is_active,
             'created_at': round_obj.created_at.isoformat() if round_obj.created_at else datetime.utcnow().isoformat(),
-            'saved_at': datetime.utcnow().isoformat(),
             'version': '2.0'  # Neue Struktur-Version
         }
-        
-        with open(os.path.join(round_path, 'rundeninfo.json'), 'w', encoding='utf-8') as f:
-            json.dump(rundeninfo, f, indent=2, ensure_ascii=False)
-        
-        # 2. TEAMS.JSON - Alle Teams mit kompletten Daten
-        teams_data = []
-        from app.models import Team
-        teams = Team.query.all()
-        
-        for team in teams:
-            team_data = {
-                'name': team.name,
-                'password_hash': team.password_hash,
-                'welcome_password': team.welcome_password,
-                'members': team.members,
-                'player_config': team.player_config,
-                'profile_images': team.profile_images,
-                'character_name': team.character_name,
-                'character_id': team.character_id,
-                'character_customization': team.character_customization,
-                'current_position': team.current_position,
-                'minigame_placement': team.minigame_placement,
-                'bonus_dice_sides': team.bonus_dice_sides,
-                'last_dice_result': team.last_dice_result,
-                'is_blocked': team.is_blocked,
-                'blocked_target_number': team.blocked_target_number,
-                'blocked_config': team.blocked_config,
-                'blocked_turns_remaining': team.blocked_turns_remaining,
-                'extra_moves_remaining': team.extra_moves_remaining
-            }
-            teams_data.append(team_data)
-        
-        with open(os.path.join(round_path, 'teams.json'), 'w', encoding='utf-8') as f:
-            json.dump(teams_data, f, indent=2, ensure_ascii=False)
+        # saved_at steht nur im Manifest, sonst wäre rundeninfo.json bei jeder Sicherung geändert
+        saved_at = datetime.utcnow().isoformat()
+        store('rundeninfo.json', _iter_json(rundeninfo))
+        
+        # 2. TEAMS.JSON - Alle Teams mit kompletten Daten (gestreamt)
+        team_count = 0
+        
+        def iter_teams():
+            nonlocal team_count
+            for team in Team.query.order_by(Team.id).yield_per(100):
+                team_count += 1
+                yield {
+                    'id': team.id,  # alte ID, damit team_ids in spielsitzung.json aufgelöst werden können
+                    'name': team.name,
+                    'password_hash': team.password_hash,
+                    'welcome_password': team.welcome_password,
+                    'members': team.members,
+                    'player_config': _dumps_or_none(team.get_player_config()),
+                    'profile_images': _dumps_or_none(team.get_profile_images()),
+                    'character_name': team.character_name,
+                    'character_id': team.character_id,
+                    'character_customization': team.character_customization,
+                    'current_position': team.current_position,
+                    'minigame_placement': team.minigame_placement,
+                    'bonus_dice_sides': team.bonus_dice_sides,
+                    'last_dice_result': team.last_dice_result,
+                    'is_blocked': team.is_blocked,
+                    'blocked_target_number': team.blocked_target_number,
+                    'blocked_config': team.blocked_config,
+                    'blocked_turns_remaining': team.blocked_turns_remaining,
+                    'extra_moves_remaining': team.extra_moves_remaining
+                }
+        
+        store('teams.json', _iter_json_list(iter_teams()))
         
         # 3. SPIELSITZUNG.JSON - GameSession Daten
-        from app.models import GameSession
         active_session = GameSession.query.filter_by(is_active=True).first()
         
         if active_session:
@@ -462,8 +613,8 @@ def save_round_to_filesystem(round_obj) -> bool:
                 'current_question_id': active_session.current_question_id,
                 'selected_folder_minigame_id': active_session.selected_folder_minigame_id,
                 'minigame_source': active_session.minigame_source,
-                'played_content_ids': active_session.played_content_ids,
-                'player_rotation_data': active_session.player_rotation_data,
+                'played_content_ids': ','.join(active_session.get_played_content_history()),
+                'player_rotation_data': json.dumps(active_session.get_player_rotation_data()),
                 'current_phase': active_session.current_phase,
                 'dice_roll_order': active_session.dice_roll_order,
                 'current_team_turn_id': active_session.current_team_turn_id,
@@ -477,39 +628,28 @@ def save_round_to_filesystem(round_obj) -> bool:
                 'field_minigame_content_type': active_session.field_minigame_content_type,
                 'field_minigame_result': active_session.field_minigame_result
             }
-            
-            with open(os.path.join(round_path, 'spielsitzung.json'), 'w', encoding='utf-8') as f:
-                json.dump(game_session_data, f, indent=2, ensure_ascii=False)
+            store('spielsitzung.json', _iter_json(game_session_data))
         
         # 4. KONFIGURATION.JSON - Rundenspezifische FieldConfiguration Daten
-        field_configs_data = []
-        from app.models import RoundFieldConfiguration
-        round_configs = RoundFieldConfiguration.query.filter_by(game_round_id=round_obj.id).all()
-        
-        for config in round_configs:
-            config_data = {
-                'field_type': config.field_type,
-                'display_name': config.display_name,
-                'description': config.description,
-                'is_enabled': config.is_enabled,
-                'frequency_type': config.frequency_type,
-                'frequency_value': config.frequency_value,
-                'color_hex': config.color_hex,
-                'emission_hex': config.emission_hex,
-                'icon': config.icon,
-                'config_data': config.config_data
-            }
-            field_configs_data.append(config_data)
-        
-        with open(os.path.join(round_path, 'konfiguration.json'), 'w', encoding='utf-8') as f:
-            json.dump(field_configs_data, f, indent=2, ensure_ascii=False)
-        
-        # 5. MINIGAMES/ - Kopie der Minigame-Ordner
+        round_configs = RoundFieldConfiguration.query.filter_by(game_round_id=round_obj.id).order_by(
+            RoundFieldConfiguration.field_type)
+        store('konfiguration.json', _iter_json_list({
+            'field_type': config.field_type,
+            'display_name': config.display_name,
+            'description': config.description,
+            'is_enabled': config.is_enabled,
+            'frequency_type': config.frequency_type,
+            'frequency_value': config.frequency_value,
+            'color_hex': config.color_hex,
+            'emission_hex': config.emission_hex,
+            'icon': config.icon,
+            'config_data': config.config_data
+        } for config in round_configs))
+        
+        # 5. MINIGAMES/ - Kopie der Minigame-Ordner (nur geänderte Dateien)
         minigames_path = os.path.join(round_path, 'minigames')
         os.makedirs(minigames_path, exist_ok=True)
         
-        # Sammle MinigameFolder Daten und kopiere Inhalte
-        from app.models import MinigameFolder
         folders = MinigameFolder.query.all()
         
         for folder in folders:
@@ -518,43 +658,121 @@ def save_round_to_filesystem(round_obj) -> bool:
                 folder_target_path = os.path.join(minigames_path, folder.folder_path)
                 os.makedirs(folder_target_path, exist_ok=True)
                 
-                # Kopiere minigames.json
+                relpath = f"minigames/{folder.folder_path}/minigames.json"
                 source_json = get_folder_json_path(folder.folder_path)
-                target_json = os.path.join(folder_target_path, 'minigames.json')
                 
                 if os.path.exists(source_json):
-                    shutil.copy2(source_json, target_json)
+                    entry, written = _copy_backup_file(source_json, round_path, relpath,
+                                                       previous_files.get(relpath), digest_cache)
+                    files[relpath] = entry
+                    if written:
+                        written_files.append(relpath)
                 else:
                     # Fallback: Erstelle leere JSON-Datei
-                    with open(target_json, 'w', encoding='utf-8') as f:
-                        json.dump({'minigames': []}, f, indent=2, ensure_ascii=False)
-                
-                print(f"✅ Minigame-Ordner '{folder.folder_path}' gesichert")
+                    store(relpath, _iter_json({'minigames': []}))
                 
             except Exception as folder_e:
                 print(f"⚠️ Fehler beim Sichern des Ordners '{folder.folder_path}': {folder_e}")
         
         # 6. ORDNER-METADATEN - Informationen über Minigame-Ordner
-        folders_data = []
-        for folder in folders:
-            folder_data = {
-                'name': folder.name,
-                'description': folder.description,
-                'folder_path': folder.folder_path,
-                'created_at': folder.created_at.isoformat() if folder.created_at else None
-            }
-            folders_data.append(folder_data)
-        
-        with open(os.path.join(round_path, 'ordner.json'), 'w', encoding='utf-8') as f:
-            json.dump(folders_data, f, indent=2, ensure_ascii=False)
+        store('ordner.json', _iter_json_list({
+            'name': folder.name,
+            'description': folder.description,
+            'folder_path': folder.folder_path,
+            'created_at': folder.created_at.isoformat() if folder.created_at else None
+        } for folder in folders))
+        
+        # Unveränderte Dateien aus früheren Sicherungen (z.B. spielsitzung.json ohne aktive Sitzung) behalten
+        for relpath, entry in previous_files.items():
+            if relpath not in files and os.path.exists(os.path.join(round_path, relpath)):
+                files[relpath] = entry
+        
+        # 7. MANIFEST.JSON - Übersicht für die Backup-Seite
+        manifest = {
+            'manifest_version': BACKUP_MANIFEST_VERSION,
+            'round': dict(rundeninfo, saved_at=saved_at),
+            'saved_at': saved_at,
+            'team_count': team_count,
+            'files': files,
+            'total_size': sum(entry['size'] for entry in files.values()),
+            'written_files': written_files
+        }
+        manifest_path = os.path.join(round_path, BACKUP_MANIFEST_FILE)
+        with open(f"{manifest_path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
         
-        print(f"✅ Spielstand '{round_obj.name}' erfolgreich in '{round_path}' gespeichert")
+        print(f"✅ Spielstand '{round_obj.name}' erfolgreich in '{round_path}' gespeichert "
+              f"({len(written_files)} von {len(files)} Dateien geändert)")
         return True
         
     except Exception as e:
         print(f"❌ Fehler beim Speichern der Runde '{round_obj.name}': {e}")
         return False
 
+def _directory_size(path: str) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, filename))
+            except OSError:
+                continue
+    return total
+
+def load_backup_summaries() -> List[dict]:
+    """
+    Lädt die Übersicht aller gesicherten Runden für die Backup-Seite.
+    
+    Liest pro Runde nur das Manifest; Backups ohne Manifest (ältere Versionen)
+    werden vollständig geladen und ihre Größe über das Dateisystem bestimmt.
+    
+    Returns:
+        List[dict]: name, description, minigame_folder_name, saved_at, team_count, size
+    """
+    rounds_path = get_saved_rounds_path()
+    
+    if not os.path.exists(rounds_path):
+        return []
+    
+    summaries = []
+    for item in sorted(os.listdir(rounds_path)):
+        item_path = os.path.join(rounds_path, item)
+        try:
+            if os.path.isdir(item_path):
+                manifest = read_backup_manifest(item_path)
+                if manifest:
+                    round_info = manifest.get('round', {})
+                    team_count = manifest.get('team_count', 0)
+                    size = manifest.get('total_size', 0)
+                else:
+                    round_info = load_round_from_new_structure(item_path)
+                    if not round_info:
+                        continue
+                    team_count = len(round_info.get('teams') or [])
+                    size = _directory_size(item_path)
+            elif item.endswith('.json'):
+                with open(item_path, 'r', encoding='utf-8') as f:
+                    round_info = json.load(f)
+                team_count = len(round_info.get('teams') or [])
+                size = os.path.getsize(item_path)
+            else:
+                continue
+        except Exception as e:
+            print(f"Fehler beim Lesen des Backups '{item}': {e}")
+            continue
+        
+        summaries.append({
+            'name': round_info.get('name', 'Unbekannt'),
+            'description': round_info.get('description', ''),
+            'minigame_folder_name': round_info.get('minigame_folder_name'),
+            'saved_at': round_info.get('saved_at'),
+            'team_count': team_count,
+            'size': size
+        })
+    
+    return summaries
+
 def load_rounds_from_filesystem() -> List[dict]:
     """
     Lädt alle gespeicherten Runden aus dem neuen Dateisystem.
@@ -672,7 +890,8 @@ def load_round_from_new_structure(round_path: str) -> dict:
             'minigame_folder_name': rundeninfo.get('minigame_folder_name'),
             'is_active': rundeninfo.get('is_active', False),
             'created_at': rundeninfo.get('created_at'),
-            'saved_at': rundeninfo.get('saved_at'),
+            # Neuere Backups führen saved_at nur im Manifest
+            'saved_at': rundeninfo.get('saved_at') or (read_backup_manifest(round_path) or {}).get('saved_at'),
             'version': rundeninfo.get('version', '2.0'),
             
             # Neue Struktur
@@ -693,209 +912,360 @@ def load_round_from_new_structure(round_path: str) -> dict:
         print(f"Fehler beim Laden der Runde aus {round_path}: {e}")
         return None
 
-def restore_rounds_to_database() -> int:
+def _parse_backup_datetime(value):
+    """Parst einen ISO-Zeitstempel aus einem Backup (None bleibt None)"""
+    return datetime.fromisoformat(value) if value else None
+
+def _check_backup_datetime(value, label: str, errors: List[str]):
+    try:
+        _parse_backup_datetime(value)
+    except (TypeError, ValueError):
+        errors.append(f"{label}: ungültiger Zeitstempel '{value}'")
+
+def _print_restore_progress(stage: str, done: int, total: int):
+    print(f"🔄 Wiederherstellung {stage}: {done}/{total}")
+
+def validate_saved_rounds(saved_rounds: List[dict]) -> List[str]:
     """
-    Stellt alle gespeicherten Runden mit kompletten Spielzustand aus dem Dateisystem wieder her.
+    Prüft alle gesicherten Runden, bevor etwas in die Datenbank geschrieben wird.
     
+    Args:
+        saved_rounds: Runden-Daten aus load_rounds_from_filesystem()
+        
     Returns:
-        int: Anzahl der wiederhergestellten Runden
+        List[str]: Gefundene Fehler (leer wenn das Archiv gültig ist)
     """
-    from app.models import GameRound, MinigameFolder, Team, GameSession, FieldConfiguration
-    from app import db
-    from datetime import datetime
+    errors = []
+    seen_names = set()
+    
+    for index, round_data in enumerate(saved_rounds):
+        if not isinstance(round_data, dict) or not round_data.get('name'):
+            errors.append(f"Runde #{index + 1}: Name fehlt")
+            continue
+        name = round_data['name']
+        label = f"Runde '{name}'"
+        if name in seen_names:
+            errors.append(f"{label}: mehrfach im Archiv vorhanden")
+        seen_names.add(name)
+        
+        _check_backup_datetime(round_data.get('created_at'), label, errors)
+        
+        for team_data in round_data.get('teams') or []:
+            if not isinstance(team_data, dict) or not team_data.get('name'):
+                errors.append(f"{label}: Team ohne Namen")
+        for config_data in round_data.get('field_configurations') or []:
+            if not isinstance(config_data, dict) or not config_data.get('field_type'):
+                errors.append(f"{label}: Feld-Konfiguration ohne Feld-Typ")
+        for folder_data in round_data.get('minigame_folders') or []:
+            if not isinstance(folder_data, dict) or not folder_data.get('name'):
+                errors.append(f"{label}: Minigame-Ordner ohne Namen")
+            else:
+                _check_backup_datetime(folder_data.get('created_at'), label, errors)
+        
+        session_data = round_data.get('game_session')
+        if session_data is not None:
+            if not isinstance(session_data, dict):
+                errors.append(f"{label}: ungültige Spielsitzung")
+            else:
+                for key in ('start_time', 'end_time', 'volcano_last_triggered'):
+                    _check_backup_datetime(session_data.get(key), f"{label} ({key})", errors)
+    
+    return errors
+
+def restore_saved_rounds(saved_rounds: Optional[List[dict]] = None, progress=None) -> dict:
+    """
+    Stellt gesicherte Runden gebündelt und in einer Transaktion wieder her.
     
-    saved_rounds = load_rounds_from_filesystem()
+    Ablauf: Das gesamte Archiv wird zuerst validiert; bei Fehlern wird nichts geschrieben.
+    Vorhandene Namen werden einmal pro Tabelle vorgeladen, danach wird je Tabelle
+    ein Bulk-INSERT ausgeführt und am Ende einmal committet. Die Minigame-Inhalte
+    werden erst nach erfolgreichem Commit zusammengeführt (pro Ordner einmal).
+    
+    Args:
+        saved_rounds: Runden-Daten (Standard: load_rounds_from_filesystem())
+        progress: Optionaler Callback progress(stage, done, total)
+        
+    Returns:
+        dict: {'restored': int, 'skipped': List[str], 'errors': List[str]}
+    """
+    from sqlalchemy import insert, update
+    from app.models import (GameRound, MinigameFolder, Team, GameSession, RoundFieldConfiguration,
+                            PlayedContent, PlayerRotation, TeamMember, build_character_render_data)
+    from app.game_logic.field_config_cache import invalidate_field_config_cache
+    from app.game_logic.team_index import invalidate_team_index
+    from app import db
     
+    progress = progress or _print_restore_progress
+    if saved_rounds is None:
+        saved_rounds = load_rounds_from_filesystem()
+    result = {'restored': 0, 'skipped': [], 'errors': []}
     if not saved_rounds:
-        return 0
+        return result
     
-    restored_count = 0
+    # 1. Vorhandene Namen einmal pro Tabelle vorladen
+    existing_round_names = {name for (name,) in db.session.query(GameRound.name)}
+    existing_team_names = {name for (name,) in db.session.query(Team.name)}
+    folder_ids = {name: folder_id for name, folder_id in db.session.query(MinigameFolder.name, MinigameFolder.id)}
     
+    # 2. Gesamtes Archiv validieren, bevor geschrieben wird
+    errors = validate_saved_rounds(saved_rounds)
+    progress('validiert', len(saved_rounds), len(saved_rounds))
+    if errors:
+        result['errors'] = errors
+        return result
+    
+    pending_rounds = []
     for round_data in saved_rounds:
-        try:
-            # Prüfe ob Runde bereits existiert
-            existing_round = GameRound.query.filter_by(name=round_data['name']).first()
-            if existing_round:
-                continue
-            
-            # Finde den zugehörigen MinigameFolder
-            folder = None
-            if round_data.get('minigame_folder_name'):
-                folder = MinigameFolder.query.filter_by(name=round_data['minigame_folder_name']).first()
-            
-            if not folder:
-                print(f"⚠️  Ordner '{round_data.get('minigame_folder_name')}' für Runde '{round_data['name']}' nicht gefunden. Überspringe.")
-                continue
-            
-            # Erstelle neue GameRound
-            new_round = GameRound(
-                name=round_data['name'],
-                description=round_data.get('description', ''),
-                minigame_folder_id=folder.id,
-                is_active=False,  # Setze nicht automatisch als aktiv
-                created_at=datetime.fromisoformat(round_data['created_at']) if round_data.get('created_at') else datetime.utcnow()
-            )
-            
-            db.session.add(new_round)
-            db.session.flush()  # Um die ID zu bekommen
-            
-            # Wiederherstellung der Teams falls vorhanden
-            if round_data.get('teams'):
-                _restore_teams_from_data(round_data['teams'])
-            
-            # Wiederherstellung der rundenspezifischen FieldConfigurations falls vorhanden
-            if round_data.get('field_configurations'):
-                _restore_field_configurations_from_data(round_data['field_configurations'], new_round.id)
-            
-            # Wiederherstellung der MinigameFolders falls vorhanden
-            if round_data.get('minigame_folders'):
-                _restore_minigame_folders_from_data(round_data['minigame_folders'])
-            
-            # Wiederherstellung der Minigame-Inhalte falls vorhanden
-            _restore_minigame_contents_from_new_structure(round_data)
-            
-            # Wiederherstellung der GameSession falls vorhanden
-            if round_data.get('game_session'):
-                _restore_game_session_from_data(round_data['game_session'], new_round.id)
-            
-            restored_count += 1
-            
-        except Exception as e:
-            print(f"Fehler beim Wiederherstellen der Runde '{round_data.get('name', 'Unbekannt')}': {e}")
-            continue
+        if round_data['name'] in existing_round_names:
+            result['skipped'].append(round_data['name'])
+        else:
+            pending_rounds.append(round_data)
+    if not pending_rounds:
+        return result
     
     try:
+        # 3. MinigameFolder (nur fehlende, erster Eintrag gewinnt)
+        folder_rows = {}
+        for round_data in pending_rounds:
+            for folder_data in round_data.get('minigame_folders') or []:
+                name = folder_data['name']
+                if name in folder_ids or name in folder_rows:
+                    continue
+                folder_rows[name] = {
+                    'name': name,
+                    'description': folder_data.get('description', ''),
+                    'folder_path': folder_data.get('folder_path', name),
+                    'created_at': _parse_backup_datetime(folder_data.get('created_at')) or datetime.utcnow()
+                }
+        if folder_rows:
+            db.session.execute(insert(MinigameFolder), list(folder_rows.values()))
+            folder_ids.update(db.session.query(MinigameFolder.name, MinigameFolder.id).filter(
+                MinigameFolder.name.in_(list(folder_rows))))
+        progress('Minigame-Ordner', len(folder_rows), len(folder_rows))
+        
+        # 4. Runden
+        round_rows = []
+        for round_data in pending_rounds:
+            folder_id = folder_ids.get(round_data.get('minigame_folder_name'))
+            if folder_id is None:
+                print(f"⚠️  Ordner '{round_data.get('minigame_folder_name')}' für Runde '{round_data['name']}' nicht gefunden. Überspringe.")
+                result['skipped'].append(round_data['name'])
+                continue
+            round_rows.append({
+                'name': round_data['name'],
+                'description': round_data.get('description', ''),
+                'minigame_folder_id': folder_id,
+                'is_active': False,  # Setze nicht automatisch als aktiv
+                'created_at': _parse_backup_datetime(round_data.get('created_at')) or datetime.utcnow()
+            })
+        if not round_rows:
+            db.session.commit()
+            return result
+        db.session.execute(insert(GameRound), round_rows)
+        round_ids = dict(db.session.query(GameRound.name, GameRound.id).filter(
+            GameRound.name.in_([row['name'] for row in round_rows])))
+        pending_rounds = [r for r in pending_rounds if r['name'] in round_ids]
+        progress('Runden', len(round_rows), len(round_rows))
+        
+        # 5. Teams (nur fehlende Namen, erster Eintrag gewinnt)
+        team_rows = {}
+        team_members = {}  # {team_name: team_member-Zeilen}
+        for round_data in pending_rounds:
+            for team_data in round_data.get('teams') or []:
+                name = team_data['name']
+                if name in existing_team_names or name in team_rows:
+                    continue
+                team_rows[name] = {
+                    'name': name,
+                    'password_hash': team_data.get('password_hash'),
+                    'welcome_password': team_data.get('welcome_password'),
+                    'character_name': team_data.get('character_name'),
+                    'character_id': team_data.get('character_id'),
+                    'character_customization': team_data.get('character_customization'),
+                    'character_render_data': build_character_render_data(team_data.get('character_customization')),
+                    'current_position': team_data.get('current_position') or 0,
+                    'minigame_placement': team_data.get('minigame_placement'),
+                    'bonus_dice_sides': team_data.get('bonus_dice_sides') or 0,
+                    'last_dice_result': team_data.get('last_dice_result'),
+                    'is_blocked': bool(team_data.get('is_blocked')),
+                    'blocked_target_number': team_data.get('blocked_target_number'),
+                    'blocked_config': team_data.get('blocked_config'),
+                    'blocked_turns_remaining': team_data.get('blocked_turns_remaining') or 0,
+                    'extra_moves_remaining': team_data.get('extra_moves_remaining') or 0
+                }
+                # Mitglieder samt Einstellungen nach team_member; in den JSON-Spalten bleiben nur Nicht-Mitglieder
+                rows, extra_config, extra_images = TeamMember.rows_from_legacy(
+                    None, team_data.get('members'),
+                    _loads_or_empty(team_data.get('player_config')), _loads_or_empty(team_data.get('profile_images')))
+                team_members[name] = rows
+                team_rows[name].update(player_config=_dumps_or_none(extra_config),
+                                       profile_images=_dumps_or_none(extra_images))
+        if team_rows:
+            db.session.execute(insert(Team), list(team_rows.values()))
+            invalidate_team_index()
+            team_ids = dict(db.session.query(Team.name, Team.id).filter(Team.name.in_(list(team_rows))))
+            member_rows = []
+            for name, rows in team_members.items():
+                for row in rows:
+                    row['team_id'] = team_ids[name]
+                member_rows.extend(rows)
+            if member_rows:
+                db.session.execute(insert(TeamMember), member_rows)
+        progress('Teams', len(team_rows), len(team_rows))
+        
+        # 6. Rundenspezifische Feld-Konfigurationen (neue Runden haben noch keine Zeilen)
+        config_rows = []
+        for round_data in pending_rounds:
+            seen_field_types = set()
+            for config_data in round_data.get('field_configurations') or []:
+                if config_data['field_type'] in seen_field_types:
+                    continue
+                seen_field_types.add(config_data['field_type'])
+                config_rows.append({
+                    'game_round_id': round_ids[round_data['name']],
+                    'field_type': config_data['field_type'],
+                    'display_name': config_data.get('display_name', ''),
+                    'description': config_data.get('description', ''),
+                    'is_enabled': config_data.get('is_enabled', True),
+                    'frequency_type': config_data.get('frequency_type', 'modulo'),
+                    'frequency_value': config_data.get('frequency_value', 10),
+                    'color_hex': config_data.get('color_hex', '#00FF00'),
+                    'emission_hex': config_data.get('emission_hex', '#00CC00'),
+                    'icon': config_data.get('icon', '⬜'),
+                    'config_data': config_data.get('config_data')
+                })
+        if config_rows:
+            db.session.execute(insert(RoundFieldConfiguration), config_rows)
+            invalidate_field_config_cache()
+        progress('Feld-Konfigurationen', len(config_rows), len(config_rows))
+        
+        # 7. Spielsitzungen (werden nicht automatisch aktiviert)
+        session_rows = []
+        session_rotations = []  # {team_name: {spieler: anzahl}} pro Sitzung
+        for round_data in pending_rounds:
+            session_data = round_data.get('game_session')
+            if not session_data:
+                continue
+            session_rotations.append(_rotation_by_team_name(session_data.get('player_rotation_data'),
+                                                            round_data.get('teams')))
+            session_rows.append({
+                'game_round_id': round_ids[round_data['name']],
+                'start_time': _parse_backup_datetime(session_data.get('start_time')) or datetime.utcnow(),
+                'end_time': _parse_backup_datetime(session_data.get('end_time')),
+                'is_active': False,
+                'current_minigame_name': session_data.get('current_minigame_name'),
+                'current_minigame_description': session_data.get('current_minigame_description'),
+                'current_player_count': session_data.get('current_player_count', '1'),
+                'selected_players': session_data.get('selected_players'),
+                'current_question_id': session_data.get('current_question_id'),
+                'selected_folder_minigame_id': session_data.get('selected_folder_minigame_id'),
+                'minigame_source': session_data.get('minigame_source', 'manual'),
+                'played_content_ids': session_data.get('played_content_ids', ''),
+                'player_rotation_data': None,  # Alte Team-IDs; die Rotation steht in player_rotation
+                'current_phase': session_data.get('current_phase', 'SETUP_MINIGAME'),
+                'dice_roll_order': session_data.get('dice_roll_order'),
+                'current_team_turn_id': session_data.get('current_team_turn_id'),
+                'volcano_countdown': session_data.get('volcano_countdown', 0),
+                'volcano_active': session_data.get('volcano_active', False),
+                'volcano_last_triggered': _parse_backup_datetime(session_data.get('volcano_last_triggered')),
+                'field_minigame_mode': session_data.get('field_minigame_mode'),
+                'field_minigame_landing_team_id': session_data.get('field_minigame_landing_team_id'),
+                'field_minigame_opponent_team_id': session_data.get('field_minigame_opponent_team_id'),
+                'field_minigame_content_id': session_data.get('field_minigame_content_id'),
+                'field_minigame_content_type': session_data.get('field_minigame_content_type'),
+                'field_minigame_result': session_data.get('field_minigame_result')
+            })
+        if session_rows:
+            # Wie bisher: eine aktive Sitzung wird beim Wiederherstellen beendet
+            db.session.execute(update(GameSession).where(GameSession.is_active.is_(True)).values(is_active=False))
+            session_ids = db.session.scalars(
+                insert(GameSession).returning(GameSession.id, sort_by_parameter_order=True), session_rows
+            ).all()
+            played_rows = [
+                {'game_session_id': session_id, 'content_id': content_id, 'played_at': row['start_time']}
+                for session_id, row in zip(session_ids, session_rows)
+                for content_id in dict.fromkeys(_split_content_ids(row['played_content_ids']))
+            ]
+            if played_rows:
+                db.session.execute(insert(PlayedContent), played_rows)
+            # Rotation über den Team-Namen auf die neuen IDs abbilden; nicht auflösbare Teams entfallen
+            rotation_team_names = {name for rotation in session_rotations for name in rotation}
+            rotation_team_ids = dict(db.session.query(Team.name, Team.id).filter(
+                Team.name.in_(list(rotation_team_names)))) if rotation_team_names else {}
+            rotation_rows = [
+                {'game_session_id': session_id, 'team_id': rotation_team_ids[team_name],
+                 'player_name': player_name, 'play_count': play_count}
+                for session_id, rotation in zip(session_ids, session_rotations)
+                for team_name, players in rotation.items() if team_name in rotation_team_ids
+                for player_name, play_count in players.items()
+            ]
+            if rotation_rows:
+                db.session.execute(insert(PlayerRotation), rotation_rows)
+        progress('Spielsitzungen', len(session_rows), len(session_rows))
+        
         db.session.commit()
-        return restored_count
     except Exception as e:
         db.session.rollback()
         print(f"Fehler beim Speichern der wiederhergestellten Runden: {e}")
-        return 0
-
-def _restore_teams_from_data(teams_data):
-    """Hilfsfunktion zur Wiederherstellung der Teams aus den Backup-Daten"""
-    from app.models import Team
-    from app import db
+        result['errors'].append(f"Fehler beim Speichern: {e}")
+        return result
     
-    for team_data in teams_data:
-        try:
-            # Prüfe ob Team bereits existiert
-            existing_team = Team.query.filter_by(name=team_data['name']).first()
-            if existing_team:
-                continue
-            
-            # Erstelle neues Team
-            team = Team(
-                name=team_data['name'],
-                password_hash=team_data.get('password_hash'),
-                welcome_password=team_data.get('welcome_password'),
-                members=team_data.get('members'),
-                player_config=team_data.get('player_config'),
-                profile_images=team_data.get('profile_images'),
-                character_name=team_data.get('character_name'),
-                character_id=team_data.get('character_id'),
-                character_customization=team_data.get('character_customization'),
-                current_position=team_data.get('current_position', 0),
-                minigame_placement=team_data.get('minigame_placement'),
-                bonus_dice_sides=team_data.get('bonus_dice_sides', 0),
-                last_dice_result=team_data.get('last_dice_result'),
-                is_blocked=team_data.get('is_blocked', False),
-                blocked_target_number=team_data.get('blocked_target_number'),
-                blocked_config=team_data.get('blocked_config'),
-                blocked_turns_remaining=team_data.get('blocked_turns_remaining', 0),
-                extra_moves_remaining=team_data.get('extra_moves_remaining', 0)
-            )
-            
-            db.session.add(team)
-            
-        except Exception as e:
-            print(f"Fehler beim Wiederherstellen des Teams '{team_data.get('name', 'Unbekannt')}': {e}")
-            continue
+    result['restored'] = len(pending_rounds)
+    
+    # 8. Minigame-Inhalte zusammenführen (Dateisystem, nach erfolgreichem Commit)
+    _merge_minigame_contents_from_backups(pending_rounds)
+    progress('Minigame-Inhalte', len(pending_rounds), len(pending_rounds))
+    
+    return result
 
-def _restore_field_configurations_from_data(field_configs_data, round_id):
-    """Hilfsfunktion zur Wiederherstellung der rundenspezifischen FieldConfigurations aus den Backup-Daten"""
-    from app.models import RoundFieldConfiguration
-    from app import db
+def restore_rounds_to_database() -> int:
+    """
+    Stellt alle gespeicherten Runden mit kompletten Spielzustand aus dem Dateisystem wieder her.
     
-    for config_data in field_configs_data:
-        try:
-            # Prüfe ob rundenspezifische Konfiguration bereits existiert
-            existing_config = RoundFieldConfiguration.query.filter_by(
-                game_round_id=round_id,
-                field_type=config_data['field_type']
-            ).first()
-            
-            if existing_config:
-                # Aktualisiere existierende Konfiguration
-                existing_config.display_name = config_data.get('display_name', existing_config.display_name)
-                existing_config.description = config_data.get('description', existing_config.description)
-                existing_config.is_enabled = config_data.get('is_enabled', existing_config.is_enabled)
-                existing_config.frequency_type = config_data.get('frequency_type', existing_config.frequency_type)
-                existing_config.frequency_value = config_data.get('frequency_value', existing_config.frequency_value)
-                existing_config.color_hex = config_data.get('color_hex', existing_config.color_hex)
-                existing_config.emission_hex = config_data.get('emission_hex', existing_config.emission_hex)
-                existing_config.icon = config_data.get('icon', existing_config.icon)
-                existing_config.config_data = config_data.get('config_data', existing_config.config_data)
-                continue
-            
-            # Erstelle neue rundenspezifische FieldConfiguration
-            round_config = RoundFieldConfiguration(
-                game_round_id=round_id,
-                field_type=config_data['field_type'],
-                display_name=config_data.get('display_name', ''),
-                description=config_data.get('description', ''),
-                is_enabled=config_data.get('is_enabled', True),
-                frequency_type=config_data.get('frequency_type', 'modulo'),
-                frequency_value=config_data.get('frequency_value', 10),
-                color_hex=config_data.get('color_hex', '#00FF00'),
-                emission_hex=config_data.get('emission_hex', '#00CC00'),
-                icon=config_data.get('icon', '⬜'),
-                config_data=config_data.get('config_data')
-            )
-            
-            db.session.add(round_config)
-            
-        except Exception as e:
-            print(f"Fehler beim Wiederherstellen der rundenspezifischen FieldConfiguration '{config_data.get('field_type', 'Unbekannt')}': {e}")
-            continue
+    Returns:
+        int: Anzahl der wiederhergestellten Runden
+    """
+    result = restore_saved_rounds()
+    for error in result['errors']:
+        print(f"⚠️  {error}")
+    return result['restored']
 
-def _restore_minigame_folders_from_data(folders_data):
-    """Hilfsfunktion zur Wiederherstellung der MinigameFolders aus den Backup-Daten"""
-    from app.models import MinigameFolder
-    from app import db
-    from datetime import datetime
+def _collect_minigame_backup_items(round_data, contents: Dict[str, list]):
+    """Sammelt die gesicherten Minigame-Inhalte einer Runde pro Ordner"""
+    # Alte Struktur: Inhalte liegen direkt in den Runden-Daten
+    if round_data.get('structure_type') != 'new_folder':
+        for folder_path, folder_content in (round_data.get('minigame_contents') or {}).items():
+            contents.setdefault(folder_path, []).extend(folder_content)
+        return
+    
+    # Neue Ordnerstruktur - gesicherte minigames.json-Dateien lesen
+    round_path = round_data.get('round_path')
+    minigames_backup_path = os.path.join(round_path, 'minigames') if round_path else None
+    if not minigames_backup_path or not os.path.exists(minigames_backup_path):
+        return
     
-    for folder_data in folders_data:
+    for folder_name in os.listdir(minigames_backup_path):
+        source_json = os.path.join(minigames_backup_path, folder_name, 'minigames.json')
+        if not os.path.exists(source_json):
+            continue
         try:
-            # Prüfe ob MinigameFolder bereits existiert
-            existing_folder = MinigameFolder.query.filter_by(name=folder_data['name']).first()
-            if existing_folder:
-                continue
-            
-            # Erstelle neuen MinigameFolder
-            folder = MinigameFolder(
-                name=folder_data['name'],
-                description=folder_data.get('description', ''),
-                folder_path=folder_data.get('folder_path', folder_data['name']),
-                created_at=datetime.fromisoformat(folder_data['created_at']) if folder_data.get('created_at') else datetime.utcnow()
-            )
-            
-            db.session.add(folder)
-            
+            with open(source_json, 'r', encoding='utf-8') as f:
+                backup_data = json.load(f)
+            contents.setdefault(folder_name, []).extend(backup_data.get('minigames', []))
         except Exception as e:
-            print(f"Fehler beim Wiederherstellen des MinigameFolder '{folder_data.get('name', 'Unbekannt')}': {e}")
-            continue
+            print(f"Fehler beim Lesen der gesicherten Inhalte für Ordner '{folder_name}': {e}")
 
-def _restore_minigame_contents_from_data(contents_data):
-    """Hilfsfunktion zur Wiederherstellung der Minigame-Inhalte aus den Backup-Daten"""
-    import json
+def _merge_minigame_contents_from_backups(rounds_data):
+    """Führt die Minigame-Inhalte aller Runden zusammen - jede Ordner-JSON wird nur einmal geschrieben"""
+    contents = {}
+    for round_data in rounds_data:
+        _collect_minigame_backup_items(round_data, contents)
     
-    for folder_path, folder_content in contents_data.items():
+    for folder_path, items in contents.items():
         try:
             # Erstelle Ordner falls nicht vorhanden
             create_minigame_folder_if_not_exists(folder_path, f"Wiederhergestellter Ordner: {folder_path}")
             
-            # Lade aktuelle Inhalte
             json_path = get_folder_json_path(folder_path)
             if os.path.exists(json_path):
                 with open(json_path, 'r', encoding='utf-8') as f:
@@ -903,134 +1273,25 @@ def _restore_minigame_contents_from_data(contents_data):
             else:
                 current_data = {'minigames': []}
             
-            # Prüfe welche Inhalte bereits vorhanden sind
+            # Nur Inhalte mit neuen IDs übernehmen
             existing_ids = {item.get('id') for item in current_data.get('minigames', [])}
-            
-            # Füge neue Inhalte hinzu
-            for item in folder_content:
+            added = 0
+            for item in items:
                 if item.get('id') not in existing_ids:
                     current_data['minigames'].append(item)
+                    existing_ids.add(item.get('id'))
+                    added += 1
             
-            # Speichere aktualisierte Daten
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(current_data, f, indent=2, ensure_ascii=False)
+            if added:
+                with open(json_path, 'w', encoding='utf-8') as f:
+                    json.dump(current_data, f, indent=2, ensure_ascii=False)
             
-            print(f"✅ Minigame-Inhalte für Ordner '{folder_path}' wiederhergestellt")
+            print(f"✅ Minigame-Inhalte für Ordner '{folder_path}' wiederhergestellt ({added} neu)")
             
         except Exception as e:
             print(f"Fehler beim Wiederherstellen der Inhalte für Ordner '{folder_path}': {e}")
             continue
 
-def _restore_minigame_contents_from_new_structure(round_data):
-    """Hilfsfunktion zur Wiederherstellung der Minigame-Inhalte aus der neuen Ordnerstruktur"""
-    import json
-    import shutil
-    
-    # Prüfe ob es sich um die neue Ordnerstruktur handelt
-    if round_data.get('structure_type') != 'new_folder':
-        # Fallback zur alten Methode
-        if 'minigame_contents' in round_data:
-            _restore_minigame_contents_from_data(round_data['minigame_contents'])
-        return
-    
-    # Neue Ordnerstruktur - kopiere Minigame-Ordner direkt
-    round_path = round_data.get('round_path')
-    if not round_path:
-        return
-    
-    minigames_backup_path = os.path.join(round_path, 'minigames')
-    if not os.path.exists(minigames_backup_path):
-        return
-    
-    # Durchsuche alle gesicherten Minigame-Ordner
-    for folder_name in os.listdir(minigames_backup_path):
-        folder_backup_path = os.path.join(minigames_backup_path, folder_name)
-        
-        if not os.path.isdir(folder_backup_path):
-            continue
-        
-        try:
-            # Erstelle Ziel-Ordner
-            create_minigame_folder_if_not_exists(folder_name, f"Wiederhergestellter Ordner: {folder_name}")
-            
-            # Kopiere minigames.json
-            source_json = os.path.join(folder_backup_path, 'minigames.json')
-            target_json = get_folder_json_path(folder_name)
-            
-            if os.path.exists(source_json):
-                # Merge mit existierendem Inhalt
-                existing_data = {'minigames': []}
-                if os.path.exists(target_json):
-                    with open(target_json, 'r', encoding='utf-8') as f:
-                        existing_data = json.load(f)
-                
-                # Lade Backup-Daten
-                with open(source_json, 'r', encoding='utf-8') as f:
-                    backup_data = json.load(f)
-                
-                # Merge Inhalte
-                existing_ids = {item.get('id') for item in existing_data.get('minigames', [])}
-                for item in backup_data.get('minigames', []):
-                    if item.get('id') not in existing_ids:
-                        existing_data['minigames'].append(item)
-                
-                # Speichere gemergten Inhalt
-                with open(target_json, 'w', encoding='utf-8') as f:
-                    json.dump(existing_data, f, indent=2, ensure_ascii=False)
-                
-                print(f"✅ Minigame-Ordner '{folder_name}' aus neuer Struktur wiederhergestellt")
-            
-        except Exception as e:
-            print(f"Fehler beim Wiederherstellen des Ordners '{folder_name}': {e}")
-            continue
-
-def _restore_game_session_from_data(session_data, round_id):
-    """Hilfsfunktion zur Wiederherstellung der GameSession aus den Backup-Daten"""
-    from app.models import GameSession
-    from app import db
-    from datetime import datetime
-    
-    try:
-        # Prüfe ob bereits eine aktive GameSession existiert
-        existing_session = GameSession.query.filter_by(is_active=True).first()
-        if existing_session:
-            # Deaktiviere existierende Session
-            existing_session.is_active = False
-        
-        # Erstelle neue GameSession
-        session = GameSession(
-            game_round_id=round_id,
-            start_time=datetime.fromisoformat(session_data['start_time']) if session_data.get('start_time') else datetime.utcnow(),
-            end_time=datetime.fromisoformat(session_data['end_time']) if session_data.get('end_time') else None,
-            is_active=False,  # Nicht automatisch aktivieren
-            current_minigame_name=session_data.get('current_minigame_name'),
-            current_minigame_description=session_data.get('current_minigame_description'),
-            current_player_count=session_data.get('current_player_count', '1'),
-            selected_players=session_data.get('selected_players'),
-            current_question_id=session_data.get('current_question_id'),
-            selected_folder_minigame_id=session_data.get('selected_folder_minigame_id'),
-            minigame_source=session_data.get('minigame_source', 'manual'),
-            played_content_ids=session_data.get('played_content_ids', ''),
-            player_rotation_data=session_data.get('player_rotation_data'),
-            current_phase=session_data.get('current_phase', 'SETUP_MINIGAME'),
-            dice_roll_order=session_data.get('dice_roll_order'),
-            current_team_turn_id=session_data.get('current_team_turn_id'),
-            volcano_countdown=session_data.get('volcano_countdown', 0),
-            volcano_active=session_data.get('volcano_active', False),
-            volcano_last_triggered=datetime.fromisoformat(session_data['volcano_last_triggered']) if session_data.get('volcano_last_triggered') else None,
-            field_minigame_mode=session_data.get('field_minigame_mode'),
-            field_minigame_landing_team_id=session_data.get('field_minigame_landing_team_id'),
-            field_minigame_opponent_team_id=session_data.get('field_minigame_opponent_team_id'),
-            field_minigame_content_id=session_data.get('field_minigame_content_id'),
-            field_minigame_content_type=session_data.get('field_minigame_content_type'),
-            field_minigame_result=session_data.get('field_minigame_result')
-        )
-        
-        db.session.add(session)
-        
-    except Exception as e:
-        print(f"Fehler beim Wiederherstellen der GameSession: {e}")
-
 def delete_round_from_filesystem(round_name: str) -> bool:
     """
     Löscht eine gespeicherte Runde aus dem Dateisystem.
@@ -1098,10 +1359,12 @@ def backup_all_rounds_before_db_reset() -> int:
             return 0
         
         backed_up_count = 0
+        # Hashes der Minigame-Quelldateien werden für alle Runden nur einmal berechnet
+        digest_cache = {}
         
         for round_obj in rounds:
             try:
-                if save_round_to_filesystem(round_obj):
+                if save_round_to_filesystem(round_obj, digest_cache=digest_cache):
                     backed_up_count += 1
                     print(f"✅ Runde '{round_obj.name}' gesichert")
                 else:
@@ -1160,6 +1423,211 @@ def get_question_from_folder(folder_name: str, question_id: str) -> Optional[Dic
     
     return None
 
+# Pro Spielsitzung angehefteter Inhalt: {game_session_id: (content_id, json_pfad, mtime_ns, ContentSnapshot)}
+# Ändert sich die Ordner-JSON (auch durch andere Prozesse), wird der Snapshot neu aufgebaut
+_content_snapshots = {}
+
+@dataclass(frozen=True)
+class ContentSnapshot:
+    """
+    Unveränderlicher Stand des aktiven Inhalts (Frage oder Minispiel) einer Spielsitzung.
+    
+    Wird beim Festlegen des Inhalts einmal aus der Ordner-JSON aufgelöst; alle Leser
+    (Moderation, Spielbrett, Team-Dashboard) verwenden danach diesen Stand.
+    """
+    game_session_id: int
+    content_id: str
+    content_type: str
+    name: str
+    description: str
+    question_text: str
+    question_type: str
+    options: tuple
+    correct_option: Optional[int]
+    correct_text: str
+    correct_answer: Optional[str]
+    player_count: Optional[str]
+    data: Mapping[str, Any]
+    team_payload: Mapping[str, Any]
+
+    @property
+    def is_question(self) -> bool:
+        return self.content_type == 'question'
+
+def _build_content_snapshot(game_session_id: int, content: Dict[str, Any]) -> ContentSnapshot:
+    """Erstellt den Snapshot aus einem Eintrag der Ordner-JSON"""
+    data = copy.deepcopy(content)
+    content_type = data.get('type', 'game')
+    question_type = data.get('question_type', 'multiple_choice') if content_type == 'question' else ''
+    options = tuple(data.get('options') or ())
+    correct_option = data.get('correct_option')
+    if not isinstance(correct_option, int) or not 0 <= correct_option < len(options):
+        correct_option = None
+    correct_text = data.get('correct_text') or ''
+    
+    correct_answer = None
+    if question_type == 'multiple_choice' and correct_option is not None:
+        correct_answer = options[correct_option]
+    elif question_type == 'text_input' and correct_text:
+        correct_answer = correct_text
+    
+    # Fragetext unter verschiedenen Feldnamen (ältere Ordner-JSONs)
+    question_text = ''
+    if content_type == 'question':
+        question_text = (data.get('question_text') or data.get('question') or data.get('text') or
+                         data.get('content') or data.get('description') or '')
+    
+    team_payload = {
+        'id': data.get('id'),
+        'name': data.get('name', ''),
+        'description': data.get('description', ''),
+        'question_text': data.get('question_text', ''),
+        'question_type': question_type or 'multiple_choice',
+        'options': list(options)
+    }
+    
+    return ContentSnapshot(
+        game_session_id=game_session_id,
+        content_id=data.get('id'),
+        content_type=content_type,
+        name=data.get('name', ''),
+        description=data.get('description', ''),
+        question_text=question_text,
+        question_type=question_type,
+        options=options,
+        correct_option=correct_option,
+        correct_text=correct_text,
+        correct_answer=correct_answer,
+        player_count=data.get('player_count'),
+        data=MappingProxyType(data),
+        team_payload=MappingProxyType(team_payload)
+    )
+
+def _json_mtime(json_path: Optional[str]) -> Optional[int]:
+    if not json_path:
+        return None
+    try:
+        return os.stat(json_path).st_mtime_ns
+    except OSError:
+        return None
+
+def _active_folder_json_path() -> Optional[str]:
+    """Pfad der Ordner-JSON der aktiven Runde (oder None)"""
+    from ..models import GameRound
+    active_round = GameRound.get_active_round()
+    if active_round and active_round.minigame_folder:
+        return get_folder_json_path(active_round.minigame_folder.folder_path)
+    return None
+
+def pin_active_content(game_session_id: int, content: Dict[str, Any]) -> ContentSnapshot:
+    """Heftet den gerade festgelegten Inhalt an die Spielsitzung an"""
+    snapshot = _build_content_snapshot(game_session_id, content)
+    json_path = _active_folder_json_path()
+    _content_snapshots[game_session_id] = (snapshot.content_id, json_path, _json_mtime(json_path), snapshot)
+    return snapshot
+
+def unpin_active_content(game_session_id: int = None):
+    """Entfernt den angehefteten Inhalt einer Spielsitzung (ohne ID: aller Sitzungen)"""
+    if game_session_id is None:
+        _content_snapshots.clear()
+    else:
+        _content_snapshots.pop(game_session_id, None)
+
+def get_active_content(active_session) -> Optional[ContentSnapshot]:
+    """
+    Gibt den aktiven Inhalt der Spielsitzung zurück, ohne die Ordner-JSON erneut zu lesen.
+    
+    Ist (noch) nichts angeheftet - z.B. nach einem Neustart oder in einem anderen
+    Worker-Prozess - oder hat sich die Ordner-JSON seitdem geändert, wird der Inhalt aus
+    dem Ordner der aktiven Runde geladen. Nicht gefundene Inhalte werden nicht gemerkt.
+    """
+    if not active_session:
+        return None
+    content_id = active_session.current_question_id or active_session.selected_folder_minigame_id
+    if not content_id:
+        return None
+    
+    pinned = _content_snapshots.get(active_session.id)
+    if pinned is not None and pinned[0] == content_id and _json_mtime(pinned[1]) == pinned[2]:
+        return pinned[3]
+    
+    from ..models import GameRound
+    active_round = GameRound.get_active_round()
+    if not active_round or not active_round.minigame_folder:
+        return None
+    folder_name = active_round.minigame_folder.folder_path
+    json_path = get_folder_json_path(folder_name)
+    mtime = _json_mtime(json_path)  # vor dem Lesen: eine Änderung währenddessen baut beim nächsten Mal neu auf
+    content = get_minigame_from_folder(folder_name, content_id)
+    if not content:
+        _content_snapshots.pop(active_session.id, None)
+        return None
+    snapshot = _build_content_snapshot(active_session.id, content)
+    _content_snapshots[active_session.id] = (content_id, json_path, mtime, snapshot)
+    return snapshot
+
+def get_active_question(active_session) -> Optional[ContentSnapshot]:
+    """Wie get_active_content(), liefert aber nur eine aktive Frage"""
+    if not active_session or not active_session.current_question_id:
+        return None
+    snapshot = get_active_content(active_session)
+    if snapshot is None or not snapshot.is_question:
+        return None
+    return snapshot
+
+# Vorab geladene Ordner-Inhalte für geplante Abläufe: {folder_name: (mtime_ns der Ordner-JSON, {content_id: Inhalt})}
+_prefetched_content = {}
+
+def _prefetched_window(folder_name: str) -> Dict[str, Any]:
+    """Vorab geladene Inhalte eines Ordners, solange sich seine JSON-Datei nicht geändert hat"""
+    entry = _prefetched_content.get(folder_name)
+    if entry is None:
+        return {}
+    if _json_mtime(get_folder_json_path(folder_name)) != entry[0]:
+        # Außerhalb der App geändert (manuell, Wiederherstellung, anderer Prozess)
+        _prefetched_content.pop(folder_name, None)
+        return {}
+    return entry[1]
+
+def prefetch_folder_content(folder_name: str, content_ids: Iterable[str]) -> int:
+    """
+    Lädt die Inhalte der angegebenen IDs vorab in den Speicher.
+
+    Die Ordner-JSON wird nur gelesen, wenn mindestens eine ID noch nicht vorliegt;
+    Einträge außerhalb von content_ids werden verworfen, der Speicher bleibt also auf
+    das geplante Fenster begrenzt. Das Fenster gilt nur für den aktuellen Stand der
+    Ordner-JSON (mtime). Gibt die Anzahl neu geladener Inhalte zurück.
+    """
+    wanted = [content_id for content_id in content_ids if content_id]
+    # mtime vor dem Lesen: eine Änderung währenddessen verwirft das Fenster beim nächsten Zugriff
+    mtime = _json_mtime(get_folder_json_path(folder_name))
+    entry = _prefetched_content.get(folder_name)
+    cached = entry[1] if entry is not None and entry[0] == mtime else {}
+    missing = [content_id for content_id in wanted if content_id not in cached]
+
+    window = {content_id: cached[content_id] for content_id in wanted if content_id in cached}
+    if missing:
+        by_id = {item.get('id'): item for item in get_minigames_from_folder(folder_name)}
+        for content_id in missing:
+            if content_id in by_id:
+                window[content_id] = by_id[content_id]
+    _prefetched_content[folder_name] = (mtime, window)
+    return sum(1 for content_id in missing if content_id in window)
+
+def get_prefetched_content(folder_name: str, content_id: str) -> Optional[Dict[str, Any]]:
+    """Wie get_minigame_from_folder(), bedient vorab geladene Inhalte aber ohne Dateizugriff"""
+    content = _prefetched_window(folder_name).get(content_id)
+    if content is not None:
+        return copy.deepcopy(content)
+    return get_minigame_from_folder(folder_name, content_id)
+
+def discard_prefetched_content(folder_name: str = None):
+    """Verwirft vorab geladene Inhalte eines Ordners (ohne Namen: aller Ordner)"""
+    if folder_name is None:
+        _prefetched_content.clear()
+    else:
+        _prefetched_content.pop(folder_name, None)
+
 def get_questions_from_folder(folder_name: str) -> List[Dict[str, Any]]:
     """Lädt alle Fragen aus einem Ordner"""
     all_content = get_minigames_from_folder(folder_name)
@@ -1196,13 +1664,13 @@ def get_all_content_from_folder(folder_name: str) -> Dict[str, List[Dict[str, An
         'questions': questions
     }
 
-def get_random_content_from_folder(folder_name: str, exclude_played_ids: List[str] = None) -> Optional[Dict[str, Any]]:
+def get_random_content_from_folder(folder_name: str, exclude_played_ids: Iterable[str] = None) -> Optional[Dict[str, Any]]:
     """
     Gibt zufälligen Inhalt (Minispiel oder Frage) aus einem Ordner zurück.
     
     Args:
         folder_name: Name des Ordners
-        exclude_played_ids: Liste von IDs, die ausgeschlossen werden sollen
+        exclude_played_ids: IDs, die ausgeschlossen werden sollen (z.B. GameSession.get_played_content_ids())
         
     Returns:
         Zufälliges Minispiel/Frage oder None wenn keines verfügbar
@@ -1213,6 +1681,7 @@ def get_random_content_from_folder(folder_name: str, exclude_played_ids: List[st
         return None
     
     # Filtere bereits gespielte Inhalte heraus
+    exclude_played_ids = _as_id_set(exclude_played_ids)
     if exclude_played_ids:
         available_items = [item for item in all_items if item.get('id') not in exclude_played_ids]
     else:
@@ -1234,13 +1703,71 @@ def get_random_content_from_folder(folder_name: str, exclude_played_ids: List[st
 
 # NEUE TRACKING-FUNKTIONEN
 
-def get_played_count_for_folder(folder_name: str, played_ids: List[str]) -> Dict[str, int]:
+def _loads_or_empty(raw: Optional[str]) -> Dict[str, Any]:
+    """JSON-Objekt aus einer Backup-Spalte (leeres Dictionary bei fehlenden/ungültigen Werten)"""
+    if not raw:
+        return {}
+    try:
+        value = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+def _dumps_or_none(value: Optional[Dict[str, Any]]) -> Optional[str]:
+    return json.dumps(value) if value else None
+
+
+def _parse_rotation_data(raw: Optional[str]) -> Dict[str, Dict[str, int]]:
+    """Liest das JSON-Format {team_id: {spieler: anzahl}} aus Backups bzw. der alten Spalte"""
+    try:
+        data = json.loads(raw) if raw else {}
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        team_id: {player: count for player, count in players.items() if isinstance(count, int) and count > 0}
+        for team_id, players in data.items()
+        if str(team_id).isdigit() and isinstance(players, dict)
+    }
+
+def _rotation_by_team_name(raw: Optional[str], teams: Optional[list]) -> Dict[str, Dict[str, int]]:
+    """
+    Ordnet die Rotation eines Backups ({alte team_id: ...}) den Team-Namen zu.
+    
+    Die alten IDs stehen nur in teams.json neuerer Backups; Einträge ohne passendes
+    Team (ältere Backups, gelöschte Teams) werden verworfen.
+    """
+    names_by_old_id = {str(team['id']): team['name'] for team in teams or []
+                       if isinstance(team, dict) and team.get('id') is not None and team.get('name')}
+    return {
+        names_by_old_id[team_id]: players
+        for team_id, players in _parse_rotation_data(raw).items()
+        if str(team_id) in names_by_old_id
+    }
+
+def _split_content_ids(ids: Optional[str]) -> List[str]:
+    """Zerlegt die alte komma-separierte Darstellung unter Beibehaltung der Reihenfolge"""
+    return [content_id.strip() for content_id in (ids or '').split(',') if content_id.strip()]
+
+def _as_id_set(ids: Optional[Iterable[str]]) -> AbstractSet[str]:
+    """Wandelt gespielte IDs für O(1)-Lookups in eine Menge um (Mengen werden durchgereicht)"""
+    if not ids:
+        return frozenset()
+    if isinstance(ids, (set, frozenset)):
+        return ids
+    if isinstance(ids, str):
+        ids = ids.split(',')
+    return {content_id.strip() for content_id in ids if content_id and content_id.strip()}
+
+def get_played_count_for_folder(folder_name: str, played_ids: Iterable[str]) -> Dict[str, int]:
     """
     Gibt Statistiken über gespielte Inhalte in einem Ordner zurück.
     
     Args:
         folder_name: Name des Ordners
-        played_ids: Liste der bereits gespielten IDs
+        played_ids: Bereits gespielte IDs
         
     Returns:
         Dict mit 'total', 'played', 'remaining'
@@ -1248,10 +1775,8 @@ def get_played_count_for_folder(folder_name: str, played_ids: List[str]) -> Dict
     all_items = get_minigames_from_folder(folder_name)
     total_count = len(all_items)
     
-    played_count = 0
-    for item in all_items:
-        if item.get('id') in played_ids:
-            played_count += 1
+    played_ids = _as_id_set(played_ids)
+    played_count = sum(1 for item in all_items if item.get('id') in played_ids)
     
     return {
         'total': total_count,
@@ -1259,19 +1784,20 @@ def get_played_count_for_folder(folder_name: str, played_ids: List[str]) -> Dict
         'remaining': total_count - played_count
     }
 
-def get_available_content_from_folder(folder_name: str, exclude_played_ids: List[str] = None) -> List[Dict[str, Any]]:
+def get_available_content_from_folder(folder_name: str, exclude_played_ids: Iterable[str] = None) -> List[Dict[str, Any]]:
     """
     Gibt alle noch nicht gespielten Inhalte aus einem Ordner zurück.
     
     Args:
         folder_name: Name des Ordners
-        exclude_played_ids: Liste von IDs, die ausgeschlossen werden sollen
+        exclude_played_ids: IDs, die ausgeschlossen werden sollen (z.B. GameSession.get_played_content_ids())
         
     Returns:
         Liste der verfügbaren Inhalte
     """
     all_items = get_minigames_from_folder(folder_name)
     
+    exclude_played_ids = _as_id_set(exclude_played_ids)
     if not exclude_played_ids:
         return all_items
     
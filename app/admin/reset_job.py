@@ -0,0 +1,216 @@
+"""
+Kompletter Spiel-Reset als Hintergrund-Job
+Der Reset läuft in einem eigenen Thread, der Request kehrt sofort mit einer Job-ID
+zurück; den Fortschritt liefert /admin/api/reset-game-status/<job_id>.
+
+Ablauf:
+1. Profilbild-Ordner atomar in einen Papierkorb-Ordner umbenennen und leer neu
+   anlegen (neue Uploads landen damit nie im Papierkorb)
+2. Spieltabellen in Abhängigkeitsreihenfolge leeren und die neue Welcome-Session
+   anlegen - alles in einer Transaktion
+3. Papierkorb-Ordner löschen (mit Fortschritt pro Datei)
+4. SQLite verkleinern: PRAGMA incremental_vacuum bei auto_vacuum=INCREMENTAL,
+   sonst VACUUM (abschaltbar über RESET_VACUUM)
+
+Der Job-Status liegt im Speicher des Prozesses, der den Reset gestartet hat.
+"""
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime
+
+from flask import current_app
+
+from ..models import (db, Character, GameEvent, GameRound, GameSession, GameSummary, PlayedContent,
+                      PlayerRegistration, PlayerRotation, PositionTimeseries, QuestionResponse, Team, TeamMember,
+                      WelcomeSession)
+from ..game_logic.team_index import invalidate_team_index
+
+# Kinder vor Eltern, damit auch mit aktivierten Fremdschlüsseln nichts verwaist
+RESET_TABLES = (
+    ('player_registrations', PlayerRegistration),
+    ('welcome_sessions', WelcomeSession),
+    ('question_responses', QuestionResponse),
+    ('game_events', GameEvent),
+    ('game_summaries', GameSummary),
+    ('position_timeseries', PositionTimeseries),
+    ('played_content', PlayedContent),
+    ('player_rotation', PlayerRotation),
+    ('game_sessions', GameSession),
+    ('team_members', TeamMember),
+    ('teams', Team),
+)
+
+_jobs = {}
+_lock = threading.Lock()
+
+
+def _new_status(job_id, started_by):
+    return {
+        'id': job_id,
+        'state': 'queued',
+        'step': None,
+        'progress': 0,
+        'started_by': started_by,
+        'started_at': datetime.utcnow().isoformat(),
+        'finished_at': None,
+        'counts': {},
+        'files_total': 0,
+        'files_removed': 0,
+        'welcome_started': False,
+        'vacuum': None,
+        'message': None,
+        'error': None,
+    }
+
+
+def _update(job_id, **changes):
+    with _lock:
+        _jobs[job_id].update(changes)
+
+
+def get_reset_status(job_id=None):
+    """Status eines Jobs (ohne ID: des zuletzt gestarteten) als Kopie oder None"""
+    with _lock:
+        if job_id is None:
+            if not _jobs:
+                return None
+            job_id = next(reversed(_jobs))
+        status = _jobs.get(job_id)
+        return dict(status) if status is not None else None
+
+
+def get_running_reset():
+    """ID eines laufenden Resets oder None"""
+    with _lock:
+        for job_id, status in _jobs.items():
+            if status['state'] in ('queued', 'running'):
+                return job_id
+    return None
+
+
+def start_reset_job(started_by):
+    """Startet den Reset im Hintergrund und gibt die Job-ID zurück (None, falls schon einer läuft)"""
+    app = current_app._get_current_object()
+    with _lock:
+        for status in _jobs.values():
+            if status['state'] in ('queued', 'running'):
+                return None
+        job_id = uuid.uuid4().hex[:12]
+        _jobs[job_id] = _new_status(job_id, started_by)
+    thread = threading.Thread(target=_run, args=(app, job_id), name=f'game-reset-{job_id}', daemon=True)
+    thread.start()
+    return job_id
+
+
+def _profile_images_dir(app):
+    return os.path.join(app.static_folder, 'profile_images')
+
+
+def _move_profile_images(app):
+    """Benennt den Profilbild-Ordner in einen Papierkorb um und legt ihn leer neu an"""
+    images_dir = _profile_images_dir(app)
+    if not os.path.isdir(images_dir):
+        return None
+    trash_dir = f"{images_dir}.trash-{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')}"
+    os.rename(images_dir, trash_dir)
+    os.makedirs(images_dir, exist_ok=True)
+    return trash_dir
+
+
+def _restore_profile_images(app, trash_dir):
+    images_dir = _profile_images_dir(app)
+    try:
+        os.rmdir(images_dir)
+        os.rename(trash_dir, images_dir)
+    except OSError as e:
+        app.logger.warning(f"Profilbilder konnten nicht zurückverschoben werden ({trash_dir}): {e}")
+
+
+def _truncate_tables():
+    """Leert alle Spieltabellen und startet die Welcome-Session (eine Transaktion)"""
+    counts = {}
+    for label, model in RESET_TABLES:
+        counts[label] = model.query.delete(synchronize_session=False)
+    Character.query.update({'is_selected': False}, synchronize_session=False)
+
+    active_round = GameRound.get_active_round()
+    if active_round and hasattr(active_round, 'reset_played_content'):
+        active_round.reset_played_content()
+
+    db.session.add(WelcomeSession(is_active=True))
+    db.session.commit()
+    invalidate_team_index()
+    return counts
+
+
+def _remove_tree(job_id, trash_dir):
+    entries = []
+    for root, _dirs, files in os.walk(trash_dir):
+        entries.extend(os.path.join(root, name) for name in files)
+    _update(job_id, files_total=len(entries))
+    for index, path in enumerate(entries, 1):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        if index % 50 == 0 or index == len(entries):
+            _update(job_id, files_removed=index, progress=50 + int(30 * index / len(entries)))
+    shutil.rmtree(trash_dir, ignore_errors=True)
+
+
+def _vacuum(app):
+    """Gibt freigewordene Seiten der SQLite-Datenbank zurück (außerhalb einer Transaktion)"""
+    if db.engine.dialect.name != 'sqlite' or not app.config.get('RESET_VACUUM', True):
+        return None
+    with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        mode = connection.exec_driver_sql('PRAGMA auto_vacuum').scalar()
+        if mode == 2:
+            connection.exec_driver_sql('PRAGMA incremental_vacuum')
+            return 'incremental_vacuum'
+        connection.exec_driver_sql('VACUUM')
+        return 'vacuum'
+
+
+def _run(app, job_id):
+    with app.app_context():
+        trash_dir = None
+        try:
+            _update(job_id, state='running', step='images_moved', progress=5)
+            trash_dir = _move_profile_images(app)
+
+            _update(job_id, step='tables', progress=10)
+            try:
+                counts = _truncate_tables()
+            except Exception:
+                db.session.rollback()
+                if trash_dir:
+                    _restore_profile_images(app, trash_dir)
+                    trash_dir = None
+                raise
+            _update(job_id, counts=counts, welcome_started=True, progress=50)
+            app.logger.info(f"Spiel-Reset {job_id}: Tabellen geleert {counts}")
+
+            _update(job_id, step='images')
+            if trash_dir:
+                _remove_tree(job_id, trash_dir)
+
+            _update(job_id, step='vacuum', progress=80)
+            try:
+                vacuum = _vacuum(app)
+            except Exception as e:
+                # Der Reset selbst ist abgeschlossen; ein fehlgeschlagenes VACUUM ist kein Abbruchgrund
+                vacuum = None
+                app.logger.warning(f"Spiel-Reset {job_id}: VACUUM fehlgeschlagen: {e}")
+
+            message = (f"Spiel komplett zurückgesetzt und Welcome-System gestartet! {counts.get('teams', 0)} Teams, "
+                       f"{counts.get('game_sessions', 0)} Sessions und alle Spieldaten wurden gelöscht.")
+            _update(job_id, state='done', step='done', progress=100, vacuum=vacuum, message=message,
+                    finished_at=datetime.utcnow().isoformat())
+            app.logger.info(f"Spiel-Reset {job_id} abgeschlossen")
+        except Exception as e:
+            app.logger.error(f"Fehler beim kompletten Spiel-Reset {job_id}: {e}", exc_info=True)
+            _update(job_id, state='failed', error=str(e), finished_at=datetime.utcnow().isoformat())
+        finally:
+            db.session.remove()
@@ -1,17 +1,24 @@
 # app/admin/routes.py
+import base64
+import binascii
+import io
 import sys
 import os
 import random
+import re
+import shutil
+import string
 import json
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session, current_app, g, jsonify, make_response, Response
 from flask_login import login_user, logout_user, login_required, current_user
 import json
 import time
-from ..models import (Admin, Team, Character, GameSession, GameEvent, MinigameFolder, GameRound, 
+from ..models import (Admin, Team, Character, GameSession, GameEvent, GameSummary, MinigameFolder, GameRound, 
                      QuestionResponse, FieldConfiguration, WelcomeSession, PlayerRegistration, 
-                     MinigameSequence, db)
+                     MinigameSequence, RoundFieldConfiguration, PlayedContent, PlayerRotation, PositionTimeseries,
+                     TeamMember, db)
 from ..forms import (AdminLoginForm, CreateTeamForm, EditTeamForm, SetNextMinigameForm, 
                      AdminConfirmPasswordForm, CreateMinigameFolderForm, EditMinigameFolderForm,
                      CreateGameRoundForm, EditGameRoundForm, FolderMinigameForm, EditFolderMinigameForm,
@@ -19,6 +26,7 @@ from ..forms import (AdminLoginForm, CreateTeamForm, EditTeamForm, SetNextMiniga
                      FieldConfigurationForm, FieldPreviewForm, FieldImportExportForm, FieldBulkEditForm,
                      SequenceUpdateForm)
 from .init_characters import initialize_characters
+from .reset_job import start_reset_job, get_reset_status, get_running_reset
 from .minigame_utils import (ensure_minigame_folders_exist, create_minigame_folder_if_not_exists,
                             delete_minigame_folder, get_minigames_from_folder, add_minigame_to_folder,
                             update_minigame_in_folder, delete_minigame_from_folder, get_minigame_from_folder,
@@ -26,17 +34,28 @@ from .minigame_utils import (ensure_minigame_folders_exist, create_minigame_fold
                             get_questions_from_folder, add_question_to_folder, get_question_from_folder,
                             get_all_content_from_folder, get_random_content_from_folder, get_played_count_for_folder,
                             get_available_content_from_folder, mark_content_as_played, reset_played_content_for_session,
-                            save_round_to_filesystem, backup_all_rounds_before_db_reset, restore_rounds_to_database,
-                            load_rounds_from_filesystem, delete_round_from_filesystem)
+                            save_round_to_filesystem, backup_all_rounds_before_db_reset, restore_rounds_to_database, restore_saved_rounds,
+                            load_rounds_from_filesystem, load_backup_summaries, delete_round_from_filesystem,
+                            pin_active_content, unpin_active_content, get_active_content, get_active_question,
+                            get_prefetched_content)
 
 # NEU: FELD-MANAGEMENT IMPORTS
 from .field_config import (
     get_field_type_color_mapping, get_field_preview_data, create_default_field_config,
     update_field_config, get_frequency_type_options, get_field_type_templates,
     export_field_configurations, import_field_configurations, reset_to_default_configurations,
-    validate_field_conflicts, get_field_usage_statistics
+    validate_field_conflicts, get_field_usage_statistics, get_editable_field_configs,
+    sync_active_round_configs
 )
 
+from app.game_logic.field_config_cache import get_cached_field_configs, invalidate_field_config_cache
+from app.game_logic.team_index import invalidate_team_index
+from app.game_logic.sequence_cursor import prefetch_upcoming
+from app.game_logic.game_summary import materialize_game_summary
+from app.game_logic.position_timeseries import record_position
+from app.instrumentation import render_metrics, metrics_token_matches
+from app.log import get_logger
+
 # SONDERFELD-LOGIK IMPORT
 from app.game_logic.special_fields import (
     handle_special_field_action, 
@@ -50,6 +69,9 @@ from app.game_logic.special_fields import (
 
 admin_bp = Blueprint('admin', __name__, template_folder='../templates/admin', url_prefix='/admin')
 
+moderation_log = get_logger('wii.moderation')
+dice_log = get_logger('wii.dice')
+
 # Simple in-memory store for field update events
 field_update_events = []
 MAX_EVENTS = 100  # Keep only last 100 events
@@ -191,7 +213,7 @@ def calculate_automatic_placements():
     for team in all_teams:
         if team.id not in answered_team_ids:
             team.minigame_placement = placement
-            current_app.logger.info(f"Team {team.name} erhält Platzierung {placement} (keine Antwort)")
+            dice_log.debug('question_placement_without_answer', team=team.name, placement=placement)
             placement += 1
 
     # VERBESSERT: Setze Bonus-Würfel für Teams mit richtigen Antworten
@@ -209,10 +231,10 @@ def calculate_automatic_placements():
             # Nur wenn das Team eine richtige Antwort gegeben hat
             if team.id in correct_team_ids:
                 team.bonus_dice_sides = bonus_config[team.minigame_placement]
-                current_app.logger.info(f"Team {team.name} (Platz {team.minigame_placement}) erhält Bonus-Würfel: 1-{team.bonus_dice_sides}")
+                dice_log.info('bonus_dice_assigned', team=team.name, placement=team.minigame_placement, sides=team.bonus_dice_sides)
             else:
                 team.bonus_dice_sides = 0
-                current_app.logger.info(f"Team {team.name} (Platz {team.minigame_placement}) erhält keinen Bonus-Würfel (falsche/keine Antwort)")
+                dice_log.debug('bonus_dice_withheld', team=team.name, placement=team.minigame_placement, reason='wrong_or_no_answer')
         else:
             team.bonus_dice_sides = 0
 
@@ -244,12 +266,11 @@ def moderation_mode():
             
             # TEMP: Test-Daten falls keine echten Daten vorhanden
             if not dice_result:
-                current_app.logger.info("DEBUG: No real dice result found, checking for test data")
+                moderation_log.debug('dice_result_fallback_to_team')
                 # Teste mit aktueller Team-Info
                 if active_session.current_team_turn_id:
-                    from datetime import datetime
                     team = Team.query.get(active_session.current_team_turn_id)
-                    current_app.logger.info(f"DEBUG: Current team: {team.name if team else 'None'}, last_dice_result: {team.last_dice_result if team else 'No team'}")
+                    moderation_log.debug('dice_result_fallback_team', team=team.name if team else None, last_dice_result=team.last_dice_result if team else None)
                     
                     if team and team.last_dice_result:
                         dice_result = {
@@ -261,13 +282,13 @@ def moderation_mode():
                             'has_bonus': team.last_dice_result > 6,
                             'is_recent': True
                         }
-                        current_app.logger.info(f"DEBUG: Using team last_dice_result: {dice_result}")
+                        moderation_log.debug('dice_result_from_team', result=dice_result)
                     else:
                         # Keine Fallback-Daten - zeige nur echte Würfelergebnisse
                         dice_result = None
-                        current_app.logger.info("DEBUG: No dice result available - not showing hardcoded values")
+                        moderation_log.debug('dice_result_unavailable')
             
-            current_app.logger.info(f"DEBUG: DICE_ROLLING phase - final dice result: {dice_result}")
+            moderation_log.debug('dice_rolling_status', result=dice_result)
             
             game_status = {
                 'current_status': 'Würfelrunde',
@@ -313,7 +334,7 @@ def moderation_mode():
             content_type = current_content.get('type', 'game') if current_content else 'game'
             
             results = _get_game_results(active_session)
-            current_app.logger.info(f"DEBUG: MINIGAME_RESULTS phase - results: {results}")
+            moderation_log.debug('minigame_results_status', results=results)
             
             game_status = {
                 'current_status': 'Ergebnisse',
@@ -362,15 +383,8 @@ def moderation_mode():
         ).first()
         
         if active_sequence:
-            active_sequence_info = {
-                'name': f"Plan: {active_round.minigame_folder.name}",
-                'current_position': active_sequence.current_position,
-                'total_items': len(active_sequence.sequence_list),
-                'progress_percentage': active_sequence.get_progress_percentage(),
-                'current_item': active_sequence.get_current_item(),
-                'next_item': active_sequence.get_next_item(),
-                'sequence_list': active_sequence.sequence_list
-            }
+            active_sequence_info = {'name': f"Plan: {active_round.minigame_folder.name}"}
+            active_sequence_info.update(active_sequence.cursor().to_info())
     
     return render_template('admin/moderation_mode.html', 
                          title='Moderationsmodus',
@@ -391,7 +405,7 @@ def moderation_mode_api():
         
         if active_session:
             current_phase = active_session.current_phase
-            current_app.logger.info(f"DEBUG API: Current phase is {current_phase}")
+            moderation_log.debug('moderation_poll', phase=current_phase)
             
             if current_phase == 'DICE_ROLLING':
                 current_team = None
@@ -404,12 +418,11 @@ def moderation_mode_api():
                 
                 # TEMP: Test-Daten falls keine echten Daten vorhanden
                 if not dice_result:
-                    current_app.logger.info("DEBUG API: No real dice result found, checking for test data")
+                    moderation_log.debug('dice_result_fallback_to_team')
                     # Teste mit aktueller Team-Info
                     if active_session.current_team_turn_id:
-                        from datetime import datetime
                         team = Team.query.get(active_session.current_team_turn_id)
-                        current_app.logger.info(f"DEBUG API: Current team: {team.name if team else 'None'}, last_dice_result: {team.last_dice_result if team else 'No team'}")
+                        moderation_log.debug('dice_result_fallback_team', team=team.name if team else None, last_dice_result=team.last_dice_result if team else None)
                         
                         if team and team.last_dice_result:
                             dice_result = {
@@ -421,13 +434,13 @@ def moderation_mode_api():
                                 'has_bonus': team.last_dice_result > 6,
                                 'is_recent': True
                             }
-                            current_app.logger.info(f"DEBUG API: Using team last_dice_result: {dice_result}")
+                            moderation_log.debug('dice_result_from_team', result=dice_result)
                         else:
                             # Keine Fallback-Daten - zeige nur echte Würfelergebnisse
                             dice_result = None
-                            current_app.logger.info("DEBUG API: No dice result available - not showing hardcoded values")
+                            moderation_log.debug('dice_result_unavailable')
                 
-                current_app.logger.info(f"DEBUG API: DICE_ROLLING phase - final dice result: {dice_result}")
+                moderation_log.debug('dice_rolling_status', result=dice_result)
                 
                 game_status = {
                     'current_status': 'Würfelrunde',
@@ -470,7 +483,7 @@ def moderation_mode_api():
                 content_type = current_content.get('type', 'game') if current_content else 'game'
                 
                 results = _get_game_results(active_session)
-                current_app.logger.info(f"DEBUG API: MINIGAME_RESULTS phase - results: {results}")
+                moderation_log.debug('minigame_results_status', results=results)
                 
                 game_status = {
                     'current_status': 'Ergebnisse',
@@ -518,15 +531,11 @@ def moderation_mode_api():
             ).first()
             
             if active_sequence:
-                active_sequence_info = {
-                    'name': f"Plan: {active_round.minigame_folder.name}",
-                    'current_position': active_sequence.current_position,
-                    'total_items': len(active_sequence.sequence_list),
-                    'progress_percentage': active_sequence.get_progress_percentage(),
-                    'current_item': active_sequence.get_current_item(),
-                    'next_item': active_sequence.get_next_item(),
-                    'sequence_list': active_sequence.sequence_list
-                }
+                cursor = active_sequence.cursor()
+                active_sequence_info = {'name': f"Plan: {active_round.minigame_folder.name}"}
+                active_sequence_info.update(cursor.to_info())
+                # Hält die nächsten Inhalte vorrätig (ohne Dateizugriff, wenn schon geladen)
+                prefetch_upcoming(cursor, active_round.minigame_folder.folder_path)
         
         return jsonify({
             'game_status': game_status,
@@ -534,9 +543,18 @@ def moderation_mode_api():
         })
         
     except Exception as e:
-        current_app.logger.error(f"ERROR in moderation_mode_api: {e}", exc_info=True)
+        moderation_log.exception('moderation_poll_failed', error=str(e))
         return jsonify({'error': str(e)}), 500
 
+@admin_bp.route('/metrics')
+def metrics():
+    """Request-Metriken im Prometheus-Textformat (nur mit METRICS_ENABLED)"""
+    if not current_app.config.get('METRICS_ENABLED'):
+        return jsonify({'error': 'Metriken sind deaktiviert'}), 404
+    if not (metrics_token_matches() or isinstance(current_user, Admin)):
+        return jsonify({'error': 'Unauthorized'}), 403
+    return Response(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
 def _get_content_details(current_content, content_type, active_session=None):
     """Hilfsfunktion um Details für Fragen/Minigames zu extrahieren"""
     if not current_content:
@@ -588,10 +606,71 @@ def _get_content_details(current_content, content_type, active_session=None):
     
     return details
 
-def _get_team_response_status(active_session):
-    """DETAILLIERTE TEAM-ANTWORTEN MIT RICHTIG/FALSCH STATUS - GLEICHE LOGIK WIE /api/question-responses"""
+def _format_answer_preview(response, question_data):
+    """Kurzvorschau einer Antwort für Moderation und Admin-API"""
+    if response.selected_option is not None:
+        options = question_data.get('options') if question_data else None
+        if options and 0 <= response.selected_option < len(options):
+            return f"Option {response.selected_option + 1}: {options[response.selected_option][:30]}..."
+        return f"Option {response.selected_option + 1}"
+    if response.answer_text:
+        answer_preview = response.answer_text[:50]
+        if len(response.answer_text) > 50:
+            answer_preview += "..."
+        return answer_preview
+    return "Keine Antwort"
+
+def _collect_question_responses(active_session):
+    """
+    Sammelt alle Teams mit ihrer Antwort auf die aktuelle Frage in einer Abfrage
+    
+    Die Frage selbst stammt aus dem angehefteten Snapshot (get_active_question), damit die
+    Ordner-JSON nicht für jede Antwort erneut geladen wird.
+    
+    Returns:
+        tuple: (Liste (team_id, team_name), sortierte Antwort-Liste, Menge der Team-IDs mit Antwort)
+    """
     from ..models import QuestionResponse, Team
     
+    rows = db.session.query(Team.id, Team.name, QuestionResponse).outerjoin(
+        QuestionResponse,
+        db.and_(
+            QuestionResponse.team_id == Team.id,
+            QuestionResponse.game_session_id == active_session.id,
+            QuestionResponse.question_id == active_session.current_question_id
+        )
+    ).order_by(Team.id).all()
+    
+    question_data = None
+    if any(response is not None and response.selected_option is not None for _, _, response in rows):
+        question = get_active_question(active_session)
+        question_data = question.data if question else None
+    
+    teams = []
+    seen_team_ids = set()
+    answered_team_ids = set()
+    responses = []
+    for team_id, team_name, response in rows:
+        if team_id not in seen_team_ids:
+            seen_team_ids.add(team_id)
+            teams.append((team_id, team_name))
+        if response is None:
+            continue
+        answered_team_ids.add(team_id)
+        responses.append({
+            "team_id": team_id,
+            "team_name": team_name,
+            "answer_preview": _format_answer_preview(response, question_data),
+            "is_correct": response.is_correct,
+            "answered_at": response.answered_at.strftime('%H:%M:%S') if response.answered_at else None
+        })
+    
+    # Sortiere nach Antwortzeit
+    responses.sort(key=lambda x: x['answered_at'] or '99:99:99')
+    return teams, responses, answered_team_ids
+
+def _get_team_response_status(active_session):
+    """DETAILLIERTE TEAM-ANTWORTEN MIT RICHTIG/FALSCH STATUS - GLEICHE LOGIK WIE /api/question-responses"""
     # Nur laden wenn Frage aktiv ist
     if not active_session.current_question_id:
         return {
@@ -601,59 +680,18 @@ def _get_team_response_status(active_session):
         }
     
     try:
-        all_teams = Team.query.all()
-        
-        # Lade Antworten für aktuelle Frage mit Details
-        responses = QuestionResponse.query.filter_by(
-            game_session_id=active_session.id,
-            question_id=active_session.current_question_id
-        ).join(Team).all()
-        
-        answered_team_ids = [r.team_id for r in responses]
-        detailed_responses = []
-        
-        # Erstelle detaillierte Antwort-Liste (wie im Admin Dashboard)
-        for response in responses:
-            answer_preview = ""
-            if response.selected_option is not None:
-                active_round = GameRound.get_active_round()
-                if active_round and active_round.minigame_folder:
-                    from .minigame_utils import get_question_from_folder
-                    question_data = get_question_from_folder(active_round.minigame_folder.folder_path, response.question_id)
-                    if question_data and question_data.get('options'):
-                        options = question_data['options']
-                        if 0 <= response.selected_option < len(options):
-                            answer_preview = f"Option {response.selected_option + 1}: {options[response.selected_option][:30]}..."
-                        else:
-                            answer_preview = f"Option {response.selected_option + 1}"
-                    else:
-                        answer_preview = f"Option {response.selected_option + 1}"
-            elif response.answer_text:
-                answer_preview = response.answer_text[:50]
-                if len(response.answer_text) > 50:
-                    answer_preview += "..."
-            else:
-                answer_preview = "Keine Antwort"
-            
-            detailed_responses.append({
-                "team_name": response.team.name,
-                "answer_preview": answer_preview,
-                "is_correct": response.is_correct,
-                "answered_at": response.answered_at.strftime('%H:%M:%S') if response.answered_at else None
-            })
-        
-        # Sortiere nach Antwortzeit
-        detailed_responses.sort(key=lambda x: x['answered_at'] or '99:99:99')
-        
-        answered_teams = [team.name for team in all_teams if team.id in answered_team_ids]
-        pending_teams = [team.name for team in all_teams if team.id not in answered_team_ids]
+        teams, responses, answered_team_ids = _collect_question_responses(active_session)
+        detailed_responses = [
+            {key: response[key] for key in ('team_name', 'answer_preview', 'is_correct', 'answered_at')}
+            for response in responses
+        ]
         
         return {
-            'answered': answered_teams,
-            'pending': pending_teams,
+            'answered': [name for team_id, name in teams if team_id in answered_team_ids],
+            'pending': [name for team_id, name in teams if team_id not in answered_team_ids],
             'detailed_responses': detailed_responses,
             'total_responses': len(detailed_responses),
-            'total_teams': len(all_teams)
+            'total_teams': len(teams)
         }
         
     except Exception as e:
@@ -666,27 +704,23 @@ def _get_team_response_status(active_session):
 
 def _get_latest_dice_result(active_session):
     """Ermittelt das neueste Würfelergebnis für den Moderationsmodus"""
-    from ..models import GameEvent
-    from datetime import datetime, timedelta
-    import json
     
     if not active_session:
-        current_app.logger.info("DEBUG _get_latest_dice_result: No active session")
+        moderation_log.debug('latest_dice_result_no_session')
         return None
         
     try:
         # Suche nach dem neuesten Würfel-Event in den letzten 60 Sekunden (erweitert)
         recent_time = datetime.utcnow() - timedelta(seconds=60)
         
-        # Debug: Alle dice_roll Events anzeigen
-        all_dice_events = GameEvent.query.filter(
-            GameEvent.event_type == 'dice_roll',
-            GameEvent.game_session_id == active_session.id
-        ).order_by(GameEvent.timestamp.desc()).limit(5).all()
-        
-        current_app.logger.info(f"DEBUG: Found {len(all_dice_events)} dice events total for session {active_session.id}")
-        for event in all_dice_events:
-            current_app.logger.info(f"  - Event {event.id}: {event.timestamp}, team={event.related_team_id}")
+        # Debug: letzte dice_roll Events anzeigen (Abfrage nur bei aktivem DEBUG-Level)
+        if moderation_log.is_enabled():
+            all_dice_events = GameEvent.query.filter(
+                GameEvent.event_type == 'dice_roll',
+                GameEvent.game_session_id == active_session.id
+            ).order_by(GameEvent.timestamp.desc()).limit(5).all()
+            moderation_log.debug('recent_dice_events', session_id=active_session.id, events=[
+                (event.id, event.timestamp.isoformat(), event.related_team_id) for event in all_dice_events])
         
         last_dice_event = GameEvent.query.filter(
             GameEvent.event_type == 'dice_roll',
@@ -694,10 +728,8 @@ def _get_latest_dice_result(active_session):
             GameEvent.timestamp >= recent_time
         ).order_by(GameEvent.timestamp.desc()).first()
         
-        current_app.logger.info(f"DEBUG: Recent dice event (last 60s): {last_dice_event}")
-        
         if last_dice_event and last_dice_event.data_json:
-            current_app.logger.info(f"DEBUG: Processing dice event data: {last_dice_event.data_json}")
+            moderation_log.debug('latest_dice_event', event_id=last_dice_event.id, data=last_dice_event.data_json)
             
             # Versuche JSON zu parsen
             if isinstance(last_dice_event.data_json, str):
@@ -723,10 +755,10 @@ def _get_latest_dice_result(active_session):
                 'is_recent': True  # Marker für Auto-Display
             }
             
-            current_app.logger.info(f"DEBUG: Returning dice result: {result}")
+            moderation_log.debug('latest_dice_result', result=result)
             return result
         else:
-            current_app.logger.info("DEBUG: No recent dice event found or no data_json")
+            moderation_log.debug('latest_dice_result_none')
             
     except Exception as e:
         current_app.logger.error(f"Error getting latest dice result: {e}", exc_info=True)
@@ -740,7 +772,7 @@ def _get_selected_players(active_session):
     # Aus selected_players Feld laden (JSON in session)
     if hasattr(active_session, 'selected_players') and active_session.selected_players:
         try:
-            selections = json.loads(active_session.selected_players) if isinstance(active_session.selected_players, str) else active_session.selected_players
+            selections = active_session.parsed_selected_players
             
             for team_id, player_name in selections.items():
                 from ..models import Team
@@ -753,52 +785,44 @@ def _get_selected_players(active_session):
     return selected_players
 
 def _get_current_content_from_session(active_session):
-    """Extrahiert aktuelle Content-Daten aus GameSession Feldern - MEHR DETAILS ALS ADMIN DASHBOARD"""
+    """
+    Extrahiert aktuelle Content-Daten aus GameSession Feldern - MEHR DETAILS ALS ADMIN DASHBOARD
+    
+    Frage- bzw. Minispiel-Daten stammen aus dem beim Festlegen angehefteten Snapshot
+    (get_active_content), nicht bei jeder Abfrage aus der Ordner-JSON.
+    """
     content = {}
     
-    # Prüfe zuerst ob eine Frage aktiv ist
-    if active_session.current_question_id:
-        # Lade Frage mit allen Details aus Datei
-        active_round = GameRound.get_active_round()
-        if active_round and active_round.minigame_folder:
-            try:
-                from .minigame_utils import get_question_from_folder
-                question_data = get_question_from_folder(
-                    active_round.minigame_folder.folder_path, 
-                    active_session.current_question_id
-                )
-                current_app.logger.info(f"DEBUG: Question data loaded: {question_data}")
-                
-                if question_data:
-                    content = {
-                        'name': active_session.current_minigame_name or question_data.get('name', 'Frage'),
-                        'description': active_session.current_minigame_description or question_data.get('description', ''),
-                        'type': 'question',
-                        'question_text': question_data.get('question_text', ''),
-                        'question_type': question_data.get('question_type', ''),
-                    }
-                    
-                    # Für Multiple Choice Fragen: Optionen hinzufügen
-                    if question_data.get('question_type') == 'multiple_choice' and question_data.get('options'):
-                        content['options'] = question_data['options']
-                        # Korrekte Antwort basierend auf Index
-                        if 'correct_option' in question_data and isinstance(question_data['correct_option'], int):
-                            try:
-                                correct_idx = question_data['correct_option']
-                                if 0 <= correct_idx < len(question_data['options']):
-                                    content['correct_answer'] = question_data['options'][correct_idx]
-                            except (IndexError, TypeError):
-                                pass
-                    
-                    # Für Text Input Fragen: Korrekte Antwort direkt
-                    elif question_data.get('question_type') == 'text_input' and question_data.get('correct_text'):
-                        content['correct_answer'] = question_data['correct_text']
-                    
-                    current_app.logger.info(f"DEBUG: Final question content: {content}")
-                    return content
-                    
-            except Exception as e:
-                current_app.logger.error(f"Error loading question: {e}", exc_info=True)
+    try:
+        snapshot = get_active_content(active_session)
+    except Exception as e:
+        current_app.logger.error(f"Error loading active content: {e}", exc_info=True)
+        snapshot = None
+    
+    if snapshot and snapshot.is_question and active_session.current_question_id:
+        content = {
+            'name': active_session.current_minigame_name or snapshot.name or 'Frage',
+            'description': active_session.current_minigame_description or snapshot.description,
+            'type': 'question',
+            'question_text': snapshot.data.get('question_text', ''),
+            'question_type': snapshot.data.get('question_type', ''),
+        }
+        
+        # Für Multiple Choice Fragen: Optionen hinzufügen
+        if snapshot.data.get('question_type') == 'multiple_choice' and snapshot.options:
+            content['options'] = list(snapshot.options)
+        if snapshot.correct_answer is not None:
+            content['correct_answer'] = snapshot.correct_answer
+        return content
+    
+    if snapshot and not snapshot.is_question and active_session.current_minigame_name:
+        content = {
+            'name': active_session.current_minigame_name,
+            'description': active_session.current_minigame_description or '',
+            'type': 'game',
+            'duration': snapshot.data.get('duration', ''),
+            'instructions': snapshot.data.get('instructions', '')
+        }
     
     # Falls kein Question-Daten gefunden, verwende Minigame-Info
     if not content and active_session.current_minigame_name:
@@ -830,26 +854,23 @@ def _get_game_results(active_session):
         teams = Team.query.all()
         team_placements = []
         
-        current_app.logger.info(f"DEBUG: Checking results for {len(teams)} teams")
+        moderation_log.debug('game_results_check', teams=len(teams))
         
         for team in teams:
             # Prüfe auf verschiedene Platzierungs-Felder
             placement = None
             if hasattr(team, 'minigame_placement') and team.minigame_placement is not None:
                 placement = team.minigame_placement
-                current_app.logger.info(f"DEBUG: Team {team.name} has minigame_placement: {placement}")
             elif hasattr(team, 'question_placement') and team.question_placement is not None:
                 placement = team.question_placement
-                current_app.logger.info(f"DEBUG: Team {team.name} has question_placement: {placement}")
             
             if placement is not None:
                 team_placements.append({
                     'team_name': team.name,
                     'placement': placement
                 })
-                current_app.logger.info(f"DEBUG: Added team {team.name} with placement {placement}")
         
-        current_app.logger.info(f"DEBUG: Found {len(team_placements)} teams with placements")
+        moderation_log.debug('game_results_placements', placements=team_placements)
         
         if team_placements:
             # Sortiere nach Platzierung
@@ -859,7 +880,7 @@ def _get_game_results(active_session):
         
         # DEBUG: Immer Beispiel-Ergebnisse für Tests
         if not results['has_results'] and len(teams) > 0:
-            current_app.logger.info("DEBUG: No real results found, creating test results")
+            moderation_log.debug('game_results_placeholder')
             for i, team in enumerate(teams[:3]):
                 team_placements.append({
                     'team_name': team.name,
@@ -925,7 +946,7 @@ def admin_dashboard():
     if active_round and active_round.minigame_folder:
         played_stats = get_played_count_for_folder(
             active_round.minigame_folder.folder_path, 
-            active_session.get_played_content_ids()
+            played_ids
         )
 
     # NEU: Feld-Konfiguration Statistiken für Dashboard
@@ -1049,20 +1070,17 @@ def admin_roll_dice():
                         return jsonify({"success": False, "error": f"Team {team.name} hat bereits in dieser Runde gewürfelt."}), 403
                         
             except (ValueError, ZeroDivisionError) as e:
-                current_app.logger.warning(f"Fehler bei Würfel-Validierung: {e}")
+                dice_log.warning('dice_validation_failed', error=str(e))
                 pass  # Bei Fehlern in der Logik, erlaube Würfeln
 
         # SONDERFELD: Prüfe ob Team blockiert ist (Sperren-Feld)
         standard_dice_roll = random.randint(1, 6)
         bonus_dice_roll = 0
         
-        current_app.logger.info(f"Team {team.name} würfelt - Bonus-Würfel-Seiten: {team.bonus_dice_sides}")
-        
         if team.bonus_dice_sides and team.bonus_dice_sides > 0:
             bonus_dice_roll = random.randint(1, team.bonus_dice_sides)
-            current_app.logger.info(f"Team {team.name} erhält Bonus-Würfel: {bonus_dice_roll} (von 1-{team.bonus_dice_sides})")
-        else:
-            current_app.logger.info(f"Team {team.name} erhält keinen Bonus-Würfel")
+        dice_log.debug('admin_roll', team=team.name, standard_roll=standard_dice_roll,
+                       bonus_roll=bonus_dice_roll, bonus_dice_sides=team.bonus_dice_sides)
         
         total_roll = standard_dice_roll + bonus_dice_roll
         old_position = team.current_position
@@ -1114,20 +1132,18 @@ def admin_roll_dice():
         # ZIELFELD: Prüfe Gewinn-Bedingung
         # WICHTIG: Team muss BEREITS auf Position 72 gewesen sein (old_position), nicht erst durch den Wurf dorthin gekommen
         victory_triggered = False
-        current_app.logger.info(f"🔍 ADMIN DICE DEBUG: Team {team.name} - old_position: {old_position}, new_position: {new_position}, total_roll: {total_roll}")
+        dice_log.debug('admin_roll_move', team=team.name, old_position=old_position, new_position=new_position, total_roll=total_roll)
         
         if old_position == 72 and total_roll >= 6:
             # Team war bereits auf Zielfeld und hat 6+ gewürfelt - hat gewonnen!
             victory_triggered = True
-            current_app.logger.info(f"🏆 VICTORY: Team {team.name} war auf Position 72 und würfelte {total_roll} (>= 6) - SIEG!")
+            dice_log.info('victory_roll', team=team.name, total_roll=total_roll)
         elif old_position == 72 and total_roll < 6:
             # Team war auf Zielfeld, hat aber weniger als 6 gewürfelt
-            current_app.logger.info(f"🎯 FINAL FIELD: Team {team.name} war auf Position 72, würfelte {total_roll} - braucht mindestens 6 zum Gewinnen")
+            dice_log.info('final_field_roll_too_low', team=team.name, total_roll=total_roll, required=6)
         elif new_position == 72:
             # Team ist gerade erst auf Position 72 angekommen - muss nächste Runde 6+ würfeln
-            current_app.logger.info(f"🎯 REACHED FINAL FIELD: Team {team.name} erreichte Position 72 - muss nächste Runde mindestens 6 würfeln")
-            
-        current_app.logger.info(f"🔍 ADMIN DICE DEBUG: victory_triggered = {victory_triggered}")
+            dice_log.info('final_field_reached', team=team.name, position=new_position)
 
         # Event für den Würfelwurf erstellen
         event_description = f"Admin würfelte für Team {team.name}: {standard_dice_roll}"
@@ -1166,11 +1182,14 @@ def admin_roll_dice():
         )
         db.session.add(dice_event)
 
+        # Positions-Zeitreihe (finale Position nach Sonderfeldern) für Charts und Board-Replay
+        record_position(active_session.id, team.id, team.current_position, total_roll)
+
         # Nächstes Team ermitteln
         dice_order_ids_str = active_session.dice_roll_order
         if not dice_order_ids_str: 
             db.session.rollback()
-            current_app.logger.error("Würfelreihenfolge ist leer in der aktiven Session.")
+            dice_log.error('dice_order_empty', session_id=active_session.id)
             return jsonify({"success": False, "error": "Fehler: Würfelreihenfolge nicht gesetzt."}), 500
 
         dice_order_ids_int = [int(tid) for tid in dice_order_ids_str.split(',') if tid.isdigit()]
@@ -1180,7 +1199,7 @@ def admin_roll_dice():
             current_team_index_in_order = dice_order_ids_int.index(team.id)
         else:
             db.session.rollback()
-            current_app.logger.error(f"Team {team.id} nicht in Würfelreihenfolge {dice_order_ids_int} gefunden.")
+            dice_log.error('team_not_in_dice_order', team_id=team.id, dice_order=dice_order_ids_int)
             return jsonify({"success": False, "error": "Fehler in der Würfelreihenfolge (Team nicht gefunden)."}), 500
 
         next_team_name = None 
@@ -1192,7 +1211,7 @@ def admin_roll_dice():
             # Prüfe ob ein Feld-Minigame gestartet wurde (Phase geändert von special_field_action)
             if active_session.current_phase == 'FIELD_MINIGAME_SELECTION_PENDING':
                 # Feld-Minigame wurde ausgelöst - nicht ROUND_OVER setzen
-                current_app.logger.info(f"Letztes Team {team.name} landete auf Minigame-Feld - Runde wartet auf Feld-Minigame")
+                dice_log.info('round_waiting_for_field_minigame', team=team.name)
                 active_session.current_team_turn_id = None  # Kein nächstes Team, aber Phase bleibt
             else:
                 # Kein Feld-Minigame - normale Rundenvervollständigung
@@ -1209,8 +1228,9 @@ def admin_roll_dice():
                 
                 # VERBESSERT: Nur Bonus-Würfel zurücksetzen, Platzierungen beibehalten für Statistiken
                 all_teams_in_db = Team.query.all()
+                dice_log.info('round_over', session_id=active_session.id, teams=len(all_teams_in_db))
                 for t_obj in all_teams_in_db:
-                    current_app.logger.info(f"Runde beendet - Bonus-Würfel für Team {t_obj.name} zurückgesetzt (war: {t_obj.bonus_dice_sides})")
+                    dice_log.debug('bonus_dice_reset', team=t_obj.name, previous_sides=t_obj.bonus_dice_sides)
                     t_obj.bonus_dice_sides = 0
                     # Platzierungen NICHT zurücksetzen - die bleiben für Statistiken
                 
@@ -1225,6 +1245,7 @@ def admin_roll_dice():
         if victory_triggered:
             try:
                 # Speichere Victory Event
+                victory_time = datetime.utcnow()
                 victory_event = GameEvent(
                     game_session_id=active_session.id,
                     event_type="game_victory",
@@ -1233,20 +1254,22 @@ def admin_roll_dice():
                     data_json=json.dumps({
                         "winning_team_id": team.id,
                         "winning_team_name": team.name,
-                        "victory_timestamp": datetime.utcnow().isoformat(),
+                        "victory_timestamp": victory_time.isoformat(),
                         "final_position": team.current_position,
-                        "final_dice_roll": total_roll
+                        "final_dice_roll": total_roll,
+                        "game_session_id": active_session.id
                     })
                 )
                 db.session.add(victory_event)
                 
-                # Setze Spiel auf beendet
+                # Setze Spiel auf beendet und speichere die Endstatistik für die Goodbye-Seite
                 active_session.current_phase = 'GAME_FINISHED'
+                materialize_game_summary(active_session, team.id, victory_time)
                 
-                current_app.logger.info(f"🏆 Victory automatisch ausgelöst für Team {team.name}")
+                dice_log.info('victory_triggered', team=team.name)
                 
             except Exception as ve:
-                current_app.logger.error(f"Fehler beim Victory-Handling: {ve}")
+                dice_log.exception('victory_handling_failed', team=team.name)
                 db.session.rollback()
                 return jsonify({"success": False, "error": f"Victory-Fehler: {str(ve)}"}), 500
 
@@ -1396,8 +1419,9 @@ def set_minigame():
         return redirect(url_for('admin.admin_dashboard'))
 
     minigame_source = form.minigame_source.data
-    current_app.logger.info(f"DEBUG set_minigame: minigame_source='{minigame_source}'")
+    moderation_log.debug('set_minigame', source=minigame_source)
     minigame_set = False
+    pinned_content = None
 
     try:
         if minigame_source == 'manual':
@@ -1407,10 +1431,9 @@ def set_minigame():
             player_count = form.player_count.data or 'all'
             
             if manual_name and manual_description:
-                current_app.logger.info(f"DEBUG set_minigame: Setting minigame name='{manual_name}', description='{manual_description}'")
+                moderation_log.debug('set_minigame_content', source='manual', name=manual_name, description=manual_description)
                 active_session.current_minigame_name = manual_name
                 active_session.current_minigame_description = manual_description
-                current_app.logger.info(f"DEBUG set_minigame: After setting - session.current_minigame_name='{active_session.current_minigame_name}'")
                 active_session.current_player_count = player_count
                 active_session.selected_folder_minigame_id = None
                 active_session.current_question_id = None
@@ -1498,6 +1521,7 @@ def set_minigame():
                 active_session.selected_folder_minigame_id = question_id
                 active_session.current_question_id = question_id
                 active_session.minigame_source = 'direct_question'
+                pinned_content = question_data
                 
                 flash(f"Direkte Frage '{question_name}' erstellt und aktiviert.", 'success')
                 minigame_set = True
@@ -1517,12 +1541,12 @@ def set_minigame():
                     # Markiere als gespielt
                     mark_content_as_played(active_session, random_content['id'])
                     
-                    current_app.logger.info(f"DEBUG set_minigame folder_random: Setting minigame name='{random_content['name']}', description='{random_content.get('description', '')}'")
+                    moderation_log.debug('set_minigame_content', source='folder_random', name=random_content['name'], description=random_content.get('description', ''))
                     active_session.current_minigame_name = random_content['name']
                     active_session.current_minigame_description = random_content.get('description', '')
-                    current_app.logger.info(f"DEBUG set_minigame folder_random: After setting - session.current_minigame_name='{active_session.current_minigame_name}'")
                     active_session.selected_folder_minigame_id = random_content['id']
                     active_session.minigame_source = 'folder_random'
+                    pinned_content = random_content
                     
                     # Setze Spieleranzahl nur bei Minispielen, nicht bei Fragen
                     if random_content.get('type') != 'question':
@@ -1535,10 +1559,10 @@ def set_minigame():
                         valid_counts = ['1', '2', '3', '4', 'all']
                         if minigame_player_count and minigame_player_count in valid_counts:
                             player_count = minigame_player_count
-                            current_app.logger.info(f"Random minigame - using player_count from config: {player_count}")
+                            moderation_log.debug('set_minigame_player_count', source='config', player_count=player_count)
                         else:
                             player_count = form_player_count or 'all'
-                            current_app.logger.info(f"Random minigame - using player_count from form: {player_count} (minigame config was: {minigame_player_count})")
+                            moderation_log.debug('set_minigame_player_count', source='form', player_count=player_count, config_player_count=minigame_player_count)
                         
                         active_session.current_player_count = player_count
                     
@@ -1590,12 +1614,12 @@ def set_minigame():
                     # Markiere als gespielt
                     mark_content_as_played(active_session, selected_content['id'])
                     
-                    current_app.logger.info(f"DEBUG set_minigame folder_selected: Setting minigame name='{selected_content['name']}', description='{selected_content.get('description', '')}'")
+                    moderation_log.debug('set_minigame_content', source='folder_selected', name=selected_content['name'], description=selected_content.get('description', ''))
                     active_session.current_minigame_name = selected_content['name']
                     active_session.current_minigame_description = selected_content.get('description', '')
-                    current_app.logger.info(f"DEBUG set_minigame folder_selected: After setting - session.current_minigame_name='{active_session.current_minigame_name}'")
                     active_session.selected_folder_minigame_id = selected_content['id']
                     active_session.minigame_source = 'folder_selected'
+                    pinned_content = selected_content
                     
                     if selected_content.get('type') == 'question':
                         active_session.current_question_id = selected_content['id']
@@ -1612,10 +1636,10 @@ def set_minigame():
                         valid_counts = ['1', '2', '3', '4', 'all']
                         if minigame_player_count and minigame_player_count in valid_counts:
                             player_count = minigame_player_count
-                            current_app.logger.info(f"Using player_count from minigame config: {player_count}")
+                            moderation_log.debug('set_minigame_player_count', source='config', player_count=player_count)
                         else:
                             player_count = form_player_count or 'all'
-                            current_app.logger.info(f"Using player_count from form: {player_count} (minigame config was: {minigame_player_count})")
+                            moderation_log.debug('set_minigame_player_count', source='form', player_count=player_count, config_player_count=minigame_player_count)
                         
                         active_session.current_player_count = player_count
                         
@@ -1647,11 +1671,12 @@ def set_minigame():
                 ).first()
                 
                 if active_sequence:
-                    current_item = active_sequence.get_current_item()
+                    cursor = active_sequence.cursor()
+                    current_item = cursor.current_item
                     
                     if current_item:
-                        # Lade vollständige Item-Daten aus dem Ordner
-                        full_item_data = get_minigame_from_folder(
+                        # Vollständige Item-Daten (beim letzten Weiterschalten vorab geladen)
+                        full_item_data = get_prefetched_content(
                             active_round.minigame_folder.folder_path, 
                             current_item['id']
                         )
@@ -1661,11 +1686,12 @@ def set_minigame():
                             display_name = full_item_data['name']
                             display_description = full_item_data.get('description', '')
                             
-                            current_app.logger.info(f"DEBUG set_minigame folder_planned: Setting minigame name='{display_name}', description='{display_description}'")
+                            moderation_log.debug('set_minigame_content', source='folder_planned', name=display_name, description=display_description)
                             active_session.current_minigame_name = display_name
                             active_session.current_minigame_description = display_description
                             active_session.selected_folder_minigame_id = current_item['id']
                             active_session.minigame_source = 'folder_planned'
+                            pinned_content = full_item_data
                             
                             # Markiere als gespielt (optional für Tracking)
                             mark_content_as_played(active_session, current_item['id'])
@@ -1674,7 +1700,7 @@ def set_minigame():
                             if current_item.get('type') == 'question':
                                 active_session.current_question_id = current_item['id']
                                 active_session.current_player_count = None
-                                flash(f"Frage '{display_name}' aus Ablaufplan geladen (Position {active_sequence.current_position + 1}/{len(active_sequence.sequence_list)}).", 'info')
+                                flash(f"Frage '{display_name}' aus Ablaufplan geladen (Position {cursor.position + 1}/{cursor.total}).", 'info')
                             else:
                                 active_session.current_question_id = None
                                 
@@ -1694,13 +1720,14 @@ def set_minigame():
                                 
                                 selection_type = "Ganze Teams" if player_count == "all" else f"{player_count} Spieler pro Team"
                                 config_source = " (aus Minigame-Konfiguration)" if minigame_player_count else " (aus Formular)"
-                                flash(f"Minispiel '{display_name}' aus Ablaufplan geladen (Position {active_sequence.current_position + 1}/{len(active_sequence.sequence_list)}, {selection_type}{config_source}).", 'info')
+                                flash(f"Minispiel '{display_name}' aus Ablaufplan geladen (Position {cursor.position + 1}/{cursor.total}, {selection_type}{config_source}).", 'info')
                             
                             # Erweitere Sequenz zum nächsten Item
                             if active_sequence.advance():
-                                current_app.logger.info(f"Sequenz für Ordner '{active_round.minigame_folder.name}' erweitert zu Position {active_sequence.current_position}")
+                                moderation_log.info('sequence_advanced', folder=active_round.minigame_folder.name, position=active_sequence.current_position)
+                                prefetch_upcoming(active_sequence, active_round.minigame_folder.folder_path)
                             else:
-                                current_app.logger.info(f"Sequenz für Ordner '{active_round.minigame_folder.name}' am Ende angelangt")
+                                moderation_log.info('sequence_finished', folder=active_round.minigame_folder.name)
                                 flash(f"Alle Items des Ablaufplans für '{active_round.minigame_folder.name}' wurden abgeschlossen!", 'success')
                             
                             minigame_set = True
@@ -1733,9 +1760,14 @@ def set_minigame():
                 data_json=f'{{"name": "{active_session.current_minigame_name}", "description": "{active_session.current_minigame_description}", "source": "{minigame_source}", "is_question": {bool(active_session.current_question_id)}}}'
             )
             db.session.add(event)
-            current_app.logger.info(f"DEBUG set_minigame: Before commit - session.current_minigame_name='{active_session.current_minigame_name}'")
             db.session.commit()
-            current_app.logger.info(f"DEBUG set_minigame: After commit - session.current_minigame_name='{active_session.current_minigame_name}'")
+            moderation_log.info('minigame_set', session_id=active_session.id, name=active_session.current_minigame_name, phase=active_session.current_phase)
+            
+            # Inhalt einmal auflösen und anheften - Leser gehen nicht mehr ans Dateisystem
+            if pinned_content:
+                pin_active_content(active_session.id, pinned_content)
+            else:
+                unpin_active_content(active_session.id)
 
     except Exception as e:
         db.session.rollback()
@@ -1819,48 +1851,13 @@ def question_responses_api():
                 "message": "Keine aktive Frage"
             })
         
-        responses = QuestionResponse.query.filter_by(
-            game_session_id=active_session.id,
-            question_id=active_session.current_question_id
-        ).join(Team).all()
-        
-        formatted_responses = []
-        for response in responses:
-            answer_preview = ""
-            if response.selected_option is not None:
-                active_round = GameRound.get_active_round()
-                if active_round and active_round.minigame_folder:
-                    question_data = get_question_from_folder(active_round.minigame_folder.folder_path, response.question_id)
-                    if question_data and question_data.get('options'):
-                        options = question_data['options']
-                        if 0 <= response.selected_option < len(options):
-                            answer_preview = f"Option {response.selected_option + 1}: {options[response.selected_option][:30]}..."
-                        else:
-                            answer_preview = f"Option {response.selected_option + 1}"
-                    else:
-                        answer_preview = f"Option {response.selected_option + 1}"
-            elif response.answer_text:
-                answer_preview = response.answer_text[:50]
-                if len(response.answer_text) > 50:
-                    answer_preview += "..."
-            else:
-                answer_preview = "Keine Antwort"
-            
-            formatted_responses.append({
-                "team_id": response.team_id,
-                "team_name": response.team.name,
-                "answer_preview": answer_preview,
-                "is_correct": response.is_correct,
-                "answered_at": response.answered_at.strftime('%H:%M:%S') if response.answered_at else None
-            })
-        
-        formatted_responses.sort(key=lambda x: x['answered_at'] or '99:99:99')
+        teams, formatted_responses, _ = _collect_question_responses(active_session)
         
         return jsonify({
             "success": True,
             "responses": formatted_responses,
             "total_responses": len(formatted_responses),
-            "total_teams": Team.query.count(),
+            "total_teams": len(teams),
             "question_name": active_session.current_minigame_name
         })
         
@@ -1966,6 +1963,10 @@ def reset_game_state_confirmed():
             try:
                 GameEvent.query.delete() 
                 QuestionResponse.query.delete()
+                PlayedContent.query.delete()
+                PlayerRotation.query.delete()
+                GameSummary.query.delete()
+                PositionTimeseries.query.delete()
                 GameSession.query.delete() 
 
                 teams = Team.query.all()
@@ -2071,8 +2072,8 @@ def manage_fields():
         return redirect(url_for('main.index'))
     
     try:
-        # Lade alle Feld-Konfigurationen
-        field_configs = FieldConfiguration.query.order_by(FieldConfiguration.field_type).all()
+        # Lade alle Feld-Konfigurationen (aufgelöst für die aktive Runde)
+        field_configs = sorted(get_cached_field_configs().values(), key=lambda config: config.field_type)
         
         # Aktive Runde für Kontext
         active_round = GameRound.get_active_round()
@@ -2116,8 +2117,9 @@ def edit_field(field_type):
         return redirect(url_for('main.index'))
     
     try:
-        # Lade existierende Konfiguration oder erstelle neue
-        config = FieldConfiguration.get_config_for_field(field_type)
+        # Lade existierende Konfiguration oder erstelle neue (ORM-Zeile mit den Werten der aktiven Runde)
+        editable_configs = get_editable_field_configs([field_type])
+        config = editable_configs[0] if editable_configs else None
         
         if not config:
             # Erstelle neue Konfiguration mit Standard-Werten
@@ -2129,6 +2131,7 @@ def edit_field(field_type):
                 config = create_default_field_config(field_type, field_type.replace('_', ' ').title())
             
             db.session.add(config)
+            invalidate_field_config_cache()
             db.session.commit()
             flash(f"Neue Konfiguration für '{field_type}' erstellt.", 'info')
         
@@ -2205,7 +2208,8 @@ def toggle_field(field_type):
         
         # Feld-Konfiguration laden oder erstellen
         current_app.logger.info(f"Looking for config for field: {field_type}")
-        config = FieldConfiguration.get_config_for_field(field_type)
+        editable_configs = get_editable_field_configs([field_type])
+        config = editable_configs[0] if editable_configs else None
         
         if not config:
             current_app.logger.info(f"No config found for {field_type}, creating new one")
@@ -2234,7 +2238,8 @@ def toggle_field(field_type):
         config.is_enabled = not old_status
         current_app.logger.info(f"Toggling {field_type} from {old_status} to {config.is_enabled}")
         
-        # Cache invalidieren
+        # Aktive Runde aktualisieren und Cache invalidieren
+        sync_active_round_configs([config])
         from app.game_logic.special_fields import clear_field_distribution_cache
         clear_field_distribution_cache()
         
@@ -2456,7 +2461,7 @@ def bulk_edit_fields():
         try:
             # Frontend sendet Feld-Typen (Strings), nicht IDs
             selected_field_types = form.selected_fields.data
-            selected_configs = FieldConfiguration.query.filter(FieldConfiguration.field_type.in_(selected_field_types)).all()
+            selected_configs = get_editable_field_configs(selected_field_types)
             
             if not selected_configs:
                 flash('Keine Felder für Bearbeitung ausgewählt.', 'warning')
@@ -2499,19 +2504,31 @@ def bulk_edit_fields():
                     flash('Neue Hauptfarbe ist erforderlich.', 'warning')
                     
             elif action == 'delete':
+                deleted_field_types = []
                 for config in selected_configs:
                     # Prüfe ob Feld in aktiver Nutzung
                     if config.field_type in ['start', 'goal', 'normal']:
                         flash(f"Basis-Feld '{config.field_type}' kann nicht gelöscht werden.", 'warning')
                         continue
                     db.session.delete(config)
+                    deleted_field_types.append(config.field_type)
                     modified_count += 1
                 
+                # Rundenspezifische Zeilen ebenfalls entfernen, sonst bleiben sie in den Runden sichtbar
+                if deleted_field_types:
+                    RoundFieldConfiguration.query.filter(
+                        RoundFieldConfiguration.field_type.in_(deleted_field_types)
+                    ).delete(synchronize_session=False)
+                
                 if modified_count > 0:
                     flash(f"{modified_count} Feld-Konfigurationen wurden gelöscht.", 'success')
             
-            # Cache invalidieren wenn Änderungen gemacht wurden
+            # Aktive Runde aktualisieren und Cache invalidieren wenn Änderungen gemacht wurden
             if modified_count > 0:
+                if action == 'delete':
+                    invalidate_field_config_cache()
+                else:
+                    sync_active_round_configs(selected_configs)
                 from app.game_logic.special_fields import clear_field_distribution_cache
                 clear_field_distribution_cache()
             
@@ -2575,7 +2592,7 @@ def create_team():
                 # Normalisiere Spielernamen (unterstützt sowohl Komma- als auch Zeilenumbruch-getrennt)
                 raw_members = form.members.data.replace('\n', ',')
                 members_list = [m.strip() for m in raw_members.split(',') if m.strip()]
-                team.members = ', '.join(members_list)
+                team.set_member_names(members_list)
                 
                 # Erstelle PlayerRegistration Einträge für die Spieler
                 welcome_session = WelcomeSession.get_active_session()
@@ -2682,7 +2699,7 @@ def edit_team(team_id):
             # Normalisiere Spielernamen (unterstützt sowohl Komma- als auch Zeilenumbruch-getrennt)
             raw_members = form.members.data.replace('\n', ',')
             members_list = [m.strip() for m in raw_members.split(',') if m.strip()]
-            team.members = ', '.join(members_list) if members_list else None
+            team.set_member_names(members_list)
             
             # Wenn sich die Spielerliste geändert hat, player_config aktualisieren
             # Entferne Einstellungen für Spieler, die nicht mehr im Team sind
@@ -2780,13 +2797,7 @@ def add_player():
         db.session.add(player_registration)
         
         # Füge Spieler auch zur Team-Mitgliederliste hinzu
-        if team.members:
-            current_members = [m.strip() for m in team.members.split(',') if m.strip()]
-            if player_name not in current_members:
-                current_members.append(player_name)
-                team.members = ', '.join(current_members)
-        else:
-            team.members = player_name
+        team.add_member(player_name)
         
         db.session.commit()
         flash(f'Spieler "{player_name}" wurde erfolgreich zu Team "{team.name}" hinzugefügt.', 'success')
@@ -2815,12 +2826,10 @@ def update_player_selection_status(team_id):
             return jsonify({'success': False, 'message': 'Spielername fehlt'}), 400
         
         # Prüfe ob Spieler wirklich im Team ist
-        if team.members:
-            members_list = [m.strip() for m in team.members.split(',') if m.strip()]
-            if player_name not in members_list:
-                return jsonify({'success': False, 'message': 'Spieler nicht im Team gefunden'}), 400
-        else:
+        if not team.member_rows:
             return jsonify({'success': False, 'message': 'Team hat keine Mitglieder'}), 400
+        if team.get_member(player_name) is None:
+            return jsonify({'success': False, 'message': 'Spieler nicht im Team gefunden'}), 400
         
         # Status aktualisieren
         team.update_player_selection_status(player_name, can_be_selected)
@@ -2853,6 +2862,7 @@ def delete_team(team_id):
     GameSession.query.filter_by(current_team_turn_id=team.id).update({"current_team_turn_id": None})
     GameEvent.query.filter_by(related_team_id=team.id).update({"related_team_id": None})
     QuestionResponse.query.filter_by(team_id=team.id).delete()
+    PlayerRotation.query.filter_by(team_id=team.id).delete()
     
     active_sessions = GameSession.query.filter(GameSession.dice_roll_order.like(f"%{str(team.id)}%")).all()
     for sess in active_sessions:
@@ -2922,7 +2932,7 @@ def _update_team_members_from_registrations():
             member_names = [player.player_name for player in assigned_players if player.player_name]
             
             # Aktualisiere das Team
-            team.members = ', '.join(member_names) if member_names else None
+            team.set_member_names(member_names)
             
         current_app.logger.info("Team-Member-Listen wurden aktualisiert")
         
@@ -3010,10 +3020,8 @@ def add_player_to_team():
             return jsonify({'success': False, 'error': 'Team nicht gefunden'})
         
         # Prüfe ob Name bereits in diesem Team existiert
-        if team.members:
-            existing_members = [m.strip() for m in team.members.split(',') if m.strip()]
-            if player_name in existing_members:
-                return jsonify({'success': False, 'error': 'Spieler ist bereits im Team'})
+        if team.get_member(player_name) is not None:
+            return jsonify({'success': False, 'error': 'Spieler ist bereits im Team'})
         
         # Prüfe ob Name bereits in PlayerRegistration existiert
         existing_player = PlayerRegistration.query.filter_by(player_name=player_name).first()
@@ -3049,19 +3057,8 @@ def add_player_to_team():
             )
             db.session.add(new_player)
         
-        # Aktualisiere Team-Members-Liste
-        if team.members:
-            existing_members = [m.strip() for m in team.members.split(',') if m.strip()]
-        else:
-            existing_members = []
-        
-        existing_members.append(player_name)
-        team.members = ', '.join(existing_members)
-        
-        # Aktualisiere player_config für neuen Spieler (kann ausgelost werden)
-        player_config = team.get_player_config() or {}
-        player_config[player_name] = {'can_be_selected': True}
-        team.set_player_config(player_config)
+        # Neuer Spieler (kann ausgelost werden)
+        team.add_member(player_name)
         
         db.session.commit()
         
@@ -3085,7 +3082,7 @@ def add_player_to_team():
 @admin_bp.route('/remove_team_member', methods=['POST'])
 @login_required
 def remove_team_member():
-    """Entfernt einen Spieler aus der team.members Liste (für nachträglich hinzugefügte Spieler)"""
+    """Entfernt einen Spieler aus dem Team (für nachträglich hinzugefügte Spieler)"""
     if not isinstance(current_user, Admin):
         return jsonify({'success': False, 'error': 'Nicht autorisiert'})
     
@@ -3105,27 +3102,16 @@ def remove_team_member():
         if not team:
             return jsonify({'success': False, 'error': 'Team nicht gefunden'})
         
-        # Entferne Spieler aus team.members
-        if not team.members:
+        # Entferne Spieler (samt Einstellungen) aus dem Team
+        if not team.member_rows:
             return jsonify({'success': False, 'error': 'Keine Team-Mitglieder vorhanden'})
         
-        current_members = [m.strip() for m in team.members.split(',') if m.strip()]
-        if player_name not in current_members:
+        if not team.remove_member(player_name):
             return jsonify({'success': False, 'error': 'Spieler ist nicht in der Team-Mitgliederliste'})
         
-        # Entferne Spieler aus der Liste
-        current_members.remove(player_name)
-        team.members = ', '.join(current_members) if current_members else None
-        
-        # Entferne auch aus player_config falls vorhanden
-        player_config = team.get_player_config() or {}
-        if player_name in player_config:
-            del player_config[player_name]
-            team.set_player_config(player_config)
-        
         db.session.commit()
         
-        current_app.logger.info(f"Spieler '{player_name}' aus Team '{team.name}' entfernt (team.members)")
+        current_app.logger.info(f"Spieler '{player_name}' aus Team '{team.name}' entfernt")
         
         return jsonify({
             'success': True,
@@ -3161,45 +3147,31 @@ def move_team_member():
         if not current_team:
             return jsonify({'success': False, 'error': 'Aktuelles Team nicht gefunden'})
         
-        # Entferne Spieler aus aktuellem Team
-        if not current_team.members:
+        # Spieler im aktuellen Team finden
+        if not current_team.member_rows:
             return jsonify({'success': False, 'error': 'Keine Team-Mitglieder im aktuellen Team'})
         
-        current_members = [m.strip() for m in current_team.members.split(',') if m.strip()]
-        if player_name not in current_members:
+        member = current_team.get_member(player_name)
+        if member is None:
             return jsonify({'success': False, 'error': 'Spieler ist nicht im aktuellen Team'})
         
-        # Entferne aus aktuellem Team
-        current_members.remove(player_name)
-        current_team.members = ', '.join(current_members) if current_members else None
-        
-        # Entferne auch aus player_config des aktuellen Teams
-        current_config = current_team.get_player_config() or {}
-        if player_name in current_config:
-            del current_config[player_name]
-            current_team.set_player_config(current_config)
-        
-        # Füge zu neuem Team hinzu (falls nicht 0 = kein Team)
+        # In neues Team verschieben (falls nicht 0 = kein Team): die Zeile wechselt nur das Team,
+        # Emoji und Profilbild bleiben beim Spieler
         if new_team_id and new_team_id != 0:
             new_team = Team.query.get(new_team_id)
             if not new_team:
                 return jsonify({'success': False, 'error': 'Neues Team nicht gefunden'})
             
             # Prüfe ob Spieler bereits im neuen Team ist
-            if new_team.members:
-                new_team_members = [m.strip() for m in new_team.members.split(',') if m.strip()]
-                if player_name in new_team_members:
-                    return jsonify({'success': False, 'error': 'Spieler ist bereits im Ziel-Team'})
-                new_team_members.append(player_name)
-            else:
-                new_team_members = [player_name]
-            
-            new_team.members = ', '.join(new_team_members)
+            if new_team.get_member(player_name) is not None:
+                return jsonify({'success': False, 'error': 'Spieler ist bereits im Ziel-Team'})
             
-            # Füge auch zu player_config des neuen Teams hinzu
-            new_config = new_team.get_player_config() or {}
-            new_config[player_name] = {'can_be_selected': True}
-            new_team.set_player_config(new_config)
+            current_team.member_rows.remove(member)
+            member.position = max((m.position for m in new_team.member_rows), default=-1) + 1
+            member.can_be_selected = True
+            new_team.member_rows.append(member)
+        else:
+            current_team.remove_member(player_name)
         
         db.session.commit()
         
@@ -3250,38 +3222,23 @@ def update_team_member_name():
         if not team:
             return jsonify({'success': False, 'error': 'Team nicht gefunden'})
         
-        # Prüfe ob alter Name in team.members existiert
-        if not team.members:
+        # Prüfe ob alter Name im Team existiert
+        if not team.member_rows:
             return jsonify({'success': False, 'error': 'Keine Team-Mitglieder vorhanden'})
         
-        current_members = [m.strip() for m in team.members.split(',') if m.strip()]
-        if old_player_name not in current_members:
+        if team.get_member(old_player_name) is None:
             return jsonify({'success': False, 'error': 'Alter Spielername nicht in Team-Mitgliederliste gefunden'})
         
         # Prüfe ob neuer Name bereits existiert (in diesem Team oder als PlayerRegistration)
-        if new_player_name in current_members:
+        if team.get_member(new_player_name) is not None:
             return jsonify({'success': False, 'error': 'Neuer Spielername existiert bereits in diesem Team'})
         
         existing_registration = PlayerRegistration.query.filter_by(player_name=new_player_name).first()
         if existing_registration:
             return jsonify({'success': False, 'error': 'Neuer Spielername ist bereits als registrierter Spieler vergeben'})
         
-        # Ändere Namen in team.members
-        updated_members = []
-        for member in current_members:
-            if member == old_player_name:
-                updated_members.append(new_player_name)
-            else:
-                updated_members.append(member)
-        
-        team.members = ', '.join(updated_members)
-        
-        # Ändere auch Namen in player_config falls vorhanden
-        player_config = team.get_player_config() or {}
-        if old_player_name in player_config:
-            player_config[new_player_name] = player_config[old_player_name]
-            del player_config[old_player_name]
-            team.set_player_config(player_config)
+        # Namen ändern (Einstellungen und Profilbild bleiben an der Zeile)
+        team.rename_member(old_player_name, new_player_name)
         
         db.session.commit()
         
@@ -3321,21 +3278,11 @@ def delete_player():
         # Spieler aus Team-Members entfernen falls vorhanden
         if player.assigned_team_id:
             team = Team.query.get(player.assigned_team_id)
-            if team and team.members:
-                existing_members = [m.strip() for m in team.members.split(',') if m.strip()]
-                if player.player_name in existing_members:
-                    existing_members.remove(player.player_name)
-                    team.members = ', '.join(existing_members) if existing_members else None
-                    
-                    # Auch aus player_config entfernen
-                    player_config = team.get_player_config() or {}
-                    if player.player_name in player_config:
-                        del player_config[player.player_name]
-                        team.set_player_config(player_config)
+            if team:
+                team.remove_member(player.player_name)
         
         # Profilbild löschen falls vorhanden
         if player.profile_image_path:
-            import os
             image_path = os.path.join(current_app.root_path, 'static', player.profile_image_path.lstrip('/static/'))
             if os.path.exists(image_path):
                 try:
@@ -3366,11 +3313,7 @@ def upload_team_player_image():
         return jsonify({'success': False, 'error': 'Nicht autorisiert'})
     
     try:
-        import base64
-        import binascii
-        import os
         from PIL import Image
-        import io
         
         data = request.get_json()
         if not data:
@@ -3519,32 +3462,20 @@ def update_player_emoji():
             team.set_player_config(player_config)
             
         else:  # player_type == 'member'
-            # Spieler in team.members (nachträglich hinzugefügter Spieler)
-            members = team.members.split(',') if team.members else []
-            clean_members = [m.strip() for m in members]
-            
-            if player_name not in clean_members:
+            # Spieler im Team (nachträglich hinzugefügter Spieler)
+            member = team.get_member(player_name)
+            if member is None:
                 return jsonify({'success': False, 'error': 'Team-Mitglied nicht gefunden'})
             
             # CLEANUP: Entferne vorhandenes Profilbild falls vorhanden (Wechsel von Bild zu Emoji)
-            profile_images = team.get_profile_images() or {}
-            if player_name in profile_images:
-                old_file_path = os.path.join(current_app.static_folder, profile_images[player_name])
+            if member.profile_image:
+                old_file_path = os.path.join(current_app.static_folder, member.profile_image)
                 if os.path.exists(old_file_path):
                     os.remove(old_file_path)
                     current_app.logger.info(f"Removed old profile image: {old_file_path}")
-                
-                del profile_images[player_name]
-                team.profile_images = json.dumps(profile_images)
-            
-            # Emoji in player_config speichern
-            player_config = team.get_player_config()
-            if player_name not in player_config:
-                player_config[player_name] = {}
-            player_config[player_name]['emoji'] = new_emoji
+                member.profile_image = None
             
-            # Speichere in Team player_config
-            team.set_player_config(player_config)
+            member.emoji = new_emoji
         
         db.session.commit()
         
@@ -3567,11 +3498,7 @@ def update_player_image():
         return jsonify({'success': False, 'error': 'Nicht autorisiert'})
     
     try:
-        import base64
-        import binascii
-        import os
         from PIL import Image
-        import io
         
         data = request.get_json()
         if not data:
@@ -3610,23 +3537,17 @@ def update_player_image():
                     player.profile_image_path = None
             
             else:  # member
-                # Prüfe ob Spieler in team.members existiert
-                members = team.members.split(',') if team.members else []
-                clean_members = [m.strip() for m in members]
-                
-                if player_name not in clean_members:
+                member = team.get_member(player_name)
+                if member is None:
                     return jsonify({'success': False, 'error': 'Team-Mitglied nicht gefunden'})
                 
                 # Team-Mitglied Profilbild entfernen
-                profile_images = team.get_profile_images() or {}
-                if player_name in profile_images:
+                if member.profile_image:
                     # Entferne Datei falls vorhanden
-                    old_file_path = os.path.join(current_app.static_folder, profile_images[player_name])
+                    old_file_path = os.path.join(current_app.static_folder, member.profile_image)
                     if os.path.exists(old_file_path):
                         os.remove(old_file_path)
-                    
-                    del profile_images[player_name]
-                    team.profile_images = json.dumps(profile_images)
+                    member.profile_image = None
             
             db.session.commit()
             return jsonify({
@@ -3675,7 +3596,6 @@ def update_player_image():
                 os.makedirs(upload_dir, exist_ok=True)
                 
                 # Generiere Dateinamen
-                import time
                 filename = f"player_{team_id}_{player_name}_{int(time.time())}.jpg"
                 file_path = os.path.join(upload_dir, filename)
                 relative_path = f"team_images/{filename}"
@@ -3712,34 +3632,22 @@ def update_player_image():
                     player.profile_image_path = relative_path
                 
                 else:  # member
-                    # Prüfe ob Spieler in team.members existiert
-                    members = team.members.split(',') if team.members else []
-                    clean_members = [m.strip() for m in members]
-                    
-                    if player_name not in clean_members:
+                    member = team.get_member(player_name)
+                    if member is None:
                         return jsonify({'success': False, 'error': 'Team-Mitglied nicht gefunden'})
                     
-                    # Team-Mitglied Profilbild aktualisieren
-                    profile_images = team.get_profile_images() or {}
-                    
                     # Entferne altes Bild falls vorhanden
-                    if player_name in profile_images:
-                        old_file_path = os.path.join(current_app.static_folder, profile_images[player_name])
+                    if member.profile_image:
+                        old_file_path = os.path.join(current_app.static_folder, member.profile_image)
                         if os.path.exists(old_file_path):
                             os.remove(old_file_path)
                     
-                    # CLEANUP: Entferne Emoji-Config falls vorhanden (Wechsel von Emoji zu Bild)
-                    player_config = team.get_player_config()
-                    if player_name in player_config and 'emoji' in player_config[player_name]:
-                        del player_config[player_name]['emoji']
-                        # Entferne den ganzen Player-Eintrag wenn er leer ist
-                        if not player_config[player_name]:
-                            del player_config[player_name]
-                        team.set_player_config(player_config)
+                    # CLEANUP: Entferne Emoji falls vorhanden (Wechsel von Emoji zu Bild)
+                    if member.emoji:
+                        member.emoji = None
                         current_app.logger.info(f"Removed emoji config for player: {player_name}")
                     
-                    profile_images[player_name] = relative_path
-                    team.profile_images = json.dumps(profile_images)
+                    member.profile_image = relative_path
                 
                 db.session.commit()
                 
@@ -4253,6 +4161,7 @@ def delete_round(round_id):
                 if other_round:
                     other_round.is_active = True
                     flash(f"Runde '{other_round.name}' wurde automatisch aktiviert.", 'info')
+                invalidate_field_config_cache(active_round_id=other_round.id if other_round else None)
             
             db.session.commit()
             
@@ -4330,9 +4239,12 @@ def backup_rounds():
         
         elif action == 'restore_all':
             try:
-                restored_count = restore_rounds_to_database()
-                if restored_count > 0:
-                    flash(f"✅ {restored_count} Runden erfolgreich wiederhergestellt!", 'success')
+                result = restore_saved_rounds(progress=lambda stage, done, total: current_app.logger.info(
+                    f"Wiederherstellung {stage}: {done}/{total}"))
+                if result['errors']:
+                    flash(f"❌ Wiederherstellung abgebrochen: {'; '.join(result['errors'][:5])}", 'danger')
+                elif result['restored'] > 0:
+                    flash(f"✅ {result['restored']} Runden erfolgreich wiederhergestellt!", 'success')
                 else:
                     flash("ℹ️ Keine Runden zum Wiederherstellen gefunden.", 'info')
             except Exception as e:
@@ -4369,14 +4281,14 @@ def backup_rounds():
         # Aktuelle Runden in der Datenbank
         db_rounds = GameRound.query.order_by(GameRound.name).all()
         
-        # Gesicherte Runden im Dateisystem
-        saved_rounds = load_rounds_from_filesystem()
+        # Gesicherte Runden im Dateisystem (aus den Backup-Manifesten)
+        saved_rounds = load_backup_summaries()
         
         # Statistiken
         stats = {
             'db_rounds_count': len(db_rounds),
             'saved_rounds_count': len(saved_rounds),
-            'total_storage_used': sum(len(json.dumps(r, ensure_ascii=False)) for r in saved_rounds)
+            'total_storage_used': sum(r['size'] for r in saved_rounds)
         }
         
         return render_template('backup_rounds.html', 
@@ -4445,107 +4357,39 @@ def start_welcome():
 @admin_bp.route('/api/reset-game-complete', methods=['POST'])
 @login_required
 def reset_game_complete():
-    """Setzt das komplette Spiel zurück - löscht alle Teams, Sessions, Minigame-Daten etc."""
+    """Setzt das komplette Spiel zurück - löscht alle Teams, Sessions, Minigame-Daten etc. (im Hintergrund)"""
     if not isinstance(current_user, Admin):
         return jsonify({"success": False, "error": "Nur Admins können das Spiel zurücksetzen"}), 403
-    
-    try:
-        current_app.logger.info(f"Complete game reset initiated by admin: {current_user.username}")
-        
-        # Sammle Statistiken vor dem Reset für Logging
-        teams_count = Team.query.count()
-        sessions_count = GameSession.query.count()
-        events_count = GameEvent.query.count()
-        registrations_count = PlayerRegistration.query.count()
-        welcome_sessions_count = WelcomeSession.query.count()
-        
-        current_app.logger.info(f"Reset stats - Teams: {teams_count}, Sessions: {sessions_count}, Events: {events_count}, Registrations: {registrations_count}, Welcome Sessions: {welcome_sessions_count}")
-        
-        # 1. Lösche alle PlayerRegistrations
-        PlayerRegistration.query.delete()
-        current_app.logger.info("PlayerRegistrations deleted")
-        
-        # 2. Lösche alle WelcomeSessions
-        WelcomeSession.query.delete()
-        current_app.logger.info("WelcomeSessions deleted")
-        
-        # 3. Lösche alle GameEvents
-        GameEvent.query.delete()
-        current_app.logger.info("GameEvents deleted")
-        
-        # 4. Lösche alle GameSessions
-        GameSession.query.delete()
-        current_app.logger.info("GameSessions deleted")
-        
-        # 5. Setze alle Charaktere auf nicht ausgewählt
-        Character.query.update({'is_selected': False})
-        current_app.logger.info("Characters reset to not selected")
-        
-        # 6. Lösche alle Teams
-        Team.query.delete()
-        current_app.logger.info("Teams deleted")
-        
-        # 7. Lösche Profilbilder
-        try:
-            import os
-            import shutil
-            profile_images_dir = os.path.join(current_app.root_path, 'static', 'profile_images')
-            if os.path.exists(profile_images_dir):
-                # Lösche alle Dateien im Ordner, aber behalte den Ordner
-                for filename in os.listdir(profile_images_dir):
-                    file_path = os.path.join(profile_images_dir, filename)
-                    try:
-                        if os.path.isfile(file_path):
-                            os.remove(file_path)
-                        elif os.path.isdir(file_path):
-                            shutil.rmtree(file_path)
-                    except Exception as file_e:
-                        current_app.logger.warning(f"Could not delete profile image file {file_path}: {file_e}")
-                current_app.logger.info("Profile images cleared")
-        except Exception as profile_e:
-            current_app.logger.warning(f"Error clearing profile images: {profile_e}")
-        
-        # 8. Lösche gespielte Content-IDs aus aktiven Runden (Reset für Minigames)
-        try:
-            from app.models import GameRound
-            active_round = GameRound.get_active_round()
-            if active_round:
-                # Reset der gespielten Inhalte
-                if hasattr(active_round, 'reset_played_content'):
-                    active_round.reset_played_content()
-                current_app.logger.info("Active round played content reset")
-        except Exception as round_e:
-            current_app.logger.warning(f"Error resetting round content: {round_e}")
-        
-        # 9. Commit alle Änderungen
-        db.session.commit()
-        
-        # 10. NEU: Automatisch Welcome-System starten nach Reset
-        try:
-            new_welcome_session = WelcomeSession(is_active=True)
-            db.session.add(new_welcome_session)
-            db.session.commit()
-            current_app.logger.info("Welcome-System automatisch nach Reset gestartet")
-            
-            return jsonify({
-                "success": True,
-                "message": f"Spiel komplett zurückgesetzt und Welcome-System gestartet! {teams_count} Teams, {sessions_count} Sessions und alle Spieldaten wurden gelöscht.",
-                "welcome_started": True
-            })
-        except Exception as welcome_e:
-            current_app.logger.error(f"Fehler beim automatischen Starten des Welcome-Systems nach Reset: {welcome_e}")
-            return jsonify({
-                "success": True,
-                "message": f"Spiel komplett zurückgesetzt! {teams_count} Teams, {sessions_count} Sessions und alle Spieldaten wurden gelöscht. Welcome-System konnte nicht automatisch gestartet werden.",
-                "welcome_started": False
-            })
-        
-        current_app.logger.info(f"Complete game reset completed successfully by admin: {current_user.username}")
-        
-    except Exception as e:
-        db.session.rollback()
-        current_app.logger.error(f"Fehler beim kompletten Spiel-Reset: {e}", exc_info=True)
-        return jsonify({"success": False, "error": f"Fehler beim Zurücksetzen: {str(e)}"}), 500
+
+    current_app.logger.info(f"Complete game reset initiated by admin: {current_user.username}")
+    job_id = start_reset_job(current_user.username)
+    if job_id is None:
+        running_id = get_running_reset()
+        return jsonify({
+            "success": False,
+            "error": "Es läuft bereits ein Reset",
+            "job_id": running_id,
+            "status_url": url_for('admin.reset_game_status', job_id=running_id) if running_id else None
+        }), 409
+
+    return jsonify({
+        "success": True,
+        "job_id": job_id,
+        "status_url": url_for('admin.reset_game_status', job_id=job_id)
+    }), 202
+
+@admin_bp.route('/api/reset-game-status')
+@admin_bp.route('/api/reset-game-status/<job_id>')
+@login_required
+def reset_game_status(job_id=None):
+    """Fortschritt eines Spiel-Resets (ohne ID: des zuletzt gestarteten)"""
+    if not isinstance(current_user, Admin):
+        return jsonify({"success": False, "error": "Nur für Admins"}), 403
+
+    status = get_reset_status(job_id)
+    if status is None:
+        return jsonify({"success": False, "error": "Reset-Job nicht gefunden"}), 404
+    return jsonify({"success": True, **status})
 
 @admin_bp.route('/api/create-teams', methods=['POST'])
 @login_required
@@ -4555,8 +4399,6 @@ def create_teams():
         return jsonify({"success": False, "error": "Nur Admins können Teams erstellen"}), 403
     
     try:
-        import random
-        import string
         
         data = request.get_json()
         team_count = data.get('team_count')
@@ -4582,7 +4424,6 @@ def create_teams():
         current_app.logger.info(f"Spieler vor Mischen: {[p.player_name for p in players_list]}")
         
         # Mehrfaches Mischen für bessere Zufälligkeit
-        import time
         random.seed(int(time.time() * 1000000) % 1000000)  # Microsekunden-basierter Seed
         for _ in range(3):
             random.shuffle(players_list)
@@ -4599,7 +4440,6 @@ def create_teams():
             # Erstelle Team
             team = Team(
                 name=f"Team {i+1}",
-                members="",  # Wird später mit Spielernamen gefüllt
                 welcome_password=password  # Speichere Klartext-Passwort für Welcome-System
             )
             team.set_password(password)
@@ -4621,14 +4461,11 @@ def create_teams():
             # Setze Team-Zuordnung für Spieler
             player.assigned_team_id = selected_team["team"].id
             selected_team["members"].append(player.player_name)
+            member = selected_team["team"].add_member(player.player_name)
             
             # Kopiere Profilbild ins Team falls vorhanden
-            if player.profile_image_path:
-                selected_team["team"].set_profile_image(player.player_name, player.profile_image_path)
-        
-        # Aktualisiere Team-Members String
-        for team_data in created_teams:
-            team_data["team"].members = ", ".join(team_data["members"])
+            if member is not None and player.profile_image_path:
+                member.profile_image = player.profile_image_path
         
         # Markiere Welcome-Session als teams_created
         welcome_session.teams_created = True
@@ -4641,7 +4478,6 @@ def create_teams():
         # Erstelle Response mit Team-Informationen (inkl. Passwörter für Admin)
         # Sortiere Teams korrekt (Team 1, Team 2, Team 3, ...)
         def extract_team_number(team_name):
-            import re
             match = re.search(r'Team (\d+)', team_name)
             return int(match.group(1)) if match else 999  # 999 für Teams ohne Nummer
         
@@ -4774,7 +4610,7 @@ def player_rotation_stats():
                     'players': stats['players'],
                     'most_played': stats['most_played'],
                     'least_played': stats['least_played'],
-                    'team_members': team.members.split(', ') if team.members else []
+                    'team_members': team.get_member_names()
                 }
         
         return jsonify({
@@ -4844,7 +4680,6 @@ def api_field_minigame_counts():
         return jsonify({'error': 'Zugriff verweigert'}), 403
     
     try:
-        import os
         
         team_vs_all_path = os.path.join(current_app.static_folder, 'field_minigames', 'team_vs_all')
         team_vs_team_path = os.path.join(current_app.static_folder, 'field_minigames', 'team_vs_team')
@@ -5126,6 +4961,8 @@ def update_sequence(folder_id):
         sequence.updated_at = datetime.utcnow()
         
         db.session.commit()
+        if sequence.is_active:
+            prefetch_upcoming(sequence, folder.folder_path)
         flash('Ablaufplan erfolgreich gespeichert.', 'success')
         
     except json.JSONDecodeError:
@@ -5153,6 +4990,7 @@ def activate_sequence(folder_id):
             sequence.is_active = True
             sequence.updated_at = datetime.utcnow()
             db.session.commit()
+            prefetch_upcoming(sequence, folder.folder_path)
             flash('Ablaufplan wurde aktiviert.', 'success')
         else:
             flash('Kein Ablaufplan für diesen Ordner gefunden.', 'warning')
@@ -5212,25 +5050,24 @@ def api_sequence_status():
             return jsonify({'has_sequence': False})
         
         # Sequenz-Daten für Frontend aufbereiten
+        cursor = active_sequence.cursor()
         sequence_data = {
             'has_sequence': True,
             'is_active': active_sequence.is_active,
-            'has_items': len(active_sequence.sequence_list) > 0,
+            'has_items': cursor.total > 0,
             'folder_name': active_round.minigame_folder.name,
-            'current_position': active_sequence.current_position,
-            'total_items': len(active_sequence.sequence_list),
-            'progress_percentage': active_sequence.get_progress_percentage(),
-            'sequence_list': active_sequence.sequence_list
+            'current_position': cursor.position,
+            'total_items': cursor.total,
+            'progress_percentage': cursor.progress_percentage,
+            'sequence_list': list(cursor.items)
         }
         
         # Aktuelles und nächstes Item
-        current_item = active_sequence.get_current_item()
-        if current_item:
-            sequence_data['current_item'] = current_item
+        if cursor.current_item:
+            sequence_data['current_item'] = cursor.current_item
         
-        next_item = active_sequence.get_next_item()
-        if next_item:
-            sequence_data['next_item'] = next_item
+        if cursor.next_item:
+            sequence_data['next_item'] = cursor.next_item
             
         return jsonify(sequence_data)
         
@@ -5260,8 +5097,6 @@ def handle_minigame_result_phase(active_session):
     
     if active_session.field_minigame_content_id:
         try:
-            import os
-            import json
             
             # Parse die Content-ID (format: "mode:filename")
             if ':' in active_session.field_minigame_content_id:
@@ -5321,8 +5156,6 @@ def check_minigame_field_status():
             opponent_team = Team.query.get(active_session.field_minigame_opponent_team_id)
         
         # Hole verfügbare Feld-Minispiele aus BEIDEN Modi - Admin soll wählen
-        import os
-        import json
         
         available_minigames = {
             'team_vs_all': [],
@@ -5414,7 +5247,6 @@ def start_field_minigame():
             other_teams = Team.query.filter(Team.id != landing_team_id).all()
             
             if other_teams:
-                import random
                 opponent_team = random.choice(other_teams)
                 active_session.field_minigame_opponent_team_id = opponent_team.id
             else:
@@ -5551,7 +5383,7 @@ def debug_field_distribution():
             current_app.logger.info(f"Position {pos}: {field_type}")
         
         # Hole Minigame-Konfiguration
-        minigame_config = FieldConfiguration.query.filter_by(field_type='minigame').first()
+        minigame_config = FieldConfiguration.get_config_for_field('minigame')
         config_info = {}
         if minigame_config:
             config_info = {
@@ -0,0 +1,195 @@
+"""
+Vorberechnete Kataloge für Charaktere und Charakter-Teile
+Die Kataloge ändern sich nur über init_characters bzw. Admin-Änderungen. Sie werden
+deshalb einmal geladen, jeder Eintrag wird einmal serialisiert und der ganze Katalog
+erhält ein ETag aus seinem Inhalt. Pro Team wird nur noch die Verfügbarkeit als
+Bitmaske (Bit i = Eintrag i verfügbar) berechnet und über die Einträge gelegt.
+
+Änderungen an Character/CharacterPart verwerfen die Kataloge erst nach dem Commit:
+Mapper-Events merken die Änderung in der Session vor, after_commit verwirft, ein
+Rollback vergisst die Markierung. Ein Generationszähler verhindert, dass ein vor dem
+Commit begonnener Neuaufbau den alten Stand ablegt. Reine Auswahländerungen
+(Character.is_selected) zählen nicht als Katalogänderung.
+"""
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from ..models import db, Character, CharacterPart
+
+# Spalten, die nicht in die Kataloge eingehen
+_IGNORED_COLUMNS = {'is_selected', 'updated_at'}
+
+_PENDING_KEY = 'character_catalogs_pending'
+
+_lock = threading.Lock()  # serialisiert den Neuaufbau
+_state_lock = threading.Lock()  # Generation und Ablage
+_catalogs = {}  # {'characters' | 'parts': Catalog}
+_generation = 0
+
+
+@dataclass
+class Catalog:
+    """Serialisierter Katalog mit Verfügbarkeits-Overlay pro Team"""
+    rows: List[object]  # transiente Kopien für is_available_for_team()
+    variants: List[Tuple[str, str]]  # pro Eintrag (nicht verfügbar, verfügbar) als JSON
+    keys: List[Tuple[Optional[str], Optional[str]]]  # (category, subcategory) pro Eintrag
+    digest: str
+    _masks: Dict[Optional[int], int] = field(default_factory=dict)
+
+    def availability_mask(self, team=None) -> int:
+        """Bitmaske der für das Team verfügbaren Einträge (pro Team zwischengespeichert)"""
+        team_id = getattr(team, 'id', None)
+        mask = self._masks.get(team_id)
+        if mask is None:
+            mask = 0
+            for position, row in enumerate(self.rows):
+                if row.is_available_for_team(team):
+                    mask |= 1 << position
+            self._masks[team_id] = mask
+        return mask
+
+    def render(self, mask: int, category=None, subcategory=None) -> str:
+        """Setzt die JSON-Antwort aus den vorserialisierten Einträgen zusammen"""
+        items = []
+        for position, variant in enumerate(self.variants):
+            if category is not None:
+                row_category, row_subcategory = self.keys[position]
+                if row_category != category or (subcategory and row_subcategory != subcategory):
+                    continue
+            items.append(variant[(mask >> position) & 1])
+        return '[' + ','.join(items) + ']'
+
+    def etag(self, mask: int, category=None, subcategory=None) -> str:
+        scope = f'{category or ""}/{subcategory or ""}'
+        return f'{self.digest}-{mask:x}-{hashlib.sha1(scope.encode("utf-8")).hexdigest()[:8]}'
+
+
+def _transient_copy(model, row):
+    """Kopie ohne Session-Bindung, damit Modell-Methoden auch nach dem Request funktionieren"""
+    return model(**{column.key: getattr(row, column.key) for column in model.__table__.columns})
+
+
+def _serialize(info: dict) -> Tuple[str, str]:
+    # Gleiches Format wie jsonify (sortierte Schlüssel, kompakt)
+    variants = []
+    for is_available in (False, True):
+        info['is_available'] = is_available
+        variants.append(json.dumps(info, sort_keys=True, separators=(',', ':')))
+    return variants[0], variants[1]
+
+
+def _character_info(char) -> dict:
+    return {
+        'id': char.id,
+        'name': char.name,
+        'description': char.description,
+        'category': char.category,
+        'rarity': char.rarity,
+        'color': char.color,
+        'is_unlocked': char.is_unlocked,
+        'stats': char.get_stats(),
+        'customization_options': char.get_customization_options(),
+        'preview_image': char.preview_image,
+        'thumbnail': char.thumbnail
+    }
+
+
+def _part_info(part) -> dict:
+    return {
+        'id': part.id,
+        'name': part.name,
+        'category': part.category,
+        'subcategory': part.subcategory,
+        'rarity': part.rarity,
+        'is_unlocked': part.is_unlocked,
+        'asset_path': part.asset_path,
+        'icon_path': part.icon_path,
+        'color_customizable': part.color_customizable,
+        'default_color': part.default_color,
+        'description': part.description,
+        'compatible_body_types': part.get_compatible_body_types(),
+        'compatible_face_shapes': part.get_compatible_face_shapes(),
+        'stats_modifier': part.get_stats_modifier(),
+        'special_effects': part.get_special_effects()
+    }
+
+
+def _build(model, describe) -> Catalog:
+    rows = [_transient_copy(model, row) for row in db.session.scalars(db.select(model).order_by(model.id))]
+    variants = [_serialize(describe(row)) for row in rows]
+    keys = [(row.category, getattr(row, 'subcategory', None)) for row in rows]
+    digest = hashlib.sha1('\n'.join(v[1] for v in variants).encode('utf-8')).hexdigest()[:16]
+    return Catalog(rows=rows, variants=variants, keys=keys, digest=digest)
+
+
+def _get_catalog(name, model, describe) -> Catalog:
+    catalog = _catalogs.get(name)
+    if catalog is None:
+        with _lock:
+            catalog = _catalogs.get(name)
+            if catalog is None:
+                generation = _generation
+                catalog = _build(model, describe)
+                with _state_lock:
+                    # Nur ablegen, wenn seit dem Lesen nichts invalidiert wurde und die eigene Session nichts Offenes hat
+                    if generation == _generation and not db.session.info.get(_PENDING_KEY):
+                        _catalogs[name] = catalog
+    return catalog
+
+
+def get_character_catalog() -> Catalog:
+    return _get_catalog('characters', Character, _character_info)
+
+
+def get_character_part_catalog() -> Catalog:
+    return _get_catalog('parts', CharacterPart, _part_info)
+
+
+def invalidate_character_catalogs():
+    """Verwirft beide Kataloge sofort; der nächste Zugriff baut sie neu auf"""
+    global _generation
+    with _state_lock:
+        _generation += 1
+        _catalogs.clear()
+
+
+def _mark_pending(target):
+    session = object_session(target)
+    if session is None:
+        invalidate_character_catalogs()
+    else:
+        session.info[_PENDING_KEY] = True
+
+
+def _on_catalog_insert_or_delete(mapper, connection, target):
+    _mark_pending(target)
+
+
+def _on_catalog_update(mapper, connection, target):
+    for attr in inspect(target).attrs:
+        if attr.key not in _IGNORED_COLUMNS and attr.history.has_changes():
+            _mark_pending(target)
+            return
+
+
+def _invalidate_after_commit(session):
+    if session.info.pop(_PENDING_KEY, None):
+        invalidate_character_catalogs()
+
+
+def _forget_after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+for _model in (Character, CharacterPart):
+    event.listen(_model, 'after_insert', _on_catalog_insert_or_delete)
+    event.listen(_model, 'after_delete', _on_catalog_insert_or_delete)
+    event.listen(_model, 'after_update', _on_catalog_update)
+event.listen(Session, 'after_commit', _invalidate_after_commit)
+event.listen(Session, 'after_rollback', _forget_after_rollback)
@@ -0,0 +1,225 @@
+"""
+Archivierung von GameEvents beendeter Spiele
+Events einer Sitzung in Phase GAME_FINISHED werden als JSON Lines (gzip) in eine Datei
+pro Sitzung geschrieben und danach aus der Live-Tabelle gelöscht. Die Live-Tabelle
+enthält dadurch nur noch laufende bzw. frisch beendete Spiele, die Abfragen der
+Polling-Endpunkte bleiben klein.
+
+Lesende Auswertungen (Goodbye-Seite, Statistiken) verwenden get_session_events():
+Live-Events und archivierte Events einer Sitzung werden zusammengeführt.
+Archivierte Events sind ArchivedEvent-Objekte mit denselben Feldern wie GameEvent.
+
+Der Dateiname enthält neben der Sitzungs-ID den Startzeitpunkt der Sitzung,
+damit nach einem Reset (IDs beginnen wieder bei 1) kein fremdes Archiv gelesen wird.
+"""
+import ast
+import gzip
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from flask import current_app
+
+from ..json_fields import json_dumps, json_loads
+from ..log import get_logger
+from ..models import db, GameEvent, GameSession
+
+log = get_logger('wii.board')
+
+ARCHIVE_BATCH_SIZE = 1000
+
+_EVENT_COLUMNS = ('id', 'game_session_id', 'timestamp', 'event_type', 'description', 'related_team_id', 'data_json')
+
+_archive_cache = {}  # {pfad: (mtime, List[ArchivedEvent])}
+
+
+@dataclass(frozen=True)
+class ArchivedEvent:
+    """Schreibgeschützte Sicht auf ein archiviertes GameEvent"""
+    id: int
+    game_session_id: int
+    timestamp: Optional[datetime]
+    event_type: str
+    description: Optional[str]
+    related_team_id: Optional[int]
+    data_json: Optional[str]
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        if not self.data_json:
+            return {}
+        try:
+            return json.loads(self.data_json)
+        except json.JSONDecodeError:
+            # Ältere Victory-Events wurden als Python-dict-Repr gespeichert
+            try:
+                return ast.literal_eval(self.data_json)
+            except (ValueError, SyntaxError):
+                return {}
+
+
+def get_archive_dir() -> str:
+    return current_app.config.get('EVENT_ARCHIVE_DIR') or os.path.join(current_app.instance_path, 'event_archive')
+
+
+def archive_path(game_session) -> str:
+    """Pfad der Archivdatei einer Sitzung (ID + Startzeitpunkt)"""
+    started = game_session.start_time.strftime('%Y%m%d%H%M%S') if game_session.start_time else 'unbekannt'
+    return os.path.join(get_archive_dir(), f'session_{game_session.id}_{started}.jsonl.gz')
+
+
+def _event_key(event_id, timestamp, event_type):
+    """
+    Identität eines Events über Archiv und Live-Tabelle hinweg. Die ID allein reicht nicht:
+    SQLite vergibt nach dem Löschen der höchsten IDs dieselben IDs erneut.
+    """
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.isoformat()
+    return event_id, timestamp, event_type
+
+
+def _row_to_line(row) -> str:
+    entry = dict(zip(_EVENT_COLUMNS, row))
+    if entry['timestamp'] is not None:
+        entry['timestamp'] = entry['timestamp'].isoformat()
+    return json_dumps(entry) + '\n'
+
+
+def _line_to_event(line: str) -> ArchivedEvent:
+    entry = json_loads(line)
+    timestamp = entry.get('timestamp')
+    return ArchivedEvent(
+        id=entry['id'],
+        game_session_id=entry['game_session_id'],
+        timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
+        event_type=entry['event_type'],
+        description=entry.get('description'),
+        related_team_id=entry.get('related_team_id'),
+        data_json=entry.get('data_json'),
+    )
+
+
+def archive_session_events(game_session) -> int:
+    """
+    Schreibt alle Events einer beendeten Sitzung ins Archiv und löscht sie aus der Tabelle.
+
+    Die Datei wird zuerst vollständig (unter temporärem Namen) geschrieben; gelöscht
+    wird erst, wenn die Anzahl der geschriebenen Zeilen stimmt. Gibt die Anzahl der
+    archivierten Events zurück (0, wenn nichts zu tun war).
+    """
+    if game_session.current_phase != 'GAME_FINISHED':
+        raise ValueError(f"Sitzung {game_session.id} ist nicht beendet (Phase {game_session.current_phase})")
+
+    expected = GameEvent.query.filter_by(game_session_id=game_session.id).count()
+    if not expected:
+        return 0
+
+    path = archive_path(game_session)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + '.tmp'
+    columns = [getattr(GameEvent, name) for name in _EVENT_COLUMNS]
+    rows = db.session.execute(
+        db.select(*columns).where(GameEvent.game_session_id == game_session.id).order_by(GameEvent.id)
+    ).yield_per(ARCHIVE_BATCH_SIZE)
+
+    written = 0
+    archived_keys = set()
+    with gzip.open(temp_path, 'wt', encoding='utf-8') as archive:
+        # Bestehendes Archiv (z.B. aus einem früheren Teil-Lauf) übernehmen
+        if os.path.exists(path):
+            with gzip.open(path, 'rt', encoding='utf-8') as existing:
+                for line in existing:
+                    if line.strip():
+                        entry = json_loads(line)
+                        archived_keys.add(_event_key(entry['id'], entry.get('timestamp'), entry['event_type']))
+                        archive.write(line)
+        for row in rows:
+            # Schon archiviert, aber nicht gelöscht (Abbruch nach os.replace): nicht doppelt schreiben
+            if _event_key(row[0], row[2], row[3]) not in archived_keys:
+                archive.write(_row_to_line(row))
+            written += 1
+
+    if written != expected:
+        os.remove(temp_path)
+        raise RuntimeError(f"Archiv für Sitzung {game_session.id} unvollständig ({written}/{expected})")
+
+    os.replace(temp_path, path)
+    _archive_cache.pop(path, None)
+    GameEvent.query.filter_by(game_session_id=game_session.id).delete(synchronize_session=False)
+    db.session.commit()
+    log.info('events_archived', session_id=game_session.id, events=written, path=path)
+    return written
+
+
+def archive_finished_sessions(older_than: Optional[timedelta] = None) -> Dict[int, int]:
+    """
+    Archiviert alle beendeten Sitzungen mit Live-Events.
+
+    older_than: nur Sitzungen, deren letztes Event älter ist (None = alle beendeten).
+    Gibt {sitzungs_id: anzahl_events} zurück.
+    """
+    query = db.session.query(GameSession.id, db.func.max(GameEvent.timestamp)) \
+        .join(GameEvent, GameEvent.game_session_id == GameSession.id) \
+        .filter(GameSession.current_phase == 'GAME_FINISHED') \
+        .group_by(GameSession.id)
+    cutoff = datetime.utcnow() - older_than if older_than else None
+
+    archived = {}
+    for session_id, last_event in query.all():
+        if cutoff is not None and last_event is not None and last_event > cutoff:
+            continue
+        archived[session_id] = archive_session_events(db.session.get(GameSession, session_id))
+    return archived
+
+
+def load_archived_events(game_session) -> List[ArchivedEvent]:
+    """Liest das Archiv einer Sitzung (gecacht, solange sich die Datei nicht ändert)"""
+    path = archive_path(game_session)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return []
+    cached = _archive_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with gzip.open(path, 'rt', encoding='utf-8') as archive:
+        events = [_line_to_event(line) for line in archive if line.strip()]
+    _archive_cache[path] = (mtime, events)
+    return events
+
+
+def get_session_events(game_session_id, event_types: Iterable[str] = None, order_by_timestamp: bool = False):
+    """
+    Events einer Sitzung aus der Live-Tabelle und - bei beendeten Sitzungen - dem Archiv.
+
+    Beide Quellen werden zusammengeführt (gleiches Event: Live-Zeile gewinnt), damit z.B. ein
+    nach der Archivierung protokolliertes Event das Archiv nicht verdeckt.
+    event_types: optionale Liste von Event-Typen. Die Reihenfolge ist die Einfügereihenfolge
+    (ID), mit order_by_timestamp=True nach Zeitstempel.
+    """
+    event_types = list(event_types) if event_types is not None else None
+    query = GameEvent.query.filter_by(game_session_id=game_session_id)
+    if event_types is not None:
+        query = query.filter(GameEvent.event_type.in_(event_types))
+    query = query.order_by(GameEvent.timestamp.asc() if order_by_timestamp else GameEvent.id.asc())
+    events = query.all()
+
+    game_session = db.session.get(GameSession, game_session_id)
+    if game_session is None or game_session.current_phase != 'GAME_FINISHED':
+        return events
+    archived = load_archived_events(game_session)
+    if not archived:
+        return events
+    if event_types is not None:
+        wanted = set(event_types)
+        archived = [event for event in archived if event.event_type in wanted]
+
+    # Archivierte Events sind älter als alle danach geschriebenen Live-Events
+    merged = {_event_key(event.id, event.timestamp, event.event_type): event for event in archived}
+    merged.update((_event_key(event.id, event.timestamp, event.event_type), event) for event in events)
+    merged = list(merged.values())
+    if order_by_timestamp:
+        merged.sort(key=lambda event: event.timestamp or datetime.min)
+    return merged
@@ -0,0 +1,219 @@
+"""
+Read-Through-Cache für FieldConfiguration
+Hält pro Runde eine unveränderliche Momentaufnahme der Feld-Konfigurationen im Speicher:
+die RoundFieldConfiguration-Zeilen der Runde, ergänzt um die globalen FieldConfiguration-
+Zeilen als Vorlage. Lesezugriffe gehen immer über die Momentaufnahme der aktiven Runde.
+
+Änderungen werden explizit über invalidate_field_config_cache() gemeldet; nach dem Commit
+wird ein Versionsstempel (Datei im Instance-Ordner) neu geschrieben, damit auch andere
+Worker reagieren. Der Stempel enthält nur die Revision der Inhalte; welche Runde aktiv
+ist, wird bei jeder neuen Stempel-Version aus der Datenbank gelesen (eine Abfrage).
+Ein Rundenwechsel schreibt den Stempel ohne neue Revision neu und verschiebt damit nur
+den Zeiger, ohne Momentaufnahmen zu verwerfen.
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_PENDING_KEY = 'field_config_cache_pending'
+_UNSET = object()
+
+_lock = threading.Lock()
+_snapshots = {}  # {round_id oder None: {field_type: CachedFieldConfig}}
+_active_round_id = _UNSET
+_revision = None
+_loaded_version = None
+
+
+@dataclass(frozen=True, slots=True)
+class CachedFieldConfig:
+    """Unveränderliche Momentaufnahme einer FieldConfiguration-Zeile"""
+    id: int
+    field_type: str
+    display_name: str
+    description: str | None
+    is_enabled: bool
+    frequency_type: str
+    frequency_value: int
+    color_hex: str
+    emission_hex: str | None
+    icon: str | None
+    config_data: str | None
+    parsed_config: dict = field(default_factory=dict)
+
+    @property
+    def config_dict(self):
+        """Gibt config_data als Dictionary zurück (Kopie, der Cache bleibt unverändert)"""
+        return dict(self.parsed_config)
+
+    @classmethod
+    def from_model(cls, config):
+        return cls(
+            id=config.id,
+            field_type=config.field_type,
+            display_name=config.display_name,
+            description=config.description,
+            is_enabled=config.is_enabled,
+            frequency_type=config.frequency_type,
+            frequency_value=config.frequency_value,
+            color_hex=config.color_hex,
+            emission_hex=config.emission_hex,
+            icon=config.icon,
+            config_data=config.config_data,
+            parsed_config=config.config_dict,
+        )
+
+
+def _version_file():
+    return (current_app.config.get('FIELD_CONFIG_VERSION_FILE')
+            or os.path.join(current_app.instance_path, 'field_config.version'))
+
+
+def field_config_version():
+    """Gibt den aktuellen Versionsstempel zurück (None wenn noch nie invalidiert)"""
+    try:
+        stat = os.stat(_version_file())
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns)
+
+
+def _read_stamp():
+    try:
+        with open(_version_file()) as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return stamp if isinstance(stamp, dict) else None
+
+
+def _bump_version(content_changed):
+    path = _version_file()
+    current = _read_stamp() or {}
+    stamp = {'revision': current.get('revision', 0) + (1 if content_changed else 0)}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(stamp, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        current_app.logger.warning(f"Versionsstempel für Feld-Konfigurationen konnte nicht geschrieben werden: {e}")
+
+
+def _clear_local():
+    global _snapshots, _active_round_id, _revision, _loaded_version
+    with _lock:
+        _snapshots = {}
+        _active_round_id = _UNSET
+        _revision = None
+        _loaded_version = None
+
+
+def _query_active_round_id():
+    from app.models import db, GameRound
+    return db.session.query(GameRound.id).filter_by(is_active=True).scalar()
+
+
+def _refresh(version):
+    """Gleicht den lokalen Zustand mit dem Versionsstempel ab"""
+    global _snapshots, _active_round_id, _revision, _loaded_version
+    stamp = _read_stamp()
+    revision = stamp.get('revision') if stamp else None
+    # Die aktive Runde kommt immer aus der Datenbank (der Stempel überlebt z.B. ein Neuaufsetzen der DB)
+    active_round_id = _query_active_round_id()
+    with _lock:
+        if revision is None or revision != _revision:
+            _snapshots = {}
+        _revision = revision
+        _active_round_id = active_round_id
+        _loaded_version = version
+
+
+def _load_snapshot(round_id):
+    """Baut die Momentaufnahme einer Runde mit höchstens zwei Abfragen auf"""
+    from app.models import FieldConfiguration, RoundFieldConfiguration
+
+    configs = {c.field_type: CachedFieldConfig.from_model(c) for c in FieldConfiguration.query.all()}
+    if round_id is not None:
+        round_configs = RoundFieldConfiguration.query.filter_by(game_round_id=round_id).all()
+        configs.update({c.field_type: CachedFieldConfig.from_model(c) for c in round_configs})
+    with _lock:
+        _snapshots[round_id] = configs
+    return configs
+
+
+def get_cached_field_configs(round_id=_UNSET):
+    """
+    Gibt alle Konfigurationen als {field_type: CachedFieldConfig} zurück
+
+    Args:
+        round_id: Runde, deren Konfiguration aufgelöst wird (Standard: aktive Runde)
+    """
+    version = field_config_version()
+    if _active_round_id is _UNSET or _loaded_version != version:
+        _refresh(version)
+    if round_id is _UNSET:
+        round_id = _active_round_id
+    configs = _snapshots.get(round_id)
+    if configs is None:
+        configs = _load_snapshot(round_id)
+    return configs
+
+
+def get_cached_field_config(field_type):
+    """Gibt die Konfiguration für einen Feldtyp zurück (oder None)"""
+    return get_cached_field_configs().get(field_type)
+
+
+def get_active_round_id():
+    """Gibt die ID der Runde zurück, deren Konfiguration gerade gilt (oder None)"""
+    version = field_config_version()
+    if _active_round_id is _UNSET or _loaded_version != version:
+        _refresh(version)
+    return _active_round_id
+
+
+def invalidate_field_config_cache(active_round_id=_UNSET):
+    """
+    Meldet eine Änderung an den Feld-Konfigurationen
+
+    Ohne Argument werden die Momentaufnahmen verworfen (Inhalte geändert). Mit
+    active_round_id wird nur der Zeiger auf die aktive Runde umgesetzt. Der
+    Versionsstempel für andere Worker wird geschrieben, sobald die aktuelle
+    Transaktion committet ist.
+    """
+    global _active_round_id, _loaded_version
+    from app.models import db
+    pending = db.session.info.setdefault(_PENDING_KEY, {'content_changed': False})
+    if active_round_id is _UNSET:
+        pending['content_changed'] = True
+        _clear_local()
+    else:
+        with _lock:
+            _active_round_id = active_round_id
+            _loaded_version = field_config_version()
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_after_commit(session):
+    global _loaded_version
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending is not None:
+        _bump_version(pending['content_changed'])
+        if pending['content_changed']:
+            _clear_local()
+        else:
+            with _lock:
+                _loaded_version = field_config_version()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _clear_after_rollback(session):
+    if session.info.pop(_PENDING_KEY, None) is not None:
+        _clear_local()
@@ -0,0 +1,448 @@
+"""
+Spielzustand im Speicher für Wii Party Clone
+Kompakte, ORM-unabhängige Repräsentation (Positionen, Sperren, Bonus-Würfel, Zugreihenfolge),
+gegen die die Sonderfeld-Regeln ausgewertet werden.
+
+Die Regeln in diesem Modul kennen weder Flask noch SQLAlchemy. Sie verändern nur den
+GameState und sammeln Events als PendingEvent. Das Zurückschreiben in die Datenbank
+übernimmt app.game_logic.state_persistence in einem Schritt.
+"""
+import json
+import random
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class TeamState:
+    """Spielrelevanter Zustand eines Teams"""
+    id: int
+    name: str
+    position: int = 0
+    bonus_dice_sides: int = 0
+    is_blocked: bool = False
+    blocked_target_number: int | None = None
+    blocked_config: str | None = None  # JSON wie in Team.blocked_config
+
+
+@dataclass(slots=True)
+class PendingEvent:
+    """Ein GameEvent, das noch nicht in die Datenbank geschrieben wurde"""
+    event_type: str
+    description: str
+    related_team_id: int | None = None
+    data: dict | None = None
+
+
+@dataclass(slots=True)
+class GameState:
+    """Zustand einer Spielsitzung, auf dem die Regeln arbeiten"""
+    session_id: int | None
+    teams: dict = field(default_factory=dict)  # {team_id: TeamState}
+    turn_order: list = field(default_factory=list)  # Team-IDs in Würfelreihenfolge
+    current_team_id: int | None = None
+    events: list = field(default_factory=list)  # [PendingEvent]
+
+    def team(self, team_id):
+        """Gibt den TeamState für eine Team-ID zurück"""
+        return self.teams[team_id]
+
+    def other_teams(self, team_id):
+        """Gibt alle Teams außer dem angegebenen zurück"""
+        return [t for t in self.teams.values() if t.id != team_id]
+
+    def record_event(self, event_type, description, related_team_id=None, data=None):
+        """Merkt ein Event für das spätere Schreiben vor"""
+        self.events.append(PendingEvent(event_type, description, related_team_id, data))
+
+
+def parse_turn_order(dice_roll_order):
+    """Wandelt den komma-separierten dice_roll_order-String in eine Liste von Team-IDs um"""
+    if not dice_roll_order:
+        return []
+    return [int(tid) for tid in dice_roll_order.split(',') if tid.strip().isdigit()]
+
+
+def format_turn_order(turn_order):
+    """Gegenstück zu parse_turn_order"""
+    return ','.join(str(tid) for tid in turn_order)
+
+
+def _dice_fields(dice_info):
+    """Original Würfel-Bewegung für Banner (falls verfügbar)"""
+    return {
+        "dice_old_position": dice_info.get('old_position') if dice_info else None,
+        "dice_new_position": dice_info.get('new_position') if dice_info else None,
+    }
+
+
+# --- Regeln -------------------------------------------------------------------
+
+def apply_catapult_forward(state, team_id, current_position, min_distance=3, max_distance=5,
+                           max_board_fields=72, dice_info=None, rng=random):
+    """Katapultiert ein Team nach vorne"""
+    team = state.team(team_id)
+    catapult_distance = rng.randint(min_distance, max_distance)
+
+    catapult_old_position = current_position
+    catapult_new_position = min(current_position + catapult_distance, max_board_fields)
+    dice_fields = _dice_fields(dice_info)
+
+    team.position = catapult_new_position
+
+    state.record_event(
+        "special_field_catapult_forward",
+        f"Team {team.name} wurde {catapult_distance} Felder nach vorne katapultiert (von Feld {catapult_old_position} zu Feld {catapult_new_position})!",
+        team.id,
+        {
+            "field_type": "catapult_forward",
+            "catapult_distance": catapult_distance,
+            "old_position": catapult_old_position,
+            "new_position": catapult_new_position,
+            **dice_fields,
+            "dice_roll": dice_info.get('dice_roll') if dice_info else None,
+            "bonus_roll": dice_info.get('bonus_roll') if dice_info else None,
+            "total_roll": dice_info.get('total_roll') if dice_info else None
+        }
+    )
+
+    return {
+        "success": True,
+        "action": "catapult_forward",
+        "catapult_distance": catapult_distance,
+        "old_position": catapult_old_position,
+        "new_position": catapult_new_position,
+        **dice_fields,
+        "message": f"🚀 Katapult! {team.name} fliegt {catapult_distance} Felder nach vorne!"
+    }
+
+
+def apply_catapult_backward(state, team_id, current_position, min_distance=4, max_distance=10,
+                            dice_info=None, rng=random):
+    """Katapultiert ein Team nach hinten"""
+    team = state.team(team_id)
+    catapult_distance = rng.randint(min_distance, max_distance)
+
+    catapult_old_position = current_position
+    catapult_new_position = max(0, current_position - catapult_distance)
+    dice_fields = _dice_fields(dice_info)
+
+    team.position = catapult_new_position
+
+    state.record_event(
+        "special_field_catapult_backward",
+        f"Team {team.name} wurde {catapult_distance} Felder nach hinten katapultiert (von Feld {catapult_old_position} zu Feld {catapult_new_position})!",
+        team.id,
+        {
+            "field_type": "catapult_backward",
+            "catapult_distance": catapult_distance,
+            "old_position": catapult_old_position,
+            "new_position": catapult_new_position,
+            **dice_fields,
+            "dice_roll": dice_info.get('dice_roll') if dice_info else None,
+            "bonus_roll": dice_info.get('bonus_roll') if dice_info else None,
+            "total_roll": dice_info.get('total_roll') if dice_info else None
+        }
+    )
+
+    return {
+        "success": True,
+        "action": "catapult_backward",
+        "catapult_distance": catapult_distance,
+        "old_position": catapult_old_position,
+        "new_position": catapult_new_position,
+        **dice_fields,
+        "message": f"💥 Rückschlag! {team.name} wird {catapult_distance} Felder zurück geschleudert!"
+    }
+
+
+def apply_player_swap(state, team_id, min_distance=3, rng=random):
+    """Tauscht die Position eines Teams mit einem zufälligen anderen Team"""
+    current_team = state.team(team_id)
+
+    # Finde andere Teams mit Mindestabstand
+    candidates = [t for t in state.other_teams(team_id)
+                  if abs(t.position - current_team.position) >= min_distance]
+
+    if not candidates:
+        # Fallback: alle anderen Teams wenn kein Mindestabstand erfüllt wird
+        candidates = [t for t in state.other_teams(team_id) if t.position != current_team.position]
+
+    if not candidates:
+        return {
+            "success": False,
+            "action": "player_swap",
+            "message": f"🔄 Kein anderes Team zum Tauschen verfügbar!"
+        }
+
+    swap_team = rng.choice(candidates)
+
+    old_current_position = current_team.position
+    old_swap_position = swap_team.position
+    current_team.position = old_swap_position
+    swap_team.position = old_current_position
+
+    # Event für das aktuelle Team (das gewürfelt hat)
+    state.record_event(
+        "special_field_player_swap",
+        f"Team {current_team.name} (Feld {old_current_position}) tauschte Positionen mit Team {swap_team.name} (Feld {old_swap_position})!",
+        current_team.id,
+        {
+            "field_type": "player_swap",
+            "current_team_id": current_team.id,
+            "current_team_old_position": old_current_position,
+            "current_team_new_position": current_team.position,
+            "swap_team_id": swap_team.id,
+            "swap_team_name": swap_team.name,
+            "swap_team_old_position": old_swap_position,
+            "swap_team_new_position": swap_team.position,
+            "is_initiating_team": True
+        }
+    )
+
+    # Event für das andere Team (das getauscht wurde)
+    state.record_event(
+        "special_field_player_swap",
+        f"Team {swap_team.name} (Feld {old_swap_position}) wurde mit Team {current_team.name} (Feld {old_current_position}) getauscht!",
+        swap_team.id,
+        {
+            "field_type": "player_swap",
+            "current_team_id": current_team.id,
+            "current_team_name": current_team.name,
+            "current_team_old_position": old_current_position,
+            "current_team_new_position": current_team.position,
+            "swap_team_id": swap_team.id,
+            "swap_team_old_position": old_swap_position,
+            "swap_team_new_position": swap_team.position,
+            "is_initiating_team": False
+        }
+    )
+
+    return {
+        "success": True,
+        "action": "player_swap",
+        "current_team_old_position": old_current_position,
+        "current_team_new_position": current_team.position,
+        "swap_team_name": swap_team.name,
+        "swap_team_old_position": old_swap_position,
+        "swap_team_new_position": swap_team.position,
+        "message": f"🔄 Positionstausch! {current_team.name} tauscht mit {swap_team.name}!"
+    }
+
+
+def apply_barrier(state, team_id, target_numbers):
+    """Blockiert ein Team, bis eine der konfigurierten Zahlen gewürfelt wird"""
+    team = state.team(team_id)
+    parsed_config = parse_barrier_config(target_numbers)
+
+    team.is_blocked = True
+    team.blocked_target_number = parsed_config['min_number']  # For backward compatibility
+    team.blocked_config = json.dumps(parsed_config)
+
+    state.record_event(
+        "special_field_barrier_set",
+        f"Team {team.name} wurde auf Sperren-Feld blockiert",
+        team.id,
+        {
+            'action': 'barrier',
+            'field_type': 'barrier',
+            'barrier_set': True,
+            'target_config': parsed_config,
+            'required_number': parsed_config['min_number'],
+            'display_text': parsed_config['display_text']
+        }
+    )
+
+    return {
+        "success": True,
+        "action": "barrier_set",
+        "target_config": parsed_config,
+        "target_number": parsed_config['min_number'],
+        "display_text": parsed_config['display_text'],
+        "message": f"🚧 Blockiert! {team.name} - {parsed_config['display_text']}"
+    }
+
+
+def get_team_barrier_config(team):
+    """Liest die gespeicherte Sperren-Konfiguration eines TeamState (mit Fallback für alte Daten)"""
+    try:
+        if team.blocked_config:
+            return json.loads(team.blocked_config)
+        target_number = team.blocked_target_number
+        return {
+            'mode': 'minimum',
+            'numbers': list(range(target_number, 7)),
+            'min_number': target_number,
+            'display_text': f"Würfle mindestens eine {target_number}!"
+        }
+    except (json.JSONDecodeError, TypeError):
+        target_number = team.blocked_target_number or 6
+        return {
+            'mode': 'minimum',
+            'numbers': list(range(target_number, 7)),
+            'min_number': target_number,
+            'display_text': f"Würfle mindestens eine {target_number}!"
+        }
+
+
+def apply_barrier_release_check(state, team_id, dice_roll, bonus_roll=0):
+    """Prüft ob ein blockiertes Team durch den Würfelwurf (Standard + Bonus) freikommt"""
+    team = state.team(team_id)
+    if not team.is_blocked:
+        return {"released": False, "message": "Team ist nicht blockiert"}
+
+    total_roll = dice_roll + bonus_roll
+    barrier_config = get_team_barrier_config(team)
+    released = check_barrier_dice_roll(total_roll, barrier_config)
+    release_method = "total" if released else None
+
+    dice_description = f"{dice_roll}"
+    if bonus_roll > 0:
+        dice_description += f" + {bonus_roll} (Bonus) = {total_roll}"
+
+    event_description = f"Team {team.name} versuchte Befreiung mit Würfel {dice_description}"
+    if released and release_method:
+        event_description += f" - Befreit durch {release_method}!"
+
+    state.record_event(
+        "special_field_barrier_released" if released else "special_field_barrier_blocked",
+        event_description,
+        team.id,
+        {
+            'action': 'check_barrier_release',
+            'field_type': 'barrier',
+            'dice_roll': dice_roll,
+            'bonus_roll': bonus_roll,
+            'total_roll': total_roll,
+            'barrier_config': barrier_config,
+            'released': released,
+            'release_method': release_method
+        }
+    )
+
+    if released:
+        team.is_blocked = False
+        team.blocked_target_number = None
+        team.blocked_config = None
+        return {
+            "released": True,
+            "dice_roll": dice_roll,
+            "bonus_roll": bonus_roll,
+            "total_roll": total_roll,
+            "barrier_config": barrier_config,
+            "release_method": release_method,
+            "message": f"🎉 Befreit! {team.name} hat {dice_description} gewürfelt!"
+        }
+    return {
+        "released": False,
+        "dice_roll": dice_roll,
+        "bonus_roll": bonus_roll,
+        "total_roll": total_roll,
+        "barrier_config": barrier_config,
+        "message": f"🚧 Noch blockiert! {team.name} hat {dice_description} gewürfelt. {barrier_config['display_text']}"
+    }
+
+
+def parse_barrier_config(target_numbers):
+    """
+    Parst die target_numbers Konfiguration und bestimmt den Modus
+
+    Args:
+        target_numbers: Liste oder String mit Ziel-Zahlen
+
+    Returns:
+        dict: Parsed configuration with mode, numbers, display_text
+    """
+    if isinstance(target_numbers, str):
+        target_str = target_numbers.strip()
+    elif isinstance(target_numbers, list):
+        # Convert list to string for parsing
+        target_str = ','.join(str(x) for x in target_numbers)
+    else:
+        target_str = "4,5,6"  # Default
+
+    # Check for maximum mode (starts with -)
+    if target_str.startswith('-'):
+        try:
+            max_number = int(target_str[1:])
+            max_number = min(max(max_number, 1), 6)  # Clamp between 1 and 6
+            return {
+                'mode': 'maximum',
+                'numbers': list(range(1, max_number + 1)),  # 1 to max_number
+                'max_number': max_number,
+                'min_number': 1,
+                'display_text': f"Würfle höchstens eine {max_number}!"
+            }
+        except ValueError:
+            pass  # Fall through to other modes
+
+    # Check for minimum mode (ends with +)
+    if target_str.endswith('+'):
+        try:
+            min_number = int(target_str[:-1])
+            min_number = min(max(min_number, 1), 6)  # Clamp between 1 and 6
+            return {
+                'mode': 'minimum',
+                'numbers': list(range(min_number, 7)),  # min_number to 6
+                'min_number': min_number,
+                'display_text': f"Würfle mindestens eine {min_number}!"
+            }
+        except ValueError:
+            pass  # Fall through to exact mode
+
+    # Exact numbers mode
+    try:
+        numbers = [int(x.strip()) for x in target_str.split(',') if x.strip()]
+        numbers = [n for n in numbers if 1 <= n <= 6]  # Filter valid dice numbers
+        if not numbers:
+            numbers = [4, 5, 6]  # Default
+
+        # Sort numbers for consistent display
+        numbers = sorted(numbers)
+
+        if len(numbers) == 1:
+            display_text = f"Würfle eine {numbers[0]}!"
+        elif len(numbers) == 2:
+            display_text = f"Würfle eine {numbers[0]} oder {numbers[1]}!"
+        else:
+            display_text = f"Würfle eine {', '.join(str(n) for n in numbers[:-1])} oder {numbers[-1]}!"
+
+        return {
+            'mode': 'exact',
+            'numbers': numbers,
+            'min_number': min(numbers),
+            'display_text': display_text
+        }
+    except ValueError:
+        # Fallback
+        return {
+            'mode': 'exact',
+            'numbers': [4, 5, 6],
+            'min_number': 4,
+            'display_text': "Würfle eine 4, 5 oder 6!"
+        }
+
+
+def check_barrier_dice_roll(dice_roll, barrier_config):
+    """
+    Prüft ob ein Würfelwurf die Barrier-Bedingung erfüllt
+
+    Args:
+        dice_roll: Die gewürfelte Zahl (kann durch Bonus-Würfel über 6 sein)
+        barrier_config: Die Barrier-Konfiguration
+
+    Returns:
+        bool: True wenn befreit, False wenn noch blockiert
+    """
+    mode = barrier_config.get('mode', 'exact')
+
+    if mode == 'minimum':
+        # Bei 4+ bedeutet: würfle mindestens 4 (auch 7, 8, 9, etc. mit Bonus)
+        min_number = barrier_config.get('min_number', 4)
+        return dice_roll >= min_number
+    elif mode == 'maximum':
+        # Bei -3 bedeutet: würfle höchstens 3
+        max_number = barrier_config.get('max_number', 3)
+        return dice_roll <= max_number
+    else:
+        # Exakte Zahlen: muss in der Liste sein
+        return dice_roll in barrier_config['numbers']
@@ -0,0 +1,152 @@
+"""
+Endstatistik eines Spiels (game_summary)
+Beim Spielgewinn wird die Statistik für die Goodbye-Seite einmal berechnet und als
+GameSummary gespeichert: Positionsverlauf pro Team, Minispiel-Statistiken,
+Spieldauer und Summen. Die Goodbye-Seite liest danach nur noch diese eine Zeile,
+statt beim Laden (vor dem ganzen Publikum) alle Würfel-Events zu parsen.
+"""
+from datetime import datetime
+
+from ..log import get_logger
+from ..models import db, GameSession, GameSummary, Team
+from .event_archive import get_session_events
+from .position_timeseries import get_position_history
+
+log = get_logger('wii.board')
+
+MOVEMENT_EVENT_TYPES = ('dice_roll', 'admin_dice_roll', 'admin_dice_roll_legacy', 'team_dice_roll')
+
+
+def format_duration(seconds):
+    """Spieldauer wie auf der Goodbye-Seite angezeigt ('1h 5m' bzw. '42m')"""
+    if seconds is None:
+        return "Unbekannt"
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    return f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
+
+
+def build_position_history(game_session_id):
+    """Positionsverlauf pro Team aus der Positions-Zeitreihe, für ältere Spiele aus den Bewegungs-Events"""
+    position_history = get_position_history(game_session_id)
+    if position_history:
+        return position_history
+    for event in get_session_events(game_session_id, MOVEMENT_EVENT_TYPES, order_by_timestamp=True):
+        if not event.related_team_id or not event.data_json:
+            continue
+        data = event.data
+        position_history.setdefault(str(event.related_team_id), []).append({
+            'position': data.get('new_position', 0),
+            'timestamp': event.timestamp.isoformat() if event.timestamp else None,
+            'dice_result': data.get('total_roll', 0),
+        })
+    return position_history
+
+
+def build_minigame_statistics(teams):
+    """Minispiel-Statistiken pro Team aus der aktuellen Platzierung der Teams"""
+    return {
+        str(team.id): {
+            'wins': 1 if team.minigame_placement == 1 else 0,
+            'participations': 1 if team.minigame_placement is not None else 0,
+            'placements': [team.minigame_placement] if team.minigame_placement is not None else [],
+            'average_placement': float(team.minigame_placement) if team.minigame_placement is not None else 0.0,
+        }
+        for team in teams
+    }
+
+
+def build_game_summary(game_session, winning_team_id=None, victory_timestamp=None):
+    """Berechnet die Endstatistik einer Spielsitzung als dict (ohne zu speichern)"""
+    victory_timestamp = victory_timestamp or datetime.utcnow()
+    teams = Team.query.options(db.joinedload(Team.character)).order_by(Team.current_position.desc()).all()
+    minigame_stats = build_minigame_statistics(teams)
+    position_history = build_position_history(game_session.id)
+
+    teams_stats = []
+    winner = None
+    for team in teams:
+        team_minigame_stats = minigame_stats.get(str(team.id), {})
+        is_winner = winning_team_id is not None and team.id == winning_team_id
+        if is_winner:
+            winner = {'id': team.id, 'name': team.name}
+        teams_stats.append({
+            'id': team.id,
+            'name': team.name,
+            'color': team.character.color if team.character else '#CCCCCC',
+            'final_position': team.current_position,
+            'minigame_wins': team_minigame_stats.get('wins', 0),
+            'minigame_participations': team_minigame_stats.get('participations', 0),
+            'minigame_placements': team_minigame_stats.get('placements', []),
+            'position_history': position_history.get(str(team.id), []),
+            'is_winner': is_winner,
+        })
+
+    duration_seconds = None
+    if game_session.start_time:
+        duration_seconds = max(0, int((victory_timestamp - game_session.start_time).total_seconds()))
+
+    return {
+        'winner': winner,
+        'teams': teams_stats,
+        'minigame_stats': minigame_stats,
+        'position_history': position_history,
+        'duration_seconds': duration_seconds,
+        'game_duration': format_duration(duration_seconds),
+        'total_minigames': len(get_session_events(game_session.id, ['placements_recorded'])),
+        'victory_timestamp': victory_timestamp.isoformat(),
+    }
+
+
+def materialize_game_summary(game_session, winning_team_id=None, victory_timestamp=None):
+    """
+    Berechnet und speichert die Endstatistik einer Sitzung (nur beim ersten Aufruf).
+
+    Fügt die GameSummary der Session hinzu; committen muss der Aufrufer.
+    Gibt die (neue oder bereits vorhandene) GameSummary zurück.
+    """
+    existing = GameSummary.query.filter_by(game_session_id=game_session.id).first()
+    if existing is not None:
+        return existing
+    summary = GameSummary(game_session_id=game_session.id, winning_team_id=winning_team_id)
+    summary.summary = build_game_summary(game_session, winning_team_id, victory_timestamp)
+    db.session.add(summary)
+    log.info('game_summary_materialized', session_id=game_session.id, winning_team_id=winning_team_id,
+             teams=len(summary.summary['teams']))
+    return summary
+
+
+def get_game_summary(game_session_id=None):
+    """GameSummary einer Sitzung bzw. (ohne ID) des zuletzt beendeten Spiels - eine Abfrage"""
+    query = GameSummary.query
+    if game_session_id is not None:
+        return query.filter_by(game_session_id=game_session_id).first()
+    return query.order_by(GameSummary.id.desc()).first()
+
+
+def summarize_finished_session(game_session_id=None):
+    """
+    Für Spiele, die vor Einführung der GameSummary beendet wurden: berechnet die
+    Endstatistik nachträglich aus dem letzten Victory-Event und speichert sie.
+    """
+    if game_session_id is not None:
+        game_session = db.session.get(GameSession, game_session_id)
+    else:
+        game_session = GameSession.query.filter_by(current_phase='GAME_FINISHED') \
+            .order_by(GameSession.id.desc()).first()
+    if game_session is None or game_session.current_phase != 'GAME_FINISHED':
+        return None
+
+    victory_events = get_session_events(game_session.id, ['game_victory'])
+    victory_data = victory_events[-1].data if victory_events else {}
+    victory_timestamp = None
+    if victory_data.get('victory_timestamp'):
+        try:
+            victory_timestamp = datetime.fromisoformat(victory_data['victory_timestamp'].replace('Z', '+00:00')).replace(tzinfo=None)
+        except ValueError:
+            victory_timestamp = None
+    if victory_timestamp is None and victory_events:
+        victory_timestamp = victory_events[-1].timestamp
+    summary = materialize_game_summary(game_session, victory_data.get('winning_team_id'), victory_timestamp)
+    db.session.commit()
+    return summary
@@ -0,0 +1,74 @@
+"""
+Faire Spieler-Rotation für Minispiele
+Lädt die Einsatz-Zähler einer Spielsitzung einmal aus der Tabelle player_rotation,
+wählt pro Team die am wenigsten eingesetzten Spieler über einen Min-Heap aus und
+schreibt alle Zähler-Änderungen einer Auslosung gesammelt zurück (player_rotation
+pro Sitzung, team_member.times_selected über alle Sitzungen).
+"""
+import heapq
+import random
+from collections import Counter
+
+from ..models import db, PlayerRotation, TeamMember
+
+
+class PlayerRotationScheduler:
+    """
+    Auslosung für eine Spielsitzung
+
+    Typischer Ablauf für eine Auslosung über mehrere Teams:
+        scheduler = PlayerRotationScheduler(game_session)
+        for team in teams:
+            players = scheduler.select(team.id, members, 2)
+            scheduler.record(team.id, players)
+        scheduler.flush()
+    """
+
+    def __init__(self, game_session, rng=None):
+        if game_session.id is None:
+            db.session.flush()
+        self.game_session_id = game_session.id
+        self._rng = rng or random
+        self._counts = None  # {team_id: {spieler: anzahl}}
+        self._pending = Counter()  # {(team_id, spieler): zusätzliche Einsätze}
+
+    def _team_counts(self, team_id):
+        """Einsatz-Zähler eines Teams (alle Teams der Sitzung werden mit einer Abfrage geladen)"""
+        if self._counts is None:
+            self._counts = {}
+            rows = db.session.execute(
+                db.select(PlayerRotation.team_id, PlayerRotation.player_name, PlayerRotation.play_count)
+                .where(PlayerRotation.game_session_id == self.game_session_id)
+            )
+            for row_team_id, player_name, play_count in rows:
+                self._counts.setdefault(row_team_id, {})[player_name] = play_count
+        return self._counts.setdefault(int(team_id), {})
+
+    def select(self, team_id, members, count_needed):
+        """
+        Wählt die count_needed am wenigsten eingesetzten Spieler aus
+
+        Bei gleicher Anzahl Einsätze entscheidet der Zufall. heapify + count_needed
+        heappop ergibt O(n + k log n) statt einer vollständigen Sortierung.
+        """
+        counts = self._team_counts(team_id)
+        heap = [(counts.get(member, 0), self._rng.random(), member) for member in dict.fromkeys(members)]
+        heapq.heapify(heap)
+        count_needed = min(max(int(count_needed), 0), len(heap))
+        return [heapq.heappop(heap)[2] for _ in range(count_needed)]
+
+    def record(self, team_id, selected_players):
+        """Merkt die Einsätze vor; geschrieben wird erst mit flush()"""
+        counts = self._team_counts(team_id)
+        for player in selected_players:
+            counts[player] = counts.get(player, 0) + 1
+            self._pending[(int(team_id), player)] += 1
+
+    def flush(self):
+        """Schreibt alle vorgemerkten Einsätze (Sitzungs- und Gesamtzähler) zurück"""
+        if not self._pending:
+            return 0
+        written = PlayerRotation.increment_many(self.game_session_id, self._pending)
+        TeamMember.increment_times_selected(self._pending)
+        self._pending = Counter()
+        return written
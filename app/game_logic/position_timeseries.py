@@ -0,0 +1,99 @@
+"""
+Kompakter Positionsverlauf pro Spielsitzung
+Jeder Würfelzug hängt an die Zeitreihe seines Teams (PositionTimeseries.samples)
+einen Datensatz fester Länge an: Zugnummer (uint32), Position (uint16), Wurf (uint16),
+little-endian, also 8 Bytes pro Zug. Die Zugnummer zählt pro Sitzung über alle Teams
+hinweg hoch; damit kann ein Client (Charts, Board-Replay) mit "seit Zug N" genau die
+neuen Züge aller Teams abholen, statt den ganzen Verlauf erneut zu laden.
+
+Zugnummern werden über game_session.position_turn_no mit einem atomaren
+UPDATE ... RETURNING vergeben; gleichzeitige Würfe (Admin und Team) bekommen damit nie
+dieselbe Nummer. Da Datensätze nur angehängt werden, sind die Zugnummern einer Zeitreihe
+aufsteigend; der Einstieg für "seit Zug N" wird per Binärsuche über die Datensätze gefunden.
+"""
+import struct
+
+from ..models import db, GameSession, PositionTimeseries
+
+SAMPLE = struct.Struct('<IHH')  # turn_no, position, roll
+
+
+def pack_sample(turn_no, position, roll):
+    return SAMPLE.pack(turn_no, max(0, int(position)), max(0, int(roll or 0)))
+
+
+def _first_index_after(samples, since_turn):
+    """Index des ersten Datensatzes mit Zugnummer > since_turn (Binärsuche)"""
+    low, high = 0, len(samples) // SAMPLE.size
+    while low < high:
+        middle = (low + high) // 2
+        if SAMPLE.unpack_from(samples, middle * SAMPLE.size)[0] <= since_turn:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def unpack_samples(samples, since_turn=0):
+    """Liste von [zug, position, wurf] mit Zugnummer > since_turn"""
+    if not samples:
+        return []
+    start = _first_index_after(samples, since_turn) * SAMPLE.size if since_turn else 0
+    return [list(sample) for sample in SAMPLE.iter_unpack(memoryview(samples)[start:])]
+
+
+def _next_turn_no(game_session_id):
+    """Vergibt die nächste Zugnummer der Sitzung (atomar in der Datenbank)"""
+    return db.session.execute(
+        db.update(GameSession)
+        .where(GameSession.id == game_session_id)
+        .values(position_turn_no=db.func.coalesce(GameSession.position_turn_no, 0) + 1)
+        .returning(GameSession.position_turn_no)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
+
+
+def record_position(game_session_id, team_id, position, roll):
+    """
+    Hängt einen Zug an die Zeitreihe des Teams an und gibt dessen Zugnummer zurück.
+
+    Zwei Statements (Zugnummer vergeben, Zeitreihe des Teams laden); committen muss der
+    Aufrufer, der Zug landet damit in derselben Transaktion wie das Würfel-Event.
+    """
+    turn_no = _next_turn_no(game_session_id)
+    row = PositionTimeseries.query.filter_by(game_session_id=game_session_id, team_id=team_id).first()
+    if row is None:
+        row = PositionTimeseries(game_session_id=game_session_id, team_id=team_id, samples=b'',
+                                 sample_count=0, last_turn_no=0)
+        db.session.add(row)
+    row.samples = (row.samples or b'') + pack_sample(turn_no, position, roll)
+    row.sample_count = (row.sample_count or 0) + 1
+    row.last_turn_no = turn_no
+    return turn_no
+
+
+def get_position_deltas(game_session_id, since_turn=0):
+    """
+    Züge aller Teams seit since_turn.
+
+    Returns:
+        dict: {'last_turn': int, 'teams': {team_id (str): [[zug, position, wurf], ...]}}
+              Teams ohne neue Züge fehlen; last_turn ist der Stand für den nächsten Abruf.
+    """
+    since_turn = max(0, int(since_turn or 0))
+    teams = {}
+    last_turn = since_turn
+    for row in PositionTimeseries.query.filter_by(game_session_id=game_session_id) \
+            .filter(PositionTimeseries.last_turn_no > since_turn).all():
+        teams[str(row.team_id)] = unpack_samples(row.samples, since_turn)
+        last_turn = max(last_turn, row.last_turn_no)
+    return {'last_turn': last_turn, 'teams': teams}
+
+
+def get_position_history(game_session_id):
+    """Kompletter Verlauf pro Team im Format der Goodbye-Statistik ({} ohne Zeitreihe)"""
+    return {
+        team_id: [{'turn': turn_no, 'position': position, 'dice_result': roll}
+                  for turn_no, position, roll in samples]
+        for team_id, samples in get_position_deltas(game_session_id)['teams'].items()
+    }
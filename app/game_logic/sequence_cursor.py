@@ -0,0 +1,109 @@
+"""
+Cursor und Inhalts-Prefetch für geplante Abläufe (MinigameSequence)
+Die Sequenz-JSON wird pro Sequenz nur einmal geparst und erst neu gelesen, wenn sich
+der Rohwert ändert. Ein SequenceCursor ist eine unveränderliche Sicht auf die geparste
+Liste und die aktuelle Position; er kostet bei jedem Polling nur einen String-Vergleich.
+
+Nach jedem Weiterschalten (und beim Aktivieren/Speichern) werden die nächsten Einträge
+mit ihrem vollständigen Inhalt aus der Ordner-JSON vorab geladen, sodass das Festlegen
+des nächsten Inhalts ohne Dateizugriff auskommt.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from flask import current_app
+
+from ..admin.minigame_utils import prefetch_folder_content
+from ..json_fields import json_loads
+
+DEFAULT_PREFETCH_COUNT = 3
+
+_parsed = {}  # {sequence_id: (sequence_data, Tuple[dict, ...])}
+
+
+@dataclass(frozen=True)
+class SequenceCursor:
+    """Unveränderliche Sicht auf eine Sequenz; die Einträge dürfen nicht verändert werden"""
+    sequence_id: Optional[int]
+    position: int
+    items: Tuple[Dict[str, Any], ...]
+
+    @property
+    def total(self) -> int:
+        return len(self.items)
+
+    @property
+    def current_item(self) -> Optional[Dict[str, Any]]:
+        if 0 <= self.position < len(self.items):
+            return self.items[self.position]
+        return None
+
+    @property
+    def next_item(self) -> Optional[Dict[str, Any]]:
+        if 0 <= self.position + 1 < len(self.items):
+            return self.items[self.position + 1]
+        return None
+
+    @property
+    def can_advance(self) -> bool:
+        return self.position < len(self.items) - 1
+
+    @property
+    def progress_percentage(self) -> int:
+        if not self.items:
+            return 0
+        return min(100, int((self.position / len(self.items)) * 100))
+
+    def upcoming(self, count: int) -> Tuple[Dict[str, Any], ...]:
+        """Aktueller Eintrag und die folgenden count-1 Einträge"""
+        start = max(self.position, 0)
+        return self.items[start:start + count]
+
+    def to_info(self) -> Dict[str, Any]:
+        """Sequenz-Felder für Moderation und sequence_status"""
+        return {
+            'current_position': self.position,
+            'total_items': self.total,
+            'progress_percentage': self.progress_percentage,
+            'current_item': self.current_item,
+            'next_item': self.next_item,
+            'sequence_list': list(self.items)
+        }
+
+
+def _parse_items(raw) -> Tuple[Dict[str, Any], ...]:
+    if not raw:
+        return ()
+    try:
+        items = json_loads(raw)
+    except (ValueError, TypeError):
+        return ()
+    return tuple(items) if isinstance(items, list) else ()
+
+
+def get_sequence_cursor(sequence) -> SequenceCursor:
+    """Gibt den Cursor einer MinigameSequence zurück (parst nur bei geändertem Rohwert)"""
+    raw = sequence.sequence_data
+    cached = _parsed.get(sequence.id) if sequence.id is not None else None
+    if cached is not None and cached[0] == raw:
+        items = cached[1]
+    else:
+        items = _parse_items(raw)
+        if sequence.id is not None:
+            _parsed[sequence.id] = (raw, items)
+    return SequenceCursor(sequence_id=sequence.id, position=sequence.current_position or 0, items=items)
+
+
+def prefetch_upcoming(sequence, folder_name: str, count: int = None) -> int:
+    """
+    Lädt den aktuellen und die folgenden Einträge der Sequenz vorab.
+
+    count: Anzahl der Einträge (Standard: SEQUENCE_PREFETCH_COUNT aus der Konfiguration).
+    Liegen alle Einträge bereits vor, findet kein Dateizugriff statt. Gibt die Anzahl
+    neu geladener Inhalte zurück.
+    """
+    if count is None:
+        count = current_app.config.get('SEQUENCE_PREFETCH_COUNT', DEFAULT_PREFETCH_COUNT)
+    cursor = sequence if isinstance(sequence, SequenceCursor) else get_sequence_cursor(sequence)
+    content_ids = [item.get('id') for item in cursor.upcoming(count) if isinstance(item, dict)]
+    return prefetch_folder_content(folder_name, content_ids)
@@ -7,11 +7,21 @@ import random
 import json
 import os
 from flask import current_app
+from app.log import get_logger
 from app.models import db, GameEvent, FieldConfiguration
+from .game_state import (
+    apply_catapult_forward, apply_catapult_backward, apply_player_swap,
+    apply_barrier, apply_barrier_release_check, parse_barrier_config, check_barrier_dice_roll
+)
+from .state_persistence import load_game_state, flush_game_state
+from .field_config_cache import field_config_version, get_cached_field_configs
+
+log = get_logger('wii.fields')
 
 # Cache für berechnete Feld-Verteilung
 _field_distribution_cache = None
 _cache_max_fields = None
+_cache_config_version = None  # Versionsstempel der Feld-Konfigurationen bei der Berechnung
 
 
 def handle_catapult_forward(team, current_position, game_session, dice_info=None):
@@ -23,54 +33,18 @@ def handle_catapult_forward(team, current_position, game_session, dice_info=None
         return {"success": False, "action": "none"}
     
     config_data = config.config_dict
-    min_distance = config_data.get('min_distance', 3)
-    max_distance = config_data.get('max_distance', 5)
-    
     max_board_fields = current_app.config.get('MAX_BOARD_FIELDS', 72)
-    catapult_distance = random.randint(min_distance, max_distance)
-    
-    # Katapult-Positionen (vor und nach Katapult)
-    catapult_old_position = current_position
-    catapult_new_position = min(current_position + catapult_distance, max_board_fields)
-    
-    # Original Würfel-Bewegung (falls verfügbar)
-    dice_old_position = dice_info.get('old_position') if dice_info else None
-    dice_new_position = dice_info.get('new_position') if dice_info else None
     
-    team.current_position = catapult_new_position
-    
-    # Event erstellen
-    event = GameEvent(
-        game_session_id=game_session.id,
-        event_type="special_field_catapult_forward",
-        description=f"Team {team.name} wurde {catapult_distance} Felder nach vorne katapultiert (von Feld {catapult_old_position} zu Feld {catapult_new_position})!",
-        related_team_id=team.id,
-        data_json=json.dumps({
-            "field_type": "catapult_forward",
-            "catapult_distance": catapult_distance,
-            "old_position": catapult_old_position,
-            "new_position": catapult_new_position,
-            # Original Würfel-Bewegung für Banner
-            "dice_old_position": dice_old_position,
-            "dice_new_position": dice_new_position,
-            "dice_roll": dice_info.get('dice_roll') if dice_info else None,
-            "bonus_roll": dice_info.get('bonus_roll') if dice_info else None,
-            "total_roll": dice_info.get('total_roll') if dice_info else None
-        })
+    state = load_game_state([team], game_session)
+    result = apply_catapult_forward(
+        state, team.id, current_position,
+        min_distance=config_data.get('min_distance', 3),
+        max_distance=config_data.get('max_distance', 5),
+        max_board_fields=max_board_fields,
+        dice_info=dice_info
     )
-    db.session.add(event)
-    
-    return {
-        "success": True,
-        "action": "catapult_forward", 
-        "catapult_distance": catapult_distance,
-        "old_position": catapult_old_position,
-        "new_position": catapult_new_position,
-        # Original Würfel-Bewegung für Banner
-        "dice_old_position": dice_old_position,
-        "dice_new_position": dice_new_position,
-        "message": f"🚀 Katapult! {team.name} fliegt {catapult_distance} Felder nach vorne!"
-    }
+    flush_game_state(state, [team])
+    return result
 
 
 def handle_catapult_backward(team, current_position, game_session, dice_info=None):
@@ -82,53 +56,16 @@ def handle_catapult_backward(team, current_position, game_session, dice_info=Non
         return {"success": False, "action": "none"}
     
     config_data = config.config_dict
-    min_distance = config_data.get('min_distance', 4)
-    max_distance = config_data.get('max_distance', 10)
-    
-    catapult_distance = random.randint(min_distance, max_distance)
-    
-    # Katapult-Positionen (vor und nach Katapult)
-    catapult_old_position = current_position
-    catapult_new_position = max(0, current_position - catapult_distance)
     
-    # Original Würfel-Bewegung (falls verfügbar)
-    dice_old_position = dice_info.get('old_position') if dice_info else None
-    dice_new_position = dice_info.get('new_position') if dice_info else None
-    
-    team.current_position = catapult_new_position
-    
-    # Event erstellen
-    event = GameEvent(
-        game_session_id=game_session.id,
-        event_type="special_field_catapult_backward",
-        description=f"Team {team.name} wurde {catapult_distance} Felder nach hinten katapultiert (von Feld {catapult_old_position} zu Feld {catapult_new_position})!",
-        related_team_id=team.id,
-        data_json=json.dumps({
-            "field_type": "catapult_backward",
-            "catapult_distance": catapult_distance,
-            "old_position": catapult_old_position,
-            "new_position": catapult_new_position,
-            # Original Würfel-Bewegung für Banner
-            "dice_old_position": dice_old_position,
-            "dice_new_position": dice_new_position,
-            "dice_roll": dice_info.get('dice_roll') if dice_info else None,
-            "bonus_roll": dice_info.get('bonus_roll') if dice_info else None,
-            "total_roll": dice_info.get('total_roll') if dice_info else None
-        })
+    state = load_game_state([team], game_session)
+    result = apply_catapult_backward(
+        state, team.id, current_position,
+        min_distance=config_data.get('min_distance', 4),
+        max_distance=config_data.get('max_distance', 10),
+        dice_info=dice_info
     )
-    db.session.add(event)
-    
-    return {
-        "success": True,
-        "action": "catapult_backward",
-        "catapult_distance": catapult_distance,
-        "old_position": catapult_old_position,
-        "new_position": catapult_new_position,
-        # Original Würfel-Bewegung für Banner
-        "dice_old_position": dice_old_position,
-        "dice_new_position": dice_new_position,
-        "message": f"💥 Rückschlag! {team.name} wird {catapult_distance} Felder zurück geschleudert!"
-    }
+    flush_game_state(state, [team])
+    return result
 
 
 def handle_player_swap(current_team, all_teams, game_session, dice_info=None):
@@ -140,87 +77,11 @@ def handle_player_swap(current_team, all_teams, game_session, dice_info=None):
         return {"success": False, "action": "none"}
     
     config_data = config.config_dict
-    min_distance = config_data.get('min_distance', 3)
-    
-    # Finde andere Teams (nicht das aktuelle) mit Mindestabstand
-    other_teams = []
-    for team in all_teams:
-        if team.id != current_team.id:
-            distance = abs(team.current_position - current_team.current_position)
-            if distance >= min_distance:
-                other_teams.append(team)
-    
-    if not other_teams:
-        # Fallback: alle anderen Teams wenn kein Mindestabstand erfüllt wird
-        other_teams = [team for team in all_teams if team.id != current_team.id and team.current_position != current_team.current_position]
-    
-    if not other_teams:
-        return {
-            "success": False,
-            "action": "player_swap",
-            "message": f"🔄 Kein anderes Team zum Tauschen verfügbar!"
-        }
-    
-    # Wähle zufälliges Team zum Tauschen
-    swap_team = random.choice(other_teams)
-    
-    # Tausche Positionen
-    old_current_position = current_team.current_position
-    old_swap_position = swap_team.current_position
-    
-    current_team.current_position = old_swap_position
-    swap_team.current_position = old_current_position
-    
-    # Event für das aktuelle Team erstellen (das gewürfelt hat)
-    current_team_event = GameEvent(
-        game_session_id=game_session.id,
-        event_type="special_field_player_swap",
-        description=f"Team {current_team.name} (Feld {old_current_position}) tauschte Positionen mit Team {swap_team.name} (Feld {old_swap_position})!",
-        related_team_id=current_team.id,
-        data_json=json.dumps({
-            "field_type": "player_swap",
-            "current_team_id": current_team.id,
-            "current_team_old_position": old_current_position,
-            "current_team_new_position": current_team.current_position,
-            "swap_team_id": swap_team.id,
-            "swap_team_name": swap_team.name,
-            "swap_team_old_position": old_swap_position,
-            "swap_team_new_position": swap_team.current_position,
-            "is_initiating_team": True  # Dieses Team hat gewürfelt
-        })
-    )
-    db.session.add(current_team_event)
     
-    # Event für das andere Team erstellen (das getauscht wurde)
-    swap_team_event = GameEvent(
-        game_session_id=game_session.id,
-        event_type="special_field_player_swap",
-        description=f"Team {swap_team.name} (Feld {old_swap_position}) wurde mit Team {current_team.name} (Feld {old_current_position}) getauscht!",
-        related_team_id=swap_team.id,
-        data_json=json.dumps({
-            "field_type": "player_swap",
-            "current_team_id": current_team.id,
-            "current_team_name": current_team.name,
-            "current_team_old_position": old_current_position,
-            "current_team_new_position": current_team.current_position,
-            "swap_team_id": swap_team.id,
-            "swap_team_old_position": old_swap_position,
-            "swap_team_new_position": swap_team.current_position,
-            "is_initiating_team": False  # Dieses Team wurde getauscht
-        })
-    )
-    db.session.add(swap_team_event)
-    
-    return {
-        "success": True,
-        "action": "player_swap",
-        "current_team_old_position": old_current_position,
-        "current_team_new_position": current_team.current_position,
-        "swap_team_name": swap_team.name,
-        "swap_team_old_position": old_swap_position,
-        "swap_team_new_position": swap_team.current_position,
-        "message": f"🔄 Positionstausch! {current_team.name} tauscht mit {swap_team.name}!"
-    }
+    state = load_game_state(all_teams, game_session)
+    result = apply_player_swap(state, current_team.id, min_distance=config_data.get('min_distance', 3))
+    flush_game_state(state, all_teams)
+    return result
 
 
 def handle_barrier_field(team, game_session):
@@ -234,45 +95,11 @@ def handle_barrier_field(team, game_session):
             return {"success": False, "action": "none"}
         
         config_data = config.config_dict
-        target_numbers = config_data.get('target_numbers', [4, 5, 6])
-        
-        # Parse target numbers and determine mode
-        parsed_config = _parse_barrier_config(target_numbers)
-        
-        # Team blockieren
-        team.is_blocked = True
-        team.blocked_target_number = parsed_config['min_number']  # For backward compatibility
-        try:
-            team.blocked_config = json.dumps(parsed_config)  # Store full config
-        except AttributeError:
-            # Fallback if blocked_config column doesn't exist
-            pass
-        
-        # Event erstellen
-        event = GameEvent(
-            game_session_id=game_session.id,
-            event_type="special_field_barrier_set",
-            description=f"Team {team.name} wurde auf Sperren-Feld blockiert",
-            related_team_id=team.id,
-            data_json=json.dumps({
-                'action': 'barrier',
-                'field_type': 'barrier',
-                'barrier_set': True,
-                'target_config': parsed_config,
-                'required_number': parsed_config['min_number'],
-                'display_text': parsed_config['display_text']
-            })
-        )
-        db.session.add(event)
         
-        return {
-            "success": True,
-            "action": "barrier_set",
-            "target_config": parsed_config,
-            "target_number": parsed_config['min_number'],
-            "display_text": parsed_config['display_text'],
-            "message": f"🚧 Blockiert! {team.name} - {parsed_config['display_text']}"
-        }
+        state = load_game_state([team], game_session)
+        result = apply_barrier(state, team.id, config_data.get('target_numbers', [4, 5, 6]))
+        flush_game_state(state, [team])
+        return result
     
     except Exception as e:
         # Fallback if anything goes wrong
@@ -302,103 +129,13 @@ def check_barrier_release(team, dice_roll, game_session, bonus_roll=0):
         return {"released": False, "message": "Team ist nicht blockiert"}
     
     # WICHTIG: Verwende Gesamtwürfelwurf (Standard + Bonus) für Barrier-Prüfung
-    total_roll = dice_roll + bonus_roll
-    current_app.logger.info(f"[BARRIER] Prüfe Team {team.name}: Standard={dice_roll}, Bonus={bonus_roll}, Gesamt={total_roll}")
-    
-    # Get barrier configuration
-    try:
-        blocked_config_data = getattr(team, 'blocked_config', None)
-        if blocked_config_data:
-            barrier_config = json.loads(blocked_config_data)
-        else:
-            # Fallback for old data
-            barrier_config = {
-                'mode': 'minimum',
-                'numbers': list(range(team.blocked_target_number, 7)),
-                'min_number': team.blocked_target_number,
-                'display_text': f"Würfle mindestens eine {team.blocked_target_number}!"
-            }
-    except (json.JSONDecodeError, AttributeError):
-        # Fallback
-        target_number = team.blocked_target_number or 6
-        barrier_config = {
-            'mode': 'minimum',
-            'numbers': list(range(target_number, 7)),
-            'min_number': target_number,
-            'display_text': f"Würfle mindestens eine {target_number}!"
-        }
-    
-    current_app.logger.info(f"[BARRIER] Team {team.name} Konfiguration: {barrier_config}")
-    
-    # Check if dice roll releases the team
     # User requirement: "es soll immer das gesamtergebnis der beiden würfel verglichen werden"
-    # Only check the total roll (standard + bonus) for barrier release
-    released = _check_barrier_dice_roll(total_roll, barrier_config)
-    current_app.logger.info(f"[BARRIER] Team {team.name}: Würfel {total_roll} vs. Konfiguration → {'BEFREIT' if released else 'BLOCKIERT'}")
+    state = load_game_state([team], game_session)
+    result = apply_barrier_release_check(state, team.id, dice_roll, bonus_roll)
+    flush_game_state(state, [team])
     
-    release_method = "total" if released else None
-    
-    # Build dice description for event
-    dice_description = f"{dice_roll}"
-    if bonus_roll > 0:
-        dice_description += f" + {bonus_roll} (Bonus) = {total_roll}"
-    
-    # Event loggen
-    event_description = f"Team {team.name} versuchte Befreiung mit Würfel {dice_description}"
-    if released and release_method:
-        event_description += f" - Befreit durch {release_method}!"
-    
-    # Erstelle Event basierend auf Ergebnis
-    if released:
-        event_type = "special_field_barrier_released"
-    else:
-        event_type = "special_field_barrier_blocked"
-    
-    event = GameEvent(
-        game_session_id=game_session.id,
-        event_type=event_type,
-        description=event_description,
-        related_team_id=team.id,
-        data_json=json.dumps({
-            'action': 'check_barrier_release',
-            'field_type': 'barrier',
-            'dice_roll': dice_roll,
-            'bonus_roll': bonus_roll,
-            'total_roll': total_roll,
-            'barrier_config': barrier_config,
-            'released': released,
-            'release_method': release_method
-        })
-    )
-    db.session.add(event)
-    
-    if released:
-        # Team freigeben
-        team.is_blocked = False
-        team.blocked_target_number = None
-        try:
-            team.blocked_config = None
-        except AttributeError:
-            # Fallback if blocked_config column doesn't exist
-            pass
-        return {
-            "released": True,
-            "dice_roll": dice_roll,
-            "bonus_roll": bonus_roll,
-            "total_roll": total_roll,
-            "barrier_config": barrier_config,
-            "release_method": release_method,
-            "message": f"🎉 Befreit! {team.name} hat {dice_description} gewürfelt!"
-        }
-    else:
-        return {
-            "released": False,
-            "dice_roll": dice_roll,
-            "bonus_roll": bonus_roll,
-            "total_roll": total_roll,
-            "barrier_config": barrier_config,
-            "message": f"🚧 Noch blockiert! {team.name} hat {dice_description} gewürfelt. {barrier_config['display_text']}"
-        }
+    log.info('barrier_check', team=team.name, total_roll=result['total_roll'], released=result['released'])
+    return result
 
 
 def calculate_smart_field_distribution(max_fields=73):
@@ -521,9 +258,10 @@ def calculate_smart_field_distribution(max_fields=73):
     
     # Debug-Info ausgeben (optional)
     if current_app and current_app.config.get('DEBUG_SPECIAL_FIELDS'):
-        current_app.logger.info(f"Feld-Verteilung berechnet: {conflict_resolution_stats['total_conflicts']} Konflikte, "
-                               f"{conflict_resolution_stats['resolved_randomly']} zufällig gelöst, "
-                               f"{conflict_resolution_stats['redistributed']} umverteilt")
+        log.debug('field_distribution_calculated',
+                  conflicts=conflict_resolution_stats['total_conflicts'],
+                  resolved_randomly=conflict_resolution_stats['resolved_randomly'],
+                  redistributed=conflict_resolution_stats['redistributed'])
     
     return final_assignment
 
@@ -552,136 +290,36 @@ def find_alternative_position(final_assignment, preferred_positions, max_fields)
     return None
 
 
-def _parse_barrier_config(target_numbers):
-    """
-    Parst die target_numbers Konfiguration und bestimmt den Modus
-    
-    Args:
-        target_numbers: Liste oder String mit Ziel-Zahlen
-        
-    Returns:
-        dict: Parsed configuration with mode, numbers, display_text
-    """
-    if isinstance(target_numbers, str):
-        target_str = target_numbers.strip()
-    elif isinstance(target_numbers, list):
-        # Convert list to string for parsing
-        target_str = ','.join(str(x) for x in target_numbers)
-    else:
-        target_str = "4,5,6"  # Default
-    
-    # Check for maximum mode (starts with -)
-    if target_str.startswith('-'):
-        try:
-            max_number = int(target_str[1:])
-            max_number = min(max(max_number, 1), 6)  # Clamp between 1 and 6
-            return {
-                'mode': 'maximum',
-                'numbers': list(range(1, max_number + 1)),  # 1 to max_number
-                'max_number': max_number,
-                'min_number': 1,
-                'display_text': f"Würfle höchstens eine {max_number}!"
-            }
-        except ValueError:
-            pass  # Fall through to other modes
-    
-    # Check for minimum mode (ends with +)
-    if target_str.endswith('+'):
-        try:
-            min_number = int(target_str[:-1])
-            min_number = min(max(min_number, 1), 6)  # Clamp between 1 and 6
-            return {
-                'mode': 'minimum',
-                'numbers': list(range(min_number, 7)),  # min_number to 6
-                'min_number': min_number,
-                'display_text': f"Würfle mindestens eine {min_number}!"
-            }
-        except ValueError:
-            pass  # Fall through to exact mode
-    
-    # Exact numbers mode
-    try:
-        numbers = [int(x.strip()) for x in target_str.split(',') if x.strip()]
-        numbers = [n for n in numbers if 1 <= n <= 6]  # Filter valid dice numbers
-        if not numbers:
-            numbers = [4, 5, 6]  # Default
-            
-        # Sort numbers for consistent display
-        numbers = sorted(numbers)
-        
-        if len(numbers) == 1:
-            display_text = f"Würfle eine {numbers[0]}!"
-        elif len(numbers) == 2:
-            display_text = f"Würfle eine {numbers[0]} oder {numbers[1]}!"
-        else:
-            display_text = f"Würfle eine {', '.join(str(n) for n in numbers[:-1])} oder {numbers[-1]}!"
-            
-        return {
-            'mode': 'exact',
-            'numbers': numbers,
-            'min_number': min(numbers),
-            'display_text': display_text
-        }
-    except ValueError:
-        # Fallback
-        return {
-            'mode': 'exact',
-            'numbers': [4, 5, 6],
-            'min_number': 4,
-            'display_text': "Würfle eine 4, 5 oder 6!"
-        }
-
-def _check_barrier_dice_roll(dice_roll, barrier_config):
-    """
-    Prüft ob ein Würfelwurf die Barrier-Bedingung erfüllt
-    
-    Args:
-        dice_roll: Die gewürfelte Zahl (kann durch Bonus-Würfel über 6 sein)
-        barrier_config: Die Barrier-Konfiguration
-        
-    Returns:
-        bool: True wenn befreit, False wenn noch blockiert
-    """
-    mode = barrier_config.get('mode', 'exact')
-    
-    if mode == 'minimum':
-        # Bei 4+ bedeutet: würfle mindestens 4 (auch 7, 8, 9, etc. mit Bonus)
-        min_number = barrier_config.get('min_number', 4)
-        return dice_roll >= min_number
-    elif mode == 'maximum':
-        # Bei -3 bedeutet: würfle höchstens 3
-        max_number = barrier_config.get('max_number', 3)
-        return dice_roll <= max_number
-    else:
-        # Exakte Zahlen: muss in der Liste sein
-        return dice_roll in barrier_config['numbers']
+# Rückwärtskompatible Namen für die Sperren-Hilfsfunktionen aus game_state
+_parse_barrier_config = parse_barrier_config
+_check_barrier_dice_roll = check_barrier_dice_roll
 
 def clear_field_distribution_cache():
     """
     Löscht den Cache für die Feld-Verteilung (z.B. nach Konfigurations-Änderungen)
     """
-    global _field_distribution_cache, _cache_max_fields
+    global _field_distribution_cache, _cache_max_fields, _cache_config_version
     _field_distribution_cache = None
     _cache_max_fields = None
+    _cache_config_version = None
     
     # Prüfe ob FieldConfiguration-Daten existieren
     try:
         field_configs = FieldConfiguration.get_all_enabled()
         if field_configs:
-            current_app.logger.info(f"Cache geleert. {len(field_configs)} Feld-Konfigurationen verfügbar.")
+            log.info('field_cache_cleared', configs=len(field_configs))
             
-            # DEBUG: Logge Minigame-Konfiguration
             minigame_config = next((c for c in field_configs if c.field_type == 'minigame'), None)
             if minigame_config:
-                current_app.logger.info(f"Minigame-Feld: aktiviert={minigame_config.is_enabled}, "
-                                       f"typ={minigame_config.frequency_type}, "
-                                       f"wert={minigame_config.frequency_value}")
+                log.debug('minigame_field_config', enabled=minigame_config.is_enabled,
+                          frequency_type=minigame_config.frequency_type,
+                          frequency_value=minigame_config.frequency_value)
             else:
-                current_app.logger.warning("Keine Minigame-Feld-Konfiguration gefunden!")
+                log.warning('minigame_field_config_missing')
         else:
-            current_app.logger.warning("Cache geleert, aber keine FieldConfiguration-Daten gefunden!")
+            log.warning('field_cache_cleared_without_configs')
     except Exception as e:
-        current_app.logger.error(f"Fehler beim Prüfen der FieldConfiguration: {e}")
+        log.error('field_config_check_failed', error=str(e))
 
 
 def get_field_type_at_position(position):
@@ -689,35 +327,29 @@ def get_field_type_at_position(position):
     Bestimmt den Feldtyp basierend auf der Position unter Verwendung des intelligenten
     Konflikt-Auflösungs-Algorithmus mit Caching für bessere Performance
     """
-    global _field_distribution_cache, _cache_max_fields
+    global _field_distribution_cache, _cache_max_fields, _cache_config_version
     
     max_fields = 73  # Standard-Wert
     
-    # Cache prüfen und neu berechnen falls nötig
+    # Cache prüfen und neu berechnen falls nötig (auch wenn ein anderer Worker die Konfiguration geändert hat)
+    config_version = field_config_version()
     if (_field_distribution_cache is None or 
-        _cache_max_fields != max_fields):
+        _cache_max_fields != max_fields or
+        _cache_config_version != config_version):
         
         _field_distribution_cache = calculate_smart_field_distribution(max_fields)
         _cache_max_fields = max_fields
+        _cache_config_version = config_version
         
-        # DEBUG: Logge Minigame-Positionen
-        try:
-            minigame_positions = [pos for pos, field_type in _field_distribution_cache.items() if field_type == 'minigame']
-            if current_app:
-                current_app.logger.info(f"Minigame-Felder auf Positionen: {sorted(minigame_positions)}")
-        except:
-            pass
+        if log.is_enabled():
+            minigame_positions = sorted(pos for pos, field_type in _field_distribution_cache.items() if field_type == 'minigame')
+            log.debug('field_distribution_rebuilt', minigame_positions=minigame_positions)
     
     # Position aus Cache zurückgeben
     field_type = _field_distribution_cache.get(position, 'normal')
     
-    # DEBUG: Logge wenn Minigame-Feld erkannt wird
     if field_type == 'minigame':
-        try:
-            if current_app:
-                current_app.logger.info(f"MINIGAME-FELD ERKANNT auf Position {position}")
-        except:
-            pass
+        log.debug('minigame_field_detected', position=position)
     
     return field_type
 
@@ -736,7 +368,6 @@ def handle_minigame_field(team, all_teams, game_session):
     Triggert Admin-Auswahl statt automatisches Starten
     """
     try:
-        import os
         
         # Lade Konfiguration  
         config_path = os.path.join(current_app.static_folder, 'field_minigames', 'config.json')
@@ -771,9 +402,7 @@ def handle_minigame_field(team, all_teams, game_session):
             return {"success": False, "action": "none", "message": "Keine aktive Runde oder Minigame-Ordner gefunden"}
         
         # Hole bereits gespielte IDs aus der Session
-        played_ids = []
-        if game_session.played_content_ids:
-            played_ids = game_session.played_content_ids.split(',')
+        played_ids = game_session.get_played_content_ids()
         
         # Hole verfügbare Minispiele für dieses Feld
         available_minigames = get_available_content_from_folder(
@@ -826,7 +455,7 @@ def handle_minigame_field(team, all_teams, game_session):
         }
         
     except Exception as e:
-        current_app.logger.error(f"Fehler beim Behandeln des Minigame-Felds: {e}")
+        log.exception('minigame_field_failed', error=str(e))
         return {"success": False, "action": "none", "message": f"Fehler beim Starten des Minigames: {str(e)}"}
 
 
@@ -848,8 +477,6 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
             return {"success": False, "message": "Kein Minigame-Feld in Auswahl-Phase aktiv"}
         
         # Lade das Feld-spezifische Minispiel aus den statischen Dateien
-        import os
-        import json
         
         # Verwende den übergebenen Modus, falls verfügbar
         mode = selected_mode or game_session.field_minigame_mode
@@ -883,6 +510,10 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
         
         # Hole die beteiligten Teams
         from app.models import Team
+        from app.game_logic.player_rotation import PlayerRotationScheduler
+        
+        # Einsatz-Zähler einmal laden, am Ende einmal schreiben
+        rotation = PlayerRotationScheduler(game_session)
         
         if game_session.field_minigame_landing_team_id:
             landing_team = Team.query.get(game_session.field_minigame_landing_team_id)
@@ -894,35 +525,34 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
                         # Ganzes Team
                         selected_players = selectable_players
                         # Tracking für alle Spieler aktualisieren
-                        game_session._update_player_rotation_tracking(str(landing_team.id), selected_players)
+                        rotation.record(landing_team.id, selected_players)
                     elif len(selectable_players) >= player_count:
                         # Faire Rotation verwenden statt zufälliger Auswahl
-                        selected_players = game_session._select_fair_rotation(str(landing_team.id), selectable_players, player_count)
+                        selected_players = rotation.select(landing_team.id, selectable_players, player_count)
                         # Tracking aktualisieren
-                        game_session._update_player_rotation_tracking(str(landing_team.id), selected_players)
+                        rotation.record(landing_team.id, selected_players)
                     else:
                         selected_players = selectable_players  # Alle Spieler wenn weniger als benötigt
                         # Tracking für alle verfügbaren Spieler
-                        game_session._update_player_rotation_tracking(str(landing_team.id), selected_players)
+                        rotation.record(landing_team.id, selected_players)
                     
                     # Erweitere Spielerdaten um alle nötigen Informationen für die Anzeige
-                    current_app.logger.info(f"[DEBUG] Processing {len(selected_players)} players for team {landing_team.name}")
+                    log.debug('field_minigame_players', team=landing_team.name, players=selected_players)
                     player_data_list = []
                     for player_name in selected_players:
                         player_info = {"name": player_name}
                         # Prüfe ob Spieler ein Foto hat
                         player_obj = landing_team.get_player_by_name(player_name)
-                        current_app.logger.info(f"[DEBUG] get_player_by_name('{player_name}') returned: {player_obj}")
                         if player_obj:
                             player_info["has_photo"] = player_obj.get("has_photo", False) 
                             player_info["profile_image"] = player_obj.get("profile_image")
                             player_info["emoji"] = player_obj.get("emoji")
-                            current_app.logger.info(f"[DEBUG] Final player_info for '{player_name}': {player_info}")
+                            log.debug('field_minigame_player_info', player=player_name, info=player_info)
                         else:
-                            current_app.logger.warning(f"[DEBUG] get_player_by_name('{player_name}') returned None!")
+                            log.warning('field_minigame_player_missing', team=landing_team.name, player=player_name)
                         player_data_list.append(player_info)
                     
-                    selected_players_data[landing_team.name] = player_data_list
+                    selected_players_data[str(landing_team.id)] = player_data_list
         
         # Für team_vs_team Mode auch Gegner-Team
         if (game_session.field_minigame_mode == 'team_vs_team' and 
@@ -935,16 +565,16 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
                         # Ganzes Team
                         selected_players = selectable_players
                         # Tracking für alle Spieler aktualisieren
-                        game_session._update_player_rotation_tracking(str(opponent_team.id), selected_players)
+                        rotation.record(opponent_team.id, selected_players)
                     elif len(selectable_players) >= player_count:
                         # Faire Rotation verwenden statt zufälliger Auswahl
-                        selected_players = game_session._select_fair_rotation(str(opponent_team.id), selectable_players, player_count)
+                        selected_players = rotation.select(opponent_team.id, selectable_players, player_count)
                         # Tracking aktualisieren
-                        game_session._update_player_rotation_tracking(str(opponent_team.id), selected_players)
+                        rotation.record(opponent_team.id, selected_players)
                     else:
                         selected_players = selectable_players
                         # Tracking für alle verfügbaren Spieler
-                        game_session._update_player_rotation_tracking(str(opponent_team.id), selected_players)
+                        rotation.record(opponent_team.id, selected_players)
                     
                     # Erweitere Spielerdaten um alle nötigen Informationen für die Anzeige
                     player_data_list = []
@@ -958,7 +588,7 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
                             player_info["emoji"] = player_obj.get("emoji")
                         player_data_list.append(player_info)
                     
-                    selected_players_data[opponent_team.name] = player_data_list
+                    selected_players_data[str(opponent_team.id)] = player_data_list
         
         # Für team_vs_all Mode: Lose von ALLEN anderen Teams Spieler aus
         elif game_session.field_minigame_mode == 'team_vs_all':
@@ -975,16 +605,16 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
                         # Ganzes Team
                         selected_players = selectable_players
                         # Tracking für alle Spieler aktualisieren
-                        game_session._update_player_rotation_tracking(str(team.id), selected_players)
+                        rotation.record(team.id, selected_players)
                     elif len(selectable_players) >= player_count:
                         # Faire Rotation verwenden statt zufälliger Auswahl
-                        selected_players = game_session._select_fair_rotation(str(team.id), selectable_players, player_count)
+                        selected_players = rotation.select(team.id, selectable_players, player_count)
                         # Tracking aktualisieren
-                        game_session._update_player_rotation_tracking(str(team.id), selected_players)
+                        rotation.record(team.id, selected_players)
                     else:
                         selected_players = selectable_players
                         # Tracking für alle verfügbaren Spieler
-                        game_session._update_player_rotation_tracking(str(team.id), selected_players)
+                        rotation.record(team.id, selected_players)
                     
                     # Erweitere Spielerdaten um alle nötigen Informationen für die Anzeige
                     player_data_list = []
@@ -998,10 +628,12 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
                             player_info["emoji"] = player_obj.get("emoji")
                         player_data_list.append(player_info)
                     
-                    selected_players_data[team.name] = player_data_list
+                    selected_players_data[str(team.id)] = player_data_list
+        
+        rotation.flush()
         
-        # Speichere die ausgelosten Spieler in der Session als JSON
-        game_session.field_minigame_selected_players = json.dumps(selected_players_data)
+        # Speichere die ausgelosten Spieler in der Session als JSON (Schlüssel: Team-ID)
+        game_session.parsed_field_minigame_selected_players = selected_players_data
         
         # Event erstellen  
         event = GameEvent(
@@ -1026,7 +658,7 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
         }
         
     except Exception as e:
-        current_app.logger.error(f"Fehler beim Starten des ausgewählten Feld-Minigames: {e}")
+        log.exception('field_minigame_start_failed', error=str(e))
         return {"success": False, "message": f"Fehler: {str(e)}"}
 
 
@@ -1039,12 +671,12 @@ def handle_field_minigame_result(game_session, winning_team_id):
         if not game_session.field_minigame_landing_team_id:
             return {"success": False, "message": "Kein aktives Feld-Minigame"}
         
-        current_app.logger.info(f"Processing field minigame result for mode: {game_session.field_minigame_mode}")
+        log.debug('field_minigame_result_processing', mode=game_session.field_minigame_mode)
         
         # Lade Konfiguration
         config_path = os.path.join(current_app.static_folder, 'field_minigames', 'config.json')
         if not os.path.exists(config_path):
-            current_app.logger.error(f"Config file not found: {config_path}")
+            log.error('field_minigame_config_missing', path=config_path)
             return {"success": False, "message": "Konfigurationsdatei nicht gefunden"}
             
         with open(config_path, 'r', encoding='utf-8') as f:
@@ -1053,21 +685,21 @@ def handle_field_minigame_result(game_session, winning_team_id):
         field_config = config.get('field_minigames', {})
         mode_config = field_config.get('modes', {}).get(game_session.field_minigame_mode, {})
         
-        current_app.logger.info(f"Mode config for {game_session.field_minigame_mode}: {mode_config}")
+        log.debug('field_minigame_mode_config', mode=game_session.field_minigame_mode, config=mode_config)
         
         if not mode_config:
-            current_app.logger.error(f"No mode config found for mode: {game_session.field_minigame_mode}")
+            log.error('field_minigame_mode_missing', mode=game_session.field_minigame_mode)
             # Use default values if mode config is missing
             mode_config = {'reward_forward': 5}
         
         # Prüfe ob das landende Team gewonnen hat
         landing_team = game_session.field_minigame_landing_team
         if not landing_team:
-            current_app.logger.error(f"Landing team not found for ID: {game_session.field_minigame_landing_team_id}")
+            log.error('field_minigame_landing_team_missing', team_id=game_session.field_minigame_landing_team_id)
             return {"success": False, "message": "Team-Daten nicht gefunden"}
             
         won = (winning_team_id == game_session.field_minigame_landing_team_id)
-        current_app.logger.info(f"Minigame result - Won: {won}, Landing team: {landing_team.name}, Winning team ID: {winning_team_id}")
+        log.info('field_minigame_result', won=won, landing_team=landing_team.name, winning_team_id=winning_team_id)
         
         if won:
             # Team gewinnt - bewege vorwärts
@@ -1131,7 +763,7 @@ def handle_field_minigame_result(game_session, winning_team_id):
         }
         
     except Exception as e:
-        current_app.logger.error(f"Fehler beim Behandeln des Minigame-Ergebnisses: {e}")
+        log.exception('field_minigame_result_failed', error=str(e))
         return {"success": False, "message": f"Fehler beim Verarbeiten des Ergebnisses: {str(e)}"}
 
 
@@ -1196,7 +828,7 @@ def get_field_statistics():
     Gibt Statistiken über die aktuellen Feld-Konfigurationen zurück
     Verwendet die intelligente Feld-Verteilung
     """
-    field_configs = FieldConfiguration.query.all()
+    field_configs = list(get_cached_field_configs().values())
     
     enabled_count = sum(1 for config in field_configs if config.is_enabled)
     disabled_count = len(field_configs) - enabled_count
@@ -1299,10 +931,8 @@ def force_field_cache_refresh():
     if _field_distribution_cache:
         # Zeige Minigame-Positionen
         minigame_positions = [pos for pos, field_type in _field_distribution_cache.items() if field_type == 'minigame']
-        if current_app:
-            current_app.logger.info(f"Cache erneuert. Minigame-Felder: {sorted(minigame_positions)}")
+        log.info('field_cache_rebuilt', minigame_positions=sorted(minigame_positions))
         return sorted(minigame_positions)
     else:
-        if current_app:
-            current_app.logger.error("Cache konnte nicht erstellt werden!")
+        log.error('field_cache_rebuild_failed')
         return []
\ No newline at end of file
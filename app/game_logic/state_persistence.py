@@ -0,0 +1,88 @@
+"""
+Persistenz-Schicht für den Spielzustand im Speicher
+Lädt einen GameState aus ORM-Objekten und schreibt nur die geänderten Werte
+sowie die gesammelten Events in einem Schritt zurück.
+"""
+import json
+
+from app.models import db, GameEvent
+from .game_state import GameState, TeamState, parse_turn_order, format_turn_order
+
+# Zuordnung TeamState-Attribut -> Team-Spalte
+TEAM_FIELD_MAP = (
+    ('position', 'current_position'),
+    ('bonus_dice_sides', 'bonus_dice_sides'),
+    ('is_blocked', 'is_blocked'),
+    ('blocked_target_number', 'blocked_target_number'),
+    ('blocked_config', 'blocked_config'),
+)
+
+
+def team_state_from_orm(team):
+    """Erstellt einen TeamState aus einem Team-Objekt"""
+    return TeamState(
+        id=team.id,
+        name=team.name,
+        position=team.current_position or 0,
+        bonus_dice_sides=team.bonus_dice_sides or 0,
+        is_blocked=bool(team.is_blocked),
+        blocked_target_number=team.blocked_target_number,
+        blocked_config=team.blocked_config,
+    )
+
+
+def load_game_state(teams, game_session=None):
+    """Erstellt einen GameState aus Team-Objekten und optional der GameSession"""
+    state = GameState(session_id=game_session.id if game_session else None)
+    for team in teams:
+        state.teams[team.id] = team_state_from_orm(team)
+    if game_session is not None:
+        state.turn_order = parse_turn_order(game_session.dice_roll_order)
+        state.current_team_id = game_session.current_team_turn_id
+    return state
+
+
+def flush_game_state(state, teams, game_session=None):
+    """
+    Überträgt die Änderungen des GameState auf die ORM-Objekte
+
+    Nur tatsächlich geänderte Spalten werden gesetzt, damit SQLAlchemy keine
+    unnötigen UPDATEs erzeugt. Gesammelte Events werden gemeinsam hinzugefügt.
+
+    Returns:
+        int: Anzahl der geänderten Spalten
+    """
+    changed = 0
+    for team in teams:
+        team_state = state.teams.get(team.id)
+        if team_state is None:
+            continue
+        for state_attr, column in TEAM_FIELD_MAP:
+            value = getattr(team_state, state_attr)
+            if getattr(team, column) != value:
+                setattr(team, column, value)
+                changed += 1
+
+    if game_session is not None:
+        turn_order = format_turn_order(state.turn_order)
+        if state.turn_order != parse_turn_order(game_session.dice_roll_order):
+            game_session.dice_roll_order = turn_order
+            changed += 1
+        if game_session.current_team_turn_id != state.current_team_id:
+            game_session.current_team_turn_id = state.current_team_id
+            changed += 1
+
+    if state.events:
+        db.session.add_all([
+            GameEvent(
+                game_session_id=state.session_id,
+                event_type=event.event_type,
+                description=event.description,
+                related_team_id=event.related_team_id,
+                data_json=json.dumps(event.data) if event.data is not None else None
+            )
+            for event in state.events
+        ])
+        state.events.clear()
+
+    return changed
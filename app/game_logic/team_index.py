@@ -0,0 +1,96 @@
+"""
+Gecachter Index Team-Name <-> Team-ID
+Wird einmal pro Prozess mit einer Abfrage geladen und bei jeder Änderung an einem
+Team (Anlegen, Umbenennen, Löschen) verworfen - erst nach dem Commit, damit ein
+paralleler Neuaufbau nicht den alten Stand festhält (Mapper-Events merken die Änderung
+in der Session vor, after_commit verwirft; ein Generationszähler verhindert, dass ein
+währenddessen gelesener alter Stand abgelegt wird). Damit können Polling-Endpunkte
+gespeicherte Team-Namen bzw. -IDs ohne Datenbankzugriff auflösen.
+"""
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from ..models import db, Team
+
+
+@dataclass(frozen=True)
+class TeamIndex:
+    names_by_id: Mapping[int, str]
+    ids_by_name: Mapping[str, int]
+
+    def name_for(self, team_id) -> Optional[str]:
+        try:
+            return self.names_by_id.get(int(team_id))
+        except (TypeError, ValueError):
+            return None
+
+    def id_for(self, team_name) -> Optional[int]:
+        return self.ids_by_name.get(team_name)
+
+
+_PENDING_KEY = 'team_index_pending'
+
+_index = None
+_generation = 0
+_lock = threading.Lock()
+
+
+def get_team_index() -> TeamIndex:
+    """Gibt den aktuellen Team-Index zurück (lädt ihn bei Bedarf mit einer Abfrage)"""
+    global _index
+    index = _index
+    if index is None:
+        generation = _generation
+        rows = db.session.execute(db.select(Team.id, Team.name)).all()
+        index = TeamIndex(
+            names_by_id=MappingProxyType({team_id: name for team_id, name in rows}),
+            ids_by_name=MappingProxyType({name: team_id for team_id, name in rows})
+        )
+        with _lock:
+            # Nur ablegen, wenn seit dem Lesen nichts invalidiert wurde und die eigene Session nichts Offenes hat
+            if generation == _generation and not db.session.info.get(_PENDING_KEY):
+                _index = index
+    return index
+
+
+def invalidate_team_index(*_args):
+    """Verwirft den Team-Index sofort; der nächste Zugriff lädt ihn neu"""
+    global _index, _generation
+    with _lock:
+        _generation += 1
+        _index = None
+
+
+def _mark_pending(mapper, connection, target):
+    session = object_session(target)
+    if session is None:
+        invalidate_team_index()
+    else:
+        session.info[_PENDING_KEY] = True
+
+
+def _mark_pending_bulk(update_context):
+    if update_context.mapper.class_ is Team:
+        update_context.session.info[_PENDING_KEY] = True
+
+
+def _invalidate_after_commit(session):
+    if session.info.pop(_PENDING_KEY, None):
+        invalidate_team_index()
+
+
+def _forget_after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+for _event_name in ('after_insert', 'after_update', 'after_delete'):
+    event.listen(Team, _event_name, _mark_pending)
+event.listen(Session, 'after_bulk_update', _mark_pending_bulk)
+event.listen(Session, 'after_bulk_delete', _mark_pending_bulk)
+event.listen(Session, 'after_commit', _invalidate_after_commit)
+event.listen(Session, 'after_rollback', _forget_after_rollback)
@@ -0,0 +1,291 @@
+"""
+Opt-in Instrumentierung pro Request (METRICS_ENABLED)
+Erfasst pro Endpunkt Laufzeit, Anzahl und Dauer der SQL-Statements (Engine-Events),
+gelesene JSON-Dateien (Audit-Hook auf open) und Antwortgröße in Histogrammen.
+Die Werte stehen unter /admin/metrics im Prometheus-Textformat bereit; gleitende
+Fenster ergeben sich dort wie üblich über rate()/increase() auf den Zählern.
+
+Einzelne Requests können zusätzlich profiliert werden: zufällig mit
+PROFILE_SAMPLE_RATE oder gezielt mit ?_profile=1 (nur Admins). Ist pyinstrument
+installiert, wird es verwendet (HTML), sonst cProfile (.prof für pstats/snakeviz).
+
+cProfile läuft ab Python 3.12 prozessweit (sys.monitoring): es kann nur ein Profil
+gleichzeitig aktiv sein, und es enthält auch die übrigen Threads. Solange ein
+cProfile-Profil läuft, werden weitere Requests deshalb nicht profiliert. Für saubere
+Profile pro Request unter dem threaded Server pyinstrument installieren.
+"""
+import contextvars
+import hmac
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+
+from flask import current_app, request
+from sqlalchemy import event
+
+try:
+    import pyinstrument
+except ImportError:  # pragma: no cover - optional
+    pyinstrument = None
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+_current = contextvars.ContextVar('request_stats', default=None)
+_audit_hook_installed = False
+_cprofile_lock = threading.Lock()  # höchstens ein cProfile-Profil gleichzeitig
+
+
+class RequestStats:
+    """Messwerte des laufenden Requests"""
+    __slots__ = ('started', 'sql_statements', 'sql_seconds', 'json_reads', 'profiler', '_sql_started')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sql_statements = 0
+        self.sql_seconds = 0.0
+        self.json_reads = 0
+        self.profiler = None
+        self._sql_started = None
+
+
+class Histogram:
+    """Kumulatives Histogramm mit festen Grenzen je Label-Kombination"""
+
+    def __init__(self, name, help_text, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self._series = {}  # {labels: [bucket_counts..., sum, count]}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self, label_names):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            items = sorted(self._series.items())
+            items = [(labels, list(series)) for labels, series in items]
+        for labels, series in items:
+            base = ','.join(f'{key}="{_escape(value)}"' for key, value in zip(label_names, labels))
+            for bound, count in zip(self.buckets, series):
+                lines.append(f'{self.name}_bucket{{{base},le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{base},le="+Inf"}} {series[-1]}')
+            lines.append(f'{self.name}_sum{{{base}}} {series[-2]}')
+            lines.append(f'{self.name}_count{{{base}}} {series[-1]}')
+        return lines
+
+
+class Counter:
+    """Monoton steigender Zähler je Label-Kombination"""
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help_text = help_text
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self, label_names):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            base = ','.join(f'{key}="{_escape(value)}"' for key, value in zip(label_names, labels))
+            lines.append(f'{self.name}{{{base}}} {value}')
+        return lines
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+ENDPOINT_LABELS = ('endpoint', 'method')
+REQUEST_LABELS = ('endpoint', 'method', 'status')
+
+REQUESTS = Counter('wii_requests_total', 'Anzahl Requests')
+REQUEST_SECONDS = Histogram('wii_request_duration_seconds', 'Laufzeit pro Request', DURATION_BUCKETS)
+SQL_STATEMENTS = Histogram('wii_request_sql_statements', 'SQL-Statements pro Request', COUNT_BUCKETS)
+SQL_SECONDS = Histogram('wii_request_sql_duration_seconds', 'SQL-Zeit pro Request', DURATION_BUCKETS)
+JSON_READS = Histogram('wii_request_json_file_reads', 'Gelesene JSON-Dateien pro Request', COUNT_BUCKETS)
+RESPONSE_BYTES = Histogram('wii_response_size_bytes', 'Antwortgröße pro Request', SIZE_BUCKETS)
+
+
+def render_metrics():
+    """Alle Metriken im Prometheus-Textformat (Version 0.0.4)"""
+    lines = REQUESTS.render(REQUEST_LABELS)
+    for histogram in (REQUEST_SECONDS, SQL_STATEMENTS, SQL_SECONDS, JSON_READS, RESPONSE_BYTES):
+        lines.extend(histogram.render(ENDPOINT_LABELS))
+    return '\n'.join(lines) + '\n'
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is not None:
+        stats.sql_statements += 1
+        stats._sql_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is not None and stats._sql_started is not None:
+        stats.sql_seconds += time.perf_counter() - stats._sql_started
+        stats._sql_started = None
+
+
+def _audit_open(event_name, args):
+    if event_name != 'open':
+        return
+    stats = _current.get()
+    if stats is None:
+        return
+    path, mode = args[0], args[1]
+    if isinstance(path, str) and path.endswith('.json') and (mode is None or 'r' in mode):
+        stats.json_reads += 1
+
+
+def _profile_dir(app):
+    return app.config.get('PROFILE_DIR') or os.path.join(app.instance_path, 'profiles')
+
+
+def _wants_profile(app):
+    if request.args.get('_profile') == '1':
+        from flask_login import current_user
+        from .models import Admin
+        return isinstance(current_user, Admin)
+    rate = app.config.get('PROFILE_SAMPLE_RATE') or 0
+    return rate > 0 and random.random() < rate
+
+
+def _start_profiler():
+    """Startet einen Profiler für den laufenden Request (None, wenn gerade keiner möglich ist)"""
+    if pyinstrument is not None:
+        profiler = pyinstrument.Profiler()
+        profiler.start()
+        return profiler
+    import cProfile
+    if not _cprofile_lock.acquire(blocking=False):
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Ein anderes Profiling-Werkzeug (z.B. Debugger, Coverage) ist bereits aktiv
+        _cprofile_lock.release()
+        return None
+    return profiler
+
+
+def _stop_profiler(profiler):
+    if pyinstrument is not None:
+        profiler.stop()
+    else:
+        try:
+            profiler.disable()
+        finally:
+            _cprofile_lock.release()
+
+
+def _end_request_stats():
+    """Beendet die Messung des laufenden Requests und gibt sie zurück (oder None)"""
+    entry = request.environ.pop('wii.request_stats', None)
+    if entry is None:
+        return None
+    stats, token = entry
+    try:
+        _current.reset(token)
+    except ValueError:
+        # Token aus einem anderen Kontext (z.B. anderer Thread)
+        _current.set(None)
+    if stats.profiler is not None:
+        _stop_profiler(stats.profiler)
+    return stats
+
+
+def _save_profile(app, profiler, endpoint):
+    directory = _profile_dir(app)
+    stamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')
+    try:
+        os.makedirs(directory, exist_ok=True)
+        if pyinstrument is not None:
+            path = os.path.join(directory, f'{stamp}_{endpoint}.html')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(profiler.output_html())
+        else:
+            path = os.path.join(directory, f'{stamp}_{endpoint}.prof')
+            profiler.dump_stats(path)
+        app.logger.info(f"Profil für {endpoint} gespeichert: {path}")
+    except OSError as e:
+        app.logger.warning(f"Profil für {endpoint} konnte nicht gespeichert werden: {e}")
+
+
+def init_instrumentation(app, db):
+    """Registriert Request-Hooks und Engine-Events (nur wenn METRICS_ENABLED gesetzt ist)"""
+    global _audit_hook_installed
+    if not app.config.get('METRICS_ENABLED'):
+        return False
+
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(db.engine, 'after_cursor_execute', _after_cursor_execute)
+    if not _audit_hook_installed:
+        # Audit-Hooks lassen sich nicht entfernen; ohne laufende Messung kehrt der Hook sofort zurück
+        sys.addaudithook(_audit_open)
+        _audit_hook_installed = True
+
+    @app.before_request
+    def _start_request_stats():
+        stats = RequestStats()
+        request.environ['wii.request_stats'] = (stats, _current.set(stats))
+        if _wants_profile(app):
+            stats.profiler = _start_profiler()
+
+    @app.after_request
+    def _record_request_stats(response):
+        stats = _end_request_stats()
+        if stats is None:
+            return response
+        endpoint = request.url_rule.endpoint if request.url_rule else 'unbekannt'
+        if stats.profiler is not None:
+            _save_profile(app, stats.profiler, endpoint)
+        labels = (endpoint, request.method)
+        REQUESTS.inc((endpoint, request.method, str(response.status_code)))
+        REQUEST_SECONDS.observe(labels, time.perf_counter() - stats.started)
+        SQL_STATEMENTS.observe(labels, stats.sql_statements)
+        SQL_SECONDS.observe(labels, stats.sql_seconds)
+        JSON_READS.observe(labels, stats.json_reads)
+        if response.content_length is not None:
+            RESPONSE_BYTES.observe(labels, response.content_length)
+        return response
+
+    @app.teardown_request
+    def _discard_request_stats(exc):
+        # Bei Ausnahmen läuft after_request nicht; Messung trotzdem beenden
+        _end_request_stats()
+
+    return True
+
+
+def metrics_token_matches():
+    """Prüft einen optionalen Bearer-Token (METRICS_TOKEN) für Prometheus-Scraper"""
+    token = current_app.config.get('METRICS_TOKEN')
+    if not token:
+        return False
+    return hmac.compare_digest(request.headers.get('Authorization', '').encode('utf-8'),
+                               f'Bearer {token}'.encode('utf-8'))
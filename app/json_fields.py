@@ -0,0 +1,173 @@
+"""
+JSON in Text-Spalten mit gecachtem, änderungsverfolgtem Zugriff
+
+Viele Modelle speichern JSON als Text und parsen es bei jedem Getter-Aufruf neu.
+JSONText ist ein Deskriptor neben der eigentlichen Spalte:
+
+    player_config = db.Column(db.Text, nullable=True)
+    parsed_player_config = JSONText('player_config', default=dict)
+
+- Geparst wird erst beim ersten Zugriff und danach nur, wenn sich der Rohwert der
+  Spalte geändert hat (Zuweisung, Refresh, Reload nach Commit mit neuem Inhalt).
+- Der gelieferte Wert ist ein dict/list, das Änderungen auf oberster Ebene bemerkt.
+  Geänderte Werte werden erst beim nächsten Flush (einmal) serialisiert.
+- Änderungen in verschachtelten Strukturen werden nicht erkannt; dafür den Wert neu
+  zuweisen oder mark_json_changed() aufrufen.
+- Zuweisungen an den Deskriptor serialisieren sofort, die Spalte bleibt damit für
+  Backups und Roh-SQL immer aktuell.
+
+Ist orjson installiert, wird es für Parsen und Serialisieren verwendet.
+"""
+import json
+import weakref
+
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional
+    orjson = None
+
+_PENDING_KEY = '_json_pending'
+
+
+if orjson is not None:
+    def json_loads(raw):
+        return orjson.loads(raw)
+
+    def json_dumps(value):
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+else:
+    def json_loads(raw):
+        return json.loads(raw)
+
+    def json_dumps(value):
+        return json.dumps(value)
+
+
+def _tracking(base, mutators):
+    """Erzeugt eine dict/list-Unterklasse, die bei Änderungen einen Callback auslöst"""
+
+    def wrap(name):
+        method = getattr(base, name)
+
+        def mutator(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            self._on_change()
+            return result
+        mutator.__name__ = name
+        return mutator
+
+    namespace = {name: wrap(name) for name in mutators}
+    namespace['__slots__'] = ('_on_change',)
+    namespace['__reduce_ex__'] = lambda self, protocol: (base, (base(self),))
+    return type(f'Tracked{base.__name__.capitalize()}', (base,), namespace)
+
+
+TrackedDict = _tracking(dict, ('__setitem__', '__delitem__', '__ior__', 'clear', 'pop',
+                               'popitem', 'setdefault', 'update'))
+TrackedList = _tracking(list, ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append',
+                               'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse'))
+
+
+class JSONText:
+    """Deskriptor für den geparsten Wert einer JSON-Text-Spalte (siehe Modul-Docstring)"""
+
+    def __init__(self, column, default=None):
+        self.column = column
+        self.default = default  # Factory für leere/ungültige Werte, z.B. dict
+        self.name = None
+        self._cache_key = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self._cache_key = f'_json_cache_{name}'
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        raw = getattr(instance, self.column)
+        cached = instance.__dict__.get(self._cache_key)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        value = self._track(instance, self._parse(raw))
+        instance.__dict__[self._cache_key] = (raw, value)
+        return value
+
+    def __set__(self, instance, value):
+        raw = None if value is None else json_dumps(value)
+        setattr(instance, self.column, raw)
+        pending = instance.__dict__.get(_PENDING_KEY)
+        if pending:
+            pending.pop(self.name, None)
+        instance.__dict__.pop(self._cache_key, None)
+
+    def _parse(self, raw):
+        if raw:
+            try:
+                return json_loads(raw)
+            except (ValueError, TypeError):
+                pass
+        return self.default() if self.default is not None else None
+
+    def _track(self, instance, value):
+        if isinstance(value, dict):
+            tracked = TrackedDict(value)
+        elif isinstance(value, list):
+            tracked = TrackedList(value)
+        else:
+            return value
+        owner = weakref.ref(instance)
+
+        def on_change():
+            target = owner()
+            if target is not None:
+                self.mark_changed(target)
+        tracked._on_change = on_change
+        return tracked
+
+    def mark_changed(self, instance):
+        """Merkt den Wert zum Serialisieren beim nächsten Flush vor"""
+        instance.__dict__.setdefault(_PENDING_KEY, {})[self.name] = self
+        try:
+            flag_modified(instance, self.column)
+        except InvalidRequestError:
+            # Spalte nicht geladen: der Wert wird beim nächsten Flush trotzdem geschrieben,
+            # sofern das Objekt aus anderem Grund geändert ist
+            pass
+
+    def store(self, instance):
+        """Serialisiert den gecachten Wert in die Spalte"""
+        cached = instance.__dict__.get(self._cache_key)
+        if cached is None:
+            return
+        value = cached[1]
+        raw = None if value is None else json_dumps(value)
+        setattr(instance, self.column, raw)
+        instance.__dict__[self._cache_key] = (raw, value)
+
+
+def json_copy(value):
+    """Flache Kopie für Getter, damit Aufrufer den gecachten Wert nicht verändern"""
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+def mark_json_changed(instance, name):
+    """Markiert einen JSONText-Wert nach Änderungen in verschachtelten Strukturen als geändert"""
+    getattr(type(instance), name).mark_changed(instance)
+
+
+@event.listens_for(Session, 'before_flush')
+def _serialize_pending_json(session, flush_context, instances):
+    for instance in (*session.new, *session.dirty):
+        pending = instance.__dict__.pop(_PENDING_KEY, None)
+        if pending:
+            for field in pending.values():
+                field.store(instance)
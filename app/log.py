@@ -0,0 +1,142 @@
+"""
+Strukturiertes, levelabhängiges Logging für Hot Paths
+Die Subsystem-Logger (wii.board, wii.dice, wii.fields, wii.moderation) nehmen ein
+Ereignis plus Schlüssel/Wert-Felder entgegen:
+
+    log = get_logger('wii.board')
+    log.debug('dice_result_found', team_id=team_id, result=last_dice_result)
+
+Ist das Level nicht aktiv, wird weder ein LogRecord erzeugt noch formatiert - auch
+große dicts kosten dann nichts. Die Ausgabe läuft über einen QueueHandler; das
+Schreiben auf stdout/Datei übernimmt ein QueueListener-Thread, Requests warten also
+nicht auf I/O. Produktiv (LOG_LEVEL=INFO) erscheinen nur Zustandswechsel wie
+Teamwechsel, Rundenende oder Sieg.
+"""
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from datetime import datetime
+
+from .json_fields import json_dumps
+
+SUBSYSTEMS = ('wii.board', 'wii.dice', 'wii.fields', 'wii.moderation')
+
+_loggers = {}
+_listener = None
+
+
+def _format_value(value):
+    if isinstance(value, str):
+        return f'"{value}"' if (' ' in value or not value) else value
+    if isinstance(value, (dict, list, tuple)):
+        try:
+            return json_dumps(value)
+        except TypeError:
+            return repr(value)
+    return str(value)
+
+
+class LogEvent:
+    """Ereignis mit Feldern; der Text wird erst beim Formatieren erzeugt"""
+    __slots__ = ('event', 'fields')
+
+    def __init__(self, event, fields):
+        self.event = event
+        self.fields = fields
+
+    def __str__(self):
+        if not self.fields:
+            return self.event
+        return self.event + ' ' + ' '.join(f'{key}={_format_value(value)}' for key, value in self.fields.items())
+
+
+class StructuredLogger:
+    """Dünne Hülle um logging.Logger, die vor jedem Aufruf das Level prüft"""
+    __slots__ = ('_logger',)
+
+    def __init__(self, name):
+        self._logger = logging.getLogger(name)
+
+    def is_enabled(self, level=logging.DEBUG):
+        """Für teure Vorberechnungen, die nur dem Log dienen"""
+        return self._logger.isEnabledFor(level)
+
+    def _log(self, level, event, fields, exc_info=None):
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, LogEvent(event, fields), exc_info=exc_info, stacklevel=3)
+
+    def debug(self, event, **fields):
+        self._log(logging.DEBUG, event, fields)
+
+    def info(self, event, **fields):
+        self._log(logging.INFO, event, fields)
+
+    def warning(self, event, **fields):
+        self._log(logging.WARNING, event, fields)
+
+    def error(self, event, **fields):
+        self._log(logging.ERROR, event, fields)
+
+    def exception(self, event, **fields):
+        self._log(logging.ERROR, event, fields, exc_info=True)
+
+
+def get_logger(name):
+    """Gibt den (gecachten) StructuredLogger für ein Subsystem zurück"""
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers[name] = StructuredLogger(name)
+    return logger
+
+
+class StructuredFormatter(logging.Formatter):
+    """Textzeile (logfmt-artig) oder eine JSON-Zeile pro Ereignis"""
+
+    def __init__(self, output='text'):
+        super().__init__('%(asctime)s %(levelname)s %(name)s %(message)s')
+        self.output = output
+
+    def format(self, record):
+        if self.output != 'json':
+            return super().format(record)
+        message = record.msg
+        entry = {
+            'ts': datetime.utcfromtimestamp(record.created).isoformat(timespec='milliseconds') + 'Z',
+            'level': record.levelname,
+            'logger': record.name,
+        }
+        if isinstance(message, LogEvent):
+            entry['event'] = message.event
+            entry.update({key: value for key, value in message.fields.items() if key not in entry})
+        else:
+            entry['event'] = record.getMessage()
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        try:
+            return json_dumps(entry)
+        except TypeError:
+            return json_dumps({key: _format_value(value) for key, value in entry.items()})
+
+
+def configure_logging(app):
+    """Richtet die wii.*-Logger mit QueueHandler ein (LOG_LEVEL, LOG_FORMAT)"""
+    global _listener
+    level = (app.config.get('LOG_LEVEL') or ('DEBUG' if app.debug else 'INFO')).upper()
+    root = logging.getLogger('wii')
+    root.setLevel(level)
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout if app.config.get('LOG_TO_STDOUT') else sys.stderr)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    # Formatiert wird im aufrufenden Thread (nur für aktive Level), geschrieben im Listener
+    queue_handler.setFormatter(StructuredFormatter(app.config.get('LOG_FORMAT') or 'text'))
+    root.addHandler(queue_handler)
+    root.propagate = False
+
+    _listener = logging.handlers.QueueListener(queue_handler.queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -2,11 +2,23 @@ from flask import render_template, jsonify, request, session, current_app, redir
 from app.main import main_bp
 from app.models import Team, Character, GameSession, GameEvent, Admin, WelcomeSession, PlayerRegistration
 from app import db, csrf
+import base64
+import binascii
+import io
+import os
 import random # Für Würfellogik
+import re
 import traceback # Für detaillierte Fehlermeldungen
 from flask_login import current_user
 from datetime import datetime, timedelta
 import json
+from app.log import get_logger
+from app.game_logic.game_summary import get_game_summary, materialize_game_summary, summarize_finished_session
+from app.game_logic.position_timeseries import get_position_deltas, record_position
+
+board_log = get_logger('wii.board')
+dice_log = get_logger('wii.dice')
+fields_log = get_logger('wii.fields')
 
 
 def get_consistent_emoji_for_player(player_name):
@@ -103,7 +115,7 @@ def board_status():
                     # Stellt sicher, dass nur gültige Integer-IDs in der Liste landen
                     dice_order_ids = [int(tid_str) for tid_str in active_session_query.dice_roll_order.split(',') if tid_str.strip().isdigit()]
                 except ValueError:
-                    current_app.logger.error(f"Ungültige dice_roll_order: {active_session_query.dice_roll_order}")
+                    board_log.error('invalid_dice_roll_order', dice_roll_order=active_session_query.dice_roll_order)
                     dice_order_ids = [] # Im Fehlerfall leere Liste
 
             # Sicherstellen, dass current_team_turn_id ein Integer ist oder None
@@ -112,7 +124,7 @@ def board_status():
                 try:
                     current_team_id = int(current_team_id)
                 except ValueError:
-                    current_app.logger.error(f"Ungültige current_team_turn_id: {current_team_id}")
+                    board_log.error('invalid_current_team_turn_id', current_team_turn_id=current_team_id)
                     current_team_id = None
 
             # Get minigame folder name from current game round
@@ -136,7 +148,6 @@ def board_status():
         # Get recent events (dice results and special field events)
         last_dice_result = None
         last_special_field_event = None
-        from datetime import datetime, timedelta
         
         # Only get events from the last 10 seconds to avoid old results (TEST MODE)
         recent_time = datetime.utcnow() - timedelta(seconds=10)
@@ -163,7 +174,6 @@ def board_status():
         # Process dice result
         if last_dice_event and last_dice_event.data_json:
             try:
-                import json
                 # Parse data_json
                 if isinstance(last_dice_event.data_json, str):
                     try:
@@ -188,15 +198,14 @@ def board_status():
                     'needs_final_roll': event_data.get('needs_final_roll', False)
                 }
                 
-                current_app.logger.info(f"Found recent dice result for team {last_dice_event.related_team_id}: {last_dice_result}")
+                board_log.debug('recent_dice_result', team_id=last_dice_event.related_team_id, result=last_dice_result)
             except Exception as e:
-                current_app.logger.error(f"Error parsing dice result: {e}")
+                board_log.error('dice_result_parse_failed', event_id=last_dice_event.id, error=str(e))
                 last_dice_result = None
 
         # Process special field event
         if last_special_event and last_special_event.data_json:
             try:
-                import json
                 # Parse data_json
                 if isinstance(last_special_event.data_json, str):
                     try:
@@ -213,9 +222,9 @@ def board_status():
                     'data': event_data
                 }
                 
-                current_app.logger.info(f"Found recent special field event for team {last_special_event.related_team_id}: {last_special_event.event_type}")
+                board_log.debug('recent_special_field_event', team_id=last_special_event.related_team_id, event_type=last_special_event.event_type)
             except Exception as e:
-                current_app.logger.error(f"Error parsing special field event: {e}")
+                board_log.error('special_field_event_parse_failed', event_id=last_special_event.id, error=str(e))
                 last_special_field_event = None
 
         # Get question data if question is active
@@ -224,47 +233,29 @@ def board_status():
             active_session_query.current_phase == 'QUESTION_ACTIVE' and 
             active_session_query.current_question_id):
             
-            current_app.logger.info(f"[QUESTION BANNER] Attempting to load question data for ID: {active_session_query.current_question_id}")
+            board_log.debug('question_banner_load', question_id=active_session_query.current_question_id)
             
             try:
-                from app.models import GameRound
-                from app.admin.minigame_utils import get_question_from_folder
-                
-                active_round = GameRound.get_active_round()
-                current_app.logger.info(f"[QUESTION BANNER] Active round: {active_round}")
+                from app.admin.minigame_utils import get_active_question
                 
-                if active_round and active_round.minigame_folder:
-                    current_app.logger.info(f"[QUESTION BANNER] Minigame folder: {active_round.minigame_folder.folder_path}")
-                    
-                    question_info = get_question_from_folder(
-                        active_round.minigame_folder.folder_path, 
-                        active_session_query.current_question_id
-                    )
-                    current_app.logger.info(f"[QUESTION BANNER] Question info loaded: {question_info}")
-                    
-                    if question_info:
-                        question_data = {
-                            'question_active': True,
-                            'question': {
-                                'id': active_session_query.current_question_id,
-                                'title': question_info.get('title', 'Aktuelle Frage'),
-                                'text': question_info.get('question', ''),
-                                'type': question_info.get('type', 'multiple_choice')
-                            },
-                            'answers': question_info.get('options', [])
-                        }
-                        current_app.logger.info(f"[QUESTION BANNER] Question data prepared: {question_data}")
-                    else:
-                        current_app.logger.warning(f"[QUESTION BANNER] No question info returned from get_question_from_folder")
+                question = get_active_question(active_session_query)
+                if question:
+                    question_info = question.data
+                    question_data = {
+                        'question_active': True,
+                        'question': {
+                            'id': active_session_query.current_question_id,
+                            'title': question_info.get('title', 'Aktuelle Frage'),
+                            'text': question_info.get('question', ''),
+                            'type': question_info.get('type', 'multiple_choice')
+                        },
+                        'answers': list(question.options)
+                    }
                 else:
-                    current_app.logger.warning(f"[QUESTION BANNER] No active round or minigame folder")
+                    board_log.warning('question_banner_missing_snapshot', question_id=active_session_query.current_question_id)
             except Exception as e:
-                current_app.logger.error(f"[QUESTION BANNER] Error loading question data: {e}")
-                import traceback
-                current_app.logger.error(f"[QUESTION BANNER] Traceback: {traceback.format_exc()}")
+                board_log.exception('question_banner_load_failed', question_id=active_session_query.current_question_id)
                 question_data = None
-        else:
-            current_app.logger.info(f"[QUESTION BANNER] Not loading question data - Phase: {active_session_query.current_phase if active_session_query else 'None'}, Question ID: {active_session_query.current_question_id if active_session_query else 'None'}")
         
         response_data = {
             "teams": team_data,
@@ -290,8 +281,7 @@ def board_status():
         return jsonify(response_data)
 
     except Exception as e:
-        current_app.logger.error(f"Schwerer Fehler in /api/board-status: {e}")
-        current_app.logger.error(traceback.format_exc())
+        board_log.exception('board_status_failed', error=str(e))
         return jsonify({"error": "Ein interner Serverfehler ist aufgetreten.", "details": str(e)}), 500
 
 @main_bp.route('/api/minigame-status')
@@ -321,25 +311,15 @@ def question_status_for_gameboard():
             return jsonify({'question_active': False, 'message': 'Keine aktive Frage'})
         
         # Hole Fragen-Daten
-        from app.models import GameRound
-        from app.admin.minigame_utils import get_question_from_folder
-        
-        active_round = GameRound.get_active_round()
-        if not active_round or not active_round.minigame_folder:
-            return jsonify({'question_active': False, 'message': 'Keine aktive Spielrunde'})
-        
-        question_data = get_question_from_folder(active_round.minigame_folder.folder_path, active_session.current_question_id)
-        current_app.logger.info(f"[QUESTION BANNER] Raw question data: {question_data}")
+        from app.admin.minigame_utils import get_active_question
         
-        if not question_data:
+        question = get_active_question(active_session)
+        if not question:
             return jsonify({'question_active': False, 'message': 'Frage nicht gefunden'})
+        question_data = question.data
         
-        # Try different field names for question text
-        question_text = (question_data.get('question_text') or   # <-- Das war's!
-                        question_data.get('question') or 
-                        question_data.get('text') or 
-                        question_data.get('content') or 
-                        question_data.get('description') or '')
+        # Fragetext wurde beim Anheften aus den verschiedenen Feldnamen aufgelöst
+        question_text = question.question_text
         
         # Get question title/name
         question_title = (question_data.get('name') or           # <-- Und das!
@@ -351,7 +331,7 @@ def question_status_for_gameboard():
                   question_data.get('answers') or 
                   question_data.get('choices') or [])
         
-        current_app.logger.info(f"[QUESTION BANNER] Processed - text: '{question_text}', answers: {answers}")
+        board_log.debug('question_banner_processed', question_id=active_session.current_question_id, text=question_text, answers=answers)
         
         return jsonify({
             'question_active': True,
@@ -362,7 +342,7 @@ def question_status_for_gameboard():
                 'type': question_data.get('question_type', 'multiple_choice')
             },
             'answers': answers,
-            'debug_raw_data': question_data  # Temporary debug field
+            'debug_raw_data': dict(question_data)  # Temporary debug field
         })
         
     except Exception as e:
@@ -441,7 +421,7 @@ def roll_dice_action_admin_only():
             )
             special_fields_available = True
         except ImportError:
-            current_app.logger.warning("Sonderfeld-Module nicht verfügbar - Legacy-Modus")
+            dice_log.warning('special_fields_unavailable', mode='legacy')
             special_fields_available = False
 
         standard_dice_roll = random.randint(1, 6)
@@ -489,13 +469,13 @@ def roll_dice_action_admin_only():
         if old_position == 72 and total_roll >= 6:
             # Team war bereits auf Zielfeld und hat 6+ gewürfelt - hat gewonnen!
             victory_triggered = True
-            current_app.logger.info(f"🏆 VICTORY: Team {team.name} war auf Position 72 und würfelte {total_roll} (>= 6) - SIEG!")
+            dice_log.info('victory_roll', team=team.name, total_roll=total_roll)
         elif old_position == 72 and total_roll < 6:
             # Team war auf Zielfeld, hat aber weniger als 6 gewürfelt
-            current_app.logger.info(f"🎯 FINAL FIELD: Team {team.name} war auf Position 72, würfelte {total_roll} - braucht mindestens 6 zum Gewinnen")
+            dice_log.info('final_field_roll_too_low', team=team.name, total_roll=total_roll, required=6)
         elif new_position == 72:
             # Team ist gerade erst auf Position 72 angekommen - muss nächste Runde 6+ würfeln
-            current_app.logger.info(f"🎯 REACHED FINAL FIELD: Team {team.name} erreichte Position 72 - muss nächste Runde mindestens 6 würfeln")
+            dice_log.info('final_field_reached', team=team.name, position=new_position)
         
         event_description = f"Admin würfelte für Team {team.name}: {standard_dice_roll}"
         if bonus_dice_roll > 0:
@@ -534,6 +514,9 @@ def roll_dice_action_admin_only():
         )
         db.session.add(dice_event)
 
+        # Positions-Zeitreihe (finale Position nach Sonderfeldern) für Charts und Board-Replay
+        record_position(active_session.id, team.id, team.current_position, total_roll)
+
         dice_order_ids_str = active_session.dice_roll_order.split(',')
         dice_order_ids_int = [int(tid) for tid in dice_order_ids_str if tid.isdigit()]
         
@@ -542,14 +525,14 @@ def roll_dice_action_admin_only():
             current_team_index_in_order = dice_order_ids_int.index(team.id)
         else:
             db.session.rollback()
-            current_app.logger.error(f"Team {team.id} nicht in Würfelreihenfolge {dice_order_ids_int} gefunden.")
+            dice_log.error('team_not_in_dice_order', team_id=team.id, dice_order=dice_order_ids_int)
             return jsonify({"success": False, "error": "Fehler in der Würfelreihenfolge (Team nicht gefunden)."}), 500
 
         # Prüfe ob ein Field-Minigame durch Sonderfeld-Behandlung gestartet wurde
         field_minigame_phases = ['FIELD_MINIGAME_SELECTION_PENDING', 'FIELD_MINIGAME_TRIGGERED', 'FIELD_MINIGAME_COMPLETED']
         if active_session.current_phase in field_minigame_phases:
             # Field-Minigame wurde gestartet - normale Team-Turn-Logik überspringen
-            current_app.logger.info(f"Field-Minigame wurde gestartet (Phase: {active_session.current_phase}) - überspringe normale Turn-Logik")
+            dice_log.info('field_minigame_started', phase=active_session.current_phase)
         elif current_team_index_in_order < len(dice_order_ids_int) - 1:
             active_session.current_team_turn_id = dice_order_ids_int[current_team_index_in_order + 1]
         else:
@@ -573,29 +556,32 @@ def roll_dice_action_admin_only():
         if victory_triggered:
             try:
                 # Speichere Victory Event
+                victory_time = datetime.utcnow()
                 victory_event = GameEvent(
                     game_session_id=active_session.id,
                     event_type="game_victory",
                     description=f"Team {team.name} hat das Spiel gewonnen!",
-                    related_team_id=team.id,
-                    data_json=str({
-                        "winning_team_id": team.id,
-                        "winning_team_name": team.name,
-                        "victory_timestamp": datetime.utcnow().isoformat(),
-                        "final_position": team.current_position,
-                        "final_dice_roll": total_roll
-                    })
+                    related_team_id=team.id
                 )
+                victory_event.data = {
+                    "winning_team_id": team.id,
+                    "winning_team_name": team.name,
+                    "victory_timestamp": victory_time.isoformat(),
+                    "final_position": team.current_position,
+                    "final_dice_roll": total_roll,
+                    "game_session_id": active_session.id
+                }
                 db.session.add(victory_event)
                 
-                # Setze Spiel auf beendet
+                # Setze Spiel auf beendet und speichere die Endstatistik für die Goodbye-Seite
                 active_session.current_phase = 'GAME_FINISHED'
+                materialize_game_summary(active_session, team.id, victory_time)
                 db.session.commit()
                 
-                current_app.logger.info(f"🏆 Victory automatisch ausgelöst für Team {team.name}")
+                dice_log.info('victory_triggered', team=team.name)
                 
             except Exception as ve:
-                current_app.logger.error(f"Fehler beim Victory-Handling: {ve}")
+                dice_log.exception('victory_handling_failed', team=team.name)
                 db.session.rollback()
 
         # Response zusammenstellen
@@ -624,8 +610,7 @@ def roll_dice_action_admin_only():
         
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Schwerer Fehler in /api/roll_dice_action_admin_only: {e}")
-        current_app.logger.error(traceback.format_exc())
+        dice_log.exception('roll_dice_failed', error=str(e))
         return jsonify({"success": False, "error": "Ein interner Serverfehler beim Würfeln ist aufgetreten.", "details": str(e)}), 500
 
 # SONDERFELD: Neue API-Endpunkte für Sonderfeld-Interaktionen
@@ -910,7 +895,6 @@ def welcome_status():
             
             # Sortiere Teams korrekt (Team 1, Team 2, Team 3, ...)
             def extract_team_number(team_name):
-                import re
                 match = re.search(r'Team (\d+)', team_name)
                 return int(match.group(1)) if match else 999  # 999 für Teams ohne Nummer
             
@@ -973,7 +957,6 @@ def welcome_admin_status():
             
             # Sortiere Teams korrekt (Team 1, Team 2, Team 3, ...)
             def extract_team_number(team_name):
-                import re
                 match = re.search(r'Team (\d+)', team_name)
                 return int(match.group(1)) if match else 999  # 999 für Teams ohne Nummer
             
@@ -1014,29 +997,34 @@ def victory():
             return jsonify({"success": False, "error": "Keine aktive Spielsitzung"}), 404
         
         # Speichere Victory Event
+        victory_time = datetime.utcnow()
         victory_event = GameEvent(
             game_session_id=active_session.id,
             event_type="game_victory",
             description=f"Team {winning_team.name} hat das Spiel gewonnen!",
-            related_team_id=winning_team_id,
-            data_json=str({
-                "winning_team_id": winning_team_id,
-                "winning_team_name": winning_team_name,
-                "victory_timestamp": datetime.utcnow().isoformat(),
-                "final_position": winning_team.current_position
-            })
+            related_team_id=winning_team_id
         )
+        victory_event.data = {
+            "winning_team_id": winning_team_id,
+            "winning_team_name": winning_team_name,
+            "victory_timestamp": victory_time.isoformat(),
+            "final_position": winning_team.current_position,
+            "game_session_id": active_session.id
+        }
         db.session.add(victory_event)
         
         # Beende aktive Session
         active_session.is_active = False
         active_session.current_phase = 'GAME_FINISHED'
         
+        # Endstatistik einmalig berechnen und speichern (Goodbye-Seite liest nur noch diese)
+        materialize_game_summary(active_session, winning_team.id, victory_time)
+        
         # Speichere Victory-Informationen in Session für Goodbye-Seite
         session['victory_data'] = {
             'winning_team_id': winning_team_id,
             'winning_team_name': winning_team_name,
-            'victory_timestamp': datetime.utcnow().isoformat(),
+            'victory_timestamp': victory_time.isoformat(),
             'game_session_id': active_session.id
         }
         
@@ -1056,105 +1044,28 @@ def victory():
 
 @main_bp.route('/goodbye')
 def goodbye():
-    """Goodbye-Seite mit Spielstatistiken"""
+    """Goodbye-Seite mit Spielstatistiken (aus der beim Sieg gespeicherten GameSummary)"""
     try:
-        # 🔍 DEBUG: Log available event types for debugging
-        all_events = GameEvent.query.with_entities(GameEvent.event_type).distinct().all()
-        current_app.logger.info(f"📊 Available event types: {[event[0] for event in all_events]}")
-        
-        # Hole Victory-Daten aus Session
+        # Victory-Daten aus der Session, sonst das zuletzt beendete Spiel
         victory_data = session.get('victory_data')
-        current_app.logger.info(f"📊 Victory data from session: {victory_data}")
-        
-        if not victory_data:
-            # Fallback: Hole letztes beendetes Spiel
-            last_finished_session = GameSession.query.filter_by(
-                current_phase='GAME_FINISHED'
-            ).order_by(GameSession.id.desc()).first()
-            
-            if last_finished_session:
-                # Hole Victory Event
-                victory_event = GameEvent.query.filter_by(
-                    game_session_id=last_finished_session.id,
-                    event_type='game_victory'
-                ).first()
-                
-                if victory_event and victory_event.data_json:
-                    import json
-                    try:
-                        victory_data = eval(victory_event.data_json) if isinstance(victory_event.data_json, str) else victory_event.data_json
-                    except:
-                        victory_data = None
-        
-        # Hole alle Teams und ihre Statistiken
-        teams = Team.query.order_by(Team.current_position.desc()).all()
-        teams_stats = []
-        
-        winning_team = None
-        game_session_id = None
-        if victory_data:
-            winning_team = Team.query.get(victory_data.get('winning_team_id'))
-            game_session_id = victory_data.get('game_session_id')
-        
-        # Berechne detaillierte Minispiel-Statistiken
-        minigame_stats = calculate_minigame_statistics(game_session_id) if game_session_id else {}
-        position_history = calculate_position_history(game_session_id) if game_session_id else {}
-        
-        current_app.logger.info(f"📊 Minigame stats calculated: {minigame_stats}")
-        current_app.logger.info(f"📊 Position history calculated: {list(position_history.keys())}")
-        
-        for team in teams:
-            team_minigame_stats = minigame_stats.get(str(team.id), {})
-            
-            team_stat = {
-                'id': team.id,
-                'name': team.name,
-                'color': team.character.color if team.character else '#CCCCCC',
-                'final_position': team.current_position,
-                'minigame_wins': team_minigame_stats.get('wins', 0),
-                'minigame_participations': team_minigame_stats.get('participations', 0),
-                'minigame_placements': team_minigame_stats.get('placements', []),
-                'position_history': position_history.get(str(team.id), []),
-                'is_winner': team.id == victory_data.get('winning_team_id') if victory_data else False
-            }
-            teams_stats.append(team_stat)
-            current_app.logger.info(f"📊 Team {team.name} stats: position={team.current_position}, wins={team_minigame_stats.get('wins', 0)}, participations={team_minigame_stats.get('participations', 0)}")
-        
-        # Sortiere Teams nach finaler Position (absteigend)
-        teams_stats.sort(key=lambda x: x['final_position'], reverse=True)
-        
-        # Berechne Spieldauer
-        game_duration = "Unbekannt"
-        total_minigames = 0
-        
-        if victory_data and victory_data.get('game_session_id'):
-            game_session = GameSession.query.get(victory_data['game_session_id'])
-            if game_session and game_session.created_at:
-                victory_time = datetime.fromisoformat(victory_data['victory_timestamp'].replace('Z', '+00:00'))
-                duration = victory_time - game_session.created_at
-                
-                hours = int(duration.total_seconds() // 3600)
-                minutes = int((duration.total_seconds() % 3600) // 60)
-                
-                if hours > 0:
-                    game_duration = f"{hours}h {minutes}m"
-                else:
-                    game_duration = f"{minutes}m"
-                
-                # Zähle Minispiel-Events (placements_recorded indicates minigames were played)
-                minigame_events = GameEvent.query.filter_by(
-                    game_session_id=game_session.id,
-                    event_type='placements_recorded'
-                ).count()
-                total_minigames = minigame_events
-        
+        game_session_id = victory_data.get('game_session_id') if victory_data else None
+
+        game_summary = get_game_summary(game_session_id)
+        if game_summary is None:
+            # Spiel wurde vor Einführung der GameSummary beendet: einmalig nachträglich berechnen
+            game_summary = summarize_finished_session(game_session_id)
+
+        summary = game_summary.summary if game_summary else {}
+        board_log.debug('goodbye_summary', session_id=game_summary.game_session_id if game_summary else None,
+                        teams=len(summary.get('teams', [])))
+
         return render_template('goodbye.html',
-                             winning_team=winning_team,
-                             teams_stats=teams_stats,
-                             game_duration=game_duration,
-                             total_minigames=total_minigames,
+                             winning_team=summary.get('winner'),
+                             teams_stats=summary.get('teams', []),
+                             game_duration=summary.get('game_duration', "Unbekannt"),
+                             total_minigames=summary.get('total_minigames', 0),
                              victory_data=victory_data,
-                             minigame_stats=minigame_stats)
+                             minigame_stats=summary.get('minigame_stats', {}))
     
     except Exception as e:
         current_app.logger.error(f"Fehler auf Goodbye-Seite: {e}", exc_info=True)
@@ -1167,87 +1078,26 @@ def goodbye():
                              victory_data=None,
                              minigame_stats={})
 
-def calculate_minigame_statistics(game_session_id):
-    """Berechnet detaillierte Minispiel-Statistiken für alle Teams basierend auf Team-Daten"""
-    if not game_session_id:
-        return {}
-    
-    try:
-        # Hole alle Teams
-        teams = Team.query.all()
-        current_app.logger.info(f"📊 Found {len(teams)} teams total")
-        
-        team_stats = {}
-        
-        for team in teams:
-            current_app.logger.info(f"📊 Team {team.name}: minigame_placement={team.minigame_placement}")
-            
-            team_stats[str(team.id)] = {
-                'wins': 1 if team.minigame_placement == 1 else 0,
-                'participations': 1 if team.minigame_placement is not None else 0,
-                'placements': [team.minigame_placement] if team.minigame_placement is not None else [],
-                'average_placement': float(team.minigame_placement) if team.minigame_placement is not None else 0.0
-            }
-        
-        current_app.logger.info(f"📊 Calculated team stats: {team_stats}")
-        return team_stats
-        
-    except Exception as e:
-        current_app.logger.error(f"Fehler beim Berechnen der Minispiel-Statistiken: {e}")
-        return {}
-    
-def calculate_position_history(game_session_id):
-    """Berechnet Positionsverlauf für alle Teams"""
-    if not game_session_id:
-        return {}
-    
-    try:
-        # 🔍 DEBUG: Check all dice events
-        all_dice_events = GameEvent.query.filter_by(
-            game_session_id=game_session_id
-        ).filter(
-            GameEvent.event_type.like('%dice%')
-        ).all()
-        current_app.logger.info(f"📊 All dice events found: {[(e.event_type, e.id) for e in all_dice_events]}")
-        
-        # Hole alle Bewegungs-Events
-        movement_events = GameEvent.query.filter_by(
-            game_session_id=game_session_id
-        ).filter(
-            GameEvent.event_type.in_(['dice_roll', 'admin_dice_roll', 'admin_dice_roll_legacy', 'team_dice_roll'])
-        ).order_by(GameEvent.timestamp.asc()).all()
-        current_app.logger.info(f"📊 Movement events found: {len(movement_events)}")
-        
-        position_history = {}
-        
-        for event in movement_events:
-            if event.related_team_id and event.data_json:
-                try:
-                    if isinstance(event.data_json, str):
-                        data = json.loads(event.data_json)
-                    else:
-                        data = event.data_json
-                    
-                    team_id_str = str(event.related_team_id)
-                    new_position = data.get('new_position', 0)
-                    
-                    if team_id_str not in position_history:
-                        position_history[team_id_str] = []
-                    
-                    position_history[team_id_str].append({
-                        'position': new_position,
-                        'timestamp': event.timestamp.isoformat(),
-                        'dice_result': data.get('total_roll', 0)
-                    })
-                
-                except (json.JSONDecodeError, KeyError) as e:
-                    current_app.logger.warning(f"Fehler beim Parsen von Positions-Daten: {e}")
-        
-        return position_history
-        
-    except Exception as e:
-        current_app.logger.error(f"Fehler beim Berechnen der Positionshistorie: {e}")
-        return {}
+@main_bp.route('/api/position-deltas')
+def position_deltas():
+    """
+    Positionsverlauf inkrementell: alle Züge seit ?since=<zugnummer> (Standard 0 = alles)
+
+    Ohne ?session_id wird die aktive bzw. zuletzt gestartete Spielsitzung verwendet.
+    Antwort: {"session_id", "last_turn", "teams": {team_id: [[zug, position, wurf], ...]}};
+    last_turn ist der since-Wert für den nächsten Abruf.
+    """
+    since_turn = request.args.get('since', 0, type=int)
+    game_session_id = request.args.get('session_id', type=int)
+    if game_session_id is None:
+        game_session = GameSession.query.filter_by(is_active=True).first() or \
+            GameSession.query.order_by(GameSession.id.desc()).first()
+        if not game_session:
+            return jsonify({"success": False, "error": "Keine Spielsitzung gefunden"}), 404
+        game_session_id = game_session.id
+
+    deltas = get_position_deltas(game_session_id, since_turn)
+    return jsonify({"success": True, "session_id": game_session_id, **deltas})
 
 # PROFILBILD-SYSTEM API ENDPUNKTE
 
@@ -1272,11 +1122,8 @@ def upload_profile_image():
     """Upload eines Profilbildes für einen Spieler"""
     current_app.logger.info("=== UPLOAD PROFILE IMAGE ROUTE REACHED ===")
     try:
-        import base64
-        import binascii
-        import os
+        # Pillow erst beim ersten Upload laden (teurer Import, fürs Board nicht nötig)
         from PIL import Image
-        import io
         
         # Debug: Log the request data
         current_app.logger.info(f"Upload request content-type: {request.content_type}")
@@ -1361,7 +1208,6 @@ def upload_profile_image():
             image = image.convert('RGB')
         
         # Erstelle Dateinamen
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         safe_player_name = "".join(c for c in player_name if c.isalnum() or c in ['_', '-'])
         filename = f"{welcome_session.id}_{safe_player_name}_{timestamp}.jpg"
@@ -1444,7 +1290,7 @@ def get_player_faces():
         
         # VERBESSERT: Fallback wenn keine Spieler explizit ausgewählt sind
         if not selected_players:
-            current_app.logger.info("Keine Spieler explizit ausgewählt - verwende alle verfügbaren Teams")
+            board_log.debug('player_faces_fallback_all_teams')
             
             # Hole alle Teams und deren Spieler als Fallback
             all_teams = Team.query.all()
@@ -1458,15 +1304,14 @@ def get_player_faces():
             # Baue selected_players Dictionary mit allen verfügbaren Spielern auf
             selected_players = {}
             for team in all_teams:
-                if team.members:
+                if team.member_rows:
                     # Hole alle Spieler die ausgewählt werden können
                     selectable_players = team.get_selectable_players()
                     if selectable_players:
                         selected_players[str(team.id)] = selectable_players
                     else:
                         # Fallback: alle Teammitglieder wenn keine speziell ausgewählt
-                        all_members = [m.strip() for m in team.members.split(',') if m.strip()]
-                        selected_players[str(team.id)] = all_members
+                        selected_players[str(team.id)] = team.get_member_names()
             
             if not selected_players:
                 return jsonify({
@@ -1475,7 +1320,7 @@ def get_player_faces():
                     "message": "Keine spielfähigen Teams gefunden"
                 })
             
-            current_app.logger.info(f"Fallback: {len(selected_players)} Teams mit Spielern gefunden")
+            board_log.debug('player_faces_fallback_teams', teams=len(selected_players))
         
         # Sammle Profilbilder der ausgewählten Spieler
         player_faces = []
@@ -1483,7 +1328,7 @@ def get_player_faces():
         for team_id_str, player_names in selected_players.items():
             team = Team.query.get(int(team_id_str))
             if not team:
-                current_app.logger.warning(f"Team mit ID {team_id_str} nicht gefunden")
+                board_log.warning('player_faces_team_missing', team_id=team_id_str)
                 continue
                 
             team_name = team.name
@@ -1491,7 +1336,7 @@ def get_player_faces():
             
             # Hole gespeicherte Player-Konfiguration (enthält gespeicherte Emojis)
             player_config = team.get_player_config()
-            current_app.logger.debug(f"Team {team_name}: player_config = {player_config}")
+            board_log.debug('player_faces_team_config', team=team_name, player_config=player_config)
             
             for player_name in player_names:
                 # Versuche zuerst vollständige Spieler-Info zu bekommen
@@ -1508,7 +1353,7 @@ def get_player_faces():
                         "has_photo": True,
                         "emoji": player_info.get('emoji')  # Emoji als Backup auch bei Foto
                     })
-                    current_app.logger.debug(f"Spieler {player_name}: Profilbild gefunden")
+                    board_log.debug('player_faces_photo', player=player_name)
                 else:
                     # Kein Profilbild - verwende Emoji
                     saved_emoji = None
@@ -1516,15 +1361,15 @@ def get_player_faces():
                     # Prüfe player_info für Emoji (modernere Methode)
                     if player_info and player_info.get('emoji'):
                         saved_emoji = player_info['emoji']
-                        current_app.logger.debug(f"Spieler {player_name}: Emoji aus player_info = {saved_emoji}")
+                        board_log.debug('player_faces_emoji', player=player_name, source='player_info', emoji=saved_emoji)
                     # Fallback: direkt aus player_config
                     elif player_config and player_name in player_config:
                         saved_emoji = player_config[player_name].get('emoji')
-                        current_app.logger.debug(f"Spieler {player_name}: Emoji aus player_config = {saved_emoji}")
+                        board_log.debug('player_faces_emoji', player=player_name, source='player_config', emoji=saved_emoji)
                     
                     # Letzter Fallback: deterministisches Emoji generieren
                     final_emoji = saved_emoji if saved_emoji else get_consistent_emoji_for_player(player_name)
-                    current_app.logger.debug(f"Spieler {player_name}: Final emoji = {final_emoji}")
+                    board_log.debug('player_faces_final_emoji', player=player_name, emoji=final_emoji)
                     
                     player_faces.append({
                         "player_name": player_name,
@@ -1538,11 +1383,10 @@ def get_player_faces():
         # Zeige Gesichter auch wenn nur Emojis vorhanden sind
         show_faces = len(player_faces) > 0
         
-        # Debug-Logging
-        current_app.logger.info(f"Player faces generiert: {len(player_faces)} Spieler, Phase: {active_session.current_phase}")
-        for face in player_faces:
-            img_type = "Foto" if face.get("has_photo") else f"Emoji({face.get('emoji', 'N/A')})"
-            current_app.logger.debug(f"  - {face.get('player_name')} ({face.get('team_name')}): {img_type}")
+        if board_log.is_enabled():
+            board_log.debug('player_faces_generated', phase=active_session.current_phase, players=[
+                (face.get('player_name'), face.get('team_name'), 'photo' if face.get('has_photo') else face.get('emoji'))
+                for face in player_faces])
         
         result = {
             "success": True,
@@ -1556,7 +1400,7 @@ def get_player_faces():
             }
         }
         
-        current_app.logger.info(f"API Response: show_faces={show_faces}, total_players={len(player_faces)}")
+        board_log.debug('player_faces_response', show_faces=show_faces, total_players=len(player_faces))
         return jsonify(result)
         
     except Exception as e:
@@ -1567,9 +1411,6 @@ def get_player_faces():
 def get_field_minigame_player_faces(active_session):
     """Holt Spieler-Gesichter für Feld-Minigames"""
     try:
-        import os
-        import json
-        import random
         
         # Hole das aktuelle Feld-Minigame
         if not active_session.field_minigame_content_id:
@@ -1632,8 +1473,8 @@ def get_field_minigame_player_faces(active_session):
         # Diese Information sollte aus der Team-Konfiguration kommen
         try:
             # Versuche Team-Mitglieder zu finden (falls in der Datenbank gespeichert)
-            if hasattr(landing_team, 'members') and landing_team.members:
-                team_member_names = landing_team.members.split(',') if isinstance(landing_team.members, str) else landing_team.members
+            if landing_team.member_rows:
+                team_member_names = landing_team.get_member_names()
                 for member_name in team_member_names:
                     member_name = member_name.strip()
                     if not any(p["name"] == member_name for p in all_landing_players):
@@ -1694,8 +1535,8 @@ def get_field_minigame_player_faces(active_session):
             
             # Zusätzliche Gegner-Spieler ohne Profilbilder
             try:
-                if hasattr(opponent_team, 'members') and opponent_team.members:
-                    team_member_names = opponent_team.members.split(',') if isinstance(opponent_team.members, str) else opponent_team.members
+                if opponent_team.member_rows:
+                    team_member_names = opponent_team.get_member_names()
                     for member_name in team_member_names:
                         member_name = member_name.strip()
                         if not any(p["name"] == member_name for p in all_opponent_players):
@@ -1760,8 +1601,8 @@ def get_field_minigame_player_faces(active_session):
                 
                 # Zusätzliche Spieler ohne Profilbilder
                 try:
-                    if hasattr(team, 'members') and team.members:
-                        team_member_names = team.members.split(',') if isinstance(team.members, str) else team.members
+                    if team.member_rows:
+                        team_member_names = team.get_member_names()
                         for member_name in team_member_names:
                             member_name = member_name.strip()
                             if not any(p["name"] == member_name for p in all_team_players):
@@ -1829,22 +1670,18 @@ def get_all_player_images():
         teams = Team.query.all()
         all_players = []
         
-        current_app.logger.info(f"API get-all-player-images: Lade {len(teams)} Teams")
+        board_log.debug('all_player_images_load', teams=len(teams))
         
         
         for team in teams:
             # Hole Team-Farbe
             team_color = team.character.color if team.character else '#CCCCCC'
             
-            # Hole alle Profilbilder des Teams
-            profile_images = team.get_profile_images()
-            
-            # Hole gespeicherte Player-Konfiguration (enthält gespeicherte Emojis)
-            player_config = team.get_player_config()
-            
-            # Spieler mit Profilbildern
-            for player_name, image_path in profile_images.items():
+            # Spieler mit Profilbildern (Mitglieder und registrierte Spieler)
+            players_with_photo = set()
+            for player_name, image_path in team.get_profile_images().items():
                 if image_path and image_path.strip():
+                    players_with_photo.add(player_name)
                     all_players.append({
                         "player_name": player_name,
                         "team_name": team.name,
@@ -1854,37 +1691,23 @@ def get_all_player_images():
                         "has_photo": True
                     })
             
-            # Spieler ohne Profilbilder (falls Team mehr Mitglieder hat)
-            try:
-                if hasattr(team, 'members') and team.members:
-                    team_member_names = team.members.split(',') if isinstance(team.members, str) else team.members
-                    for member_name in team_member_names:
-                        member_name = member_name.strip()
-                        # Prüfe ob bereits mit Profilbild hinzugefügt
-                        if not any(p["player_name"] == member_name for p in all_players):
-                            # Prüfe zuerst nach gespeichertem Emoji in player_config
-                            saved_emoji = None
-                            if player_config and member_name in player_config:
-                                saved_emoji = player_config[member_name].get('emoji')
-                            
-                            # Verwende gespeichertes Emoji oder falle zurück auf deterministisches
-                            emoji = saved_emoji if saved_emoji else get_consistent_emoji_for_player(member_name)
-                            
-                            all_players.append({  
-                                "player_name": member_name,
-                                "team_name": team.name,
-                                "team_id": team.id,
-                                "team_color": team_color,
-                                "emoji": emoji,
-                                "has_photo": False
-                            })
-            except:
-                pass
+            # Mitglieder ohne Profilbild: gespeichertes oder deterministisches Emoji
+            for member in team.member_rows:
+                if member.name in players_with_photo:
+                    continue
+                all_players.append({
+                    "player_name": member.name,
+                    "team_name": team.name,
+                    "team_id": team.id,
+                    "team_color": team_color,
+                    "emoji": member.emoji or get_consistent_emoji_for_player(member.name),
+                    "has_photo": False
+                })
         
-        current_app.logger.info(f"API get-all-player-images: Gebe {len(all_players)} Spieler zurück")
-        for player in all_players:
-            img_type = "Foto" if player.get("has_photo") else f"Emoji({player.get('emoji', 'N/A')})"
-            current_app.logger.debug(f"  - {player.get('player_name')} ({player.get('team_name')}): {img_type}")
+        if board_log.is_enabled():
+            board_log.debug('all_player_images_response', players=[
+                (player.get('player_name'), player.get('team_name'), 'photo' if player.get('has_photo') else player.get('emoji'))
+                for player in all_players])
         
         return jsonify({
             "success": True,
@@ -1970,7 +1793,6 @@ def remove_player():
         deleted_image = False
         if registration.profile_image_path:
             try:
-                import os
                 image_path = os.path.join(current_app.static_folder, registration.profile_image_path)
                 if os.path.exists(image_path):
                     os.remove(image_path)
@@ -2023,21 +1845,21 @@ def advance_field_minigame_phase():
                 if current_team_index < len(dice_order_ids) - 1:
                     # Es gibt noch weitere Teams - bleibe in DICE_ROLLING
                     active_session.current_phase = 'DICE_ROLLING'
-                    current_app.logger.info(f"Field Minigame beendet - zurück zu DICE_ROLLING für Team {active_session.current_team_turn_id} (Index {current_team_index} von {len(dice_order_ids)})")
+                    fields_log.info('field_minigame_finished', next_phase='DICE_ROLLING', team_id=active_session.current_team_turn_id, turn_index=current_team_index, teams=len(dice_order_ids))
                 else:
                     # Das war das letzte Team - Runde beendet
                     active_session.current_phase = 'ROUND_OVER'
                     active_session.current_team_turn_id = None
-                    current_app.logger.info("Field Minigame beendet - war letztes Team, Runde abgeschlossen (ROUND_OVER)")
+                    fields_log.info('field_minigame_finished', next_phase='ROUND_OVER', reason='last_team')
             except (ValueError, IndexError) as e:
-                current_app.logger.error(f"Fehler beim Verarbeiten der Würfelreihenfolge: {e}")
+                fields_log.error('dice_order_invalid', error=str(e))
                 # Fallback: Runde beenden
                 active_session.current_phase = 'ROUND_OVER'
                 active_session.current_team_turn_id = None
         else:
             # Keine Teams mehr oder Runde schon beendet
             active_session.current_phase = 'ROUND_OVER'
-            current_app.logger.info("Field Minigame beendet - keine Würfelreihenfolge oder Team, Runde abgeschlossen (ROUND_OVER)")
+            fields_log.info('field_minigame_finished', next_phase='ROUND_OVER', reason='no_dice_order')
         
         # Field-Minigame Daten löschen
         active_session.field_minigame_landing_team_id = None
@@ -2056,7 +1878,7 @@ def advance_field_minigame_phase():
         })
         
     except Exception as e:
-        current_app.logger.error(f"Fehler beim Weiterschalten der Field Minigame Phase: {e}")
+        fields_log.exception('field_minigame_advance_failed', error=str(e))
         db.session.rollback()
         return jsonify({'success': False, 'message': 'Internal server error'}), 500
 
@@ -2087,8 +1909,6 @@ def field_minigame_status():
             minigame_materials = ""
             if active_session.field_minigame_content_id:
                 try:
-                    import os
-                    import json
                     
                     # Feld-Minispiele sind im field_minigames Ordner gespeichert
                     # Versuche zuerst den gespeicherten Mode, dann beide Ordner
@@ -2114,7 +1934,7 @@ def field_minigame_status():
                         minigame_instructions = minigame_data.get('instructions', '')
                         minigame_materials = minigame_data.get('materials', '')
                 except Exception as e:
-                    current_app.logger.warning(f"Fehler beim Laden der Feld-Minispiel-Daten: {e}")
+                    fields_log.warning('field_minigame_data_load_failed', error=str(e))
                     minigame_name = "Unbekanntes Minispiel"
             
             # Hole ausgeloste Spieler mit Profilbildern
@@ -2122,10 +1942,35 @@ def field_minigame_status():
             selected_players_with_images = {}
             if active_session.field_minigame_selected_players:
                 try:
-                    selected_players = json.loads(active_session.field_minigame_selected_players)
+                    from app.game_logic.team_index import get_team_index
+                    
+                    # Gespeichert nach Team-ID (alte Einträge nach Team-Namen); das Banner zeigt Team-Namen
+                    team_index = get_team_index()
+                    stored_players = active_session.parsed_field_minigame_selected_players
+                    stored_ids = [int(team_key) for team_key in stored_players if team_key.isdigit()]
+                    stored_names = [team_key for team_key in stored_players if not team_key.isdigit()]
+                    teams_by_id = {team.id: team for team in Team.query.filter(
+                        db.or_(Team.id.in_(stored_ids), Team.name.in_(stored_names)))}
+                    # Namen aus den geladenen Zeilen auflösen - der Index kennt neue Teams evtl. noch nicht
+                    ids_by_name = {team.name: team.id for team in teams_by_id.values()}
+                    selected_players = {}
+                    team_ids = {}
+                    for team_key, players in stored_players.items():
+                        if team_key.isdigit():
+                            team = teams_by_id.get(int(team_key))
+                            team_name = team.name if team else team_index.name_for(team_key)
+                            team_id = int(team_key)
+                        else:
+                            team_name = team_key
+                            team_id = ids_by_name.get(team_key, team_index.id_for(team_key))
+                        if team_name is None:
+                            continue
+                        selected_players[team_name] = players
+                        team_ids[team_name] = team_id
+                    
                     # Erweitere um Profilbilder
                     for team_name, players in selected_players.items():
-                        team = Team.query.filter_by(name=team_name).first()
+                        team = teams_by_id.get(team_ids[team_name])
                         if team:
                             players_with_images = []
                             for player_data in players:
@@ -2156,7 +2001,7 @@ def field_minigame_status():
                                     })
                             selected_players_with_images[team_name] = players_with_images
                 except Exception as e:
-                    current_app.logger.warning(f"Fehler beim Laden der Spielerbilder: {e}")
+                    fields_log.warning('field_minigame_player_images_failed', error=str(e))
                     selected_players = {}
             
             return jsonify({
@@ -2187,8 +2032,6 @@ def field_minigame_status():
             reward_forward = 0
             if result == 'won':
                 # Lade Konfiguration für Belohnung
-                import os
-                import json
                 config_path = os.path.join(current_app.static_folder, 'field_minigames', 'config.json')
                 if os.path.exists(config_path):
                     with open(config_path, 'r', encoding='utf-8') as f:
@@ -2213,5 +2056,5 @@ def field_minigame_status():
         return jsonify({"show_banner": False})
         
     except Exception as e:
-        current_app.logger.error(f"Fehler beim Abrufen des Field Minigame Status: {e}")
+        fields_log.exception('field_minigame_status_failed', error=str(e))
         return jsonify({"show_banner": False})
\ No newline at end of file
@@ -2,9 +2,12 @@ from flask_sqlalchemy import SQLAlchemy
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
 from datetime import datetime
+from sqlalchemy import event
+from types import MappingProxyType
 import json
 
 from . import db
+from .json_fields import JSONText, json_copy, json_loads, json_dumps, mark_json_changed
 
 class Admin(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -32,17 +35,151 @@ class Admin(UserMixin, db.Model):
     def __repr__(self):
         return f'<Admin {self.username}>'
 
+# Standardwerte der Charakter-Anpassung (einmal angelegt, von allen Teams geteilt)
+CHARACTER_CUSTOMIZATION_DEFAULTS = MappingProxyType({
+    # Basic colors
+    'shirtColor': '#4169E1',   # Royal Blue
+    'pantsColor': '#8B4513',   # Saddle Brown
+    'hairColor': '#2C1810',    # Dark Brown
+    'shoeColor': '#8B4513',    # Saddle Brown
+    'skinColor': '#FFDE97',    # Skin color
+    'eyeColor': '#4169E1',     # Eye color
+    
+    # Body features
+    'bodyType': 'normal',      # slim, normal, athletic, chunky
+    'height': 'normal',        # short, normal, tall
+    
+    # Face features
+    'faceShape': 'oval',       # oval, round, square, heart
+    'eyeShape': 'normal',      # normal, big, small, sleepy
+    'eyebrowStyle': 'normal',  # normal, thick, thin, bushy
+    'noseShape': 'normal',     # normal, small, big, pointed
+    'mouthShape': 'normal',    # normal, small, big, wide
+    'beardStyle': 'none',      # none, mustache, goatee, full
+    
+    # Hair
+    'hairStyle': 'short',      # short, medium, long, bald, curly
+    'hairLength': 'short',     # short, medium, long
+    
+    # Clothing
+    'shirtType': 'tshirt',     # tshirt, polo, hoodie, formal
+    'pantsType': 'jeans',      # jeans, shorts, formal, athletic
+    'shoeType': 'sneakers',    # sneakers, boots, formal, sandals
+    
+    # Accessories
+    'hat': 'none',             # none, cap, beanie, formal
+    'glasses': 'none',         # none, normal, sunglasses, reading
+    'jewelry': 'none',         # none, watch, chain, rings
+    'backpack': 'none',        # none, school, hiking, stylish
+    
+    # Animation style
+    'animationStyle': 'normal', # normal, energetic, calm, quirky
+    'walkStyle': 'normal',      # normal, bouncy, confident, sneaky
+    'idleStyle': 'normal',      # normal, fidgety, relaxed, proud
+    
+    # Voice/Sound
+    'voiceType': 'normal',      # normal, deep, high, robotic
+    'voicePitch': 1.0,          # 0.5-2.0
+    
+    # Special effects
+    'aura': 'none',             # none, sparkles, fire, electric
+    'trail': 'none',            # none, stars, bubbles, flames
+    
+    # Pose/Expression
+    'defaultPose': 'normal',    # normal, confident, shy, heroic
+    'defaultExpression': 'happy' # happy, serious, playful, determined
+})
+
+# Formatversion von Team.character_render_data; ältere Einträge werden neu abgeleitet
+CHARACTER_RENDER_DATA_VERSION = 1
+
+
+def parse_character_customization(raw):
+    """Mischt gespeichertes Anpassungs-JSON mit den Standardwerten"""
+    merged = dict(CHARACTER_CUSTOMIZATION_DEFAULTS)
+    if not raw:
+        return merged
+    try:
+        merged.update(json_loads(raw))
+    except (TypeError, ValueError):
+        pass
+    return merged
+
+
+def derive_character_render_data(customization):
+    """Leitet Teile, Animationen und Stimme aus den (gemischten) Anpassungen ab"""
+    parts = {
+        'head': f"head_{customization.get('faceShape', 'oval')}.obj",
+        'body': f"body_{customization.get('bodyType', 'normal')}.obj",
+        'hair': f"hair_{customization.get('hairStyle', 'short')}.obj",
+        'shirt': f"shirt_{customization.get('shirtType', 'tshirt')}.obj",
+        'pants': f"pants_{customization.get('pantsType', 'jeans')}.obj",
+        'shoes': f"shoes_{customization.get('shoeType', 'sneakers')}.obj",
+        'eyes': f"eyes_{customization.get('eyeShape', 'normal')}.obj",
+        'eyebrows': f"eyebrows_{customization.get('eyebrowStyle', 'normal')}.obj",
+        'nose': f"nose_{customization.get('noseShape', 'normal')}.obj",
+        'mouth': f"mouth_{customization.get('mouthShape', 'normal')}.obj"
+    }
+
+    # Add accessories if selected
+    if customization.get('hat', 'none') != 'none':
+        parts['hat'] = f"hat_{customization['hat']}.obj"
+    if customization.get('glasses', 'none') != 'none':
+        parts['glasses'] = f"glasses_{customization['glasses']}.obj"
+    if customization.get('jewelry', 'none') != 'none':
+        parts['jewelry'] = f"jewelry_{customization['jewelry']}.obj"
+    if customization.get('backpack', 'none') != 'none':
+        parts['backpack'] = f"backpack_{customization['backpack']}.obj"
+    if customization.get('beardStyle', 'none') != 'none':
+        parts['beard'] = f"beard_{customization['beardStyle']}.obj"
+
+    animation_style = customization.get('animationStyle', 'normal')
+    animations = {
+        'idle': f"idle_{customization.get('idleStyle', 'normal')}.anim",
+        'walk': f"walk_{customization.get('walkStyle', 'normal')}.anim",
+        'run': f"run_{animation_style}.anim",
+        'jump': f"jump_{animation_style}.anim",
+        'celebrate': f"celebrate_{animation_style}.anim",
+        'disappointed': f"disappointed_{animation_style}.anim",
+        'thinking': f"thinking_{animation_style}.anim",
+        'wave': f"wave_{animation_style}.anim"
+    }
+
+    return {
+        'v': CHARACTER_RENDER_DATA_VERSION,
+        'parts': parts,
+        'animations': animations,
+        'voice': {
+            'type': customization.get('voiceType', 'normal'),
+            'pitch': customization.get('voicePitch', 1.0)
+        }
+    }
+
+
+def build_character_render_data(raw_customization):
+    """Serialisierte Form für Team.character_render_data (None ohne Anpassungen)"""
+    if raw_customization is None:
+        return None
+    render_data = derive_character_render_data(parse_character_customization(raw_customization))
+    return json_dumps(render_data)
+
+
 class Team(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), unique=True, nullable=False)
     password_hash = db.Column(db.String(256), nullable=True)
     # Neues Feld für Welcome-System (nur 6-stellige Passwörter, temporär gespeichert)
     welcome_password = db.Column(db.String(10), nullable=True)
-    members = db.Column(db.String(255), nullable=True)
-    # Erweiterte Spieler-Konfiguration (JSON mit Spieler-Details)
+    # Alt: komma-separierte Spielerliste, jetzt Tabelle team_member (siehe Team.members)
+    members_legacy = db.Column('members', db.String(255), nullable=True)
+    member_rows = db.relationship('TeamMember', back_populates='team', lazy='selectin',
+                                  order_by='TeamMember.position', cascade='all, delete-orphan')
+    # Spieler-Einstellungen/Profilbilder von Nicht-Mitgliedern (z.B. registrierte Spieler);
+    # die Werte der Mitglieder stehen in team_member
     player_config = db.Column(db.Text, nullable=True)  # JSON mit Spieler-Einstellungen
-    # Profilbilder für Team-Mitglieder (JSON: {"player_name": "path/to/image.jpg", ...})
+    parsed_player_config = JSONText('player_config', default=dict)
     profile_images = db.Column(db.Text, nullable=True)  # JSON mit Profilbild-Pfaden
+    parsed_profile_images = JSONText('profile_images', default=dict)
 
     character_name = db.Column(db.String(100), nullable=True)
     character_id = db.Column(db.Integer, db.ForeignKey('character.id'), nullable=True)
@@ -50,6 +187,9 @@ class Team(UserMixin, db.Model):
     
     # Charakter-Anpassungen (JSON: {"shirtColor": "#FF0000", "pantsColor": "#00FF00", ...})
     character_customization = db.Column(db.Text, nullable=True)  # JSON mit Charakter-Anpassungen
+    parsed_character_customization = JSONText('character_customization', default=dict)
+    # Vorberechnete Teile/Animationen/Stimme (JSON), wird beim Setzen der Anpassungen mitgeschrieben
+    character_render_data = db.Column(db.Text, nullable=True)
 
     current_position = db.Column(db.Integer, default=0)
     minigame_placement = db.Column(db.Integer, nullable=True)
@@ -114,242 +254,316 @@ class Team(UserMixin, db.Model):
         self.extra_moves_remaining = 0
         self.has_shield = False
 
+    @property
+    def members(self):
+        """Komma-separierte Spielerliste (abgeleitet aus team_member, für Formulare und Backups)"""
+        names = self.get_member_names()
+        return ', '.join(names) if names else None
+
+    @members.setter
+    def members(self, value):
+        self.set_member_names(split_member_names(value))
+
+    def get_member_names(self):
+        """Gibt die Spielernamen in Team-Reihenfolge zurück"""
+        return [member.name for member in self.member_rows]
+
+    def get_member(self, player_name):
+        """Gibt den TeamMember-Eintrag eines Spielers zurück (None wenn kein Mitglied)"""
+        for member in self.member_rows:
+            if member.name == player_name:
+                return member
+        return None
+
+    def add_member(self, player_name, can_be_selected=True):
+        """Fügt einen Spieler hinzu (eine neue Zeile); gibt None zurück wenn er schon Mitglied ist"""
+        if not player_name or self.get_member(player_name) is not None:
+            return None
+        position = max((member.position for member in self.member_rows), default=-1) + 1
+        member = TeamMember(name=player_name, position=position, can_be_selected=can_be_selected)
+        # Bisher beim Team gespeicherte Einstellungen des Spielers übernehmen
+        config = self.parsed_player_config
+        if isinstance(config, dict) and player_name in config:
+            settings = config.pop(player_name) or {}
+            member.can_be_selected = settings.get('can_be_selected', can_be_selected)
+            member.emoji = settings.get('emoji')
+        images = self.parsed_profile_images
+        if isinstance(images, dict) and player_name in images:
+            member.profile_image = images.pop(player_name)
+        self.member_rows.append(member)
+        return member
+
+    def remove_member(self, player_name):
+        """Entfernt einen Spieler samt seiner Einstellungen (löscht eine Zeile)"""
+        member = self.get_member(player_name)
+        if member is None:
+            return False
+        self.member_rows.remove(member)
+        return True
+
+    def rename_member(self, old_name, new_name):
+        """Benennt einen Spieler um (aktualisiert eine Zeile)"""
+        member = self.get_member(old_name)
+        if member is None or self.get_member(new_name) is not None:
+            return False
+        member.name = new_name
+        return True
+
+    def set_member_names(self, names):
+        """Setzt die komplette Spielerliste; unveränderte Spieler behalten ihre Zeile"""
+        names = list(dict.fromkeys(names))
+        keep = set(names)
+        for member in [m for m in self.member_rows if m.name not in keep]:
+            self.member_rows.remove(member)
+        for position, name in enumerate(names):
+            member = self.get_member(name) or self.add_member(name)
+            if member.position != position:
+                member.position = position
+
     def get_player_config(self):
         """Gibt die Spieler-Konfiguration als Dictionary zurück"""
-        if not self.player_config:
-            return {}
-        try:
-            return json.loads(self.player_config)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        config = json_copy(self.parsed_player_config)
+        if not isinstance(config, dict):
+            config = {}
+        for member in self.member_rows:
+            settings = {'can_be_selected': member.can_be_selected}
+            if member.emoji:
+                settings['emoji'] = member.emoji
+            config[member.name] = settings
+        return config
 
     def set_player_config(self, config_dict):
         """Setzt die Spieler-Konfiguration aus Dictionary"""
-        if config_dict is None:
-            self.player_config = None
-        else:
-            self.player_config = json.dumps(config_dict)
+        extras = None if config_dict is None else dict(config_dict)
+        for member in self.member_rows:
+            settings = (extras.pop(member.name, None) if extras is not None else None) or {}
+            member.can_be_selected = settings.get('can_be_selected', True)
+            member.emoji = settings.get('emoji')
+        self.parsed_player_config = extras or None
     
     def get_character_customization(self):
-        """Gibt die erweiterte Charakter-Anpassungen als Dictionary zurück"""
-        defaults = {
-            # Basic colors
-            'shirtColor': '#4169E1',   # Royal Blue
-            'pantsColor': '#8B4513',   # Saddle Brown
-            'hairColor': '#2C1810',    # Dark Brown
-            'shoeColor': '#8B4513',    # Saddle Brown
-            'skinColor': '#FFDE97',    # Skin color
-            'eyeColor': '#4169E1',     # Eye color
-            
-            # Body features
-            'bodyType': 'normal',      # slim, normal, athletic, chunky
-            'height': 'normal',        # short, normal, tall
-            
-            # Face features
-            'faceShape': 'oval',       # oval, round, square, heart
-            'eyeShape': 'normal',      # normal, big, small, sleepy
-            'eyebrowStyle': 'normal',  # normal, thick, thin, bushy
-            'noseShape': 'normal',     # normal, small, big, pointed
-            'mouthShape': 'normal',    # normal, small, big, wide
-            'beardStyle': 'none',      # none, mustache, goatee, full
-            
-            # Hair
-            'hairStyle': 'short',      # short, medium, long, bald, curly
-            'hairLength': 'short',     # short, medium, long
-            
-            # Clothing
-            'shirtType': 'tshirt',     # tshirt, polo, hoodie, formal
-            'pantsType': 'jeans',      # jeans, shorts, formal, athletic
-            'shoeType': 'sneakers',    # sneakers, boots, formal, sandals
-            
-            # Accessories
-            'hat': 'none',             # none, cap, beanie, formal
-            'glasses': 'none',         # none, normal, sunglasses, reading
-            'jewelry': 'none',         # none, watch, chain, rings
-            'backpack': 'none',        # none, school, hiking, stylish
-            
-            # Animation style
-            'animationStyle': 'normal', # normal, energetic, calm, quirky
-            'walkStyle': 'normal',      # normal, bouncy, confident, sneaky
-            'idleStyle': 'normal',      # normal, fidgety, relaxed, proud
-            
-            # Voice/Sound
-            'voiceType': 'normal',      # normal, deep, high, robotic
-            'voicePitch': 1.0,          # 0.5-2.0
-            
-            # Special effects
-            'aura': 'none',             # none, sparkles, fire, electric
-            'trail': 'none',            # none, stars, bubbles, flames
-            
-            # Pose/Expression
-            'defaultPose': 'normal',    # normal, confident, shy, heroic
-            'defaultExpression': 'happy' # happy, serious, playful, determined
-        }
-        
-        if not self.character_customization:
-            return defaults
-        
-        try:
-            base_customization = json.loads(self.character_customization)
-            # Merge with defaults to ensure all fields are present
-            defaults.update(base_customization)
-            return defaults
-        except (json.JSONDecodeError, TypeError):
-            return defaults
-    
+        """Gibt die erweiterte Charakter-Anpassungen als Dictionary zurück
+
+        Das Ergebnis wird pro Instanz zwischengespeichert und über den Rohwert der Spalte
+        geprüft, direkte Zuweisungen oder ein Refresh verwerfen den Cache also automatisch.
+        Zurückgegeben wird eine Kopie, damit Aufrufer den Cache nicht verändern.
+        """
+        return dict(self._merged_character_customization())
+
+    def _merged_character_customization(self):
+        raw = self.character_customization
+        cached = self.__dict__.get('_customization_cache')
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        merged = dict(CHARACTER_CUSTOMIZATION_DEFAULTS)
+        stored = self.parsed_character_customization
+        if isinstance(stored, dict):
+            merged.update(stored)
+        self.__dict__['_customization_cache'] = (raw, merged)
+        return merged
+
     def set_character_customization(self, customization_dict):
         """Setzt die erweiterte Charakter-Anpassungen aus Dictionary"""
-        if customization_dict is None:
-            self.character_customization = None
-        else:
-            self.character_customization = json.dumps(customization_dict)
-    
+        self.parsed_character_customization = customization_dict
+        # character_render_data wird vom Attribut-Event mitgeschrieben
+        self.__dict__.pop('_customization_cache', None)
+        self.__dict__.pop('_render_data_cache', None)
+
+    def _character_render_data(self):
+        """Kompakte Darstellung (Teile, Animationen, Stimme) aus der Spalte bzw. abgeleitet für Altbestände"""
+        raw = self.character_render_data
+        cached = self.__dict__.get('_render_data_cache')
+        if cached is not None and cached[0] == (raw, self.character_customization):
+            return cached[1]
+        render_data = None
+        if raw:
+            try:
+                render_data = json_loads(raw)
+            except (TypeError, ValueError):
+                render_data = None
+        if not isinstance(render_data, dict) or render_data.get('v') != CHARACTER_RENDER_DATA_VERSION:
+            render_data = derive_character_render_data(self._merged_character_customization())
+        self.__dict__['_render_data_cache'] = ((raw, self.character_customization), render_data)
+        return render_data
+
     def get_character_parts(self):
         """Gibt die aktuellen Charakter-Teile basierend auf Anpassungen zurück"""
-        customization = self.get_character_customization()
-        
-        # Build parts configuration based on customization
-        parts = {
-            'head': f"head_{customization.get('faceShape', 'oval')}.obj",
-            'body': f"body_{customization.get('bodyType', 'normal')}.obj",
-            'hair': f"hair_{customization.get('hairStyle', 'short')}.obj",
-            'shirt': f"shirt_{customization.get('shirtType', 'tshirt')}.obj",
-            'pants': f"pants_{customization.get('pantsType', 'jeans')}.obj",
-            'shoes': f"shoes_{customization.get('shoeType', 'sneakers')}.obj",
-            'eyes': f"eyes_{customization.get('eyeShape', 'normal')}.obj",
-            'eyebrows': f"eyebrows_{customization.get('eyebrowStyle', 'normal')}.obj",
-            'nose': f"nose_{customization.get('noseShape', 'normal')}.obj",
-            'mouth': f"mouth_{customization.get('mouthShape', 'normal')}.obj"
-        }
-        
-        # Add accessories if selected
-        if customization.get('hat', 'none') != 'none':
-            parts['hat'] = f"hat_{customization['hat']}.obj"
-        if customization.get('glasses', 'none') != 'none':
-            parts['glasses'] = f"glasses_{customization['glasses']}.obj"
-        if customization.get('jewelry', 'none') != 'none':
-            parts['jewelry'] = f"jewelry_{customization['jewelry']}.obj"
-        if customization.get('backpack', 'none') != 'none':
-            parts['backpack'] = f"backpack_{customization['backpack']}.obj"
-        if customization.get('beardStyle', 'none') != 'none':
-            parts['beard'] = f"beard_{customization['beardStyle']}.obj"
-        
-        return parts
-    
+        return dict(self._character_render_data()['parts'])
+
     def get_character_animations(self):
         """Gibt die Charakter-Animationen basierend auf Anpassungen zurück"""
-        customization = self.get_character_customization()
-        
-        animations = {
-            'idle': f"idle_{customization.get('idleStyle', 'normal')}.anim",
-            'walk': f"walk_{customization.get('walkStyle', 'normal')}.anim",
-            'run': f"run_{customization.get('animationStyle', 'normal')}.anim",
-            'jump': f"jump_{customization.get('animationStyle', 'normal')}.anim",
-            'celebrate': f"celebrate_{customization.get('animationStyle', 'normal')}.anim",
-            'disappointed': f"disappointed_{customization.get('animationStyle', 'normal')}.anim",
-            'thinking': f"thinking_{customization.get('animationStyle', 'normal')}.anim",
-            'wave': f"wave_{customization.get('animationStyle', 'normal')}.anim"
-        }
-        
-        return animations
-    
+        return dict(self._character_render_data()['animations'])
+
     def get_character_voice_config(self):
         """Gibt die Stimm-Konfiguration basierend auf Anpassungen zurück"""
-        customization = self.get_character_customization()
-        
+        voice = self._character_render_data()['voice']
         return {
-            'type': customization.get('voiceType', 'normal'),
-            'pitch': customization.get('voicePitch', 1.0),
+            'type': voice['type'],
+            'pitch': voice['pitch'],
             'volume': 1.0,
             'effects': []
         }
 
     def get_selectable_players(self):
         """Gibt eine Liste der Spieler zurück, die für Auslosung verfügbar sind"""
-        if not self.members:
-            return []
-        
-        all_players = [m.strip() for m in self.members.split(',') if m.strip()]
-        player_config = self.get_player_config()
-        
-        # Filtere Spieler, die nicht ausgelost werden sollen
-        selectable = []
-        for player in all_players:
-            player_settings = player_config.get(player, {})
-            if player_settings.get('can_be_selected', True):  # Default: kann ausgelost werden
-                selectable.append(player)
-        
-        return selectable
+        return [member.name for member in self.member_rows if member.can_be_selected]
 
     def update_player_selection_status(self, player_name, can_be_selected=True):
         """Aktualisiert den Auslosungs-Status eines Spielers"""
-        config = self.get_player_config()
-        if player_name not in config:
-            config[player_name] = {}
-        config[player_name]['can_be_selected'] = can_be_selected
-        self.set_player_config(config)
+        member = self.get_member(player_name)
+        if member is not None:
+            member.can_be_selected = can_be_selected
+            return
+        config = self.parsed_player_config
+        config.setdefault(player_name, {})['can_be_selected'] = can_be_selected
+        mark_json_changed(self, 'parsed_player_config')
 
     def get_profile_images(self):
         """Gibt Profilbilder als Dictionary zurück"""
-        if not self.profile_images:
-            return {}
-        try:
-            return json.loads(self.profile_images)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        images = json_copy(self.parsed_profile_images)
+        if not isinstance(images, dict):
+            images = {}
+        for member in self.member_rows:
+            if member.profile_image:
+                images[member.name] = member.profile_image
+        return images
+
+    def set_profile_images(self, images_dict):
+        """Setzt alle Profilbilder aus Dictionary (Mitglieder in team_member, übrige beim Team)"""
+        extras = dict(images_dict or {})
+        for member in self.member_rows:
+            member.profile_image = extras.pop(member.name, None)
+        self.parsed_profile_images = extras or None
 
     def set_profile_image(self, player_name, image_path):
         """Setzt Profilbild für einen Spieler"""
-        images = self.get_profile_images()
-        images[player_name] = image_path
-        self.profile_images = json.dumps(images)
+        member = self.get_member(player_name)
+        if member is not None:
+            member.profile_image = image_path
+        else:
+            self.parsed_profile_images[player_name] = image_path
 
     def get_profile_image(self, player_name):
         """Gibt Profilbild-Pfad für einen Spieler zurück"""
-        images = self.get_profile_images()
-        return images.get(player_name)
+        member = self.get_member(player_name)
+        if member is not None:
+            return member.profile_image
+        return self.parsed_profile_images.get(player_name)
 
     def remove_profile_image(self, player_name):
         """Entfernt Profilbild eines Spielers"""
-        images = self.get_profile_images()
+        member = self.get_member(player_name)
+        if member is not None:
+            member.profile_image = None
+            return
+        images = self.parsed_profile_images
         if player_name in images:
             del images[player_name]
-            self.profile_images = json.dumps(images)
 
     def get_player_by_name(self, player_name):
         """Gibt vollständige Spielerinformationen für einen Spieler zurück"""
-        if not player_name:
-            return None
-            
-        # Hole Spieler-Konfiguration und Profilbilder
-        player_config = self.get_player_config()
-        profile_images = self.get_profile_images()
-        
-        # Prüfe ob Spieler existiert
-        if not self.members:
+        member = self.get_member(player_name) if player_name else None
+        if member is None:
             return None
-            
-        all_players = [m.strip() for m in self.members.split(',') if m.strip()]
-        if player_name not in all_players:
-            return None
-            
-        # Baue Spieler-Info zusammen
-        player_info = {
-            'name': player_name,
-            'has_photo': player_name in profile_images,
-            'profile_image': profile_images.get(player_name),
-            'emoji': None
-        }
-        
-        # Hole Emoji aus player_config falls vorhanden
-        if player_name in player_config:
-            player_info['emoji'] = player_config[player_name].get('emoji')
-        
-        return player_info
+        return member.to_player_info()
 
     def __repr__(self):
         return f'<Team {self.name}>'
 
+
+def split_member_names(raw_members):
+    """Zerlegt eine Komma- oder Zeilen-getrennte Spielerliste (Duplikate entfernt)"""
+    if not raw_members:
+        return []
+    if not isinstance(raw_members, str):
+        raw_members = ','.join(raw_members)
+    names = (m.strip() for m in raw_members.replace('\n', ',').split(','))
+    return list(dict.fromkeys(name for name in names if name))
+
+
+class TeamMember(db.Model):
+    """Ein Spieler eines Teams mit seinen Einstellungen"""
+    __tablename__ = 'team_member'
+    id = db.Column(db.Integer, primary_key=True)
+    team_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=False, index=True)
+    name = db.Column(db.String(100), nullable=False)
+    position = db.Column(db.Integer, default=0, nullable=False)  # Reihenfolge im Team
+    can_be_selected = db.Column(db.Boolean, default=True, nullable=False)
+    emoji = db.Column(db.String(16), nullable=True)
+    profile_image = db.Column(db.String(255), nullable=True)
+    times_selected = db.Column(db.Integer, default=0, nullable=False)  # Auslosungen über alle Sitzungen
+
+    team = db.relationship('Team', back_populates='member_rows')
+
+    __table_args__ = (db.UniqueConstraint('team_id', 'name', name='unique_team_member'),)
+
+    def to_player_info(self):
+        return {
+            'name': self.name,
+            'has_photo': self.profile_image is not None,
+            'profile_image': self.profile_image,
+            'emoji': self.emoji
+        }
+
+    @staticmethod
+    def rows_from_legacy(team_id, members, player_config=None, profile_images=None):
+        """
+        Baut team_member-Zeilen aus dem alten Format (Migration und Backup-Wiederherstellung)
+
+        Args:
+            team_id: ID des Teams
+            members: komma-separierte Spielerliste
+            player_config: {spieler: {'can_be_selected': ..., 'emoji': ...}}
+            profile_images: {spieler: pfad}
+
+        Returns:
+            tuple: (Zeilen als Dictionaries, übrige player_config, übrige profile_images)
+        """
+        player_config = dict(player_config) if isinstance(player_config, dict) else {}
+        profile_images = dict(profile_images) if isinstance(profile_images, dict) else {}
+        rows = []
+        for position, name in enumerate(split_member_names(members)):
+            settings = player_config.pop(name, None) or {}
+            rows.append({
+                'team_id': team_id,
+                'name': name,
+                'position': position,
+                'can_be_selected': bool(settings.get('can_be_selected', True)),
+                'emoji': settings.get('emoji'),
+                'profile_image': profile_images.pop(name, None),
+                'times_selected': 0
+            })
+        return rows, player_config, profile_images
+
+    @staticmethod
+    def increment_times_selected(increments):
+        """
+        Erhöht times_selected mehrerer Spieler mit einem Statement
+
+        Args:
+            increments: {(team_id, player_name): Anzahl}
+        """
+        rows = [{'b_team_id': int(team_id), 'b_name': player_name, 'b_count': count}
+                for (team_id, player_name), count in increments.items() if count]
+        if not rows:
+            return 0
+        table = TeamMember.__table__
+        stmt = (table.update()
+                .where(table.c.team_id == db.bindparam('b_team_id'), table.c.name == db.bindparam('b_name'))
+                .values(times_selected=table.c.times_selected + db.bindparam('b_count')))
+        db.session.execute(stmt, rows)
+        return len(rows)
+
+    def __repr__(self):
+        return f'<TeamMember {self.name} Team {self.team_id}>'
+
+
+@event.listens_for(Team.character_customization, 'set')
+def _sync_character_render_data(target, value, oldvalue, initiator):
+    """Hält character_render_data bei jeder Zuweisung der Anpassungen aktuell"""
+    if value is not oldvalue:
+        target.character_render_data = build_character_render_data(value)
+
 class FieldConfiguration(db.Model):
     """Konfiguration für Spielfeld-Typen und deren Häufigkeiten"""
     id = db.Column(db.Integer, primary_key=True)
@@ -373,6 +587,7 @@ class FieldConfiguration(db.Model):
     
     # Zusätzliche Konfiguration (JSON)
     config_data = db.Column(db.Text, nullable=True)  # JSON für feldspezifische Einstellungen
+    parsed_config_data = JSONText('config_data', default=dict)
     
     # Metadaten
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -380,31 +595,28 @@ class FieldConfiguration(db.Model):
 
     @property
     def config_dict(self):
-        """Gibt config_data als Dictionary zurück"""
-        if self.config_data:
-            try:
-                return json.loads(self.config_data)
-            except (json.JSONDecodeError, TypeError):
-                return {}
-        return {}
+        """Gibt config_data als Dictionary zurück (geparst wird nur bei geändertem config_data)"""
+        return json_copy(self.parsed_config_data)
 
     @config_dict.setter
     def config_dict(self, value):
         """Setzt config_data aus Dictionary"""
-        if value is None:
-            self.config_data = None
-        else:
-            self.config_data = json.dumps(value)
+        self.parsed_config_data = value
 
     @staticmethod
     def get_config_for_field(field_type):
-        """Gibt die Konfiguration für einen bestimmten Feldtyp zurück"""
-        return FieldConfiguration.query.filter_by(field_type=field_type).first()
+        """
+        Gibt die Konfiguration für einen bestimmten Feldtyp zurück (aus dem Cache, nur lesend).
+        Zum Bearbeiten die Zeile direkt über FieldConfiguration.query laden.
+        """
+        from app.game_logic.field_config_cache import get_cached_field_config
+        return get_cached_field_config(field_type)
     
     @staticmethod
     def get_all_enabled():
-        """Gibt alle aktivierten Feld-Konfigurationen zurück"""
-        return FieldConfiguration.query.filter_by(is_enabled=True).all()
+        """Gibt alle aktivierten Feld-Konfigurationen zurück (aus dem Cache, nur lesend)"""
+        from app.game_logic.field_config_cache import get_cached_field_configs
+        return [config for config in get_cached_field_configs().values() if config.is_enabled]
     
     @staticmethod
     def initialize_default_configs():
@@ -535,6 +747,8 @@ class FieldConfiguration(db.Model):
                 )
                 db.session.add(field_config)
         
+        from app.game_logic.field_config_cache import invalidate_field_config_cache
+        invalidate_field_config_cache()
         try:
             db.session.commit()
         except Exception as e:
@@ -544,6 +758,12 @@ class FieldConfiguration(db.Model):
     def __repr__(self):
         return f'<FieldConfiguration {self.field_type}: {self.display_name}>'
 
+# Spalten, die eine Runde von der globalen FieldConfiguration übernimmt
+ROUND_CONFIG_COLUMNS = (
+    'field_type', 'display_name', 'description', 'is_enabled', 'frequency_type',
+    'frequency_value', 'color_hex', 'emission_hex', 'icon', 'config_data',
+)
+
 class RoundFieldConfiguration(db.Model):
     """Rundenspezifische Konfiguration für Spielfeld-Typen"""
     id = db.Column(db.Integer, primary_key=True)
@@ -568,6 +788,7 @@ class RoundFieldConfiguration(db.Model):
     
     # Zusätzliche Konfiguration (JSON)
     config_data = db.Column(db.Text, nullable=True)
+    parsed_config_data = JSONText('config_data', default=dict)
     
     # Metadaten
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -579,20 +800,69 @@ class RoundFieldConfiguration(db.Model):
     @property
     def config_dict(self):
         """Gibt config_data als Dictionary zurück"""
-        if self.config_data:
-            try:
-                return json.loads(self.config_data)
-            except (json.JSONDecodeError, TypeError):
-                return {}
-        return {}
+        return json_copy(self.parsed_config_data)
 
     @config_dict.setter
     def config_dict(self, value):
         """Setzt config_data aus Dictionary"""
-        if value is None:
-            self.config_data = None
-        else:
-            self.config_data = json.dumps(value)
+        self.parsed_config_data = value
+
+    @staticmethod
+    def upsert_many(game_round_id, configs, overwrite=True):
+        """
+        Schreibt mehrere Konfigurationen mit einem Statement in eine Runde
+
+        Args:
+            game_round_id: ID der Runde
+            configs: FieldConfiguration-Objekte, Cache-Einträge oder Dictionaries
+            overwrite: Bestehende Zeilen aktualisieren (False = nur fehlende anlegen)
+
+        Returns:
+            int: Anzahl der übergebenen Konfigurationen
+        """
+        now = datetime.utcnow()
+        rows = []
+        for config in configs:
+            get = config.get if isinstance(config, dict) else (lambda key, c=config: getattr(c, key, None))
+            row = {column: get(column) for column in ROUND_CONFIG_COLUMNS}
+            if row['is_enabled'] is None:
+                row['is_enabled'] = True
+            row.update(game_round_id=game_round_id, created_at=now, updated_at=now)
+            rows.append(row)
+        if not rows:
+            return 0
+
+        table = RoundFieldConfiguration.__table__
+        dialect = db.session.get_bind().dialect.name
+        if dialect in ('sqlite', 'postgresql'):
+            if dialect == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert
+            stmt = insert(table).values(rows)
+            if overwrite:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['game_round_id', 'field_type'],
+                    set_={column: stmt.excluded[column] for column in ROUND_CONFIG_COLUMNS + ('updated_at',)}
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=['game_round_id', 'field_type'])
+            db.session.execute(stmt)
+            return len(rows)
+
+        # Fallback für andere Datenbanken: bestehende Zeilen mit einer Abfrage vorladen
+        existing = {c.field_type: c for c in RoundFieldConfiguration.query.filter(
+            RoundFieldConfiguration.game_round_id == game_round_id,
+            RoundFieldConfiguration.field_type.in_([row['field_type'] for row in rows])
+        )}
+        for row in rows:
+            round_config = existing.get(row['field_type'])
+            if round_config is None:
+                db.session.add(RoundFieldConfiguration(**row))
+            elif overwrite:
+                for column in ROUND_CONFIG_COLUMNS:
+                    setattr(round_config, column, row[column])
+        return len(rows)
 
     def __repr__(self):
         return f'<RoundFieldConfiguration {self.field_type} for Round {self.game_round_id}>'
@@ -649,24 +919,22 @@ class MinigameSequence(db.Model):
         else:
             self.sequence_data = json.dumps(value)
     
+    def cursor(self):
+        """Gibt den SequenceCursor zurück (geparste Liste wird prozessweit wiederverwendet)"""
+        from app.game_logic.sequence_cursor import get_sequence_cursor
+        return get_sequence_cursor(self)
+
     def get_current_item(self):
         """Gibt das aktuelle Element der Sequenz zurück"""
-        sequence = self.sequence_list
-        if sequence and self.current_position < len(sequence):
-            return sequence[self.current_position]
-        return None
+        return self.cursor().current_item
     
     def get_next_item(self):
         """Gibt das nächste Element der Sequenz zurück"""
-        sequence = self.sequence_list
-        if sequence and self.current_position + 1 < len(sequence):
-            return sequence[self.current_position + 1]
-        return None
+        return self.cursor().next_item
     
     def advance(self):
         """Geht zum nächsten Element in der Sequenz"""
-        sequence = self.sequence_list
-        if sequence and self.current_position < len(sequence) - 1:
+        if self.cursor().can_advance:
             self.current_position += 1
             return True
         return False
@@ -677,10 +945,7 @@ class MinigameSequence(db.Model):
     
     def get_progress_percentage(self):
         """Gibt den Fortschritt in Prozent zurück"""
-        sequence = self.sequence_list
-        if not sequence:
-            return 0
-        return min(100, int((self.current_position / len(sequence)) * 100))
+        return self.cursor().progress_percentage
     
     def __repr__(self):
         return f'<MinigameSequence for Folder {self.minigame_folder_id}>'
@@ -698,13 +963,19 @@ class GameRound(db.Model):
     round_field_configs = db.relationship('RoundFieldConfiguration', backref='game_round', lazy='dynamic', cascade="all, delete-orphan")
 
     def activate(self):
-        """Aktiviert diese Runde und deaktiviert alle anderen"""
-        GameRound.query.update({'is_active': False})
+        """
+        Aktiviert diese Runde und deaktiviert alle anderen
+
+        Die Feld-Konfigurationen werden nicht mehr umkopiert: Lesezugriffe lösen
+        über den Feld-Konfigurations-Cache die Zeilen der aktiven Runde auf, die
+        Aktivierung setzt also nur noch den Zeiger auf die aktive Runde um.
+        """
+        GameRound.query.filter(GameRound.is_active.is_(True), GameRound.id != self.id).update(
+            {'is_active': False})
         self.is_active = True
-        
-        # Lade rundenspezifische Konfigurationen
-        self._load_round_configurations()
-        
+
+        from app.game_logic.field_config_cache import invalidate_field_config_cache
+        invalidate_field_config_cache(active_round_id=self.id)
         db.session.commit()
         
         # Automatisches Backup nach Aktivierung
@@ -715,93 +986,14 @@ class GameRound(db.Model):
             import logging
             logging.warning(f"Backup der aktivierten Runde '{self.name}' fehlgeschlagen: {backup_e}")
 
-    def _load_round_configurations(self):
-        """Lädt die rundenspezifischen Konfigurationen in die globale FieldConfiguration"""
-        # Sichere aktuelle Konfigurationen der vorherigen Runde
-        self._save_current_configurations()
-        
-        # Lade Konfigurationen für diese Runde
-        for round_config in self.round_field_configs:
-            global_config = FieldConfiguration.query.filter_by(field_type=round_config.field_type).first()
-            if global_config:
-                global_config.is_enabled = round_config.is_enabled
-                global_config.frequency_type = round_config.frequency_type
-                global_config.frequency_value = round_config.frequency_value
-                global_config.color_hex = round_config.color_hex
-                global_config.emission_hex = round_config.emission_hex
-                global_config.icon = round_config.icon
-                global_config.config_data = round_config.config_data
-    
-    def _save_current_configurations(self):
-        """Speichert die aktuellen globalen Konfigurationen für die vorherige Runde"""
-        previous_round = GameRound.query.filter_by(is_active=True).first()
-        if not previous_round or previous_round.id == self.id:
-            return
-        
-        # Aktualisiere die Konfigurationen der vorherigen Runde
-        global_configs = FieldConfiguration.query.all()
-        for global_config in global_configs:
-            round_config = RoundFieldConfiguration.query.filter_by(
-                game_round_id=previous_round.id,
-                field_type=global_config.field_type
-            ).first()
-            
-            if round_config:
-                # Aktualisiere existierende Konfiguration
-                round_config.is_enabled = global_config.is_enabled
-                round_config.frequency_type = global_config.frequency_type
-                round_config.frequency_value = global_config.frequency_value
-                round_config.color_hex = global_config.color_hex
-                round_config.emission_hex = global_config.emission_hex
-                round_config.icon = global_config.icon
-                round_config.config_data = global_config.config_data
-            else:
-                # Erstelle neue Konfiguration
-                round_config = RoundFieldConfiguration(
-                    game_round_id=previous_round.id,
-                    field_type=global_config.field_type,
-                    display_name=global_config.display_name,
-                    description=global_config.description,
-                    is_enabled=global_config.is_enabled,
-                    frequency_type=global_config.frequency_type,
-                    frequency_value=global_config.frequency_value,
-                    color_hex=global_config.color_hex,
-                    emission_hex=global_config.emission_hex,
-                    icon=global_config.icon,
-                    config_data=global_config.config_data
-                )
-                db.session.add(round_config)
-    
     def get_field_configurations(self):
         """Gibt die rundenspezifischen Konfigurationen zurück"""
         return self.round_field_configs.all()
     
     def ensure_round_configurations(self):
         """Stellt sicher, dass alle Feld-Konfigurationen für diese Runde existieren"""
-        global_configs = FieldConfiguration.query.all()
-        for global_config in global_configs:
-            round_config = RoundFieldConfiguration.query.filter_by(
-                game_round_id=self.id,
-                field_type=global_config.field_type
-            ).first()
-            
-            if not round_config:
-                # Erstelle rundenspezifische Konfiguration basierend auf globaler Konfiguration
-                round_config = RoundFieldConfiguration(
-                    game_round_id=self.id,
-                    field_type=global_config.field_type,
-                    display_name=global_config.display_name,
-                    description=global_config.description,
-                    is_enabled=global_config.is_enabled,
-                    frequency_type=global_config.frequency_type,
-                    frequency_value=global_config.frequency_value,
-                    color_hex=global_config.color_hex,
-                    emission_hex=global_config.emission_hex,
-                    icon=global_config.icon,
-                    config_data=global_config.config_data
-                )
-                db.session.add(round_config)
-        
+        # Fehlende Feld-Typen werden aus der globalen Vorlage ergänzt, bestehende bleiben unverändert
+        RoundFieldConfiguration.upsert_many(self.id, FieldConfiguration.query.all(), overwrite=False)
         db.session.commit()
 
     @classmethod
@@ -850,17 +1042,22 @@ class Character(db.Model):
     category = db.Column(db.String(50), default="default")  # default, special, premium, unlocked
     rarity = db.Column(db.String(20), default="common")  # common, rare, epic, legendary
     unlock_condition = db.Column(db.Text, nullable=True)  # JSON: {"type": "points", "value": 1000}
+    parsed_unlock_condition = JSONText('unlock_condition', default=dict)
     is_unlocked = db.Column(db.Boolean, default=True)
     
     # Character stats/attributes
     stats = db.Column(db.Text, nullable=True)  # JSON: {"strength": 5, "speed": 3, "luck": 4}
+    parsed_stats = JSONText('stats', default=lambda: {"strength": 5, "speed": 5, "luck": 5, "charisma": 5})
     
     # Asset paths for modular parts
     parts_config = db.Column(db.Text, nullable=True)  # JSON: {"head": "head1.obj", "body": "body1.obj"}
+    parsed_parts_config = JSONText('parts_config', default=dict)
     
     # Animation and effects
     animation_config = db.Column(db.Text, nullable=True)  # JSON: {"idle": "idle.anim", "walk": "walk.anim"}
+    parsed_animation_config = JSONText('animation_config', default=dict)
     voice_config = db.Column(db.Text, nullable=True)  # JSON: {"type": "voice1", "pitch": 1.0}
+    parsed_voice_config = JSONText('voice_config', default=lambda: {"type": "default", "pitch": 1.0})
     
     # Display properties
     preview_image = db.Column(db.String(120), nullable=True)  # High-res preview image
@@ -872,114 +1069,61 @@ class Character(db.Model):
     
     # Customization options
     customization_options = db.Column(db.Text, nullable=True)  # JSON: Available customization options
+    parsed_customization_options = JSONText('customization_options', default=lambda: {
+        "faces": ["face1", "face2", "face3"],
+        "tshirts": ["tshirt1", "tshirt2", "tshirt3"],
+        "pants": ["pants1", "pants2", "pants3"],
+        "shoes": ["shoes1", "shoes2", "shoes3"],
+        "accessories": ["acc1", "acc2", "acc3"]
+    })
     
     def get_stats(self):
         """Returns character stats as dictionary"""
-        if not self.stats:
-            return {"strength": 5, "speed": 5, "luck": 5, "charisma": 5}
-        try:
-            return json.loads(self.stats)
-        except (json.JSONDecodeError, TypeError):
-            return {"strength": 5, "speed": 5, "luck": 5, "charisma": 5}
+        return json_copy(self.parsed_stats)
     
     def set_stats(self, stats_dict):
         """Sets character stats from dictionary"""
-        if stats_dict is None:
-            self.stats = None
-        else:
-            self.stats = json.dumps(stats_dict)
+        self.parsed_stats = stats_dict
     
     def get_parts_config(self):
         """Returns parts configuration as dictionary"""
-        if not self.parts_config:
-            return {}
-        try:
-            return json.loads(self.parts_config)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return json_copy(self.parsed_parts_config)
     
     def set_parts_config(self, parts_dict):
         """Sets parts configuration from dictionary"""
-        if parts_dict is None:
-            self.parts_config = None
-        else:
-            self.parts_config = json.dumps(parts_dict)
+        self.parsed_parts_config = parts_dict
     
     def get_animation_config(self):
         """Returns animation configuration as dictionary"""
-        if not self.animation_config:
-            return {}
-        try:
-            return json.loads(self.animation_config)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return json_copy(self.parsed_animation_config)
     
     def set_animation_config(self, animation_dict):
         """Sets animation configuration from dictionary"""
-        if animation_dict is None:
-            self.animation_config = None
-        else:
-            self.animation_config = json.dumps(animation_dict)
+        self.parsed_animation_config = animation_dict
     
     def get_voice_config(self):
         """Returns voice configuration as dictionary"""
-        if not self.voice_config:
-            return {"type": "default", "pitch": 1.0}
-        try:
-            return json.loads(self.voice_config)
-        except (json.JSONDecodeError, TypeError):
-            return {"type": "default", "pitch": 1.0}
+        return json_copy(self.parsed_voice_config)
     
     def set_voice_config(self, voice_dict):
         """Sets voice configuration from dictionary"""
-        if voice_dict is None:
-            self.voice_config = None
-        else:
-            self.voice_config = json.dumps(voice_dict)
+        self.parsed_voice_config = voice_dict
     
     def get_unlock_condition(self):
         """Returns unlock condition as dictionary"""
-        if not self.unlock_condition:
-            return {}
-        try:
-            return json.loads(self.unlock_condition)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return json_copy(self.parsed_unlock_condition)
     
     def set_unlock_condition(self, condition_dict):
         """Sets unlock condition from dictionary"""
-        if condition_dict is None:
-            self.unlock_condition = None
-        else:
-            self.unlock_condition = json.dumps(condition_dict)
+        self.parsed_unlock_condition = condition_dict
     
     def get_customization_options(self):
         """Returns customization options as dictionary"""
-        if not self.customization_options:
-            return {
-                "faces": ["face1", "face2", "face3"],
-                "tshirts": ["tshirt1", "tshirt2", "tshirt3"],
-                "pants": ["pants1", "pants2", "pants3"],
-                "shoes": ["shoes1", "shoes2", "shoes3"],
-                "accessories": ["acc1", "acc2", "acc3"]
-            }
-        try:
-            return json.loads(self.customization_options)
-        except (json.JSONDecodeError, TypeError):
-            return {
-                "faces": ["face1", "face2", "face3"],
-                "tshirts": ["tshirt1", "tshirt2", "tshirt3"],
-                "pants": ["pants1", "pants2", "pants3"],
-                "shoes": ["shoes1", "shoes2", "shoes3"],
-                "accessories": ["acc1", "acc2", "acc3"]
-            }
+        return json_copy(self.parsed_customization_options)
     
     def set_customization_options(self, options_dict):
         """Sets customization options from dictionary"""
-        if options_dict is None:
-            self.customization_options = None
-        else:
-            self.customization_options = json.dumps(options_dict)
+        self.parsed_customization_options = options_dict
     
     def is_available_for_team(self, team=None):
         """Check if character is available for a team"""
@@ -1011,6 +1155,7 @@ class CharacterPart(db.Model):
     # Properties
     rarity = db.Column(db.String(20), default="common")  # common, rare, epic, legendary
     unlock_condition = db.Column(db.Text, nullable=True)  # JSON unlock requirements
+    parsed_unlock_condition = JSONText('unlock_condition', default=dict)
     is_unlocked = db.Column(db.Boolean, default=True)
     
     # Visual properties
@@ -1019,15 +1164,21 @@ class CharacterPart(db.Model):
     
     # Compatibility
     compatible_body_types = db.Column(db.Text, nullable=True)  # JSON: ["normal", "athletic", "slim"]
+    parsed_compatible_body_types = JSONText('compatible_body_types', default=lambda: ["normal", "slim", "athletic", "chunky"])
     compatible_face_shapes = db.Column(db.Text, nullable=True)  # JSON: ["oval", "round", "square"]
+    parsed_compatible_face_shapes = JSONText('compatible_face_shapes', default=lambda: ["oval", "round", "square", "heart"])
     conflicts_with = db.Column(db.Text, nullable=True)  # JSON: Other parts this conflicts with
+    parsed_conflicts_with = JSONText('conflicts_with', default=list)
     
     # Stats/Effects
     stats_modifier = db.Column(db.Text, nullable=True)  # JSON: {"luck": +1, "speed": -1}
+    parsed_stats_modifier = JSONText('stats_modifier', default=dict)
     special_effects = db.Column(db.Text, nullable=True)  # JSON: ["sparkles", "glow"]
+    parsed_special_effects = JSONText('special_effects', default=list)
     
     # Animation properties
     animation_modifiers = db.Column(db.Text, nullable=True)  # JSON: Animation modifications
+    parsed_animation_modifiers = JSONText('animation_modifiers', default=dict)
     
     # Metadata
     description = db.Column(db.Text, nullable=True)
@@ -1036,115 +1187,59 @@ class CharacterPart(db.Model):
     
     def get_unlock_condition(self):
         """Returns unlock condition as dictionary"""
-        if not self.unlock_condition:
-            return {}
-        try:
-            return json.loads(self.unlock_condition)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return json_copy(self.parsed_unlock_condition)
     
     def set_unlock_condition(self, condition_dict):
         """Sets unlock condition from dictionary"""
-        if condition_dict is None:
-            self.unlock_condition = None
-        else:
-            self.unlock_condition = json.dumps(condition_dict)
+        self.parsed_unlock_condition = condition_dict
     
     def get_compatible_body_types(self):
         """Returns compatible body types as list"""
-        if not self.compatible_body_types:
-            return ["normal", "slim", "athletic", "chunky"]
-        try:
-            return json.loads(self.compatible_body_types)
-        except (json.JSONDecodeError, TypeError):
-            return ["normal", "slim", "athletic", "chunky"]
+        return json_copy(self.parsed_compatible_body_types)
     
     def set_compatible_body_types(self, types_list):
         """Sets compatible body types from list"""
-        if types_list is None:
-            self.compatible_body_types = None
-        else:
-            self.compatible_body_types = json.dumps(types_list)
+        self.parsed_compatible_body_types = types_list
     
     def get_compatible_face_shapes(self):
         """Returns compatible face shapes as list"""
-        if not self.compatible_face_shapes:
-            return ["oval", "round", "square", "heart"]
-        try:
-            return json.loads(self.compatible_face_shapes)
-        except (json.JSONDecodeError, TypeError):
-            return ["oval", "round", "square", "heart"]
+        return json_copy(self.parsed_compatible_face_shapes)
     
     def set_compatible_face_shapes(self, shapes_list):
         """Sets compatible face shapes from list"""
-        if shapes_list is None:
-            self.compatible_face_shapes = None
-        else:
-            self.compatible_face_shapes = json.dumps(shapes_list)
+        self.parsed_compatible_face_shapes = shapes_list
     
     def get_conflicts_with(self):
         """Returns conflicting parts as list"""
-        if not self.conflicts_with:
-            return []
-        try:
-            return json.loads(self.conflicts_with)
-        except (json.JSONDecodeError, TypeError):
-            return []
+        return json_copy(self.parsed_conflicts_with)
     
     def set_conflicts_with(self, conflicts_list):
         """Sets conflicting parts from list"""
-        if conflicts_list is None:
-            self.conflicts_with = None
-        else:
-            self.conflicts_with = json.dumps(conflicts_list)
+        self.parsed_conflicts_with = conflicts_list
     
     def get_stats_modifier(self):
         """Returns stats modifier as dictionary"""
-        if not self.stats_modifier:
-            return {}
-        try:
-            return json.loads(self.stats_modifier)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return json_copy(self.parsed_stats_modifier)
     
     def set_stats_modifier(self, modifier_dict):
         """Sets stats modifier from dictionary"""
-        if modifier_dict is None:
-            self.stats_modifier = None
-        else:
-            self.stats_modifier = json.dumps(modifier_dict)
+        self.parsed_stats_modifier = modifier_dict
     
     def get_special_effects(self):
         """Returns special effects as list"""
-        if not self.special_effects:
-            return []
-        try:
-            return json.loads(self.special_effects)
-        except (json.JSONDecodeError, TypeError):
-            return []
+        return json_copy(self.parsed_special_effects)
     
     def set_special_effects(self, effects_list):
         """Sets special effects from list"""
-        if effects_list is None:
-            self.special_effects = None
-        else:
-            self.special_effects = json.dumps(effects_list)
+        self.parsed_special_effects = effects_list
     
     def get_animation_modifiers(self):
         """Returns animation modifiers as dictionary"""
-        if not self.animation_modifiers:
-            return {}
-        try:
-            return json.loads(self.animation_modifiers)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return json_copy(self.parsed_animation_modifiers)
     
     def set_animation_modifiers(self, modifiers_dict):
         """Sets animation modifiers from dictionary"""
-        if modifiers_dict is None:
-            self.animation_modifiers = None
-        else:
-            self.animation_modifiers = json.dumps(modifiers_dict)
+        self.parsed_animation_modifiers = modifiers_dict
     
     def is_compatible_with(self, body_type="normal", face_shape="oval"):
         """Check if this part is compatible with given body type and face shape"""
@@ -1196,6 +1291,7 @@ class GameSession(db.Model):
     current_minigame_description = db.Column(db.Text, nullable=True)
     current_player_count = db.Column(db.String(20), default='1', nullable=True)  # Spieleranzahl-Konfiguration
     selected_players = db.Column(db.Text, nullable=True)  # JSON mit ausgewählten Spielern pro Team
+    parsed_selected_players = JSONText('selected_players', default=dict)
     
     # Für Einzelfragen
     current_question_id = db.Column(db.String(100), nullable=True)  # UUID aus JSON-Datei
@@ -1204,9 +1300,11 @@ class GameSession(db.Model):
     selected_folder_minigame_id = db.Column(db.String(100), nullable=True)  # ID aus JSON-Datei
     minigame_source = db.Column(db.String(50), default='manual')  # 'manual', 'folder_random', 'folder_selected', 'direct_question'
 
-    # Tracking für bereits gespielte Inhalte
-    played_content_ids = db.Column(db.Text, nullable=True, default='')  # Komma-separierte Liste von gespielten IDs
-    player_rotation_data = db.Column(db.Text, nullable=True)  # JSON mit Spieleinsatz-Tracking pro Team
+    # Tracking für bereits gespielte Inhalte (Tabelle played_content; die komma-separierte
+    # Spalte bleibt nur für alte Datenbanken und Backups erhalten)
+    played_content_ids = db.Column(db.Text, nullable=True, default='')
+    player_rotation_data = db.Column(db.Text, nullable=True)  # Alt: JSON-Tracking, jetzt Tabelle player_rotation
+    position_turn_no = db.Column(db.Integer, nullable=True, default=0)  # Zähler der Positions-Zeitreihe (atomar erhöht)
 
     # Feld-Minigame spezifische Felder
     field_minigame_mode = db.Column(db.String(50), nullable=True)  # 'team_vs_all', 'team_vs_team'
@@ -1216,6 +1314,7 @@ class GameSession(db.Model):
     field_minigame_content_type = db.Column(db.String(20), nullable=True)  # 'question', 'game'
     field_minigame_result = db.Column(db.String(20), nullable=True)  # 'won', 'lost'
     field_minigame_selected_players = db.Column(db.Text, nullable=True)  # JSON mit ausgelosten Spielern
+    parsed_field_minigame_selected_players = JSONText('field_minigame_selected_players')
     
     # Beziehungen für Feld-Minigames
     field_minigame_landing_team = db.relationship('Team', foreign_keys=[field_minigame_landing_team_id])
@@ -1234,27 +1333,51 @@ class GameSession(db.Model):
     volcano_last_triggered = db.Column(db.DateTime, nullable=True)  # Letzter Ausbruch
 
     events = db.relationship('GameEvent', backref='game_session', lazy='dynamic', cascade="all, delete-orphan")
+    played_contents = db.relationship('PlayedContent', backref='game_session', lazy='dynamic',
+                                      cascade="all, delete-orphan", order_by='PlayedContent.played_at')
+    player_rotations = db.relationship('PlayerRotation', backref='game_session', lazy='dynamic',
+                                       cascade="all, delete-orphan")
 
     def get_played_content_ids(self):
-        """Gibt eine Liste der bereits gespielten Content-IDs zurück"""
-        if not self.played_content_ids:
+        """Gibt die Menge der bereits gespielten Content-IDs zurück (eine indizierte Abfrage)"""
+        if self.id is None:
+            return set()
+        return set(db.session.scalars(
+            db.select(PlayedContent.content_id).where(PlayedContent.game_session_id == self.id)
+        ))
+
+    def get_played_content_history(self):
+        """Gibt die gespielten Content-IDs in Spielreihenfolge zurück"""
+        if self.id is None:
             return []
-        return [content_id.strip() for content_id in self.played_content_ids.split(',') if content_id.strip()]
+        return list(db.session.scalars(
+            db.select(PlayedContent.content_id)
+            .where(PlayedContent.game_session_id == self.id)
+            .order_by(PlayedContent.played_at, PlayedContent.id)
+        ))
 
     def add_played_content_id(self, content_id):
-        """Fügt eine Content-ID zur Liste der gespielten Inhalte hinzu"""
-        played_ids = self.get_played_content_ids()
-        if content_id not in played_ids:
-            played_ids.append(content_id)
-            self.played_content_ids = ','.join(played_ids)
+        """Markiert eine Content-ID als gespielt (doppelte Einträge werden ignoriert)"""
+        if not content_id:
+            return
+        if self.id is None:
+            db.session.flush()
+        PlayedContent.insert_many(self.id, [content_id])
 
     def reset_played_content(self):
-        """Setzt die Liste der gespielten Inhalte zurück"""
+        """Setzt die gespielten Inhalte zurück"""
+        if self.id is not None:
+            PlayedContent.query.filter_by(game_session_id=self.id).delete(synchronize_session=False)
         self.played_content_ids = ''
 
     def is_content_already_played(self, content_id):
         """Prüft, ob ein Inhalt bereits gespielt wurde"""
-        return content_id in self.get_played_content_ids()
+        if self.id is None:
+            return False
+        return db.session.scalar(db.select(db.exists().where(
+            PlayedContent.game_session_id == self.id,
+            PlayedContent.content_id == content_id
+        )))
 
     def get_selected_players(self):
         """Gibt die ausgewählten Spieler als Dictionary zurück"""
@@ -1262,40 +1385,40 @@ class GameSession(db.Model):
         if (self.current_phase in ['FIELD_MINIGAME_SELECTION_PENDING', 'FIELD_MINIGAME_TRIGGERED', 'FIELD_MINIGAME_ACTIVE', 'FIELD_MINIGAME_COMPLETED'] 
             and self.field_minigame_selected_players):
             try:
-                field_players = json.loads(self.field_minigame_selected_players)
-                # Konvertiere Format von {"Team1": [{"name": "Player1"}]} zu {"team_id": ["Player1"]}
+                field_players = self.parsed_field_minigame_selected_players
+                # Konvertiere Format von {"team_id": [{"name": "Player1"}]} zu {"team_id": ["Player1"]}
                 converted = {}
-                for team_name, players in field_players.items():
-                    # Finde Team ID basierend auf Name (Teams sind global, nicht rundespezifisch)
-                    team = Team.query.filter_by(name=team_name).first()
-                    if team:
-                        converted[str(team.id)] = [p.get('name', '') for p in players if isinstance(p, dict)]
+                team_index = None
+                for team_key, players in field_players.items():
+                    if not team_key.isdigit():
+                        # Altes Format mit Team-Namen: über den gecachten Team-Index auflösen
+                        if team_index is None:
+                            from .game_logic.team_index import get_team_index
+                            team_index = get_team_index()
+                        team_id = team_index.id_for(team_key)
+                        if team_id is None:
+                            continue
+                        team_key = str(team_id)
+                    converted[team_key] = [p.get('name', '') for p in players if isinstance(p, dict)]
                 return converted
-            except (json.JSONDecodeError, TypeError):
+            except (TypeError, AttributeError):
                 pass
         
         # Standard-Verhalten für normale Minigames
-        if not self.selected_players:
-            return {}
-        try:
-            return json.loads(self.selected_players)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return json_copy(self.parsed_selected_players)
 
     def set_selected_players(self, players_dict):
         """Setzt die ausgewählten Spieler aus Dictionary"""
-        if players_dict is None:
-            self.selected_players = None
-        else:
-            self.selected_players = json.dumps(players_dict)
+        self.parsed_selected_players = players_dict
 
     def select_random_players(self, teams, count_per_team):
-        """Wählt faire rotierend Spieler aus jedem Team aus"""
-        import random
+        """Wählt faire rotierend Spieler aus jedem Team aus (Zähler werden einmal geladen und einmal geschrieben)"""
+        from .game_logic.player_rotation import PlayerRotationScheduler
+        scheduler = PlayerRotationScheduler(self)
         selected = {}
         
         for team in teams:
-            if not team.members:
+            if not team.member_rows:
                 # Fallback: Verwende Team-Name wenn keine Mitglieder definiert
                 selected[str(team.id)] = [team.name]
                 continue
@@ -1305,13 +1428,10 @@ class GameSession(db.Model):
                 # Unterscheidung zwischen "ganzes Team" und regulärer Auswahl
                 if count_per_team == "all":
                     # Bei "ganzes Team" alle Spieler verwenden (auch nicht-auslosbare)
-                    all_members = [m.strip() for m in team.members.split(',') if m.strip()] if team.members else []
-                    if not all_members:
-                        selected[str(team.id)] = [team.name]
-                        continue
+                    all_members = team.get_member_names()
                     selected[str(team.id)] = all_members
                     # Tracking für alle Spieler
-                    self._update_player_rotation_tracking(str(team.id), all_members)
+                    scheduler.record(team.id, all_members)
                 else:
                     # Bei normaler Auswahl nur auslosbare Spieler verwenden
                     selectable_members = team.get_selectable_players()
@@ -1322,113 +1442,75 @@ class GameSession(db.Model):
                     
                     # Faire Auswahl basierend auf Rotation aus auslosbaren Spielern
                     selected_count = min(int(count_per_team), len(selectable_members))
-                    selected_members = self._select_fair_rotation(str(team.id), selectable_members, selected_count)
+                    selected_members = scheduler.select(team.id, selectable_members, selected_count)
                     selected[str(team.id)] = selected_members
                     # Tracking aktualisieren
-                    self._update_player_rotation_tracking(str(team.id), selected_members)
+                    scheduler.record(team.id, selected_members)
                 
             except (ValueError, AttributeError):
                 # Fallback bei Parsing-Fehlern
                 selected[str(team.id)] = [team.name]
         
+        scheduler.flush()
         self.set_selected_players(selected)
         return selected
 
     def get_player_rotation_data(self):
-        """Gibt die Spieler-Rotations-Daten als Dictionary zurück"""
-        if not self.player_rotation_data:
-            return {}
-        try:
-            return json.loads(self.player_rotation_data)
-        except (json.JSONDecodeError, TypeError):
-            return {}
-
-    def set_player_rotation_data(self, rotation_dict):
-        """Setzt die Spieler-Rotations-Daten aus Dictionary"""
-        if rotation_dict is None:
-            self.player_rotation_data = None
-        else:
-            self.player_rotation_data = json.dumps(rotation_dict)
+        """Gibt die Spieler-Einsätze als Dictionary {team_id: {spieler: anzahl}} zurück"""
+        rotation_data = {}
+        if self.id is None:
+            return rotation_data
+        rows = db.session.execute(
+            db.select(PlayerRotation.team_id, PlayerRotation.player_name, PlayerRotation.play_count)
+            .where(PlayerRotation.game_session_id == self.id)
+        )
+        for team_id, player_name, play_count in rows:
+            rotation_data.setdefault(str(team_id), {})[player_name] = play_count
+        return rotation_data
 
     def _select_fair_rotation(self, team_id, members, count_needed):
-        """Wählt Spieler basierend auf fairer Rotation aus"""
-        import random
-        
-        rotation_data = self.get_player_rotation_data()
-        team_data = rotation_data.get(team_id, {})
-        
-        # Initialisiere Spieler-Zähler falls noch nicht vorhanden
-        player_counts = {}
-        for member in members:
-            player_counts[member] = team_data.get(member, 0)
-        
-        # Sortiere Spieler nach Anzahl gespielter Spiele (aufsteigend)
-        sorted_players = sorted(player_counts.items(), key=lambda x: x[1])
-        
-        # Bestimme minimale Anzahl gespielter Spiele
-        min_games = sorted_players[0][1] if sorted_players else 0
-        
-        # Finde alle Spieler mit minimaler Anzahl Spiele
-        available_players = [player for player, count in sorted_players if count == min_games]
-        
-        selected_players = []
-        
-        # Wähle aus Spielern mit wenigsten Spielen
-        if len(available_players) >= count_needed:
-            # Genug Spieler mit minimalen Spielen verfügbar
-            selected_players = random.sample(available_players, count_needed)
-        else:
-            # Nicht genug Spieler mit minimalen Spielen - fülle mit nächst-besten auf
-            selected_players.extend(available_players)
-            remaining_needed = count_needed - len(selected_players)
-            
-            # Finde Spieler mit zweit-wenigsten Spielen
-            remaining_players = [player for player, count in sorted_players 
-                               if count > min_games and player not in selected_players]
-            
-            if remaining_players and remaining_needed > 0:
-                # Sortiere nach Anzahl Spiele und fülle auf
-                remaining_players_sorted = sorted(remaining_players, 
-                                                key=lambda p: player_counts[p])
-                
-                additional_players = remaining_players_sorted[:remaining_needed]
-                selected_players.extend(additional_players)
-        
-        return selected_players
+        """Wählt Spieler basierend auf fairer Rotation aus (Einzelaufruf, siehe PlayerRotationScheduler)"""
+        from .game_logic.player_rotation import PlayerRotationScheduler
+        return PlayerRotationScheduler(self).select(team_id, members, count_needed)
 
     def _update_player_rotation_tracking(self, team_id, selected_players):
-        """Aktualisiert das Tracking für die ausgewählten Spieler"""
-        rotation_data = self.get_player_rotation_data()
-        
-        if team_id not in rotation_data:
-            rotation_data[team_id] = {}
-        
-        # Erhöhe Zähler für ausgewählte Spieler
-        for player in selected_players:
-            if player not in rotation_data[team_id]:
-                rotation_data[team_id][player] = 0
-            rotation_data[team_id][player] += 1
-        
-        self.set_player_rotation_data(rotation_data)
+        """Aktualisiert das Tracking für die ausgewählten Spieler (Einzelaufruf, siehe PlayerRotationScheduler)"""
+        from .game_logic.player_rotation import PlayerRotationScheduler
+        scheduler = PlayerRotationScheduler(self)
+        scheduler.record(team_id, selected_players)
+        scheduler.flush()
 
     def reset_player_rotation(self):
         """Setzt die Spieler-Rotation zurück"""
+        if self.id is not None:
+            PlayerRotation.query.filter_by(game_session_id=self.id).delete(synchronize_session=False)
         self.player_rotation_data = None
 
     def get_player_statistics(self):
-        """Gibt Statistiken über Spieleinsätze zurück"""
-        rotation_data = self.get_player_rotation_data()
+        """Gibt Statistiken über Spieleinsätze zurück (Summen/Extremwerte per GROUP BY)"""
+        if self.id is None:
+            return {}
         stats = {}
-        
-        for team_id, players in rotation_data.items():
-            team_stats = {
-                'total_games': sum(players.values()),
-                'players': dict(players),
-                'most_played': max(players.values()) if players else 0,
-                'least_played': min(players.values()) if players else 0
+        aggregates = db.session.execute(
+            db.select(
+                PlayerRotation.team_id,
+                db.func.sum(PlayerRotation.play_count),
+                db.func.max(PlayerRotation.play_count),
+                db.func.min(PlayerRotation.play_count)
+            )
+            .where(PlayerRotation.game_session_id == self.id)
+            .group_by(PlayerRotation.team_id)
+        )
+        for team_id, total_games, most_played, least_played in aggregates:
+            stats[str(team_id)] = {
+                'total_games': total_games or 0,
+                'players': {},
+                'most_played': most_played or 0,
+                'least_played': least_played or 0
             }
-            stats[team_id] = team_stats
-        
+        for team_id, players in self.get_player_rotation_data().items():
+            if team_id in stats:
+                stats[team_id]['players'] = players
         return stats
 
     def trigger_volcano_countdown(self, countdown=5):
@@ -1454,6 +1536,116 @@ class GameSession(db.Model):
     def __repr__(self):
         return f'<GameSession {self.id} Round: {self.game_round_id} Active: {self.is_active} Phase: {self.current_phase}>'
 
+class PlayedContent(db.Model):
+    """Bereits gespielter Inhalt (Minispiel oder Frage aus der Ordner-JSON) einer Spielsitzung"""
+    __tablename__ = 'played_content'
+    id = db.Column(db.Integer, primary_key=True)
+    game_session_id = db.Column(db.Integer, db.ForeignKey('game_session.id'), nullable=False)
+    content_id = db.Column(db.String(100), nullable=False)
+    played_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    # Der eindeutige Index deckt auch alle Abfragen pro Spielsitzung ab
+    __table_args__ = (db.UniqueConstraint('game_session_id', 'content_id', name='unique_played_content'),)
+
+    @staticmethod
+    def insert_many(game_session_id, content_ids, played_at=None):
+        """
+        Trägt mehrere gespielte Inhalte mit einem Statement ein; bereits vorhandene werden übersprungen
+
+        Returns:
+            int: Anzahl der übergebenen (eindeutigen) Content-IDs
+        """
+        played_at = played_at or datetime.utcnow()
+        content_ids = list(dict.fromkeys(cid for cid in content_ids if cid))
+        if not content_ids:
+            return 0
+        rows = [{'game_session_id': game_session_id, 'content_id': cid, 'played_at': played_at}
+                for cid in content_ids]
+
+        table = PlayedContent.__table__
+        dialect = db.session.get_bind().dialect.name
+        if dialect in ('sqlite', 'postgresql'):
+            if dialect == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert
+            stmt = insert(table).values(rows).on_conflict_do_nothing(
+                index_elements=['game_session_id', 'content_id']
+            )
+            db.session.execute(stmt)
+            return len(rows)
+
+        # Fallback für andere Datenbanken: vorhandene IDs mit einer Abfrage vorladen
+        existing = set(db.session.scalars(db.select(PlayedContent.content_id).where(
+            PlayedContent.game_session_id == game_session_id,
+            PlayedContent.content_id.in_(content_ids)
+        )))
+        db.session.add_all([PlayedContent(**row) for row in rows if row['content_id'] not in existing])
+        return len(rows)
+
+    def __repr__(self):
+        return f'<PlayedContent {self.content_id} Session {self.game_session_id}>'
+
+class PlayerRotation(db.Model):
+    """Anzahl der Einsätze eines Spielers pro Spielsitzung (Grundlage der fairen Rotation)"""
+    __tablename__ = 'player_rotation'
+    id = db.Column(db.Integer, primary_key=True)
+    game_session_id = db.Column(db.Integer, db.ForeignKey('game_session.id'), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=False)
+    player_name = db.Column(db.String(100), nullable=False)
+    play_count = db.Column(db.Integer, default=0, nullable=False)
+
+    __table_args__ = (db.UniqueConstraint('game_session_id', 'team_id', 'player_name', name='unique_player_rotation'),)
+
+    @staticmethod
+    def increment_many(game_session_id, increments):
+        """
+        Erhöht die Einsatz-Zähler mehrerer Spieler mit einem Statement
+
+        Args:
+            game_session_id: ID der Spielsitzung
+            increments: {(team_id, player_name): Anzahl}
+
+        Returns:
+            int: Anzahl der betroffenen Spieler
+        """
+        rows = [{'game_session_id': game_session_id, 'team_id': int(team_id),
+                 'player_name': player_name, 'play_count': count}
+                for (team_id, player_name), count in increments.items() if count]
+        if not rows:
+            return 0
+
+        table = PlayerRotation.__table__
+        dialect = db.session.get_bind().dialect.name
+        if dialect in ('sqlite', 'postgresql'):
+            if dialect == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert
+            stmt = insert(table).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['game_session_id', 'team_id', 'player_name'],
+                set_={'play_count': table.c.play_count + stmt.excluded.play_count}
+            )
+            db.session.execute(stmt)
+            return len(rows)
+
+        # Fallback für andere Datenbanken: vorhandene Zähler mit einer Abfrage vorladen
+        existing = {(r.team_id, r.player_name): r for r in PlayerRotation.query.filter(
+            PlayerRotation.game_session_id == game_session_id,
+            PlayerRotation.team_id.in_({row['team_id'] for row in rows})
+        )}
+        for row in rows:
+            rotation = existing.get((row['team_id'], row['player_name']))
+            if rotation is None:
+                db.session.add(PlayerRotation(**row))
+            else:
+                rotation.play_count += row['play_count']
+        return len(rows)
+
+    def __repr__(self):
+        return f'<PlayerRotation {self.player_name} Team {self.team_id}: {self.play_count}>'
+
 class GameEvent(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     game_session_id = db.Column(db.Integer, db.ForeignKey('game_session.id'), nullable=False)
@@ -1492,6 +1684,42 @@ class GameEvent(db.Model):
     def __repr__(self):
         return f'<GameEvent {self.id} Type: {self.event_type} Session: {self.game_session_id}>'
 
+class GameSummary(db.Model):
+    """Beim Spielgewinn einmalig berechnete Endstatistik einer Spielsitzung (für die Goodbye-Seite)"""
+    __tablename__ = 'game_summary'
+    id = db.Column(db.Integer, primary_key=True)
+    game_session_id = db.Column(db.Integer, db.ForeignKey('game_session.id'), nullable=False, unique=True)
+    winning_team_id = db.Column(db.Integer, nullable=True)  # Kein Fremdschlüssel: bleibt nach Team-Löschung lesbar
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    # {'winner', 'teams', 'minigame_stats', 'position_history', 'game_duration', 'duration_seconds', 'total_minigames', 'victory_timestamp'}
+    summary_json = db.Column(db.Text, nullable=False, default='{}')
+
+    summary = JSONText('summary_json', default=dict)
+
+    def __repr__(self):
+        return f'<GameSummary Session: {self.game_session_id} Winner: {self.winning_team_id}>'
+
+class PositionTimeseries(db.Model):
+    """
+    Positionsverlauf eines Teams in einer Spielsitzung als Append-only-Zeitreihe
+
+    samples enthält pro Zug einen gepackten Datensatz (Zugnummer, Position, Wurf);
+    Format und Zugriff siehe app/game_logic/position_timeseries.py.
+    """
+    __tablename__ = 'position_timeseries'
+    id = db.Column(db.Integer, primary_key=True)
+    game_session_id = db.Column(db.Integer, db.ForeignKey('game_session.id'), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=False)
+    samples = db.Column(db.LargeBinary, nullable=False, default=b'')
+    sample_count = db.Column(db.Integer, nullable=False, default=0)
+    last_turn_no = db.Column(db.Integer, nullable=False, default=0)  # Zugnummer des letzten Datensatzes
+
+    # Der eindeutige Index deckt auch alle Abfragen pro Spielsitzung ab
+    __table_args__ = (db.UniqueConstraint('game_session_id', 'team_id', name='unique_position_timeseries'),)
+
+    def __repr__(self):
+        return f'<PositionTimeseries Session: {self.game_session_id} Team: {self.team_id} ({self.sample_count} Züge)>'
+
 class WelcomeSession(db.Model):
     """Verwaltet Willkommensmodus und Spielerregistrierung"""
     id = db.Column(db.Integer, primary_key=True)
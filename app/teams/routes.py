@@ -3,13 +3,22 @@ from flask_login import login_user, logout_user, login_required, current_user
 from app.models import Team, db, Admin, GameSession, GameRound, QuestionResponse, GameEvent, Character, CharacterPart
 from flask import current_app
 from app.forms import TeamLoginForm, QuestionAnswerForm
-from app.admin.minigame_utils import get_question_from_folder
+from app.admin.minigame_utils import get_question_from_folder, get_active_question
+from app.game_logic.character_catalog import get_character_catalog, get_character_part_catalog
+from app.game_logic.game_summary import materialize_game_summary
+from app.game_logic.position_timeseries import record_position
+from app.user_cache import fresh_principal
 from app import csrf
+from app.log import get_logger
 import json
+import random
 from datetime import datetime, timedelta
 
 teams_bp = Blueprint('teams', __name__, url_prefix='/teams')
 
+board_log = get_logger('wii.board')
+dice_log = get_logger('wii.dice')
+
 @teams_bp.route('/login', methods=['GET', 'POST'])
 def team_login():
     # Teams müssen immer das Passwort eingeben - automatische Auslogung
@@ -196,7 +205,7 @@ def _get_last_dice_result(team_user, active_session):
                 'needs_final_roll': event_data.get('needs_final_roll', False)
             }
         except Exception as e:
-            current_app.logger.error(f"Error parsing dice result: {e}")
+            board_log.error('dice_result_parse_failed', error=str(e))
             return None
     
     return None
@@ -217,8 +226,9 @@ def _get_dashboard_data(team_user):
     question_response = None
     question_answered = False
     
-    if active_session and active_session.current_question_id and active_round and active_round.minigame_folder:
-        current_question_data = get_question_from_folder(active_round.minigame_folder.folder_path, active_session.current_question_id)
+    if active_session and active_session.current_question_id:
+        current_question = get_active_question(active_session)
+        current_question_data = current_question.team_payload if current_question else None
         if current_question_data:
             # Hole bereits gegebene Antwort dieses Teams für diese Frage
             question_response = QuestionResponse.query.filter_by(
@@ -378,6 +388,8 @@ def team_setup():
     
     if request.method == 'POST':
         try:
+            # Schreibende Route: Team frisch aus der Datenbank statt aus dem Principal-Cache
+            fresh_principal(current_user)
             data = request.get_json() if request.is_json else request.form
             new_team_name = data.get('team_name', '').strip()
             character_id = data.get('character_id')
@@ -541,38 +553,12 @@ def team_setup():
 
 @teams_bp.route('/api/characters')
 def api_characters():
-    """API endpoint für Charakterdaten"""
+    """API endpoint für Charakterdaten (vorserialisierter Katalog, Verfügbarkeit als Team-Overlay)"""
     try:
-        # Hole alle verfügbaren Charaktere
-        characters = Character.query.all()
-        
-        character_data = []
-        for char in characters:
-            # Prüfe ob Charakter für aktuelles Team verfügbar ist
-            is_available = True
-            current_team = current_user if isinstance(current_user, Team) else None
-            
-            if not char.is_available_for_team(current_team):
-                is_available = False
-            
-            char_info = {
-                'id': char.id,
-                'name': char.name,
-                'description': char.description,
-                'category': char.category,
-                'rarity': char.rarity,
-                'color': char.color,
-                'is_unlocked': char.is_unlocked,
-                'is_available': is_available,
-                'stats': char.get_stats(),
-                'customization_options': char.get_customization_options(),
-                'preview_image': char.preview_image,
-                'thumbnail': char.thumbnail
-            }
-            
-            character_data.append(char_info)
-        
-        return jsonify(character_data)
+        current_team = current_user if isinstance(current_user, Team) else None
+        catalog = get_character_catalog()
+        mask = catalog.availability_mask(current_team)
+        return _catalog_response(catalog.render(mask), catalog.etag(mask))
     
     except Exception as e:
         current_app.logger.error(f"Fehler beim Laden der Charakterdaten: {e}")
@@ -580,52 +566,28 @@ def api_characters():
 
 @teams_bp.route('/api/character-parts')
 def api_character_parts():
-    """API endpoint für Charakter-Teile"""
+    """API endpoint für Charakter-Teile (vorserialisierter Katalog, Verfügbarkeit als Team-Overlay)"""
     try:
         category = request.args.get('category')
         subcategory = request.args.get('subcategory')
         
-        if category:
-            parts = CharacterPart.get_parts_by_category(category, subcategory)
-        else:
-            parts = CharacterPart.query.all()
-        
-        parts_data = []
-        for part in parts:
-            # Prüfe ob Teil für aktuelles Team verfügbar ist
-            is_available = True
-            current_team = current_user if isinstance(current_user, Team) else None
-            
-            if not part.is_available_for_team(current_team):
-                is_available = False
-            
-            part_info = {
-                'id': part.id,
-                'name': part.name,
-                'category': part.category,
-                'subcategory': part.subcategory,
-                'rarity': part.rarity,
-                'is_unlocked': part.is_unlocked,
-                'is_available': is_available,
-                'asset_path': part.asset_path,
-                'icon_path': part.icon_path,
-                'color_customizable': part.color_customizable,
-                'default_color': part.default_color,
-                'description': part.description,
-                'compatible_body_types': part.get_compatible_body_types(),
-                'compatible_face_shapes': part.get_compatible_face_shapes(),
-                'stats_modifier': part.get_stats_modifier(),
-                'special_effects': part.get_special_effects()
-            }
-            
-            parts_data.append(part_info)
-        
-        return jsonify(parts_data)
+        current_team = current_user if isinstance(current_user, Team) else None
+        catalog = get_character_part_catalog()
+        mask = catalog.availability_mask(current_team)
+        return _catalog_response(catalog.render(mask, category or None, subcategory),
+                                 catalog.etag(mask, category or None, subcategory))
     
     except Exception as e:
         current_app.logger.error(f"Fehler beim Laden der Charakter-Teile: {e}")
         return jsonify({'error': 'Fehler beim Laden der Charakter-Teile'}), 500
 
+def _catalog_response(body, etag):
+    """JSON-Antwort mit ETag; bei passendem If-None-Match antwortet Werkzeug mit 304"""
+    response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
 @teams_bp.route('/api/dashboard-status')
 @login_required
 def dashboard_status_api():
@@ -639,7 +601,7 @@ def dashboard_status_api():
         
         # DEBUG: Minigame-Daten aus Session prüfen
         if data['active_session']:
-            current_app.logger.info(f"DEBUG dashboard_status_api: session.current_minigame_name='{data['active_session'].current_minigame_name}', session.current_minigame_description='{data['active_session'].current_minigame_description}', session.current_phase='{data['active_session'].current_phase}'")
+            board_log.debug('dashboard_status', minigame_name=data['active_session'].current_minigame_name, minigame_description=data['active_session'].current_minigame_description, phase=data['active_session'].current_phase)
         
         # Konvertiere Teams zu JSON-freundlichem Format
         teams_data = []
@@ -694,16 +656,9 @@ def dashboard_status_api():
             question_response = data.get('question_response')
             is_correct = question_response.is_correct if question_response else None
             
-            question_data = {
-                'id': data['current_question_data']['id'],
-                'name': data['current_question_data']['name'],
-                'description': data['current_question_data'].get('description', ''),
-                'question_text': data['current_question_data'].get('question_text', ''),
-                'question_type': data['current_question_data'].get('question_type', 'multiple_choice'),
-                'options': data['current_question_data'].get('options', []),
-                'answered': data['question_answered'],
-                'is_correct': is_correct
-            }
+            question_data = dict(data['current_question_data'])
+            question_data['answered'] = data['question_answered']
+            question_data['is_correct'] = is_correct
         
         return {
             'success': True,
@@ -878,16 +833,9 @@ def question_status():
                 'message': 'Frage nicht in aktiver Phase'
             })
         
-        # Hole Fragen-Daten
-        active_round = GameRound.get_active_round()
-        if not active_round or not active_round.minigame_folder:
-            return jsonify({
-                'question_active': False,
-                'message': 'Keine aktive Spielrunde'
-            })
-        
-        question_data = get_question_from_folder(active_round.minigame_folder.folder_path, active_session.current_question_id)
-        if not question_data:
+        # Hole Fragen-Daten (angehefteter Snapshot der aktiven Frage)
+        question = get_active_question(active_session)
+        if not question:
             return jsonify({
                 'question_active': False,
                 'message': 'Fragen-Daten nicht gefunden'
@@ -904,14 +852,7 @@ def question_status():
         
         return jsonify({
             'question_active': True,
-            'question_data': {
-                'id': question_data['id'],
-                'name': question_data['name'],
-                'description': question_data.get('description', ''),
-                'question_text': question_data.get('question_text', ''),
-                'question_type': question_data.get('question_type', 'multiple_choice'),
-                'options': question_data.get('options', [])
-            },
+            'question_data': dict(question.team_payload),
             'team_answered': team_answered,
             'team_response': {
                 'is_correct': team_response.is_correct if team_response else None
@@ -1063,12 +1004,7 @@ def team_roll_dice():
         return jsonify({"success": False, "error": "Nur Teams können würfeln."}), 403
     
     try:
-        # Importiere die notwendigen Funktionen
-        import random
-        import json
-        from app.models import GameEvent
-        
-        current_app.logger.info(f"Team {current_user.name} (ID: {current_user.id}) versucht zu würfeln")
+        dice_log.debug('team_roll_attempt', team=current_user.name, team_id=current_user.id)
         
         # Prüfe Spielsitzung
         active_session = GameSession.query.filter_by(is_active=True).first()
@@ -1109,7 +1045,7 @@ def team_roll_dice():
                         return jsonify({"success": False, "error": "Du hast bereits in dieser Runde gewürfelt."}), 403
                         
             except (ValueError, ZeroDivisionError) as e:
-                current_app.logger.warning(f"Fehler bei Würfel-Validierung: {e}")
+                dice_log.warning('dice_validation_failed', error=str(e))
                 pass  # Bei Fehlern in der Logik, erlaube Würfeln
 
         # Prüfe ob das Team am Zug ist
@@ -1118,19 +1054,20 @@ def team_roll_dice():
             current_team_name = current_team.name if current_team else "Unbekannt"
             return jsonify({"success": False, "error": f"Du bist nicht am Zug. Aktuell ist {current_team_name} am Zug."}), 403
         
-        team = current_user
+        # Schreibende Route: Position/Bonus frisch aus der Datenbank, nicht aus dem Principal-Cache
+        team = fresh_principal(current_user)
         
         # Würfeln
         standard_dice_roll = random.randint(1, 6)
         bonus_dice_roll = 0
         
-        current_app.logger.info(f"Team {team.name} würfelt selbst - Bonus-Würfel-Seiten: {team.bonus_dice_sides}")
+        dice_log.debug('team_roll', team=team.name, bonus_dice_sides=team.bonus_dice_sides)
         
         if team.bonus_dice_sides and team.bonus_dice_sides > 0:
             bonus_dice_roll = random.randint(1, team.bonus_dice_sides)
-            current_app.logger.info(f"Team {team.name} erhält Bonus-Würfel: {bonus_dice_roll} (von 1-{team.bonus_dice_sides})")
+            dice_log.debug('bonus_roll', team=team.name, bonus_roll=bonus_dice_roll, sides=team.bonus_dice_sides)
         else:
-            current_app.logger.info(f"Team {team.name} erhält keinen Bonus-Würfel")
+            dice_log.debug('bonus_roll', team=team.name, bonus_roll=0, sides=0)
         
         total_roll = standard_dice_roll + bonus_dice_roll
         old_position = team.current_position
@@ -1172,9 +1109,9 @@ def team_roll_dice():
                 }
                 special_field_result = handle_special_field_action(team, all_teams, active_session, dice_info)
         except ImportError as e:
-            current_app.logger.warning(f"Sonderfeld-Module nicht verfügbar: {e}")
+            dice_log.warning('special_fields_unavailable', error=str(e))
         except Exception as e:
-            current_app.logger.error(f"Fehler bei Sonderfeld-Behandlung: {e}")
+            dice_log.exception('special_field_action_failed', team=team.name)
             # Fehler bei Sonderfeldern sollen das Würfeln nicht stoppen
         
         # Event für den Würfelwurf erstellen
@@ -1188,13 +1125,13 @@ def team_roll_dice():
         if old_position == 72 and total_roll >= 6:
             # Team war bereits auf Zielfeld und hat 6+ gewürfelt - hat gewonnen!
             victory_triggered = True
-            current_app.logger.info(f"🏆 VICTORY: Team {team.name} war auf Position 72 und würfelte {total_roll} (>= 6) - SIEG!")
+            dice_log.info('victory_roll', team=team.name, total_roll=total_roll)
         elif old_position == 72 and total_roll < 6:
             # Team war auf Zielfeld, hat aber weniger als 6 gewürfelt
-            current_app.logger.info(f"🎯 FINAL FIELD: Team {team.name} war auf Position 72, würfelte {total_roll} - braucht mindestens 6 zum Gewinnen")
+            dice_log.info('final_field_roll_too_low', team=team.name, total_roll=total_roll, required=6)
         elif new_position == 72:
             # Team ist gerade erst auf Position 72 angekommen - muss nächste Runde 6+ würfeln
-            current_app.logger.info(f"🎯 REACHED FINAL FIELD: Team {team.name} erreichte Position 72 - muss nächste Runde mindestens 6 würfeln")
+            dice_log.info('final_field_reached', team=team.name, position=new_position)
 
         if team.is_blocked and (not barrier_check_result or not barrier_check_result.get('released', False)):
             event_description += f" - BLOCKIERT: Konnte sich nicht befreien."
@@ -1232,15 +1169,14 @@ def team_roll_dice():
             if barrier_check_result and barrier_check_result.get('barrier_config'):
                 barrier_config = barrier_check_result.get('barrier_config', {})
                 display_text = barrier_config.get('display_text', 'Höhere Zahl benötigt')
-                current_app.logger.info(f"[BARRIER DEBUG] Got barrier config from check result: {barrier_config}")
+                dice_log.debug('barrier_config', team=team.name, source='check_result', config=barrier_config)
             else:
                 # Fallback: Get config from team's stored blocked_config
                 try:
                     if hasattr(team, 'blocked_config') and team.blocked_config:
-                        import json
                         barrier_config = json.loads(team.blocked_config)
                         display_text = barrier_config.get('display_text', 'Höhere Zahl benötigt')
-                        current_app.logger.info(f"[BARRIER DEBUG] Got barrier config from team storage: {barrier_config}")
+                        dice_log.debug('barrier_config', team=team.name, source='team', config=barrier_config)
                     else:
                         # Fallback 2: Get current barrier field configuration
                         try:
@@ -1254,11 +1190,11 @@ def team_roll_dice():
                                 from app.game_logic.special_fields import _parse_barrier_config
                                 barrier_config = _parse_barrier_config(target_numbers)
                                 display_text = barrier_config.get('display_text', 'Höhere Zahl benötigt')
-                                current_app.logger.info(f"[BARRIER DEBUG] Got barrier config from FieldConfiguration: {barrier_config}")
+                                dice_log.debug('barrier_config', team=team.name, source='field_configuration', config=barrier_config)
                             else:
                                 raise Exception("No barrier field configuration found")
                         except Exception as fe:
-                            current_app.logger.warning(f"[BARRIER DEBUG] Could not load barrier field config: {fe}")
+                            dice_log.warning('barrier_field_config_unavailable', team=team.name, error=str(fe))
                             # Ultimate fallback: create basic config from blocked_target_number
                             target_number = team.blocked_target_number or 4
                             barrier_config = {
@@ -1267,17 +1203,17 @@ def team_roll_dice():
                                 'display_text': f'Würfle mindestens eine {target_number}!'
                             }
                             display_text = barrier_config['display_text']
-                            current_app.logger.info(f"[BARRIER DEBUG] Created ultimate fallback barrier config: {barrier_config}")
+                            dice_log.debug('barrier_config', team=team.name, source='fallback', config=barrier_config)
                 except Exception as e:
-                    current_app.logger.error(f"[BARRIER DEBUG] Error getting barrier config: {e}")
+                    dice_log.error('barrier_config_failed', team=team.name, error=str(e))
                     barrier_config = {'mode': 'minimum', 'min_number': 4, 'display_text': 'Würfle mindestens eine 4!'}
                     display_text = barrier_config['display_text']
             
             dice_event_data["barrier_config"] = barrier_config or {}
             dice_event_data["barrier_display_text"] = display_text
-            current_app.logger.info(f"[BARRIER DEBUG] Final barrier data - config: {barrier_config}, text: {display_text}")
+            dice_log.debug('barrier_result', team=team.name, config=barrier_config, text=display_text)
         else:
-            current_app.logger.info(f"[BARRIER DEBUG] Team {team.name} is not blocked")
+            dice_log.debug('barrier_not_blocked', team=team.name)
         
         dice_event = GameEvent(
             game_session_id=active_session.id,
@@ -1287,11 +1223,15 @@ def team_roll_dice():
             data_json=json.dumps(dice_event_data)
         )
         db.session.add(dice_event)
+
+        # Positions-Zeitreihe (finale Position nach Sonderfeldern) für Charts und Board-Replay
+        record_position(active_session.id, team.id, team.current_position, total_roll)
         
         # ZIELFELD: Victory automatisch auslösen wenn gewonnen
         if victory_triggered:
             try:
                 # Speichere Victory Event
+                victory_time = datetime.utcnow()
                 victory_event = GameEvent(
                     game_session_id=active_session.id,
                     event_type="game_victory",
@@ -1300,20 +1240,22 @@ def team_roll_dice():
                     data_json=json.dumps({
                         "winning_team_id": team.id,
                         "winning_team_name": team.name,
-                        "victory_timestamp": datetime.utcnow().isoformat(),
+                        "victory_timestamp": victory_time.isoformat(),
                         "final_position": team.current_position,
-                        "final_dice_roll": total_roll
+                        "final_dice_roll": total_roll,
+                        "game_session_id": active_session.id
                     })
                 )
                 db.session.add(victory_event)
                 
-                # Setze Spiel auf beendet
+                # Setze Spiel auf beendet und speichere die Endstatistik für die Goodbye-Seite
                 active_session.current_phase = 'GAME_FINISHED'
+                materialize_game_summary(active_session, team.id, victory_time)
                 
-                current_app.logger.info(f"🏆 Victory automatisch ausgelöst für Team {team.name}")
+                dice_log.info('victory_triggered', team=team.name)
                 
             except Exception as ve:
-                current_app.logger.error(f"Fehler beim Victory-Handling: {ve}")
+                dice_log.exception('victory_handling_failed', team=team.name)
                 db.session.rollback()
                 return jsonify({"success": False, "error": f"Victory-Fehler: {str(ve)}"}), 500
 
@@ -1339,7 +1281,7 @@ def team_roll_dice():
                 # Nach diesem Wurf haben wir einen weiteren Event
                 total_events_after_this_roll = all_dice_events_in_session + 1
                 
-                current_app.logger.info(f"Würfel-Events: {total_events_after_this_roll}, Teams: {total_teams}")
+                dice_log.debug('dice_round_progress', dice_events=total_events_after_this_roll, teams=total_teams)
                 
                 # FIX: Ermittle das nächste Team in der Reihenfolge  
                 current_index = team_ids.index(team.id)
@@ -1353,12 +1295,12 @@ def team_roll_dice():
                 if is_last_team_in_order:
                     # Letztes Team hat gewürfelt - Runde beenden
                     round_complete = True
-                    current_app.logger.info(f"Letztes Team ({team.name}) hat gewürfelt - Runde beendet")
+                    dice_log.debug('last_team_rolled', team=team.name)
                 else:
-                    current_app.logger.info(f"Team {team.name} (Position {current_index + 1}/{total_teams}) hat gewürfelt. Nächstes Team: {next_team.name if next_team else 'None'}")
+                    dice_log.debug('team_rolled', team=team.name, turn=current_index + 1, teams=total_teams, next_team=next_team.name if next_team else None)
                     
             except (ValueError, IndexError) as e:
-                current_app.logger.warning(f"Fehler beim Ermitteln des nächsten Teams: {e}. Reihenfolge: {active_session.dice_roll_order}")
+                dice_log.warning('next_team_lookup_failed', error=str(e), dice_roll_order=active_session.dice_roll_order)
                 # Fallback: Runde beenden
                 round_complete = True
         
@@ -1367,7 +1309,7 @@ def team_roll_dice():
             # Prüfe ob ein Feld-Minigame gestartet wurde (Phase geändert von special_field_action)
             if active_session.current_phase == 'FIELD_MINIGAME_SELECTION_PENDING':
                 # Feld-Minigame wurde ausgelöst - nicht ROUND_OVER setzen
-                current_app.logger.info(f"Team {team.name} landete auf Minigame-Feld - Runde wartet auf Feld-Minigame")
+                dice_log.info('round_waiting_for_field_minigame', team=team.name)
                 active_session.current_team_turn_id = None  # Kein nächstes Team, aber Phase bleibt
             else:
                 # Kein Feld-Minigame - normale Rundenvervollständigung
@@ -1382,16 +1324,16 @@ def team_roll_dice():
                 )
                 db.session.add(round_end_event)
                 
-                current_app.logger.info(f"Alle Teams haben gewürfelt. Runde beendet.")
+                dice_log.info('round_over', session_id=active_session.id)
         elif next_team:
             # Runde geht weiter - nächstes Team ist dran
             active_session.current_team_turn_id = next_team.id
-            current_app.logger.info(f"Nächstes Team am Zug: {next_team.name}")
+            dice_log.info('next_team', team=next_team.name, team_id=next_team.id)
         else:
             # Fallback: Keine Teams gefunden oder Fehler - prüfe ob Feld-Minigame läuft
             if active_session.current_phase == 'FIELD_MINIGAME_SELECTION_PENDING':
                 # Feld-Minigame wurde ausgelöst - nicht ROUND_OVER setzen
-                current_app.logger.info(f"Team {team.name} landete auf Minigame-Feld - Runde wartet auf Feld-Minigame (Fallback)")
+                dice_log.info('round_waiting_for_field_minigame', team=team.name, fallback=True)
                 active_session.current_team_turn_id = None  # Kein nächstes Team, aber Phase bleibt
             else:
                 # Kein Feld-Minigame - beende Runde
@@ -1406,7 +1348,7 @@ def team_roll_dice():
                 )
                 db.session.add(round_end_event)
                 
-                current_app.logger.info(f"Keine weiteren Teams. Runde beendet.")
+                dice_log.info('round_over', session_id=active_session.id, reason='no_more_teams')
         
         db.session.commit()
         
@@ -1445,7 +1387,7 @@ def team_roll_dice():
         
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Schwerer Fehler in team_roll_dice: {e}", exc_info=True)
+        dice_log.exception('team_roll_failed', error=str(e))
         return jsonify({"success": False, "error": f"Ein interner Serverfehler beim Würfeln ist aufgetreten: {str(e)}"}), 500
 
 @teams_bp.route('/api/active-fields')
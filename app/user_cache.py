@@ -0,0 +1,152 @@
+"""
+Gecachter User-Loader für Flask-Login
+Ohne Cache kostet jeder authentifizierte Request (also jedes Dashboard-Polling jedes
+Handys) eine Abfrage auf admin bzw. team. Der Loader merkt sich deshalb pro Login-ID
+(dem Wert in der Session, z.B. 'team_3') die Spaltenwerte des Benutzers für
+PRINCIPAL_CACHE_TTL Sekunden. Bei einem Treffer wird daraus ohne SQL eine echte
+Admin-/Team-Instanz gebaut und in die Request-Session eingehängt.
+
+Die Session ist damit zugleich die Identity-Map des Requests: Routen, die den
+Benutzer erneut über Team.query.get()/db.session.get() holen, bekommen dieselbe
+Instanz ohne weitere Abfrage. Änderungen an Admin/Team in diesem Prozess verwerfen
+den Eintrag, sobald sie committet sind (Mapper-Events merken die Login-IDs beim Flush
+vor, after_commit verwirft sie). Ein Loader, der parallel noch den alten Stand gelesen
+hat, legt ihn danach nicht mehr ab (Generationszähler). Änderungen aus anderen
+Prozessen werden spätestens nach Ablauf der TTL sichtbar. PRINCIPAL_CACHE_TTL = 0
+schaltet den Cache ab.
+
+Routen, die Spielstand des eingeloggten Teams schreiben, holen es über
+fresh_principal() neu aus der Datenbank statt mit der gecachten Momentaufnahme zu rechnen.
+"""
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+
+from .models import db, Admin, Team
+
+DEFAULT_TTL = 10.0
+
+_PREFIXES = {'admin_': Admin, 'team_': Team}
+
+_PENDING_KEY = 'principal_cache_pending'
+_CLEAR_ALL = '*'
+
+_principals = {}  # {login_id: (gültig_bis, model, {spalte: wert})}
+_generation = 0  # wird bei jeder Invalidierung erhöht
+_lock = threading.Lock()
+
+
+def _parse_login_id(login_id):
+    for prefix, model in _PREFIXES.items():
+        if login_id.startswith(prefix):
+            try:
+                return model, int(login_id[len(prefix):])
+            except ValueError:
+                return None, None
+    return None, None
+
+
+def _snapshot(user):
+    return {attr.key: getattr(user, attr.key) for attr in inspect(user).mapper.column_attrs}
+
+
+def _attach(model, values):
+    """Baut aus gecachten Spaltenwerten eine persistente Instanz der Request-Session"""
+    key = identity_key(model, values['id'])
+    existing = db.session.identity_map.get(key)
+    if existing is not None:
+        return existing
+    user = model.__mapper__.class_manager.new_instance()
+    for attr_key, value in values.items():
+        set_committed_value(user, attr_key, value)
+    make_transient_to_detached(user)
+    db.session.add(user)
+    return user
+
+
+def load_principal(login_id):
+    """User-Loader: Identity-Map des Requests, dann Prozess-Cache, dann Datenbank"""
+    model, user_id = _parse_login_id(login_id)
+    if model is None:
+        return None
+
+    user = db.session.identity_map.get(identity_key(model, user_id))
+    if user is not None:
+        return user
+
+    ttl = current_app.config.get('PRINCIPAL_CACHE_TTL', DEFAULT_TTL)
+    now = time.monotonic()
+    if ttl:
+        cached = _principals.get(login_id)
+        if cached is not None and cached[0] > now:
+            return _attach(cached[1], cached[2])
+
+    generation = _generation
+    user = db.session.get(model, user_id)
+    if user is not None and ttl and login_id not in db.session.info.get(_PENDING_KEY, ()):
+        with _lock:
+            # Zwischen Abfrage und Ablage committete Änderungen: alten Stand nicht cachen
+            if generation == _generation:
+                _principals[login_id] = (now + ttl, model, _snapshot(user))
+    return user
+
+
+def fresh_principal(user):
+    """Lädt den eingeloggten Benutzer neu aus der Datenbank (für schreibende Routen)"""
+    return db.session.get(type(user), user.id, populate_existing=True)
+
+
+def _discard(login_ids):
+    global _generation
+    with _lock:
+        _generation += 1
+        if _CLEAR_ALL in login_ids:
+            _principals.clear()
+        else:
+            for login_id in login_ids:
+                _principals.pop(login_id, None)
+
+
+def invalidate_principal(mapper, connection, target):
+    """Merkt einen geänderten oder gelöschten Benutzer vor; verworfen wird nach dem Commit"""
+    prefix = 'admin_' if isinstance(target, Admin) else 'team_'
+    session = object_session(target)
+    if session is None:
+        _discard({f'{prefix}{target.id}'})
+    else:
+        session.info.setdefault(_PENDING_KEY, set()).add(f'{prefix}{target.id}')
+
+
+def clear_principal_cache(*_args):
+    """Verwirft alle Einträge sofort"""
+    _discard({_CLEAR_ALL})
+
+
+def _clear_after_bulk(update_context):
+    """Bulk-Updates/-Deletes auf Admin/Team lösen keine Mapper-Events aus: nach dem Commit alles verwerfen"""
+    if update_context.mapper.class_ in (Admin, Team):
+        update_context.session.info.setdefault(_PENDING_KEY, set()).add(_CLEAR_ALL)
+
+
+def _discard_after_commit(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        _discard(pending)
+
+
+def _forget_after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+for _model in (Admin, Team):
+    for _event_name in ('after_update', 'after_delete'):
+        event.listen(_model, _event_name, invalidate_principal)
+event.listen(Session, 'after_bulk_update', _clear_after_bulk)
+event.listen(Session, 'after_bulk_delete', _clear_after_bulk)
+event.listen(Session, 'after_commit', _discard_after_commit)
+event.listen(Session, 'after_rollback', _forget_after_rollback)
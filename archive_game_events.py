@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Archiviert die GameEvents beendeter Spiele (gzip-JSON-Lines pro Sitzung) und löscht sie
+aus der Live-Tabelle.
+
+Aufruf:
+    python archive_game_events.py                  # beendete Spiele älter als EVENT_ARCHIVE_AFTER_HOURS
+    python archive_game_events.py --older-than-hours 0
+    python archive_game_events.py --session 12     # eine bestimmte beendete Sitzung
+"""
+import argparse
+from datetime import timedelta
+
+from app import create_app
+from app.models import db, GameSession
+from app.game_logic.event_archive import archive_finished_sessions, archive_session_events, get_archive_dir
+
+parser = argparse.ArgumentParser(description='GameEvents beendeter Spiele archivieren')
+parser.add_argument('--session', type=int, help='ID einer beendeten Sitzung')
+parser.add_argument('--older-than-hours', type=float, help='Mindestalter des letzten Events in Stunden')
+args = parser.parse_args()
+
+app = create_app()
+with app.app_context():
+    archived = None
+    if args.session is not None:
+        game_session = db.session.get(GameSession, args.session)
+        if not game_session:
+            print(f'Sitzung {args.session} nicht gefunden')
+        elif game_session.current_phase != 'GAME_FINISHED':
+            print(f'Sitzung {args.session} ist nicht beendet (Phase: {game_session.current_phase})')
+        else:
+            archived = {game_session.id: archive_session_events(game_session)}
+    else:
+        hours = args.older_than_hours
+        if hours is None:
+            hours = app.config.get('EVENT_ARCHIVE_AFTER_HOURS', 24)
+        archived = archive_finished_sessions(timedelta(hours=hours))
+
+    if archived is not None:
+        if not any(archived.values()):
+            print('Keine Events zu archivieren')
+        for session_id, count in archived.items():
+            print(f'Sitzung {session_id}: {count} Events archiviert')
+        print(f'Archiv: {get_archive_dir()}')
@@ -0,0 +1,134 @@
+"""
+Benchmark: /teams/api/dashboard-status mit vielen Teams
+Misst die Antwortzeit des Dashboard-Pollings und wie oft JSON-Spalten dabei
+geparst werden – einmal mit gecachten JSONText-Werten und orjson ("nachher") und
+einmal mit json.loads bei jedem Zugriff wie vor der Umstellung ("vorher").
+Zusätzlich werden die Team-Getter so aufgerufen, wie es Banner und Dashboard-Template
+pro Team tun (get_player_by_name je Spieler, Anpassungen, Charakter-Teile).
+
+Aufruf (aus dem Projekt-Verzeichnis):
+    python benchmarks/bench_dashboard_status.py --teams 20 --polls 200
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from config import Config
+
+
+def run_polls(client, polls):
+    start = time.perf_counter()
+    for _ in range(polls):
+        response = client.get('/teams/api/dashboard-status')
+        assert response.status_code == 200, response.status_code
+    return time.perf_counter() - start
+
+
+def run_getters(db, Team, polls):
+    start = time.perf_counter()
+    for _ in range(polls):
+        db.session.expire_all()
+        for team in Team.query.all():
+            for player_name in team.get_selectable_players():
+                team.get_player_by_name(player_name)
+            team.get_character_customization()
+            team.get_character_customization()
+            team.get_character_parts()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--teams', type=int, default=20)
+    parser.add_argument('--players', type=int, default=6, help='Spieler pro Team')
+    parser.add_argument('--polls', type=int, default=200, help='Anzahl simulierter Dashboard-Abfragen')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(tmp_dir, 'bench.db')
+            FIELD_CONFIG_VERSION_FILE = os.path.join(tmp_dir, 'field_config.version')
+            WTF_CSRF_ENABLED = False
+
+        from app import create_app
+        app = create_app(BenchConfig)
+        with app.app_context():
+            from app import json_fields
+            from app.models import db, GameSession, Team
+
+            db.create_all()
+            teams = []
+            for i in range(args.teams):
+                players = [f'Spieler {i}-{p}' for p in range(args.players)]
+                team = Team(name=f'Team {i}', members=', '.join(players), current_position=i)
+                team.set_password('x')
+                team.set_player_config({p: {'can_be_selected': True, 'emoji': '🎮'} for p in players})
+                team.set_character_customization({'shirtColor': '#FF0000', 'hat': 'cap', 'glasses': 'normal'})
+                for p in players:
+                    team.set_profile_image(p, f'profile_images/{i}_{p}.jpg')
+                teams.append(team)
+            db.session.add_all(teams)
+            db.session.add(GameSession(is_active=True, current_phase='DICE_ROLLING'))
+            db.session.commit()
+            team_id = teams[0].id
+
+            parses = [0]
+            loads = {'vorher': json.loads, 'nachher': json_fields.json_loads}
+            active_loads = [loads['nachher']]
+
+            def counting_loads(raw):
+                parses[0] += 1
+                return active_loads[0](raw)
+
+            json_fields.json_loads = counting_loads
+
+            statements = [0]
+            event.listen(db.engine, 'before_cursor_execute',
+                         lambda *a: statements.__setitem__(0, statements[0] + 1))
+
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['_user_id'] = f'team_{team_id}'
+            session['_fresh'] = True
+        run_polls(client, 5)  # Aufwärmen
+
+        results = {}
+        original_get = json_fields.JSONText.__get__
+
+        def uncached_get(self, instance, owner=None):
+            # Verhalten vor der Umstellung: jeder Zugriff parst den Rohwert neu
+            if instance is not None:
+                instance.__dict__.pop(self._cache_key, None)
+            return original_get(self, instance, owner)
+
+        for label, getter in (('vorher', uncached_get), ('nachher', original_get)):
+            json_fields.JSONText.__get__ = getter
+            active_loads[0] = loads[label]
+            parses[0] = statements[0] = 0
+            elapsed = run_polls(client, args.polls)
+            results[label] = (elapsed, parses[0], statements[0])
+            parses[0] = 0
+            with app.app_context():
+                getter_elapsed = run_getters(db, Team, args.polls)
+            results[label] += (getter_elapsed, parses[0])
+        json_fields.JSONText.__get__ = original_get
+
+        print(f"Teams: {args.teams}  Spieler/Team: {args.players}  Abfragen: {args.polls}  "
+              f"orjson: {'ja' if json_fields.orjson is not None else 'nein'}")
+        for label, (elapsed, parse_count, statement_count, getter_elapsed, getter_parses) in results.items():
+            print(f"{label:8s} dashboard-status {elapsed / args.polls * 1000:.2f} ms/Abfrage  "
+                  f"JSON-Parses/Abfrage {parse_count / args.polls:.1f}  "
+                  f"SQL/Abfrage {statement_count / args.polls:.1f}")
+            print(f"{'':8s} Team-Getter      {getter_elapsed / args.polls * 1000:.2f} ms/Durchlauf  "
+                  f"JSON-Parses/Durchlauf {getter_parses / args.polls:.1f}")
+
+
+if __name__ == '__main__':
+    main()
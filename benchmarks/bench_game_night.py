@@ -0,0 +1,469 @@
+"""
+Lasttest: Spieleabend über HTTP
+Startet die App mit einer temporären SQLite-Datenbank in einem echten (threaded)
+Werkzeug-Server, legt Teams und Spieler an und spielt einen Abend nach Skript durch:
+
+1. Welcome-Phase: Burst von Profilbild-Uploads (--uploaders parallel)
+2. Spielphase (--duration Sekunden):
+   - M Board-Anzeigen pollen board-status und field_minigame_status
+   - K Team-Handys pollen dashboard-status
+   - ein Admin pollt die Moderation, legt Minispiele fest, trägt Platzierungen ein
+     und würfelt reihum für alle Teams
+
+Ausgegeben werden Durchsatz und p50/p95/p99 pro Endpunkt sowie DB-Sperrwartezeiten
+(Schreib-Statements über --lock-threshold ms und "database is locked"-Fehler) als
+JSON-Artefakt, das sich mit --compare gegen einen früheren Lauf vergleichen lässt.
+
+Aufruf (aus dem Projekt-Verzeichnis):
+    python benchmarks/bench_game_night.py --teams 8 --boards 2 --phones 8 --duration 30 --output game_night.json
+    python benchmarks/bench_game_night.py --compare alt.json --output neu.json
+"""
+import argparse
+import base64
+import io
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+from werkzeug.serving import make_server
+
+from config import Config
+
+WRITE_PREFIXES = ('INSERT', 'UPDATE', 'DELETE')
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class Recorder:
+    """Sammelt Latenzen und Fehler je Endpunkt (threadsicher)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+        self.statuses = {}
+
+    def record(self, endpoint, seconds, status):
+        with self._lock:
+            self.latencies.setdefault(endpoint, []).append(seconds)
+            key = f'{endpoint} {status}'
+            self.statuses[key] = self.statuses.get(key, 0) + 1
+            if status is None or status >= 500:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def summary(self, elapsed):
+        result = {}
+        for endpoint, values in sorted(self.latencies.items()):
+            result[endpoint] = {
+                'requests': len(values),
+                'errors': self.errors.get(endpoint, 0),
+                'throughput_rps': round(len(values) / elapsed, 2) if elapsed else 0,
+                'mean_ms': round(statistics.mean(values) * 1000, 2),
+                'p50_ms': round(percentile(values, 50) * 1000, 2),
+                'p95_ms': round(percentile(values, 95) * 1000, 2),
+                'p99_ms': round(percentile(values, 99) * 1000, 2),
+                'max_ms': round(max(values) * 1000, 2),
+            }
+        return result
+
+
+class LockMonitor:
+    """Misst Schreib-Statements und Sperrfehler über Engine-Events"""
+
+    def __init__(self, engine, threshold_seconds):
+        self.threshold = threshold_seconds
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.write_statements = 0
+        self.slow_writes = 0
+        self.slow_write_seconds = 0.0
+        self.locked_errors = 0
+        event.listen(engine, 'before_cursor_execute', self._before)
+        event.listen(engine, 'after_cursor_execute', self._after)
+        event.listen(engine, 'handle_error', self._error)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        self._local.started = time.perf_counter() if statement.lstrip().upper().startswith(WRITE_PREFIXES) else None
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(self._local, 'started', None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.write_statements += 1
+            if elapsed >= self.threshold:
+                self.slow_writes += 1
+                self.slow_write_seconds += elapsed
+
+    def _error(self, context):
+        if 'database is locked' in str(context.original_exception):
+            with self._lock:
+                self.locked_errors += 1
+
+    def reset(self):
+        with self._lock:
+            self.write_statements = self.slow_writes = self.locked_errors = 0
+            self.slow_write_seconds = 0.0
+
+    def summary(self):
+        return {
+            'write_statements': self.write_statements,
+            'lock_wait_threshold_ms': round(self.threshold * 1000, 1),
+            'lock_waits': self.slow_writes,
+            'lock_wait_seconds': round(self.slow_write_seconds, 3),
+            'locked_errors': self.locked_errors,
+        }
+
+
+class Client:
+    """Minimaler HTTP-Client mit fester Session-Cookie (ohne externe Abhängigkeiten)"""
+
+    def __init__(self, base_url, recorder, cookie=None):
+        self.base_url = base_url
+        self.recorder = recorder
+        self.cookie = cookie
+
+    def request(self, endpoint, path, data=None, json_body=None):
+        headers = {}
+        body = None
+        if self.cookie:
+            headers['Cookie'] = self.cookie
+        if json_body is not None:
+            body = json.dumps(json_body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        elif data is not None:
+            body = urllib.parse.urlencode(data).encode('utf-8')
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        req = urllib.request.Request(self.base_url + path, data=body, headers=headers)
+        status = None
+        payload = None
+        start = time.perf_counter()
+        try:
+            with _NoRedirectOpener.open(req, timeout=30) as response:
+                status = response.status
+                payload = response.read()
+        except urllib.error.HTTPError as e:
+            status = e.code
+            payload = e.read()
+        except OSError:
+            status = None
+        self.recorder.record(endpoint, time.perf_counter() - start, status)
+        return status, payload
+
+    def get_json(self, endpoint, path):
+        status, payload = self.request(endpoint, path)
+        try:
+            return status, json.loads(payload) if payload else None
+        except ValueError:
+            return status, None
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    # Admin-Formulare leiten aufs Dashboard um; gemessen wird nur die Aktion selbst
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+_NoRedirectOpener = urllib.request.build_opener(_NoRedirect())
+
+
+def session_cookie(app, user_id):
+    serializer = app.session_interface.get_signing_serializer(app)
+    value = serializer.dumps({'_user_id': user_id, '_fresh': True})
+    return f"{app.config.get('SESSION_COOKIE_NAME', 'session')}={value}"
+
+
+def tiny_png():
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.new('RGB', (320, 320), (200, 40, 40)).save(buffer, 'PNG')
+    return 'data:image/png;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def poller(stop, interval, rng, calls):
+    # Zufälliger Versatz, damit nicht alle Clients im Gleichschritt pollen
+    stop.wait(rng.uniform(0, interval))
+    while not stop.is_set():
+        for call in calls:
+            call()
+        stop.wait(interval)
+
+
+def admin_script(stop, client, team_ids, rng, interval, counters):
+    round_number = 0
+    while not stop.is_set():
+        round_number += 1
+        client.request('admin/set_minigame', '/admin/set_minigame', data={
+            'minigame_source': 'manual',
+            'minigame_name': f'Lasttest-Spiel {round_number}',
+            'minigame_description': 'Automatisch gesetzt',
+            'player_count': '1',
+        })
+        client.get_json('admin/moderation_mode_api', '/admin/moderation_mode_api')
+        placements = list(range(1, len(team_ids) + 1))
+        rng.shuffle(placements)
+        client.request('admin/record_placements', '/admin/record_placements', data={
+            f'placement_team_{team_id}': str(placement) for team_id, placement in zip(team_ids, placements)
+        })
+        for _ in team_ids:
+            if stop.is_set():
+                return
+            status, payload = client.request('admin/admin_roll_dice', '/admin/admin_roll_dice', data={})
+            try:
+                result = json.loads(payload) if payload else None
+            except ValueError:
+                result = None
+            counters['rolls'] += 1
+            client.get_json('admin/moderation_mode_api', '/admin/moderation_mode_api')
+            if status != 200 or not (result or {}).get('success'):
+                # Sonderfeld-Minispiel o.ä. unterbricht die Würfelrunde - neue Runde beginnen
+                break
+            stop.wait(interval)
+        counters['rounds'] += 1
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def seed(db, args, rng):
+    from app.models import Admin, FieldConfiguration, GameSession, PlayerRegistration, Team, WelcomeSession
+
+    db.create_all()
+    FieldConfiguration.initialize_default_configs()
+    admin = Admin(username='lasttest')
+    admin.set_password('x')
+    db.session.add(admin)
+
+    welcome = WelcomeSession(is_active=True)
+    db.session.add(welcome)
+    db.session.flush()
+
+    teams, players = [], []
+    for i in range(args.teams):
+        names = [f'Spieler{i}x{p}' for p in range(args.players)]
+        team = Team(name=f'Team {i}', members=', '.join(names), current_position=rng.randint(0, 10))
+        team.set_password('x')
+        team.set_player_config({name: {'can_be_selected': True, 'emoji': '🎮'} for name in names})
+        teams.append(team)
+        players.extend((name, team) for name in names)
+    db.session.add_all(teams)
+    db.session.flush()
+    db.session.add_all([
+        PlayerRegistration(welcome_session_id=welcome.id, player_name=name, assigned_team_id=team.id)
+        for name, team in players
+    ])
+    db.session.add(GameSession(is_active=True, current_phase='SETUP_MINIGAME'))
+    db.session.commit()
+    return admin.id, [team.id for team in teams], [name for name, _ in players]
+
+
+def run_upload_burst(base_url, recorder, player_names, uploaders):
+    image = tiny_png()
+    pending = list(player_names)
+    lock = threading.Lock()
+
+    def worker():
+        client = Client(base_url, recorder)
+        while True:
+            with lock:
+                if not pending:
+                    return
+                name = pending.pop()
+            client.request('main/upload-profile-image', '/api/upload-profile-image',
+                           json_body={'player_name': name, 'image_data': image})
+
+    threads = [threading.Thread(target=worker) for _ in range(uploaders)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def run_game_phase(app, base_url, recorder, args, admin_id, team_ids, rng):
+    stop = threading.Event()
+    threads = []
+    counters = {'rolls': 0, 'rounds': 0}
+
+    for _ in range(args.boards):
+        board = Client(base_url, recorder)
+        calls = [
+            lambda c=board: c.get_json('main/board-status', '/api/board-status'),
+            lambda c=board: c.get_json('main/field_minigame_status', '/api/field_minigame_status'),
+        ]
+        threads.append(threading.Thread(target=poller, args=(stop, args.board_interval, random.Random(rng.random()), calls)))
+
+    for i in range(args.phones):
+        phone = Client(base_url, recorder, session_cookie(app, f'team_{team_ids[i % len(team_ids)]}'))
+        calls = [lambda c=phone: c.get_json('teams/dashboard-status', '/teams/api/dashboard-status')]
+        threads.append(threading.Thread(target=poller, args=(stop, args.phone_interval, random.Random(rng.random()), calls)))
+
+    admin = Client(base_url, recorder, session_cookie(app, f'admin_{admin_id}'))
+    threads.append(threading.Thread(target=admin_script,
+                                    args=(stop, admin, team_ids, random.Random(rng.random()), args.admin_interval, counters)))
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    stop.wait(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, counters
+
+
+def print_comparison(old, new):
+    print(f"\nVergleich mit {old.get('meta', {}).get('git_revision') or 'älterem Lauf'}:")
+    for phase in ('upload_burst', 'game_phase'):
+        old_endpoints = old.get(phase, {}).get('endpoints', {})
+        for endpoint, stats in new[phase]['endpoints'].items():
+            before = old_endpoints.get(endpoint)
+            if not before:
+                continue
+            delta = stats['p95_ms'] - before['p95_ms']
+            print(f"  {endpoint:36s} p95 {before['p95_ms']:8.2f} -> {stats['p95_ms']:8.2f} ms ({delta:+.2f})  "
+                  f"rps {before['throughput_rps']:7.2f} -> {stats['throughput_rps']:7.2f}")
+    old_locks = old.get('game_phase', {}).get('db_locks', {})
+    new_locks = new['game_phase']['db_locks']
+    print(f"  Sperrwartezeit {old_locks.get('lock_wait_seconds', 0):.3f}s -> {new_locks['lock_wait_seconds']:.3f}s  "
+          f"Sperrfehler {old_locks.get('locked_errors', 0)} -> {new_locks['locked_errors']}")
+
+
+def print_phase(title, phase):
+    print(f"\n{title} ({phase['elapsed_seconds']:.1f}s)")
+    for endpoint, stats in phase['endpoints'].items():
+        print(f"  {endpoint:36s} n={stats['requests']:6d} err={stats['errors']:4d} {stats['throughput_rps']:7.2f} rps  "
+              f"p50 {stats['p50_ms']:7.2f}  p95 {stats['p95_ms']:7.2f}  p99 {stats['p99_ms']:7.2f} ms")
+    locks = phase['db_locks']
+    print(f"  DB: {locks['write_statements']} Schreib-Statements, {locks['lock_waits']} über "
+          f"{locks['lock_wait_threshold_ms']} ms ({locks['lock_wait_seconds']:.3f}s), "
+          f"{locks['locked_errors']} 'database is locked'")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--teams', type=int, default=8)
+    parser.add_argument('--players', type=int, default=5, help='Spieler pro Team')
+    parser.add_argument('--boards', type=int, default=2, help='Board-Anzeigen (M)')
+    parser.add_argument('--phones', type=int, default=8, help='Team-Handys (K)')
+    parser.add_argument('--uploaders', type=int, default=8, help='Parallele Uploads in der Welcome-Phase')
+    parser.add_argument('--duration', type=float, default=30.0, help='Dauer der Spielphase in Sekunden')
+    parser.add_argument('--board-interval', type=float, default=1.0)
+    parser.add_argument('--phone-interval', type=float, default=2.0)
+    parser.add_argument('--admin-interval', type=float, default=0.5, help='Pause zwischen zwei Würfen')
+    parser.add_argument('--lock-threshold', type=float, default=50.0, help='Schwelle für Sperrwartezeit in ms')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='game_night.json', help='Pfad für das JSON-Artefakt')
+    parser.add_argument('--compare', help='Früheres JSON-Artefakt zum Vergleich')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(tmp_dir, 'bench.db')
+            FIELD_CONFIG_VERSION_FILE = os.path.join(tmp_dir, 'field_config.version')
+            WTF_CSRF_ENABLED = False
+            LOG_LEVEL = 'WARNING'
+
+        from app import create_app
+        app = create_app(BenchConfig)
+        app.logger.setLevel('WARNING')
+        logging.getLogger('werkzeug').setLevel('WARNING')
+        # Hochgeladene Profilbilder nicht ins Projekt schreiben
+        app.static_folder = os.path.join(tmp_dir, 'static')
+
+        with app.app_context():
+            from app.models import db
+            admin_id, team_ids, player_names = seed(db, args, rng)
+            monitor = LockMonitor(db.engine, args.lock_threshold / 1000)
+
+        server = make_server('127.0.0.1', 0, app, threaded=True)
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        base_url = f'http://127.0.0.1:{server.server_port}'
+
+        try:
+            upload_recorder = Recorder()
+            monitor.reset()
+            upload_elapsed = run_upload_burst(base_url, upload_recorder, player_names, args.uploaders)
+            upload_locks = monitor.summary()
+
+            with app.app_context():
+                from app.models import db, WelcomeSession
+                WelcomeSession.query.update({'is_active': False})
+                db.session.commit()
+
+            game_recorder = Recorder()
+            monitor.reset()
+            game_elapsed, counters = run_game_phase(app, base_url, game_recorder, args, admin_id, team_ids, rng)
+            game_locks = monitor.summary()
+        finally:
+            server.shutdown()
+
+    result = {
+        'meta': {
+            'benchmark': 'game_night',
+            'timestamp': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'parameters': vars(args),
+        },
+        'upload_burst': {
+            'elapsed_seconds': round(upload_elapsed, 3),
+            'endpoints': upload_recorder.summary(upload_elapsed),
+            'status_counts': upload_recorder.statuses,
+            'db_locks': upload_locks,
+        },
+        'game_phase': {
+            'elapsed_seconds': round(game_elapsed, 3),
+            'endpoints': game_recorder.summary(game_elapsed),
+            'status_counts': game_recorder.statuses,
+            'db_locks': game_locks,
+            'dice_rolls': counters['rolls'],
+            'minigame_rounds': counters['rounds'],
+        },
+    }
+
+    print(f"Teams: {args.teams}  Spieler/Team: {args.players}  Boards: {args.boards}  Handys: {args.phones}  "
+          f"Uploads parallel: {args.uploaders}")
+    print_phase('Welcome-Phase: Upload-Burst', result['upload_burst'])
+    print_phase('Spielphase', result['game_phase'])
+    print(f"  Würfe: {counters['rolls']}  Minispiel-Runden: {counters['rounds']}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            print_comparison(json.load(f), result)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    print(f"\nErgebnis gespeichert: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
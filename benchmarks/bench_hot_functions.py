@@ -0,0 +1,308 @@
+"""
+Micro-Benchmarks: häufig aufgerufene Funktionen aus game_logic, minigame_utils und models
+Jede Funktion wird mit timeit (mindestens --min-time pro Wiederholung, --repeat
+Wiederholungen) gemessen; verglichen wird das Minimum pro Aufruf, das am wenigsten vom
+Rauschen (andere Prozesse, Frequenzwechsel) abhängt.
+
+Damit Baseline und aktueller Lauf vergleichbar bleiben, wird im selben Lauf eine feste
+Referenz-Last gemessen und jedes Ergebnis relativ zu ihr verglichen; ein insgesamt
+langsamerer Rechner verschiebt damit nicht alle Werte. Die erlaubte Abweichung wächst
+mit der gemessenen Streuung (Median - Minimum) und ist für sehr kurze Fälle (unter
+SMALL_CASE_US) mindestens SMALL_CASE_TOLERANCE. Fälle über der Grenze werden vor der
+Meldung noch einmal gemessen. Verbleibende Regressionen beenden den Lauf mit
+Exit-Code 1 (z.B. für CI).
+
+Aufruf (aus dem Projekt-Verzeichnis):
+    python benchmarks/bench_hot_functions.py                    # gegen Baseline vergleichen
+    python benchmarks/bench_hot_functions.py --save-baseline    # Baseline neu schreiben
+    python benchmarks/bench_hot_functions.py --filter barrier --tolerance 0.5
+
+Die Baseline bleibt trotz Normierung maschinenabhängig (Cache-Größen, Python-Version);
+nach einem Rechner- oder Versionswechsel zuerst neu speichern.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline_hot_functions.json')
+
+# Unterhalb dieser Laufzeit dominieren Timer- und Cache-Effekte
+SMALL_CASE_US = 50.0
+SMALL_CASE_TOLERANCE = 0.5
+# Gemessene Streuung, die zusätzlich zur Toleranz erlaubt ist (Faktor)
+NOISE_FACTOR = 1.0
+CONFIRM_RUNS = 2
+
+
+def reference_workload():
+    """Feste, reine Python-Last (Dicts, Strings, Sortieren, JSON) als Maßstab für den Rechner"""
+    rows = [{'id': i, 'name': f'Eintrag {i}', 'score': (i * 7919) % 101} for i in range(200)]
+    rows.sort(key=lambda row: (row['score'], row['name']))
+    return json.dumps(rows)
+
+
+def measure(func, repeat, min_time):
+    """Minimum, Median und Streuung pro Aufruf in Mikrosekunden"""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    runs = [seconds / number * 1e6 for seconds in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'median_us': round(statistics.median(runs), 3),
+        'min_us': round(min(runs), 3),
+        'stdev_us': round(statistics.stdev(runs), 3) if len(runs) > 1 else 0.0,
+        'loops': number,
+    }
+
+
+def write_folder(base_path, folder_name, item_count):
+    folder_path = os.path.join(base_path, folder_name)
+    os.makedirs(folder_path, exist_ok=True)
+    items = []
+    for i in range(item_count):
+        item = {'id': f'item{i}', 'name': f'Inhalt {i}', 'description': 'x' * 80, 'player_count': '2'}
+        if i % 3 == 0:
+            item.update({'type': 'question', 'question_text': f'Frage {i}?', 'options': ['A', 'B', 'C', 'D']})
+        else:
+            item['type'] = 'game'
+        items.append(item)
+    with open(os.path.join(folder_path, 'minigames.json'), 'w', encoding='utf-8') as f:
+        json.dump({'folder_info': {'name': folder_name}, 'minigames': items}, f)
+    return [item['id'] for item in items]
+
+
+def build_cases(tmp_dir):
+    """Gibt (app, [(name, callable)]) zurück; alle Aufrufe laufen im App-Kontext"""
+    folders_path = os.path.join(tmp_dir, 'minigame_folders')
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(tmp_dir, 'bench.db')
+        FIELD_CONFIG_VERSION_FILE = os.path.join(tmp_dir, 'field_config.version')
+        MINIGAME_FOLDERS_PATH = folders_path
+        LOG_LEVEL = 'WARNING'
+
+    from app import create_app
+    app = create_app(BenchConfig)
+    app.logger.setLevel('WARNING')
+
+    from app.admin.minigame_utils import get_random_content_from_folder
+    from app.game_logic.special_fields import (
+        _check_barrier_dice_roll, _parse_barrier_config,
+        calculate_smart_field_distribution, get_field_type_at_position
+    )
+    from app.main.routes import get_consistent_emoji_for_player
+    from app.models import db, FieldConfiguration, GameSession, Team
+
+    rng = random.Random(42)
+    with app.app_context():
+        db.create_all()
+        FieldConfiguration.initialize_default_configs()
+
+        members = [f'Spieler {i}' for i in range(8)]
+        team = Team(name='Bench', members=', '.join(members))
+        team.set_password('x')
+        team.set_character_customization({'shirtColor': '#FF0000', 'hat': 'cap', 'glasses': 'normal'})
+        session = GameSession(is_active=True, current_phase='DICE_ROLLING')
+        db.session.add_all([team, session])
+        db.session.commit()
+        team_id, session_id = team.id, session.id
+        for _ in range(20):
+            selected = session._select_fair_rotation(team_id, members, 2)
+            session._update_player_rotation_tracking(team_id, selected)
+        db.session.commit()
+
+    small_ids = write_folder(folders_path, 'Bench1k', 1000)
+    large_ids = write_folder(folders_path, 'Bench10k', 10000)
+    played_small = set(rng.sample(small_ids, len(small_ids) // 2))
+    played_large = set(rng.sample(large_ids, len(large_ids) // 2))
+
+    positions = list(range(73))
+    barrier_configs = ['4-6', '5+', '2,4,6', '6']
+    parsed_barriers = [_parse_barrier_config(config) for config in barrier_configs]
+    player_names = [f'Spieler {i} mit längerem Namen' for i in range(50)]
+
+    def field_types_all_positions():
+        for position in positions:
+            get_field_type_at_position(position)
+
+    def parse_barriers():
+        for config in barrier_configs:
+            _parse_barrier_config(config)
+
+    def check_barriers():
+        for config in parsed_barriers:
+            for roll in range(1, 13):
+                _check_barrier_dice_roll(roll, config)
+
+    def emojis():
+        for name in player_names:
+            get_consistent_emoji_for_player(name)
+
+    loaded = {}
+
+    def character_customization():
+        # Team nur einmal laden; gemessen wird der Getter, nicht die Abfrage
+        team_obj = loaded.get('team')
+        if team_obj is None:
+            team_obj = loaded['team'] = db.session.get(Team, team_id)
+        team_obj.get_character_customization()
+
+    def fair_rotation():
+        db.session.get(GameSession, session_id)._select_fair_rotation(team_id, members, 2)
+
+    cases = [
+        ('calculate_smart_field_distribution', lambda: calculate_smart_field_distribution(73)),
+        ('get_field_type_at_position[73 Felder, warm]', field_types_all_positions),
+        ('_parse_barrier_config[4 Varianten]', parse_barriers),
+        ('_check_barrier_dice_roll[4x12 Würfe]', check_barriers),
+        ('get_random_content_from_folder[1k]', lambda: get_random_content_from_folder('Bench1k')),
+        ('get_random_content_from_folder[1k, 50% gespielt]',
+         lambda: get_random_content_from_folder('Bench1k', played_small)),
+        ('get_random_content_from_folder[10k]', lambda: get_random_content_from_folder('Bench10k')),
+        ('get_random_content_from_folder[10k, 50% gespielt]',
+         lambda: get_random_content_from_folder('Bench10k', played_large)),
+        ('GameSession._select_fair_rotation[8 Spieler]', fair_rotation),
+        ('Team.get_character_customization', character_customization),
+        ('get_consistent_emoji_for_player[50 Namen]', emojis),
+    ]
+    return app, cases
+
+
+def _spread(stats):
+    """Relative Streuung einer Messung: (Median - Minimum) / Minimum"""
+    return (stats['median_us'] - stats['min_us']) / stats['min_us'] if stats['min_us'] else 0.0
+
+
+def allowed_slowdown(stats, before, tolerance):
+    """Erlaubte relative Verlangsamung für einen Fall (Toleranz + gemessenes Rauschen)"""
+    limit = tolerance
+    if before['min_us'] < SMALL_CASE_US:
+        limit = max(limit, SMALL_CASE_TOLERANCE)
+    return limit + NOISE_FACTOR * max(_spread(stats), _spread(before))
+
+
+def slowdown(stats, before, reference_us, baseline_reference_us):
+    """Relative Änderung gegenüber der Baseline, normiert auf die Referenz-Last beider Läufe"""
+    if not before['min_us']:
+        return 0.0
+    scale = baseline_reference_us / reference_us if reference_us and baseline_reference_us else 1.0
+    return stats['min_us'] * scale / before['min_us'] - 1
+
+
+def compare(results, baseline, tolerance, reference_us):
+    """Gibt die Namen der Funktionen zurück, die langsamer als die erlaubte Abweichung sind"""
+    regressions = []
+    baseline_reference_us = baseline.get('meta', {}).get('reference_us')
+    for name, stats in results.items():
+        before = baseline.get('results', {}).get(name)
+        if not before:
+            print(f"  {name:52s} {stats['min_us']:12.2f} µs  (neu)")
+            continue
+        change = slowdown(stats, before, reference_us, baseline_reference_us)
+        limit = allowed_slowdown(stats, before, tolerance)
+        flag = ''
+        if change > limit:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        elif change < -limit:
+            flag = '  schneller'
+        print(f"  {name:52s} {stats['min_us']:12.2f} µs  Baseline {before['min_us']:12.2f} µs  "
+              f"{change * 100:+7.1f}% (Grenze {limit * 100:.0f}%){flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Pfad der Baseline-Datei')
+    parser.add_argument('--save-baseline', action='store_true', help='Ergebnisse als neue Baseline speichern')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Erlaubte Verlangsamung ohne Rauschen (0.25 = 25%%)')
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--min-time', type=float, default=0.3, help='Mindestdauer pro Wiederholung in Sekunden')
+    parser.add_argument('--filter', help='Nur Benchmarks, deren Name diesen Text enthält')
+    args = parser.parse_args()
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app, cases = build_cases(tmp_dir)
+        if args.filter:
+            cases = [(name, func) for name, func in cases if args.filter.lower() in name.lower()]
+        results = {}
+        regressions = []
+        with app.app_context():
+            # Referenz vor und nach den Fällen messen; das Minimum ist der Maßstab des Laufs
+            reference = measure(reference_workload, args.repeat, args.min_time)
+            for name, func in cases:
+                func()  # Aufwärmen (Caches füllen)
+                results[name] = measure(func, args.repeat, args.min_time)
+            reference_us = min(reference['min_us'],
+                               measure(reference_workload, args.repeat, args.min_time)['min_us'])
+
+            print(f"Python {platform.python_version()} auf {platform.machine()}, "
+                  f"Referenz-Last {reference_us:.2f} µs")
+            if baseline is not None:
+                meta = baseline.get('meta', {})
+                if meta.get('python') != platform.python_version() or meta.get('machine') != platform.machine():
+                    print(f"Hinweis: Baseline stammt von Python {meta.get('python')} auf {meta.get('machine')}")
+                if not meta.get('reference_us'):
+                    print("Hinweis: Baseline ohne Referenz-Last, Vergleich nicht normiert (neu speichern)")
+                suspects = compare(results, baseline, args.tolerance, reference_us)
+                # Auffällige Fälle erneut messen; nur bestätigte Verlangsamungen zählen
+                cases_by_name = dict(cases)
+                for name in suspects:
+                    stats = results[name]
+                    for _ in range(CONFIRM_RUNS):
+                        again = measure(cases_by_name[name], args.repeat, args.min_time)
+                        if again['min_us'] < stats['min_us']:
+                            stats = again
+                        before = baseline['results'][name]
+                        if slowdown(stats, before, reference_us, meta.get('reference_us')) <= \
+                                allowed_slowdown(stats, before, args.tolerance):
+                            print(f"  {name}: bei Wiederholung im Rahmen ({stats['min_us']:.2f} µs)")
+                            break
+                    else:
+                        regressions.append(name)
+                    results[name] = stats
+            else:
+                for name, stats in results.items():
+                    print(f"  {name:52s} {stats['min_us']:12.2f} µs  (median {stats['median_us']:.2f}, "
+                          f"stdev {stats['stdev_us']:.2f}, {stats['loops']} Schleifen)")
+
+    if args.save_baseline:
+        data = {
+            'meta': {
+                'created_at': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'reference_us': round(reference_us, 3),
+            },
+            'results': results,
+        }
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print(f"Baseline gespeichert: {args.baseline}")
+
+    if regressions:
+        print(f"{len(regressions)} bestätigte Regression(en): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark: Antwort-Übersicht einer Frage mit vielen Teams
+Misst _get_team_response_status() (Moderationsansicht) bei 30 antwortenden Teams:
+Dauer, SQL-Statements und wie oft die Ordner-JSON geparst wird.
+
+Aufruf (aus dem Projekt-Verzeichnis):
+    python benchmarks/bench_question_responses.py --teams 30 --items 300
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from config import Config
+
+
+def write_folder(folders_path, folder_name, item_count):
+    items = [{'id': f'game-{i}', 'name': f'Spiel {i}', 'type': 'game', 'description': 'x' * 200}
+             for i in range(item_count)]
+    items.append({'id': 'q-1', 'name': 'Frage', 'type': 'question', 'question_text': 'Welche?',
+                  'options': ['Antwort A', 'Antwort B', 'Antwort C', 'Antwort D'], 'correct_option': 2})
+    os.makedirs(os.path.join(folders_path, folder_name), exist_ok=True)
+    with open(os.path.join(folders_path, folder_name, 'minigames.json'), 'w', encoding='utf-8') as f:
+        json.dump({'minigames': items}, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--teams', type=int, default=30)
+    parser.add_argument('--items', type=int, default=300, help='Einträge in der Ordner-JSON')
+    parser.add_argument('--polls', type=int, default=50, help='Anzahl simulierter Abfragen der Moderation')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        folders_path = os.path.join(tmp_dir, 'minigame_folders')
+        write_folder(folders_path, 'Bench', args.items)
+
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(tmp_dir, 'bench.db')
+            FIELD_CONFIG_VERSION_FILE = os.path.join(tmp_dir, 'field_config.version')
+            MINIGAME_FOLDERS_PATH = folders_path
+
+        from app import create_app
+        app = create_app(BenchConfig)
+        with app.test_request_context():
+            from app.models import db, GameRound, GameSession, MinigameFolder, QuestionResponse, Team
+            from app.admin import minigame_utils
+            from app.admin.routes import _get_team_response_status
+
+            db.create_all()
+            folder = MinigameFolder(name='Bench', folder_path='Bench')
+            db.session.add(folder)
+            db.session.flush()
+            db.session.add(GameRound(name='Bench', minigame_folder_id=folder.id, is_active=True))
+            session = GameSession(is_active=True, current_question_id='q-1', current_phase='QUESTION_ACTIVE')
+            db.session.add(session)
+            teams = [Team(name=f'Team {i}') for i in range(args.teams)]
+            for team in teams:
+                team.set_password('x')
+            db.session.add_all(teams)
+            db.session.flush()
+            db.session.add_all([
+                QuestionResponse(team_id=team.id, game_session_id=session.id, question_id='q-1',
+                                 selected_option=i % 4, is_correct=(i % 4 == 2))
+                for i, team in enumerate(teams)
+            ])
+            db.session.commit()
+
+            parses = [0]
+            original = minigame_utils.get_minigame_from_folder
+
+            def counting_get_content(folder_name, content_id):
+                parses[0] += 1
+                return original(folder_name, content_id)
+
+            minigame_utils.get_minigame_from_folder = counting_get_content
+
+            statements = [0]
+            event.listen(db.engine, 'before_cursor_execute',
+                         lambda *a: statements.__setitem__(0, statements[0] + 1))
+
+            start = time.perf_counter()
+            for _ in range(args.polls):
+                status = _get_team_response_status(session)
+            elapsed = time.perf_counter() - start
+
+            assert status['total_responses'] == args.teams, status
+            print(f"Teams: {args.teams}  Abfragen: {args.polls}  Einträge in Ordner-JSON: {args.items + 1}")
+            print(f"_get_team_response_status(): {elapsed / args.polls * 1000:.2f} ms/Abfrage  "
+                  f"SQL/Abfrage {statements[0] / args.polls:.1f}  "
+                  f"JSON-Parses gesamt {parses[0]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark: Rundenwechsel mit vielen Runden
+Misst die Dauer von GameRound.activate(), die Anzahl der SQL-Statements pro Aktivierung
+und die Kosten der ersten Feld-Konfigurations-Abfrage nach einem Wechsel.
+
+Aufruf (aus dem Projekt-Verzeichnis):
+    python benchmarks/bench_round_activation.py --rounds 500 --switches 200
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from config import Config
+
+
+def build_app(tmp_dir):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(tmp_dir, 'bench.db')
+        FIELD_CONFIG_VERSION_FILE = os.path.join(tmp_dir, 'field_config.version')
+        WTF_CSRF_ENABLED = False
+
+    from app import create_app
+    return create_app(BenchConfig)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=500, help='Anzahl angelegter Runden')
+    parser.add_argument('--switches', type=int, default=200, help='Anzahl gemessener Rundenwechsel')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app = build_app(tmp_dir)
+        with app.app_context():
+            from app.models import db, FieldConfiguration, GameRound, MinigameFolder, RoundFieldConfiguration
+            from app.admin import minigame_utils
+            from app.game_logic.field_config_cache import get_cached_field_configs
+
+            # Dateisystem-Backup ausklammern, gemessen wird nur der Rundenwechsel
+            minigame_utils.save_round_to_filesystem = lambda round_obj: True
+
+            db.create_all()
+            FieldConfiguration.initialize_default_configs()
+            folder = MinigameFolder(name='Bench', folder_path='bench')
+            db.session.add(folder)
+            db.session.commit()
+
+            start = time.perf_counter()
+            db.session.add_all([
+                GameRound(name=f'Runde {i}', minigame_folder_id=folder.id) for i in range(args.rounds)
+            ])
+            db.session.commit()
+            round_ids = [row.id for row in db.session.query(GameRound.id)]
+            for round_obj in GameRound.query.all():
+                round_obj.ensure_round_configurations()
+            setup_seconds = time.perf_counter() - start
+            config_count = RoundFieldConfiguration.query.count()
+
+            statements = [0]
+            event.listen(db.engine, 'before_cursor_execute',
+                         lambda *a: statements.__setitem__(0, statements[0] + 1))
+
+            activation_ms, activation_statements = [], []
+            lookup_ms, lookup_statements = [], []
+            for _ in range(args.switches):
+                round_obj = db.session.get(GameRound, rng.choice(round_ids))
+
+                statements[0] = 0
+                start = time.perf_counter()
+                round_obj.activate()
+                activation_ms.append((time.perf_counter() - start) * 1000)
+                activation_statements.append(statements[0])
+
+                statements[0] = 0
+                start = time.perf_counter()
+                configs = get_cached_field_configs()
+                lookup_ms.append((time.perf_counter() - start) * 1000)
+                lookup_statements.append(statements[0])
+                assert configs, 'Keine Feld-Konfigurationen aufgelöst'
+
+            statements[0] = 0
+            start = time.perf_counter()
+            for _ in range(1000):
+                get_cached_field_configs()
+            warm_us = (time.perf_counter() - start) * 1000
+            warm_statements = statements[0]
+
+            active_round_id = GameRound.get_active_round().id
+            statements[0] = 0
+            start = time.perf_counter()
+            RoundFieldConfiguration.upsert_many(active_round_id, FieldConfiguration.query.all())
+            db.session.commit()
+            upsert_ms = (time.perf_counter() - start) * 1000
+            upsert_statements = statements[0]
+
+        print(f"Runden: {args.rounds}  Rundenkonfigurationen: {config_count}  Setup: {setup_seconds:.2f}s")
+        print(f"activate():            Mittel {statistics.mean(activation_ms):.2f} ms  "
+              f"p95 {percentile(activation_ms, 95):.2f} ms  "
+              f"SQL/Aufruf {statistics.mean(activation_statements):.1f}")
+        print(f"1. Abfrage nach Wechsel: Mittel {statistics.mean(lookup_ms):.2f} ms  "
+              f"p95 {percentile(lookup_ms, 95):.2f} ms  "
+              f"SQL/Aufruf {statistics.mean(lookup_statements):.1f}")
+        print(f"Warme Abfrage:          {warm_us:.2f} µs/Aufruf  SQL gesamt {warm_statements}")
+        print(f"Bulk-Upsert aktive Runde: {upsert_ms:.2f} ms  SQL {upsert_statements}")
+
+
+if __name__ == '__main__':
+    main()
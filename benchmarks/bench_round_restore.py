@@ -0,0 +1,86 @@
+"""
+Benchmark: Wiederherstellung gesicherter Runden
+Erzeugt ein synthetisches Archiv (Runden mit Teams, Feld-Konfigurationen und Spielsitzung)
+und misst restore_saved_rounds() gegen eine frische SQLite-Datenbank.
+
+Aufruf (aus dem Projekt-Verzeichnis):
+    python benchmarks/bench_round_restore.py --rounds 50 --teams 20
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from config import Config
+
+
+def build_archive(round_count, team_count, field_types):
+    now = datetime.utcnow().isoformat()
+    archive = []
+    for r in range(round_count):
+        archive.append({
+            'name': f'Runde {r}',
+            'description': 'Benchmark',
+            'minigame_folder_name': 'Bench',
+            'created_at': now,
+            'saved_at': now,
+            'teams': [{'name': f'Team {r}-{t}', 'password_hash': 'x', 'current_position': t}
+                      for t in range(team_count)],
+            'field_configurations': [{'field_type': ft, 'display_name': ft, 'color_hex': '#FFFFFF'}
+                                     for ft in field_types],
+            'minigame_folders': [{'name': 'Bench', 'folder_path': 'bench', 'created_at': now}],
+            'game_session': {'start_time': now, 'current_phase': 'DICE_ROLLING', 'dice_roll_order': '1,2,3'},
+        })
+    return archive
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=50)
+    parser.add_argument('--teams', type=int, default=20, help='Teams pro Runde')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(tmp_dir, 'bench.db')
+            FIELD_CONFIG_VERSION_FILE = os.path.join(tmp_dir, 'field_config.version')
+
+        from app import create_app
+        app = create_app(BenchConfig)
+        with app.app_context():
+            from app.models import db, FieldConfiguration, GameRound, Team, RoundFieldConfiguration
+            from app.admin.minigame_utils import restore_saved_rounds
+
+            db.create_all()
+            FieldConfiguration.initialize_default_configs()
+            field_types = [c.field_type for c in FieldConfiguration.query.all()]
+            archive = build_archive(args.rounds, args.teams, field_types)
+
+            statements = [0]
+            event.listen(db.engine, 'before_cursor_execute',
+                         lambda *a: statements.__setitem__(0, statements[0] + 1))
+
+            start = time.perf_counter()
+            result = restore_saved_rounds(archive, progress=lambda stage, done, total: None)
+            elapsed = time.perf_counter() - start
+
+            assert not result['errors'], result['errors']
+            print(f"Runden: {GameRound.query.count()}  Teams: {Team.query.count()}  "
+                  f"Feld-Konfigurationen: {RoundFieldConfiguration.query.count()}")
+            print(f"restore_saved_rounds(): {elapsed * 1000:.1f} ms  SQL-Statements: {statements[0]}")
+
+            statements[0] = 0
+            start = time.perf_counter()
+            again = restore_saved_rounds(archive, progress=lambda stage, done, total: None)
+            print(f"Erneuter Lauf (alles vorhanden): {(time.perf_counter() - start) * 1000:.1f} ms  "
+                  f"übersprungen: {len(again['skipped'])}  SQL-Statements: {statements[0]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark: Kaltstart der Anwendung
+Startet für jeden Durchlauf einen frischen Python-Prozess, der die App importiert,
+create_app() aufruft und das Board einmal abfragt (/board und /api/board-status).
+Gemessen werden Gesamtdauer des Prozesses sowie Import, create_app und erster Request.
+Ein zusätzlicher Lauf mit -X importtime listet die teuersten Module.
+
+Mit --max-ms lässt sich ein Zielwert für den Median des Kaltstarts vorgeben; wird er
+überschritten, endet das Skript mit Exit-Code 1 (z.B. für CI).
+
+Aufruf (aus dem Projekt-Verzeichnis):
+    python benchmarks/bench_startup.py --runs 5 --top 15
+    python benchmarks/bench_startup.py --max-ms 1500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_TARGET_MS = 1500
+
+CHILD_SCRIPT = """
+import json, os, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {project_dir!r})
+from config import Config
+from app import create_app
+imported = time.perf_counter()
+
+class StartupConfig(Config):
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join({tmp_dir!r}, 'startup.db')
+    FIELD_CONFIG_VERSION_FILE = os.path.join({tmp_dir!r}, 'field_config.version')
+    LOG_LEVEL = 'WARNING'
+
+app = create_app(StartupConfig)
+created = time.perf_counter()
+with app.app_context():
+    from app.models import db
+    db.create_all()
+prepared = time.perf_counter()
+client = app.test_client()
+for path in ('/board', '/api/board-status'):
+    client.get(path)
+served = time.perf_counter()
+print(json.dumps({{
+    'import_ms': (imported - start) * 1000,
+    'create_app_ms': (created - imported) * 1000,
+    'first_request_ms': (served - prepared) * 1000,
+    'modules': sorted(name for name in ('flask_migrate', 'alembic', 'PIL') if name in sys.modules),
+}}))
+"""
+
+
+def run_child(tmp_dir, importtime=False):
+    code = CHILD_SCRIPT.format(project_dir=PROJECT_DIR, tmp_dir=tmp_dir)
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', code]
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True, cwd=PROJECT_DIR)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"Startprozess fehlgeschlagen:\n{result.stderr[-2000:]}")
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    data['wall_ms'] = wall_ms
+    return data, result.stderr
+
+
+def parse_importtime(stderr, top):
+    """Teuerste Top-Level-Importe (kumulativ, in ms) aus der -X importtime-Ausgabe"""
+    roots = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        # Verschachtelte Importe sind eingerückt; nur direkt ausgelöste Importe zählen
+        if name.startswith('  '):
+            continue
+        roots.append((int(cumulative_us) / 1000, int(self_us) / 1000, name.strip()))
+    return sorted(roots, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15, help='Anzahl der teuersten Importe in der Ausgabe')
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help=f'Zielwert für den Median des Kaltstarts (Vorschlag: {DEFAULT_TARGET_MS} ms)')
+    args = parser.parse_args()
+
+    runs = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        run_child(tmp_dir)  # Bytecode-Cache und Datenbank anlegen
+        for _ in range(args.runs):
+            runs.append(run_child(tmp_dir)[0])
+        profile, stderr = run_child(tmp_dir, importtime=True)
+
+    def median(key):
+        return statistics.median(run[key] for run in runs)
+
+    print(f"Kaltstart ({args.runs} Läufe, Median):")
+    print(f"  Prozess gesamt   {median('wall_ms'):8.1f} ms")
+    print(f"  Import app       {median('import_ms'):8.1f} ms")
+    print(f"  create_app()     {median('create_app_ms'):8.1f} ms")
+    print(f"  erster Request   {median('first_request_ms'):8.1f} ms")
+    print(f"  geladen: {', '.join(profile['modules']) or 'weder Flask-Migrate/Alembic noch Pillow'}")
+
+    print(f"\nTeuerste Importe (-X importtime, kumulativ):")
+    for cumulative_ms, self_ms, name in parse_importtime(stderr, args.top):
+        print(f"  {cumulative_ms:8.1f} ms  (selbst {self_ms:6.1f} ms)  {name}")
+
+    if args.max_ms is not None:
+        if median('wall_ms') > args.max_ms:
+            print(f"\nZiel verfehlt: {median('wall_ms'):.1f} ms > {args.max_ms:.1f} ms")
+            sys.exit(1)
+        print(f"\nZiel erreicht: {median('wall_ms'):.1f} ms <= {args.max_ms:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -80,9 +80,38 @@ class Config:
     PARTICLE_EFFECTS = True
     SOUND_EFFECTS = True  # Für zukünftige Audio-Implementation
     
+    # CACHE-KONFIGURATION
+    # Versionsstempel-Datei für den Feld-Konfigurations-Cache (teilen sich alle Worker; Standard: instance/field_config.version)
+    FIELD_CONFIG_VERSION_FILE = os.environ.get('FIELD_CONFIG_VERSION_FILE')
+    # Anzahl der Ablaufplan-Einträge, deren Inhalt beim Weiterschalten vorab geladen wird
+    SEQUENCE_PREFETCH_COUNT = 3
+    # Sekunden, die der User-Loader eingeloggte Admins/Teams ohne Abfrage wiederverwendet (0 = aus)
+    PRINCIPAL_CACHE_TTL = float(os.environ.get('PRINCIPAL_CACHE_TTL') or 10)
+    # SQLite nach einem kompletten Spiel-Reset verkleinern (VACUUM bzw. incremental_vacuum)
+    RESET_VACUUM = True
+    # Ablage der archivierten GameEvents beendeter Spiele (Standard: instance/event_archive)
+    EVENT_ARCHIVE_DIR = os.environ.get('EVENT_ARCHIVE_DIR')
+    # Beendete Spiele erst archivieren, wenn ihr letztes Event so viele Stunden alt ist
+    EVENT_ARCHIVE_AFTER_HOURS = float(os.environ.get('EVENT_ARCHIVE_AFTER_HOURS') or 24)
+    
+    # INSTRUMENTIERUNG (opt-in)
+    # Metriken pro Endpunkt unter /admin/metrics (Prometheus-Textformat)
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '').lower() in ('1', 'true', 'yes')
+    # Optionaler Bearer-Token, damit Prometheus ohne Admin-Login abfragen kann
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+    # Anteil zufällig profilierter Requests (0.0 - 1.0); einzelne Requests zusätzlich mit ?_profile=1
+    # Ohne pyinstrument (cProfile) wird immer nur ein Request gleichzeitig profiliert
+    PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE') or 0)
+    # Ablage der Profile (Standard: instance/profiles)
+    PROFILE_DIR = os.environ.get('PROFILE_DIR')
+    
     # DEBUGGING
     DEBUG_SPECIAL_FIELDS = False  # Zusätzliche Debug-Logs für Sonderfelder
     FORCE_SPECIAL_FIELD_TRIGGERS = False  # Immer Sonderfeld-Aktionen auslösen (nur für Tests)
 
     # Logging Konfiguration (optional, aber hilfreich für Debugging)
-    LOG_TO_STDOUT = os.environ.get('LOG_TO_STDOUT')
\ No newline at end of file
+    LOG_TO_STDOUT = os.environ.get('LOG_TO_STDOUT')
+    # Level der wii.*-Logger (Standard: DEBUG im Debug-Modus, sonst INFO)
+    LOG_LEVEL = os.environ.get('LOG_LEVEL')
+    # 'text' (Schlüssel=Wert) oder 'json' (eine JSON-Zeile pro Ereignis)
+    LOG_FORMAT = os.environ.get('LOG_FORMAT') or 'text'
\ No newline at end of file
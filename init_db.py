@@ -36,7 +36,7 @@ with app_instance.app_context():
     try:
         db.create_all()
         print("Datenbank-Tabellen erfolgreich erstellt.")
-        print("✅ Spiele-Tracking-Feld 'played_content_ids' in GameSession enthalten.")
+        print("✅ Spiele-Tracking-Tabelle 'played_content' enthalten.")
         print("✅ Sonderfeld-Features 'is_blocked' und 'blocked_target_number' in Team enthalten.")
     except Exception as e:
         print(f"Fehler beim Erstellen der Tabellen: {e}")
@@ -199,6 +199,10 @@ with app_instance.app_context():
             game_round_id=default_round.id,
             played_content_ids=''  # Explizit initialisieren
         )
+        # Gespielte Inhalte und Rotation liegen in eigenen Tabellen - Test-Session nur in einem Savepoint anlegen
+        tracking_savepoint = db.session.begin_nested()
+        db.session.add(test_session)
+        db.session.flush()
         
         # Teste die neuen Methoden
         print("Teste get_played_content_ids()...")
@@ -220,7 +224,6 @@ with app_instance.app_context():
         final_ids = test_session.get_played_content_ids()
         print(f"  Nach Reset: {final_ids}")
         
-        # Lösche Test-Session (nicht speichern)
         print("✅ Alle Tracking-Features funktionieren korrekt!")
         
         # NEU: Teste Selected Players Features
@@ -269,6 +272,8 @@ with app_instance.app_context():
             team_name = team.name if team else f"Team {team_id}"
             print(f"    {team_name}: {team_stats['players']}")
         
+        # Lösche Test-Session samt Tracking- und Rotationsdaten (nicht speichern)
+        tracking_savepoint.rollback()
         print("✅ Alle Selected Players Features und Rotation funktionieren korrekt!")
         
     except ImportError as ie:
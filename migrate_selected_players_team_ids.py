@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Migration Script: Speichert ausgeloste Feld-Minispiel-Spieler nach Team-ID
+
+game_session.field_minigame_selected_players enthielt bisher Team-Namen als
+Schlüssel ({"Team Rot": [{"name": ...}]}). Neue Auslosungen speichern die
+Team-ID ({"3": [...]}); dieses Script wandelt vorhandene Einträge um.
+Einträge für nicht mehr vorhandene Teams bleiben unverändert.
+
+python migrate_selected_players_team_ids.py
+"""
+
+import json
+import os
+import sys
+
+# Füge das Projekt-Root-Verzeichnis zum sys.path hinzu
+PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import text
+
+from app import create_app, db
+
+
+def convert_selected_players():
+    """Ersetzt Team-Namen durch Team-IDs in field_minigame_selected_players"""
+
+    app = create_app()
+
+    with app.app_context():
+        print("🔄 Wandle ausgeloste Spieler in das Team-ID-Format um...")
+
+        try:
+            with db.engine.begin() as conn:
+                team_ids = {name: team_id for team_id, name in conn.execute(text("SELECT id, name FROM team"))}
+                sessions = conn.execute(text(
+                    "SELECT id, field_minigame_selected_players FROM game_session "
+                    "WHERE field_minigame_selected_players IS NOT NULL AND field_minigame_selected_players != ''"
+                )).fetchall()
+
+                updates = []
+                for session_id, raw in sessions:
+                    try:
+                        selected = json.loads(raw)
+                    except (json.JSONDecodeError, TypeError):
+                        print(f"⚠️  Spielsitzung {session_id}: ungültiges JSON, übersprungen.")
+                        continue
+                    if not isinstance(selected, dict):
+                        continue
+
+                    converted = {}
+                    for team_key, players in selected.items():
+                        if not team_key.isdigit() and team_key in team_ids:
+                            team_key = str(team_ids[team_key])
+                        converted[team_key] = players
+                    if converted != selected:
+                        updates.append({'session_id': session_id, 'value': json.dumps(converted)})
+
+                if updates:
+                    conn.execute(text(
+                        "UPDATE game_session SET field_minigame_selected_players = :value WHERE id = :session_id"
+                    ), updates)
+
+            print(f"✅ {len(updates)} von {len(sessions)} Spielsitzung(en) umgewandelt.")
+            return True
+
+        except Exception as e:
+            print(f"❌ Fehler bei der Migration: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = convert_selected_players()
+    sys.exit(0 if success else 1)